@@ -0,0 +1,163 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Micro-benchmarks for AnyDictionary lookup, insert and iteration, compared
+// against std::map<std::string, std::any>, which AnyDictionary used to be
+// built on.
+//
+// usage: any_dictionary_perf_test [iterations]
+
+#include <algorithm>
+#include <any>
+#include <chrono>
+#include <cstdlib>
+#include <iomanip>
+#include <iostream>
+#include <map>
+#include <random>
+#include <string>
+#include <vector>
+
+#include "opentimelineio/anyDictionary.h"
+
+namespace otio = opentimelineio::OPENTIMELINEIO_VERSION;
+
+using clock_type = std::chrono::steady_clock;
+using std_map    = std::map<std::string, std::any>;
+
+static std::vector<std::string>
+make_keys(size_t count)
+{
+    std::vector<std::string> keys;
+    for (size_t i = 0; i < count; ++i)
+    {
+        keys.push_back("metadata_key_" + std::to_string(i));
+    }
+    std::shuffle(keys.begin(), keys.end(), std::mt19937(1234));
+    return keys;
+}
+
+template <typename Dict>
+static Dict
+make_dict(std::vector<std::string> const& keys)
+{
+    Dict d;
+    for (size_t i = 0; i < keys.size(); ++i)
+    {
+        d[keys[i]] = int64_t(i);
+    }
+    return d;
+}
+
+// Run fn iterations times and return the nanoseconds per operation, where
+// each call performs ops_per_call operations.
+template <typename Fn>
+static double
+time_per_op(size_t iterations, size_t ops_per_call, Fn&& fn)
+{
+    auto const begin = clock_type::now();
+    for (size_t i = 0; i < iterations; ++i)
+    {
+        fn();
+    }
+    std::chrono::duration<double, std::nano> const elapsed =
+        clock_type::now() - begin;
+    return elapsed.count() / double(iterations * ops_per_call);
+}
+
+template <typename Dict>
+static double
+bench_lookup(std::vector<std::string> const& keys, size_t iterations)
+{
+    Dict const d     = make_dict<Dict>(keys);
+    int64_t    total = 0;
+    double     ns    = time_per_op(iterations, keys.size(), [&] {
+        for (auto const& key: keys)
+        {
+            total += std::any_cast<int64_t>(d.find(key)->second);
+        }
+    });
+    if (total < 0)
+    {
+        std::cerr << total;
+    }
+    return ns;
+}
+
+template <typename Dict>
+static double
+bench_insert(std::vector<std::string> const& keys, size_t iterations)
+{
+    size_t total = 0;
+    double ns    = time_per_op(iterations, keys.size(), [&] {
+        total += make_dict<Dict>(keys).size();
+    });
+    if (total == 0)
+    {
+        std::cerr << total;
+    }
+    return ns;
+}
+
+template <typename Dict>
+static double
+bench_iterate(std::vector<std::string> const& keys, size_t iterations)
+{
+    Dict const d     = make_dict<Dict>(keys);
+    size_t     total = 0;
+    double     ns    = time_per_op(iterations, keys.size(), [&] {
+        for (auto const& e: d)
+        {
+            total += e.first.size();
+        }
+    });
+    if (total == 0)
+    {
+        std::cerr << total;
+    }
+    return ns;
+}
+
+static void
+report(char const* name, size_t size, double map_ns, double dict_ns)
+{
+    std::cout << std::left << std::setw(10) << name << std::right
+              << std::setw(8) << size << std::fixed << std::setprecision(1)
+              << std::setw(14) << map_ns << std::setw(16) << dict_ns
+              << std::setw(10) << map_ns / dict_ns << "x" << std::endl;
+}
+
+int
+main(int argc, char* argv[])
+{
+    size_t const work = argc > 1 ? size_t(std::atol(argv[1])) : 2000000;
+
+    std::cout << std::left << std::setw(10) << "benchmark" << std::right
+              << std::setw(8) << "keys" << std::setw(14) << "std::map ns"
+              << std::setw(16) << "AnyDictionary ns" << std::setw(11)
+              << "speedup" << std::endl;
+
+    for (size_t size: { 4, 8, 16, 64, 1024 })
+    {
+        auto const   keys       = make_keys(size);
+        size_t const iterations = std::max(work / size, size_t(1));
+
+        report(
+            "lookup",
+            size,
+            bench_lookup<std_map>(keys, iterations),
+            bench_lookup<otio::AnyDictionary>(keys, iterations));
+        report(
+            "insert",
+            size,
+            bench_insert<std_map>(keys, iterations / 4 + 1),
+            bench_insert<otio::AnyDictionary>(keys, iterations / 4 + 1));
+        report(
+            "iterate",
+            size,
+            bench_iterate<std_map>(keys, iterations),
+            bench_iterate<otio::AnyDictionary>(keys, iterations));
+    }
+
+    return 0;
+}
@@ -0,0 +1,142 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Benchmark for applying a conform-like list of edits to a long track, by
+// calling the functions in algo/editAlgorithm.h in a loop and with an
+// EditTransaction.
+//
+// usage: edit_perf_test [clips] [edits]
+
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <string>
+
+#include "opentimelineio/algo/editAlgorithm.h"
+#include "opentimelineio/clip.h"
+#include "opentimelineio/externalReference.h"
+#include "opentimelineio/track.h"
+
+namespace otio = opentimelineio::OPENTIMELINEIO_VERSION;
+
+using clock_type = std::chrono::steady_clock;
+using otio::RationalTime;
+using otio::TimeRange;
+
+static otio::SerializableObject::Retainer<otio::Track>
+make_track(int clips)
+{
+    otio::SerializableObject::Retainer<otio::Track> track(new otio::Track);
+    for (int i = 0; i < clips; ++i)
+    {
+        track->append_child(new otio::Clip(
+            "clip " + std::to_string(i),
+            new otio::ExternalReference(
+                "file:///media/clip_" + std::to_string(i) + ".mov",
+                TimeRange(RationalTime(0, 24), RationalTime(2000, 24))),
+            TimeRange(RationalTime(100, 24), RationalTime(24 + i % 48, 24))));
+    }
+    return track;
+}
+
+// Apply the edits, through the transaction if there is one.
+static void
+apply_edits(otio::Track* track, int edits, otio::algo::EditTransaction* tx)
+{
+    otio::ErrorStatus error_status;
+    double const      duration = track->duration().value();
+    for (int i = 0; i < edits; ++i)
+    {
+        RationalTime const time(double((i * 7919) % int(duration - 100)), 24);
+        auto               clip = new otio::Clip(
+            "edit " + std::to_string(i),
+            nullptr,
+            TimeRange(RationalTime(0, 24), RationalTime(12 + i % 24, 24)));
+        switch (i % 3)
+        {
+            case 0: {
+                TimeRange const range(time, clip->duration());
+                if (tx)
+                    tx->overwrite(clip, range, true, nullptr, &error_status);
+                else
+                    otio::algo::overwrite(
+                        clip,
+                        track,
+                        range,
+                        true,
+                        nullptr,
+                        &error_status);
+                break;
+            }
+            case 1:
+                if (tx)
+                    tx->insert(clip, time, true, nullptr, &error_status);
+                else
+                    otio::algo::insert(
+                        clip,
+                        track,
+                        time,
+                        true,
+                        nullptr,
+                        &error_status);
+                break;
+            default:
+                if (tx)
+                    tx->remove(time, true, nullptr, &error_status);
+                else
+                    otio::algo::remove(
+                        track,
+                        time,
+                        true,
+                        nullptr,
+                        &error_status);
+                otio::SerializableObject::Retainer<> release(clip);
+                break;
+        }
+        if (otio::is_error(error_status))
+        {
+            std::cerr << "edit " << i << " failed: "
+                      << otio::ErrorStatus::outcome_to_string(
+                             error_status.outcome)
+                      << std::endl;
+            std::exit(1);
+        }
+    }
+}
+
+int
+main(int argc, char** argv)
+{
+    int const clips = argc > 1 ? std::atoi(argv[1]) : 5000;
+    int const edits = argc > 2 ? std::atoi(argv[2]) : 3000;
+
+    auto looped = make_track(clips);
+    auto begin  = clock_type::now();
+    apply_edits(looped, edits, nullptr);
+    std::chrono::duration<double> const loop_time = clock_type::now() - begin;
+
+    auto transacted = make_track(clips);
+    begin           = clock_type::now();
+    {
+        otio::algo::EditTransaction transaction(transacted);
+        apply_edits(transacted, edits, &transaction);
+        transaction.commit();
+    }
+    std::chrono::duration<double> const transaction_time =
+        clock_type::now() - begin;
+
+    std::cout << clips << " clips, " << edits << " edits" << std::endl;
+    std::cout << "  loop:        " << loop_time.count() << " s" << std::endl;
+    std::cout << "  transaction: " << transaction_time.count() << " s"
+              << std::endl;
+    std::cout << "  speedup:     "
+              << loop_time.count() / transaction_time.count() << "x"
+              << std::endl;
+
+    if (!transacted->is_equivalent_to(*looped))
+    {
+        std::cerr << "the results differ" << std::endl;
+        return 1;
+    }
+    return 0;
+}
@@ -2,11 +2,13 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include <iostream>
+#include <memory>
 
 #include "opentimelineio/clip.h"
 #include "opentimelineio/typeRegistry.h"
 #include "opentimelineio/serialization.h"
 #include "opentimelineio/deserialization.h"
+#include "opentimelineio/objectArena.h"
 #include "opentimelineio/timeline.h"
 
 #include "util.h"
@@ -24,6 +26,8 @@ const struct {
     bool TO_JSON_FILE_NO_DOWNGRADE   = true;
     bool CLONE_TEST                  = true;
     bool SINGLE_CLIP_DOWNGRADE_TEST  = true;
+    bool LAZY_METADATA_READ          = true;
+    bool OBJECT_ARENA_READ           = true;
 } RUN_STRUCT ;
 
 // typedef std::chrono::duration<float> fsec;
@@ -153,7 +157,75 @@ main(
         return 1;
     }
 
-    print_elapsed_time("deserialize_json_from_file", begin, end);
+    const double read_eager =
+        print_elapsed_time("deserialize_json_from_file", begin, end);
+
+    if (RUN_STRUCT.LAZY_METADATA_READ)
+    {
+        std::any lazy_result;
+        begin = std::chrono::steady_clock::now();
+        otio::deserialize_json_from_file(
+                examples::normalize_path(argv[1]),
+                &lazy_result,
+                &err,
+                true /* lazy_metadata */
+        );
+        end = std::chrono::steady_clock::now();
+        assert(!otio::is_error(err));
+        const double read_lazy = print_elapsed_time(
+                "deserialize_json_from_file [lazy metadata]",
+                begin,
+                end
+        );
+        std::cout << "  JSON from file eager/lazy: " << read_eager / read_lazy;
+        std::cout << std::endl;
+    }
+
+    if (RUN_STRUCT.OBJECT_ARENA_READ)
+    {
+        // load and free the file with and without an arena
+        double load[2], teardown[2];
+        for (int use_arena = 0; use_arena < 2; ++use_arena)
+        {
+            std::unique_ptr<otio::ObjectArena> arena;
+            begin = std::chrono::steady_clock::now();
+            if (use_arena)
+            {
+                arena.reset(new otio::ObjectArena);
+            }
+            otio::SerializableObject::Retainer<> result(
+                    otio::SerializableObject::from_json_file(
+                        examples::normalize_path(argv[1]),
+                        &err
+                    )
+            );
+            arena.reset();
+            end = std::chrono::steady_clock::now();
+            assert(!otio::is_error(err));
+            load[use_arena] = print_elapsed_time(
+                    use_arena
+                    ? "deserialize_json_from_file [object arena]"
+                    : "deserialize_json_from_file [no arena]",
+                    begin,
+                    end
+            );
+
+            begin = std::chrono::steady_clock::now();
+            result = nullptr;
+            end = std::chrono::steady_clock::now();
+            teardown[use_arena] = print_elapsed_time(
+                    use_arena
+                    ? "free timeline [object arena]"
+                    : "free timeline [no arena]",
+                    begin,
+                    end
+            );
+        }
+        std::cout << "  load no arena/arena: " << load[0] / load[1];
+        std::cout << std::endl;
+        std::cout << "  free no arena/arena: " << teardown[0] / teardown[1];
+        std::cout << std::endl;
+    }
 
 
     double str_dg, str_nodg;
@@ -362,6 +362,7 @@ setup(
             'otiocat = opentimelineio.console.otiocat:main',
             'otioconvert = opentimelineio.console.otioconvert:main',
             'otiopluginfo = opentimelineio.console.otiopluginfo:main',
+            'otioservice = opentimelineio.console.otioservice:main',
             'otiostat = opentimelineio.console.otiostat:main',
             'otiotool = opentimelineio.console.otiotool:main',
             (
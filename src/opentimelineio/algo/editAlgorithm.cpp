@@ -883,4 +883,259 @@ void remove(
     }
 }
             
+EditTransaction::EditTransaction(Track* track)
+    : _track(track)
+{
+    for (auto const& child : track->children())
+    {
+        _children.push_back(child);
+        if (auto item = dynamic_retainer_cast<Item>(child))
+        {
+            _source_ranges.emplace_back(item, item->source_range());
+        }
+    }
+
+    // a transaction opened inside another one on the same track shares its
+    // index
+    if (!track->_range_index)
+    {
+        track->_range_index.reset(new Composition::_RangeIndex);
+        _owns_index = true;
+    }
+}
+
+EditTransaction::~EditTransaction()
+{
+    if (_open)
+    {
+        rollback();
+    }
+}
+
+void
+EditTransaction::overwrite(
+    Item*            item,
+    TimeRange const& range,
+    bool const       remove_transitions,
+    Item*            fill_template,
+    ErrorStatus*     error_status)
+{
+    if (!_check_open(error_status))
+        return;
+    _save_source_range(item);
+    _save_source_range(fill_template);
+    algo::overwrite(
+        item,
+        _track,
+        range,
+        remove_transitions,
+        fill_template,
+        error_status);
+}
+
+void
+EditTransaction::insert(
+    Item*               item,
+    RationalTime const& time,
+    bool const          remove_transitions,
+    Item*               fill_template,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status))
+        return;
+    _save_source_range(item);
+    _save_source_range(fill_template);
+    algo::insert(
+        item,
+        _track,
+        time,
+        remove_transitions,
+        fill_template,
+        error_status);
+}
+
+void
+EditTransaction::trim(
+    Item*               item,
+    RationalTime const& delta_in,
+    RationalTime const& delta_out,
+    Item*               fill_template,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status) || !_check_child(item, error_status))
+        return;
+    _save_source_range(fill_template);
+    algo::trim(item, delta_in, delta_out, fill_template, error_status);
+}
+
+void
+EditTransaction::slice(
+    RationalTime const& time,
+    bool const          remove_transitions,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status))
+        return;
+    algo::slice(_track, time, remove_transitions, error_status);
+}
+
+void
+EditTransaction::slip(
+    Item*               item,
+    RationalTime const& delta,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status) || !_check_child(item, error_status))
+        return;
+    algo::slip(item, delta);
+}
+
+void
+EditTransaction::slide(
+    Item*               item,
+    RationalTime const& delta,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status) || !_check_child(item, error_status))
+        return;
+    algo::slide(item, delta);
+}
+
+void
+EditTransaction::ripple(
+    Item*               item,
+    RationalTime const& delta_in,
+    RationalTime const& delta_out,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status) || !_check_child(item, error_status))
+        return;
+    algo::ripple(item, delta_in, delta_out, error_status);
+}
+
+void
+EditTransaction::roll(
+    Item*               item,
+    RationalTime const& delta_in,
+    RationalTime const& delta_out,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status) || !_check_child(item, error_status))
+        return;
+    algo::roll(item, delta_in, delta_out, error_status);
+}
+
+void
+EditTransaction::fill(
+    Item*                item,
+    RationalTime const&  track_time,
+    ReferencePoint const reference_point,
+    ErrorStatus*         error_status)
+{
+    if (!_check_open(error_status))
+        return;
+    _save_source_range(item);
+    algo::fill(item, _track, track_time, reference_point, error_status);
+}
+
+void
+EditTransaction::remove(
+    RationalTime const& time,
+    bool const          fill,
+    Item*               fill_template,
+    ErrorStatus*        error_status)
+{
+    if (!_check_open(error_status))
+        return;
+    _save_source_range(fill_template);
+    algo::remove(_track, time, fill, fill_template, error_status);
+}
+
+void
+EditTransaction::commit()
+{
+    _close();
+}
+
+void
+EditTransaction::rollback()
+{
+    if (!_open)
+        return;
+
+    auto children      = std::move(_children);
+    auto source_ranges = std::move(_source_ranges);
+    _close();
+
+    // restore in reverse, so that the range an item had first wins
+    for (auto it = source_ranges.rbegin(); it != source_ranges.rend(); ++it)
+    {
+        it->first->set_source_range(it->second);
+    }
+
+    _track->clear_children();
+    std::vector<Composable*> restored;
+    for (auto const& child : children)
+    {
+        // children removed by the transaction and then added elsewhere stay
+        // where they are
+        if (!child->parent())
+        {
+            restored.push_back(child);
+        }
+    }
+    _track->set_children(restored);
+}
+
+bool
+EditTransaction::_check_open(ErrorStatus* error_status) const
+{
+    if (!_open)
+    {
+        if (error_status)
+            *error_status = ErrorStatus(
+                ErrorStatus::INTERNAL_ERROR,
+                "the edit transaction has been committed or rolled back");
+        return false;
+    }
+    return true;
+}
+
+bool
+EditTransaction::_check_child(Item* item, ErrorStatus* error_status) const
+{
+    if (item->parent() != _track)
+    {
+        if (error_status)
+        {
+            *error_status                = ErrorStatus::NOT_A_CHILD_OF;
+            error_status->object_details = item;
+        }
+        return false;
+    }
+    return true;
+}
+
+void
+EditTransaction::_save_source_range(Item* item)
+{
+    if (item)
+    {
+        _source_ranges.emplace_back(item, item->source_range());
+    }
+}
+
+void
+EditTransaction::_close()
+{
+    if (_owns_index)
+    {
+        _track->_range_index.reset();
+        _owns_index = false;
+    }
+    _open = false;
+    _children.clear();
+    _source_ranges.clear();
+}
+
 }}} // namespace opentimelineio::OPENTIMELINEIO_VERSION::algo
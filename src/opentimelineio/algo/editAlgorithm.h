@@ -4,6 +4,11 @@
 #pragma once
 
 #include "opentimelineio/composition.h"
+#include "opentimelineio/track.h"
+
+#include <optional>
+#include <utility>
+#include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION { namespace algo {
 
@@ -214,4 +219,128 @@ void remove(
     Item*               fill_template = nullptr,
     ErrorStatus*        error_status = nullptr);
 
+//
+// Apply a sequence of edits to a track as one transaction.
+//
+// Each of the functions above looks up the ranges of the track's children
+// from scratch, so applying a long list of edits to a long track, such as
+// a conform change list, spends most of its time computing the same ranges
+// over and over again.  While a transaction is open, the track keeps an
+// index of the ranges of its children, which each edit only updates from
+// the first child it changes.  The edits have the same effect as calling
+// the functions in order.
+//
+//   EditTransaction transaction(track);
+//   transaction.overwrite(clip, range, true, nullptr, &error_status);
+//   transaction.remove(time, true, nullptr, &error_status);
+//   transaction.commit();
+//
+// The edits are applied to the track as they are made.  commit() keeps
+// them, and rollback(), or destroying a transaction that has not been
+// committed, restores the children of the track and their source ranges.
+//
+// While the transaction is open, change the track and its children only
+// through the transaction, or with set_source_range(); the index does not
+// see other changes to the durations of the children, such as to the
+// offsets of transitions or the available ranges of media references.
+//
+class EditTransaction
+{
+public:
+    explicit EditTransaction(Track* track);
+    ~EditTransaction();
+
+    EditTransaction(EditTransaction const&)            = delete;
+    EditTransaction& operator=(EditTransaction const&) = delete;
+
+    Track* track() const noexcept { return _track; }
+
+    // Whether the transaction has not been committed or rolled back yet.
+    bool is_open() const noexcept { return _open; }
+
+    // The edits, see the functions of the same names above.  item must be
+    // a child of the track for the edits of an item.
+    void overwrite(
+        Item*            item,
+        TimeRange const& range,
+        bool             remove_transitions = true,
+        Item*            fill_template      = nullptr,
+        ErrorStatus*     error_status       = nullptr);
+
+    void insert(
+        Item*               item,
+        RationalTime const& time,
+        bool                remove_transitions = true,
+        Item*               fill_template      = nullptr,
+        ErrorStatus*        error_status       = nullptr);
+
+    void trim(
+        Item*               item,
+        RationalTime const& delta_in,
+        RationalTime const& delta_out,
+        Item*               fill_template = nullptr,
+        ErrorStatus*        error_status  = nullptr);
+
+    void slice(
+        RationalTime const& time,
+        bool                remove_transitions = true,
+        ErrorStatus*        error_status       = nullptr);
+
+    void slip(
+        Item*               item,
+        RationalTime const& delta,
+        ErrorStatus*        error_status = nullptr);
+
+    void slide(
+        Item*               item,
+        RationalTime const& delta,
+        ErrorStatus*        error_status = nullptr);
+
+    void ripple(
+        Item*               item,
+        RationalTime const& delta_in,
+        RationalTime const& delta_out,
+        ErrorStatus*        error_status = nullptr);
+
+    void roll(
+        Item*               item,
+        RationalTime const& delta_in,
+        RationalTime const& delta_out,
+        ErrorStatus*        error_status = nullptr);
+
+    void fill(
+        Item*                item,
+        RationalTime const&  track_time,
+        ReferencePoint const reference_point = ReferencePoint::Source,
+        ErrorStatus*         error_status    = nullptr);
+
+    void remove(
+        RationalTime const& time,
+        bool const          fill          = true,
+        Item*               fill_template = nullptr,
+        ErrorStatus*        error_status  = nullptr);
+
+    // Keep the edits and close the transaction.
+    void commit();
+
+    // Undo the edits and close the transaction.
+    void rollback();
+
+private:
+    bool _check_open(ErrorStatus* error_status) const;
+    bool _check_child(Item* item, ErrorStatus* error_status) const;
+    void _save_source_range(Item* item);
+    void _close();
+
+    SerializableObject::Retainer<Track> _track;
+    bool                                _open       = true;
+    bool                                _owns_index = false;
+
+    // The state to restore on rollback.
+    std::vector<SerializableObject::Retainer<Composable>> _children;
+    std::vector<
+        std::pair<SerializableObject::Retainer<Item>, std::optional<TimeRange>>>
+        _source_ranges;
+};
+
 }}} // namespace opentimelineio::OPENTIMELINEIO_VERSION::algo
@@ -5,44 +5,204 @@
 
 #include "opentimelineio/version.h"
 
+#include <algorithm>
 #include <any>
 #include <assert.h>
-#include <map>
+#include <cstddef>
+#include <functional>
+#include <initializer_list>
+#include <iterator>
+#include <memory>
+#include <mutex>
+#include <new>
+#include <stdexcept>
 #include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 /// @brief This class provides a replacement for "std::map<std::string, std::any>".
 ///
-/// This class has exactly the same API as "std::map<std::string, std::any>",
-/// except that it records a "time-stamp" that bumps monotonically every time an
+/// This class has the same API as "std::map<std::string, std::any>", except
+/// that it records a "time-stamp" that bumps monotonically every time an
 /// operation that would invalidate iterators is performed (this happens for
-/// operator =, clear, erase, insert, and swap). The stamp also lets external
-/// observers know when the map has been destroyed (which includes the case of
-/// the map being relocated in memory).
+/// operator =, clear, erase, swap, and any operation that inserts a new key).
+/// The stamp also lets external observers know when the map has been
+/// destroyed (which includes the case of the map being relocated in memory).
 ///
 /// This allows us to hand out iterators that can be aware of mutation and moves
 /// and take steps to safe-guard themselves from causing a crash.  (Yes, I'm
 /// talking to you, Python...)
-class AnyDictionary : private std::map<std::string, std::any>
+///
+/// Rather than a tree with a heap allocation per item, the items are stored
+/// in a few chunks of contiguous slots, and a vector of pointers to the items
+/// sorted by key is used for lookups and iteration.  Metadata dictionaries
+/// are small and read far more often than written, so a binary search over
+/// contiguous memory beats walking tree nodes.  As with std::map, iteration
+/// is in key order and items never move, so references to items stay valid
+/// until the item is erased.  Unlike std::map, inserting a new key
+/// invalidates iterators, which is why it bumps the stamp.  Inserting a key
+/// in the middle shifts the pointers after it, so build large dictionaries
+/// from unsorted data with the range constructor or the range insert, which
+/// sort once.
+///
+/// A dictionary read from JSON with lazy metadata decoding enabled starts out
+/// holding only the JSON text of the object.  The text is decoded the first
+/// time the items are accessed, and is written back verbatim when the
+/// dictionary is serialized, unless it has been accessed through a non-const
+/// reference since (see raw_json()).
+class AnyDictionary
 {
 public:
-    using map::map;
+    using key_type        = std::string;
+    using mapped_type     = std::any;
+    using value_type      = std::pair<const std::string, std::any>;
+    using key_compare     = std::less<std::string>;
+    using allocator_type  = std::allocator<value_type>;
+    using size_type       = std::size_t;
+    using difference_type = std::ptrdiff_t;
+    using reference       = value_type&;
+    using const_reference = value_type const&;
+    using pointer         = value_type*;
+    using const_pointer   = value_type const*;
+
+private:
+    using index_type = std::vector<value_type*>;
+
+public:
+    /// @brief Iterator over the items, in key order.
+    template <bool is_const>
+    class Iterator
+    {
+    public:
+        using iterator_category = std::bidirectional_iterator_tag;
+        using value_type        = AnyDictionary::value_type;
+        using difference_type   = std::ptrdiff_t;
+        using pointer =
+            std::conditional_t<is_const, value_type const*, value_type*>;
+        using reference =
+            std::conditional_t<is_const, value_type const&, value_type&>;
+
+        Iterator() = default;
+
+        template <bool c = is_const, typename = std::enable_if_t<c>>
+        Iterator(Iterator<false> const& other)
+            : _it(other._it)
+        {}
+
+        reference operator*() const { return **_it; }
+        pointer   operator->() const { return *_it; }
+
+        Iterator& operator++()
+        {
+            ++_it;
+            return *this;
+        }
+
+        Iterator operator++(int)
+        {
+            Iterator result = *this;
+            ++_it;
+            return result;
+        }
+
+        Iterator& operator--()
+        {
+            --_it;
+            return *this;
+        }
+
+        Iterator operator--(int)
+        {
+            Iterator result = *this;
+            --_it;
+            return result;
+        }
+
+        friend bool operator==(Iterator const& lhs, Iterator const& rhs)
+        {
+            return lhs._it == rhs._it;
+        }
+
+        friend bool operator!=(Iterator const& lhs, Iterator const& rhs)
+        {
+            return lhs._it != rhs._it;
+        }
+
+    private:
+        friend class AnyDictionary;
+        friend class Iterator<!is_const>;
+
+        explicit Iterator(index_type::const_iterator it)
+            : _it(it)
+        {}
+
+        index_type::const_iterator _it;
+    };
+
+    using iterator               = Iterator<false>;
+    using const_iterator         = Iterator<true>;
+    using reverse_iterator       = std::reverse_iterator<iterator>;
+    using const_reverse_iterator = std::reverse_iterator<const_iterator>;
+
+    /// @brief Compares items by key.
+    struct value_compare
+    {
+        bool operator()(value_type const& lhs, value_type const& rhs) const
+        {
+            return lhs.first < rhs.first;
+        }
+    };
 
     /// @brief Create an empty dictionary.
     AnyDictionary()
-        : map{}
-        , _mutation_stamp{}
+        : _mutation_stamp{}
     {}
 
+    /// @brief Create a dictionary from a list of items.
+    ///
+    /// If a key appears more than once, the first item with that key is kept.
+    AnyDictionary(std::initializer_list<value_type> ilist)
+        : AnyDictionary()
+    {
+        insert(ilist.begin(), ilist.end());
+    }
+
+    /// @brief Create a dictionary from a range of items.
+    ///
+    /// If a key appears more than once, the first item with that key is kept.
+    template <typename InputIt>
+    AnyDictionary(InputIt first, InputIt last)
+        : AnyDictionary()
+    {
+        insert(first, last);
+    }
+
     /// @brief Create a copy of a dictionary.
     ///
     /// To be safe, avoid brace-initialization so as to not trigger
     /// list initialization behavior in older compilers:
     AnyDictionary(const AnyDictionary& other)
-        : map(other)
-        , _mutation_stamp{}
-    {}
+        : _mutation_stamp{}
+    {
+        _copy_items(other);
+    }
+
+    /// @brief Move a dictionary, leaving the other one empty.
+    ///
+    /// This is deliberately not noexcept: std::any only stores values that
+    /// are nothrow move constructible inline, and dictionaries stored in an
+    /// std::any must stay on the heap so that their address, which is handed
+    /// out through MutationStamp, does not change when the std::any moves.
+    AnyDictionary(AnyDictionary&& other)
+        : _mutation_stamp{}
+    {
+        other.mutate();
+        _steal_items(other);
+        _lazy = std::move(other._lazy);
+    }
 
     /// @brief Destructor.
     ~AnyDictionary()
@@ -52,13 +212,18 @@ public:
             _mutation_stamp->stamp          = -1;
             _mutation_stamp->any_dictionary = nullptr;
         }
+        _destroy_items();
     }
 
     /// @brief Copy operator.
     AnyDictionary& operator=(const AnyDictionary& other)
     {
         mutate();
-        map::operator=(other);
+        if (this != &other)
+        {
+            _destroy_items();
+            _copy_items(other);
+        }
         return *this;
     }
 
@@ -67,7 +232,12 @@ public:
     {
         mutate();
         other.mutate();
-        map::operator=(other);
+        if (this != &other)
+        {
+            _destroy_items();
+            _steal_items(other);
+            _lazy = std::move(other._lazy);
+        }
         return *this;
     }
 
@@ -75,53 +245,229 @@ public:
     AnyDictionary& operator=(std::initializer_list<value_type> ilist)
     {
         mutate();
-        map::operator=(ilist);
+        _destroy_items();
+        insert(ilist.begin(), ilist.end());
         return *this;
     }
 
-    using map::get_allocator;
+    allocator_type get_allocator() const noexcept { return allocator_type(); }
+
+    /// @brief Return the JSON text the dictionary was read from.
+    ///
+    /// This is only set for dictionaries read with lazy metadata decoding
+    /// that have not been accessed through a non-const reference since, as
+    /// any such access may have modified the items.  Otherwise return null.
+    std::string const* raw_json() const noexcept
+    {
+        return _lazy ? &_lazy->json : nullptr;
+    }
+
+    /// @brief Return the value for the given key, throwing std::out_of_range
+    /// if the key is not set.
+    std::any& at(const key_type& key)
+    {
+        auto it = find(key);
+        if (it == end())
+        {
+            throw std::out_of_range("AnyDictionary::at");
+        }
+        return it->second;
+    }
+
+    /// @brief Return the value for the given key, throwing std::out_of_range
+    /// if the key is not set.
+    std::any const& at(const key_type& key) const
+    {
+        auto it = find(key);
+        if (it == end())
+        {
+            throw std::out_of_range("AnyDictionary::at");
+        }
+        return it->second;
+    }
+
+    /// @brief Return the value for the given key, inserting an empty value
+    /// if the key is not set.
+    std::any& operator[](const key_type& key)
+    {
+        _write();
+        auto pos = _lower_bound(key);
+        if (pos == _index.end() || (*pos)->first != key)
+        {
+            pos = _insert_at(pos, key, std::any());
+        }
+        return (*pos)->second;
+    }
 
-    using map::at;
-    using map::operator[];
+    /// @brief Return the value for the given key, inserting an empty value
+    /// if the key is not set.
+    std::any& operator[](key_type&& key)
+    {
+        _write();
+        auto pos = _lower_bound(key);
+        if (pos == _index.end() || (*pos)->first != key)
+        {
+            pos = _insert_at(pos, std::move(key), std::any());
+        }
+        return (*pos)->second;
+    }
 
-    using map::begin;
-    using map::cbegin;
-    using map::cend;
-    using map::crbegin;
-    using map::crend;
-    using map::end;
-    using map::rbegin;
-    using map::rend;
+    iterator begin()
+    {
+        _write();
+        return iterator(_index.cbegin());
+    }
+    const_iterator begin() const
+    {
+        _read();
+        return const_iterator(_index.cbegin());
+    }
+    const_iterator cbegin() const { return begin(); }
+    iterator       end()
+    {
+        _write();
+        return iterator(_index.cend());
+    }
+    const_iterator end() const
+    {
+        _read();
+        return const_iterator(_index.cend());
+    }
+    const_iterator         cend() const { return end(); }
+    reverse_iterator       rbegin() { return reverse_iterator(end()); }
+    const_reverse_iterator rbegin() const
+    {
+        return const_reverse_iterator(end());
+    }
+    const_reverse_iterator crbegin() const { return rbegin(); }
+    reverse_iterator       rend() { return reverse_iterator(begin()); }
+    const_reverse_iterator rend() const
+    {
+        return const_reverse_iterator(begin());
+    }
+    const_reverse_iterator crend() const { return rend(); }
 
     /// @brief Clear the dictionary.
     void clear() noexcept
     {
         mutate();
-        map::clear();
+        _destroy_items();
+    }
+
+    /// @brief Insert an item constructed from args, unless its key is
+    /// already set.
+    template <typename... Args>
+    std::pair<iterator, bool> emplace(Args&&... args)
+    {
+        _write();
+        value_type* item = _construct(std::forward<Args>(args)...);
+        auto        pos  = _lower_bound(item->first);
+        if (pos != _index.end() && (*pos)->first == item->first)
+        {
+            _destroy(item);
+            return { iterator(pos), false };
+        }
+        mutate();
+        return { iterator(_index.insert(pos, item)), true };
+    }
+
+    /// @brief Insert an item constructed from args, unless its key is
+    /// already set.  The hint is ignored.
+    template <typename... Args>
+    iterator emplace_hint(const_iterator /* hint */, Args&&... args)
+    {
+        return emplace(std::forward<Args>(args)...).first;
+    }
+
+    /// @brief Insert an item, unless its key is already set.
+    std::pair<iterator, bool> insert(const value_type& value)
+    {
+        return _insert_unique(value.first, value.second);
+    }
+
+    /// @brief Insert an item, unless its key is already set.
+    std::pair<iterator, bool> insert(value_type&& value)
+    {
+        return _insert_unique(value.first, std::move(value.second));
+    }
+
+    /// @brief Insert an item, unless its key is already set.  The hint is
+    /// ignored.
+    iterator insert(const_iterator /* hint */, const value_type& value)
+    {
+        return insert(value).first;
+    }
+
+    /// @brief Insert an item, unless its key is already set.  The hint is
+    /// ignored.
+    iterator insert(const_iterator /* hint */, value_type&& value)
+    {
+        return insert(std::move(value)).first;
+    }
+
+    /// @brief Insert a range of items, skipping keys that are already set.
+    ///
+    /// The items are appended and sorted once, so this is the efficient way
+    /// to add many items in no particular order.  If a key appears more than
+    /// once in the range, the first item with that key is kept.
+    template <typename InputIt>
+    void insert(InputIt first, InputIt last)
+    {
+        _write();
+        size_type const old_size = _index.size();
+        try
+        {
+            for (; first != last; ++first)
+            {
+                _index.push_back(_construct(*first));
+            }
+        }
+        catch (...)
+        {
+            _merge_appended(old_size);
+            throw;
+        }
+        _merge_appended(old_size);
+    }
+
+    /// @brief Insert a list of items, skipping keys that are already set.
+    void insert(std::initializer_list<value_type> ilist)
+    {
+        insert(ilist.begin(), ilist.end());
     }
-    using map::emplace;
-    using map::emplace_hint;
-    using map::insert;
 
     /// @brief Erase an item.
     iterator erase(const_iterator pos)
     {
+        _write();
         mutate();
-        return map::erase(pos);
+        _destroy(*pos._it);
+        return iterator(_index.erase(pos._it));
     }
 
     /// @brief Erase a range of items.
     iterator erase(const_iterator first, const_iterator last)
     {
+        _write();
         mutate();
-        return map::erase(first, last);
+        for (auto it = first._it; it != last._it; ++it)
+        {
+            _destroy(*it);
+        }
+        return iterator(_index.erase(first._it, last._it));
     }
 
     /// @brief Erase an item with the given key.
     size_type erase(const key_type& key)
     {
         mutate();
-        return map::erase(key);
+        auto it = find(key);
+        if (it == end())
+        {
+            return 0;
+        }
+        erase(it);
+        return 1;
     }
 
     /// @brief Swap dictionaries.
@@ -129,7 +475,23 @@ public:
     {
         mutate();
         other.mutate();
-        map::swap(other);
+        _index.swap(other._index);
+        _chunks.swap(other._chunks);
+        _free.swap(other._free);
+        std::swap(_chunk_capacity, other._chunk_capacity);
+        std::swap(_chunk_used, other._chunk_used);
+        _lazy.swap(other._lazy);
+    }
+
+    /// @brief Reserve storage for the given number of items.
+    void reserve(size_type n)
+    {
+        _write();
+        _index.reserve(n);
+        if (n > _index.size())
+        {
+            _reserve_slots(n - _index.size());
+        }
     }
 
     /// @brief Return whether the given key has been set.
@@ -194,34 +556,74 @@ public:
         }
     }
 
-    using map::empty;
-    using map::max_size;
-    using map::size;
-
-    using map::count;
-    using map::equal_range;
-    using map::find;
-    using map::lower_bound;
-    using map::upper_bound;
-
-    using map::key_comp;
-    using map::value_comp;
-
-    using map::allocator_type;
-    using map::const_iterator;
-    using map::const_pointer;
-    using map::const_reference;
-    using map::const_reverse_iterator;
-    using map::difference_type;
-    using map::iterator;
-    using map::key_compare;
-    using map::key_type;
-    using map::mapped_type;
-    using map::pointer;
-    using map::reference;
-    using map::reverse_iterator;
-    using map::size_type;
-    using map::value_type;
+    bool empty() const
+    {
+        _read();
+        return _index.empty();
+    }
+
+    size_type size() const
+    {
+        _read();
+        return _index.size();
+    }
+
+    size_type max_size() const noexcept { return _index.max_size(); }
+
+    size_type count(const key_type& key) const
+    {
+        return find(key) == end() ? 0 : 1;
+    }
+
+    iterator find(const key_type& key)
+    {
+        _write();
+        return iterator(_find(key));
+    }
+
+    const_iterator find(const key_type& key) const
+    {
+        _read();
+        return const_iterator(_find(key));
+    }
+
+    iterator lower_bound(const key_type& key)
+    {
+        _write();
+        return iterator(_lower_bound(key));
+    }
+
+    const_iterator lower_bound(const key_type& key) const
+    {
+        _read();
+        return const_iterator(_lower_bound(key));
+    }
+
+    iterator upper_bound(const key_type& key)
+    {
+        _write();
+        return iterator(_upper_bound(key));
+    }
+
+    const_iterator upper_bound(const key_type& key) const
+    {
+        _read();
+        return const_iterator(_upper_bound(key));
+    }
+
+    std::pair<iterator, iterator> equal_range(const key_type& key)
+    {
+        return { lower_bound(key), upper_bound(key) };
+    }
+
+    std::pair<const_iterator, const_iterator>
+    equal_range(const key_type& key) const
+    {
+        return { lower_bound(key), upper_bound(key) };
+    }
+
+    key_compare   key_comp() const { return key_compare(); }
+    value_compare value_comp() const { return value_compare(); }
 
     /// @brief This struct provides a mutation time stamp.
     struct MutationStamp
@@ -278,8 +680,80 @@ public:
     friend struct MutationStamp;
 
 private:
+    friend class JSONDecoder;
+
+    // Uninitialized storage for one item.
+    struct _Slot
+    {
+        alignas(value_type) unsigned char bytes[sizeof(value_type)];
+    };
+
+    // The items, sorted by key.
+    index_type _index;
+
+    // The storage for the items.  Chunks grow with the number of items, only
+    // the last one has slots that were never used, and the slots of erased
+    // items are kept in _free for reuse.
+    std::vector<std::unique_ptr<_Slot[]>> _chunks;
+    std::vector<_Slot*>                   _free;
+    size_type                             _chunk_capacity = 0;
+    size_type                             _chunk_used     = 0;
+
     MutationStamp* _mutation_stamp = nullptr;
 
+    // The JSON text of a lazily decoded dictionary.
+    struct _LazyJSON
+    {
+        explicit _LazyJSON(std::string text)
+            : json(std::move(text))
+        {}
+
+        std::string    json;
+        std::once_flag decoded;
+    };
+
+    std::unique_ptr<_LazyJSON> _lazy;
+
+    static constexpr size_type _min_chunk_capacity = 4;
+
+    // Make this a dictionary that decodes the given JSON object on first
+    // access.  The JSON must not contain schema objects.
+    void _set_raw_json(std::string&& json)
+    {
+        mutate();
+        _destroy_items();
+        _lazy.reset(new _LazyJSON(std::move(json)));
+    }
+
+    // Decode a JSON object holding no schema objects into result, which is
+    // empty.  This is defined with the JSON reader, in deserialization.cpp.
+    static void _decode_json(std::string const& json, AnyDictionary* result);
+
+    // Decode the JSON text, if that has not been done yet, before reading the
+    // items.  Concurrent reads are safe, as they are for std::map.
+    void _read() const
+    {
+        if (_lazy)
+        {
+            std::call_once(_lazy->decoded, [this] {
+                AnyDictionary decoded;
+                _decode_json(_lazy->json, &decoded);
+                const_cast<AnyDictionary*>(this)->_steal_items(decoded);
+            });
+        }
+    }
+
+    // Decode the JSON text before handing out access that may modify the
+    // items, after which the text is out of date.
+    void _write()
+    {
+        if (_lazy)
+        {
+            _read();
+            _lazy.reset();
+        }
+    }
+
     void mutate() noexcept
     {
         if (_mutation_stamp)
@@ -287,6 +761,225 @@ private:
             _mutation_stamp->stamp++;
         }
     }
+
+    // Make sure that n items can be constructed without allocating.
+    void _reserve_slots(size_type n)
+    {
+        size_type const available =
+            _free.size() + (_chunk_capacity - _chunk_used);
+        if (available >= n)
+        {
+            return;
+        }
+
+        // hand the unused tail of the current chunk to the free list, so
+        // that only the last chunk is partially used
+        for (; _chunk_used < _chunk_capacity; ++_chunk_used)
+        {
+            _free.push_back(&_chunks.back()[_chunk_used]);
+        }
+
+        size_type const capacity =
+            std::max({ n - available, _index.size(), _min_chunk_capacity });
+        _chunks.emplace_back(new _Slot[capacity]);
+        _chunk_capacity = capacity;
+        _chunk_used     = 0;
+    }
+
+    template <typename... Args>
+    value_type* _construct(Args&&... args)
+    {
+        _reserve_slots(1);
+
+        _Slot* slot;
+        if (!_free.empty())
+        {
+            slot = _free.back();
+            _free.pop_back();
+        }
+        else
+        {
+            slot = &_chunks.back()[_chunk_used++];
+        }
+
+        try
+        {
+            return new (static_cast<void*>(slot->bytes))
+                value_type(std::forward<Args>(args)...);
+        }
+        catch (...)
+        {
+            _free.push_back(slot);
+            throw;
+        }
+    }
+
+    void _destroy(value_type* item) noexcept
+    {
+        item->~value_type();
+        _free.push_back(reinterpret_cast<_Slot*>(item));
+    }
+
+    void _destroy_items() noexcept
+    {
+        _lazy.reset();
+        for (value_type* item: _index)
+        {
+            item->~value_type();
+        }
+        _index.clear();
+        _chunks.clear();
+        _free.clear();
+        _chunk_capacity = 0;
+        _chunk_used     = 0;
+    }
+
+    void _copy_items(AnyDictionary const& other)
+    {
+        // a copy of an unmodified lazy dictionary decodes on its own
+        if (other._lazy)
+        {
+            _lazy.reset(new _LazyJSON(other._lazy->json));
+            return;
+        }
+
+        _index.reserve(other._index.size());
+        _reserve_slots(other._index.size());
+        for (value_type const* item: other._index)
+        {
+            _index.push_back(_construct(*item));
+        }
+    }
+
+    void _steal_items(AnyDictionary& other) noexcept
+    {
+        _index          = std::move(other._index);
+        _chunks         = std::move(other._chunks);
+        _free           = std::move(other._free);
+        _chunk_capacity = other._chunk_capacity;
+        _chunk_used     = other._chunk_used;
+
+        other._index.clear();
+        other._chunks.clear();
+        other._free.clear();
+        other._chunk_capacity = 0;
+        other._chunk_used     = 0;
+    }
+
+    static bool _item_less(value_type const* lhs, value_type const* rhs)
+    {
+        return lhs->first < rhs->first;
+    }
+
+    // Keys are mostly inserted in order (by the JSON reader and when
+    // copying), so check for appending before searching.
+    index_type::const_iterator _lower_bound(const key_type& key) const
+    {
+        if (_index.empty() || _index.back()->first < key)
+        {
+            return _index.cend();
+        }
+        return std::lower_bound(
+            _index.cbegin(),
+            _index.cend(),
+            key,
+            [](value_type const* item, key_type const& k) {
+                return item->first < k;
+            });
+    }
+
+    // A binary search that stops as soon as it finds the key, comparing each
+    // key once.
+    index_type::const_iterator _find(const key_type& key) const
+    {
+        size_type lo = 0;
+        size_type hi = _index.size();
+        while (lo < hi)
+        {
+            size_type const mid = lo + (hi - lo) / 2;
+            int const       c   = _index[mid]->first.compare(key);
+            if (c < 0)
+            {
+                lo = mid + 1;
+            }
+            else if (c > 0)
+            {
+                hi = mid;
+            }
+            else
+            {
+                return _index.cbegin() + difference_type(mid);
+            }
+        }
+        return _index.cend();
+    }
+
+    index_type::const_iterator _upper_bound(const key_type& key) const
+    {
+        auto pos = _lower_bound(key);
+        return (pos != _index.cend() && (*pos)->first == key) ? pos + 1 : pos;
+    }
+
+    template <typename Key>
+    index_type::const_iterator
+    _insert_at(index_type::const_iterator pos, Key&& key, std::any&& value)
+    {
+        value_type* item = _construct(std::forward<Key>(key), std::move(value));
+        mutate();
+        return _index.insert(pos, item);
+    }
+
+    template <typename Value>
+    std::pair<iterator, bool> _insert_unique(key_type const& key, Value&& value)
+    {
+        _write();
+        auto pos = _lower_bound(key);
+        if (pos != _index.end() && (*pos)->first == key)
+        {
+            return { iterator(pos), false };
+        }
+        return {
+            iterator(
+                _insert_at(pos, key, std::any(std::forward<Value>(value)))),
+            true
+        };
+    }
+
+    // Sort the items from old_size on into the items before them, keeping
+    // the first item for each key.
+    void _merge_appended(size_type old_size)
+    {
+        if (_index.size() == old_size)
+        {
+            return;
+        }
+        mutate();
+
+        auto const first = _index.begin();
+        auto const mid   = first + difference_type(old_size);
+        if (!std::is_sorted(mid, _index.end(), _item_less))
+        {
+            std::stable_sort(mid, _index.end(), _item_less);
+        }
+        if (old_size > 0 && !_item_less(*(mid - 1), *mid))
+        {
+            std::inplace_merge(first, mid, _index.end(), _item_less);
+        }
+
+        auto out = first;
+        for (auto it = first; it != _index.end(); ++it)
+        {
+            if (out != first && (*(out - 1))->first == (*it)->first)
+            {
+                _destroy(*it);
+            }
+            else
+            {
+                *out++ = *it;
+            }
+        }
+        _index.erase(out, _index.end());
+    }
 };
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
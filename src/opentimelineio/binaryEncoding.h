@@ -0,0 +1,94 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/version.h"
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @name Binary Encoding
+///
+/// The encoding written by serialize_binary_to_string() is the magic bytes
+/// followed by one value, where each value is a tag byte and its data:
+///
+/// - null, false and true have no data
+/// - int64 and double are 8 little endian bytes
+/// - a string is its length, as a varint, and its bytes; new_string also
+///   appends the string to a table, and string_ref is the index of a string
+///   in that table, as a varint
+/// - an object is the keys and values of its items, each key written as a
+///   string, up to an object_end tag; an array is its values up to an
+///   array_end tag
+/// - rational_time, time_range and time_transform are their numbers, as
+///   doubles: value and rate; start time value, rate, duration value and
+///   rate; offset value, rate, scale and rate
+/// - float64_array and int64_array are the number of elements, as a varint,
+///   and their little endian bytes
+///
+/// Schema objects are written as objects, the same as in JSON.
+///@{
+
+namespace binary_encoding {
+
+constexpr char   magic[]           = { 'O', 'T', 'I', 'O', 'B', 'I', 'N', '1' };
+constexpr size_t magic_size        = sizeof(magic);
+constexpr size_t max_shared_string = 64; ///< Longer strings are not tabled.
+
+enum Tag : uint8_t
+{
+    null = 0,
+    false_value,
+    true_value,
+    int64,
+    double_value,
+    string,
+    new_string,
+    string_ref,
+    object_begin,
+    object_end,
+    array_begin,
+    array_end,
+    rational_time,
+    time_range,
+    time_transform,
+    float64_array,
+    int64_array,
+};
+
+inline bool
+is_little_endian()
+{
+    uint16_t const one = 1;
+    return *reinterpret_cast<uint8_t const*>(&one) == 1;
+}
+
+/// Copy count 8 byte numbers between little endian bytes and memory.
+inline void
+copy_little_endian(void* destination, void const* source, size_t count)
+{
+    std::memcpy(destination, source, count * 8);
+    if (!is_little_endian())
+    {
+        auto bytes = static_cast<uint8_t*>(destination);
+        for (size_t i = 0; i < count * 8; i += 8)
+        {
+            for (size_t j = 0; j < 4; ++j)
+            {
+                uint8_t const b  = bytes[i + j];
+                bytes[i + j]     = bytes[i + 7 - j];
+                bytes[i + 7 - j] = b;
+            }
+        }
+    }
+}
+
+} // namespace binary_encoding
+
+///@}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
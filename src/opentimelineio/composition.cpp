@@ -3,13 +3,46 @@
 
 #include "opentimelineio/composition.h"
 #include "opentimelineio/clip.h"
+#include "opentimelineio/editJournal.h"
+#include "opentimelineio/transition.h"
 #include "opentimelineio/vectorIndexing.h"
 
+#include <algorithm>
 #include <assert.h>
 #include <set>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
+namespace {
+
+// Return the first index between lower and upper for which go_right is
+// false, assuming it is true for the indices before that and false after,
+// probing the same indices as Composition::_bisect_left() and _bisect_right().
+template <typename GoRight>
+size_t
+_bisect_indices(size_t lower, size_t upper, GoRight const& go_right)
+{
+    while (lower < upper)
+    {
+        size_t const midpoint = lower + (upper - lower) / 2;
+        if (go_right(midpoint))
+        {
+            lower = midpoint + 1;
+        }
+        else
+        {
+            upper = midpoint;
+        }
+    }
+    return lower;
+}
+
+// The composition whose children Composition::_clone_without_children()
+// leaves out.
+thread_local Composition const* _cloning_without_children = nullptr;
+
+} // namespace
+
 Composition::Composition(
     std::string const&              name,
     std::optional<TimeRange> const& source_range,
@@ -22,7 +55,11 @@ Composition::Composition(
 
 Composition::~Composition()
 {
-    clear_children();
+    // not clear_children(), which would record the change while recording
+    for (Composable* child: _children)
+    {
+        child->_set_parent(nullptr);
+    }
 }
 
 std::string
@@ -32,9 +69,57 @@ Composition::composition_kind() const
     return kind;
 }
 
+bool
+Composition::materialize(ErrorStatus* error_status)
+{
+    if (is_materialized())
+    {
+        return true;
+    }
+
+    std::vector<Retainer<Composable>> children;
+    if (!_read_lazy_children(&children, error_status))
+    {
+        return false;
+    }
+
+    for (Composable* child: children)
+    {
+        child->_set_parent(this);
+    }
+
+    _children  = std::move(children);
+    _child_set = std::set<Composable*>(_children.begin(), _children.end());
+    _lazy_children_loaded = true;
+    _invalidate_ranges(0);
+    return true;
+}
+
+bool
+Composition::dematerialize()
+{
+    if (!_lazy_children)
+    {
+        return false;
+    }
+
+    for (Composable* child: _children)
+    {
+        child->_set_parent(nullptr);
+    }
+
+    _children.clear();
+    _child_set.clear();
+    _lazy_children_loaded = false;
+    _invalidate_ranges(0);
+    return true;
+}
+
 void
 Composition::clear_children()
 {
+    EditJournal::_record_set_children(this);
+    _drop_lazy_children();
     for (Composable* child: _children)
     {
         child->_set_parent(nullptr);
@@ -42,6 +127,7 @@ Composition::clear_children()
 
     _children.clear();
     _child_set.clear();
+    _invalidate_ranges(0);
 }
 
 bool
@@ -61,6 +147,10 @@ Composition::set_children(
         }
     }
 
+    // the old children are replaced, so they need not be read, unless they
+    // are being recorded
+    EditJournal::_record_set_children(this);
+    _drop_lazy_children();
     for (auto child: children)
     {
         child->_set_parent(this);
@@ -68,6 +158,7 @@ Composition::set_children(
 
     _children  = decltype(_children)(children.begin(), children.end());
     _child_set = std::set<Composable*>(children.begin(), children.end());
+    _invalidate_ranges(0);
     return true;
 }
 
@@ -86,25 +177,34 @@ Composition::insert_child(
         return false;
     }
 
+    _materialize_children();
+    _drop_lazy_children();
     child->_set_parent(this);
 
     index = adjusted_vector_index(index, _children);
     if (index >= int(_children.size()))
     {
+        _invalidate_ranges(_children.size());
         _children.emplace_back(child);
     }
     else
     {
-        _children.insert(_children.begin() + std::max(index, 0), child);
+        index = std::max(index, 0);
+        _invalidate_ranges(size_t(index));
+        _children.insert(_children.begin() + index, child);
     }
 
     _child_set.insert(child);
+    EditJournal::_record_insert_child(
+        this,
+        std::min(index, int(_children.size()) - 1));
     return true;
 }
 
 bool
 Composition::set_child(int index, Composable* child, ErrorStatus* error_status)
 {
+    _materialize_children();
     index = adjusted_vector_index(index, _children);
     if (index < 0 || index >= int(_children.size()))
     {
@@ -126,11 +226,14 @@ Composition::set_child(int index, Composable* child, ErrorStatus* error_status)
             return false;
         }
 
+        EditJournal::_record_set_child(this, index);
+        _drop_lazy_children();
         _children[index]->_set_parent(nullptr);
         _child_set.erase(_children[index]);
         child->_set_parent(this);
         _children[index] = child;
         _child_set.insert(child);
+        _invalidate_ranges(size_t(index));
     }
     return true;
 }
@@ -138,6 +241,7 @@ Composition::set_child(int index, Composable* child, ErrorStatus* error_status)
 bool
 Composition::remove_child(int index, ErrorStatus* error_status)
 {
+    _materialize_children();
     if (_children.empty())
     {
         if (error_status)
@@ -148,19 +252,25 @@ Composition::remove_child(int index, ErrorStatus* error_status)
     }
 
     index = adjusted_vector_index(index, _children);
+    EditJournal::_record_remove_child(
+        this,
+        std::min(std::max(index, 0), int(_children.size()) - 1));
 
+    _drop_lazy_children();
     _child_set.erase(_children[index]);
 
     if (size_t(index) >= _children.size())
     {
         _children.back()->_set_parent(nullptr);
         _children.pop_back();
+        _invalidate_ranges(_children.size());
     }
     else
     {
         index = std::max(index, 0);
         _children[index]->_set_parent(nullptr);
         _children.erase(_children.begin() + index);
+        _invalidate_ranges(size_t(index));
     }
 
     return true;
@@ -170,6 +280,7 @@ int
 Composition::index_of_child(Composable const* child, ErrorStatus* error_status)
     const
 {
+    _materialize_children();
     for (size_t i = 0; i < _children.size(); i++)
     {
         if (_children[i] == child)
@@ -207,9 +318,39 @@ void
 Composition::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
+
+    if (this == _cloning_without_children)
+    {
+        writer.write("children", std::vector<Retainer<Composable>>());
+        return;
+    }
+
+    // the children cannot be written if they cannot be read
+    ErrorStatus error_status;
+    if (!const_cast<Composition*>(this)->materialize(&error_status))
+    {
+        writer.error(error_status);
+        return;
+    }
     writer.write("children", _children);
 }
 
+SerializableObject*
+Composition::_clone_without_children(
+    SerializableObject const* object,
+    Composition const*        composition,
+    ErrorStatus*              error_status)
+{
+    struct Scope
+    {
+        Composition const* previous = _cloning_without_children;
+        ~Scope() { _cloning_without_children = previous; }
+    } scope;
+
+    _cloning_without_children = composition;
+    return object->clone(error_status);
+}
+
 bool
 Composition::is_parent_of(Composable const* other) const
 {
@@ -298,6 +439,100 @@ Composition::range_of_all_children(ErrorStatus* error_status) const
     return std::map<Composable*, TimeRange>();
 }
 
+std::optional<TimeRange>
+Composition::_indexed_range_of_child_at_index(int index) const
+{
+    if (!_range_index || index < 0 || !_index_ranges(size_t(index) + 1))
+    {
+        return std::nullopt;
+    }
+    return _range_index->ranges[index];
+}
+
+bool
+Composition::_index_ranges(size_t count) const
+{
+    if (!_range_index || count > _children.size())
+    {
+        return false;
+    }
+
+    _RangeIndex& index = *_range_index;
+    if (count <= index.valid)
+    {
+        return true;
+    }
+
+    index.ranges.resize(_children.size());
+    index.end_times.resize(_children.size());
+
+    // start as Track::range_of_all_children() does, from zero in the rate of
+    // the first child
+    RationalTime end_time;
+    if (index.valid > 0)
+    {
+        end_time = index.end_times[index.valid - 1];
+    }
+    else if (auto transition = dynamic_cast<Transition*>(_children[0].value))
+    {
+        end_time = RationalTime(0, transition->in_offset().rate());
+    }
+    else if (auto item = dynamic_cast<Item*>(_children[0].value))
+    {
+        ErrorStatus        error_status;
+        RationalTime const duration =
+            item->trimmed_range(&error_status).duration();
+        if (is_error(error_status))
+        {
+            return false;
+        }
+        end_time = RationalTime(0, duration.rate());
+    }
+    else
+    {
+        return false;
+    }
+
+    // Children in another rate are left to be computed as usual, because
+    // range_of_child_at_index() adds them up from the rate of the child
+    // itself, and so would not always agree with the index.
+    double const rate = end_time.rate();
+    for (size_t i = index.valid; i < count; ++i)
+    {
+        Composable* child = _children[i];
+        if (auto transition = dynamic_cast<Transition*>(child))
+        {
+            if (transition->in_offset().rate() != rate
+                || transition->out_offset().rate() != rate)
+            {
+                return false;
+            }
+            index.ranges[i] = TimeRange(
+                end_time - transition->in_offset(),
+                transition->out_offset() + transition->in_offset());
+        }
+        else if (auto item = dynamic_cast<Item*>(child))
+        {
+            ErrorStatus  error_status;
+            RationalTime duration =
+                item->trimmed_range(&error_status).duration();
+            if (is_error(error_status) || duration.rate() != rate)
+            {
+                return false;
+            }
+            index.ranges[i] = TimeRange(end_time, duration);
+            end_time        = index.ranges[i].end_time_exclusive();
+        }
+        else
+        {
+            return false;
+        }
+        index.end_times[i] = end_time;
+        index.valid        = i + 1;
+    }
+    return true;
+}
+
 // XXX should have reference_space argument or something
 TimeRange
 Composition::range_of_child(Composable const* child, ErrorStatus* error_status)
@@ -419,6 +654,7 @@ Composition::trimmed_range_of_child(
 std::vector<Composable*>
 Composition::_children_at_time(RationalTime t, ErrorStatus* error_status) const
 {
+    _materialize_children();
     std::vector<Composable*> result;
 
     // range_of_child_at_index is O(i), so this loop is quadratic:
@@ -471,6 +707,7 @@ Composition::trim_child_range(TimeRange child_range) const
 bool
 Composition::has_child(Composable* child) const
 {
+    _materialize_children();
     return _child_set.find(child) != _child_set.end();
 }
 
@@ -480,53 +717,82 @@ Composition::child_at_time(
     ErrorStatus*        error_status,
     bool                shallow_search) const
 {
+    _materialize_children();
     Retainer<Composable> result;
 
-    auto range_map = range_of_all_children(error_status);
-    if (is_error(error_status))
-    {
-        return result;
+    if (_index_ranges(_children.size()))
+    {
+        // the same search as below, on the indexed ranges
+        auto const&  ranges             = _range_index->ranges;
+        size_t const first_inside_range = _bisect_indices(
+            0,
+            _children.size(),
+            [&ranges, &search_time](size_t i) {
+                return ranges[i].end_time_exclusive() < search_time;
+            });
+        size_t const last_in_range = _bisect_indices(
+            first_inside_range,
+            _children.size(),
+            [&ranges, &search_time](size_t i) {
+                return !(search_time < ranges[i].start_time());
+            });
+        for (size_t i = first_inside_range; i < last_in_range; ++i)
+        {
+            if (ranges[i].overlaps(search_time))
+            {
+                result = _children[i];
+                break;
+            }
+        }
     }
-
-    // find the first item whose end_time_exclusive is after the
-    const auto first_inside_range = _bisect_left(
-        search_time,
-        [&range_map](Composable* child) {
-            return range_map[child].end_time_exclusive();
-        },
-        error_status);
-    if (is_error(error_status))
+    else
     {
-        return result;
-    }
+        auto range_map = range_of_all_children(error_status);
+        if (is_error(error_status))
+        {
+            return result;
+        }
 
-    // find the last item whose start_time is before the
-    const auto last_in_range = _bisect_right(
-        search_time,
-        [&range_map](Composable* child) {
-            return range_map[child].start_time();
-        },
-        error_status,
-        first_inside_range);
-    if (is_error(error_status))
-    {
-        return result;
-    }
+        // find the first item whose end_time_exclusive is after the
+        const auto first_inside_range = _bisect_left(
+            search_time,
+            [&range_map](Composable* child) {
+                return range_map[child].end_time_exclusive();
+            },
+            error_status);
+        if (is_error(error_status))
+        {
+            return result;
+        }
 
-    // limit the search to children who are in the search_range
-    std::vector<Retainer<Composable>> possible_matches;
-    for (auto child = _children.begin() + first_inside_range;
-         child < _children.begin() + last_in_range;
-         ++child)
-    {
-        possible_matches.push_back(child->value);
-    }
-    for (const auto& thing: possible_matches)
-    {
-        if (range_map[thing].overlaps(search_time))
+        // find the last item whose start_time is before the
+        const auto last_in_range = _bisect_right(
+            search_time,
+            [&range_map](Composable* child) {
+                return range_map[child].start_time();
+            },
+            error_status,
+            first_inside_range);
+        if (is_error(error_status))
         {
-            result = thing;
-            break;
+            return result;
+        }
+
+        // limit the search to children who are in the search_range
+        std::vector<Retainer<Composable>> possible_matches;
+        for (auto child = _children.begin() + first_inside_range;
+             child < _children.begin() + last_in_range;
+             ++child)
+        {
+            possible_matches.push_back(child->value);
+        }
+        for (const auto& thing: possible_matches)
+        {
+            if (range_map[thing].overlaps(search_time))
+            {
+                result = thing;
+                break;
+            }
         }
     }
 
@@ -563,8 +829,33 @@ Composition::children_in_range(
     TimeRange const& search_range,
     ErrorStatus*     error_status) const
 {
+    _materialize_children();
     std::vector<Retainer<Composable>> children;
 
+    if (_index_ranges(_children.size()))
+    {
+        // the same search as below, on the indexed ranges
+        auto const&  ranges             = _range_index->ranges;
+        size_t const first_inside_range = _bisect_indices(
+            0,
+            _children.size(),
+            [&ranges, &search_range](size_t i) {
+                return ranges[i].end_time_inclusive()
+                       < search_range.start_time();
+            });
+        size_t const last_in_range = _bisect_indices(
+            first_inside_range,
+            _children.size(),
+            [&ranges, &search_range](size_t i) {
+                return !(
+                    search_range.end_time_inclusive() < ranges[i].start_time());
+            });
+        children.assign(
+            _children.begin() + first_inside_range,
+            _children.begin() + last_in_range);
+        return children;
+    }
+
     auto range_map = range_of_all_children(error_status);
     if (is_error(error_status))
     {
@@ -5,15 +5,29 @@
 
 #include "opentimelineio/item.h"
 #include "opentimelineio/version.h"
+#include <memory>
 #include <set>
+#include <stdexcept>
+#include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 class Clip;
 
+namespace algo {
+class EditTransaction;
+}
+
 /// @brief Base class for an Item that contains Composables.
 ///
 /// Should be subclassed (for example by Track Stack), not used directly.
+///
+/// The tracks and stacks of a file read with deserialize_json_from_file() in
+/// lazy mode are read without their children, which are read from the file
+/// the first time they are accessed.  This is not thread safe, even for
+/// const access, so call materialize() first when sharing a composition
+/// between threads.  Accessing the children throws std::runtime_error if they
+/// cannot be read, rather than presenting the composition as empty.
 class Composition : public Item
 {
 public:
@@ -47,11 +61,36 @@ public:
     virtual std::string composition_kind() const;
 
     /// @brief Return the list of children.
-    std::vector<Retainer<Composable>> const& children() const noexcept
+    std::vector<Retainer<Composable>> const& children() const
     {
+        _materialize_children();
         return _children;
     }
 
+    /// @brief Return whether the children have been read.
+    ///
+    /// This is only false for compositions read lazily whose children have
+    /// not been accessed yet.
+    bool is_materialized() const noexcept
+    {
+        return !_lazy_children || _lazy_children_loaded;
+    }
+
+    /// @brief Read the children of a composition read lazily, if that has not
+    /// been done yet.
+    ///
+    /// Accessing the children reads them as well, but can only report errors
+    /// by throwing std::runtime_error.
+    bool materialize(ErrorStatus* error_status = nullptr);
+
+    /// @brief Drop the children of a composition read lazily, so that they
+    /// are read from the file again when they are next accessed.
+    ///
+    /// Changes made to the children since they were read are lost.  Return
+    /// false, keeping the children, if the composition was not read lazily
+    /// or if children have been set, inserted or removed since.
+    bool dematerialize();
+
     /// @brief Clear the children.
     void clear_children();
 
@@ -81,7 +120,7 @@ public:
     /// the child.
     bool append_child(Composable* child, ErrorStatus* error_status = nullptr)
     {
-        return insert_child(int(_children.size()), child, error_status);
+        return insert_child(int(children().size()), child, error_status);
     }
 
     /// @brief Return the index of the given child.
@@ -172,6 +211,14 @@ public:
         std::optional<TimeRange> const& search_range   = std::nullopt,
         bool                            shallow_search = false) const;
 
+    // Clone object, which is or contains composition, as clone() does but
+    // leaving out the children of composition, for the algorithms that give
+    // a copy of a composition other children.
+    static SerializableObject* _clone_without_children(
+        SerializableObject const* object,
+        Composition const*        composition,
+        ErrorStatus*              error_status = nullptr);
+
 protected:
     virtual ~Composition();
 
@@ -182,7 +229,87 @@ protected:
         Composable const* child,
         ErrorStatus*      error_status = nullptr) const;
 
+    // Return the range of the child at the given index from the range index
+    // of an open EditTransaction, or nullopt if there is none or the range
+    // has to be computed as usual.
+    std::optional<TimeRange> _indexed_range_of_child_at_index(int index) const;
+
 private:
+    friend class Item;
+    friend class JSONDecoder;
+    friend class algo::EditTransaction;
+
+    // The ranges of the children of a track, as range_of_all_children()
+    // returns them, kept while an EditTransaction is open on it so that
+    // every edit does not compute them all over again.  The ranges before
+    // valid are up to date, the others are computed again when needed.
+    struct _RangeIndex
+    {
+        std::vector<TimeRange>    ranges;
+        std::vector<RationalTime> end_times;
+        size_t                    valid = 0;
+    };
+
+    // Compute the indexed ranges of the first count children.  Returns false
+    // if there is no index, or if a child's range cannot be indexed because
+    // it is in a different rate than the first child or cannot be computed.
+    bool _index_ranges(size_t count) const;
+
+    void _invalidate_ranges(size_t index) const noexcept
+    {
+        if (_range_index && index < _range_index->valid)
+        {
+            _range_index->valid = index;
+        }
+    }
+
+    void _child_range_changed(Composable const* child) const
+    {
+        if (_range_index)
+        {
+            int const index = index_of_child(child);
+            if (index >= 0)
+            {
+                _invalidate_ranges(size_t(index));
+            }
+        }
+    }
+
+    // Where the children of a composition read lazily are in the file.
+    struct _LazyChildren
+    {
+        std::shared_ptr<std::string const> file_name;
+        size_t                             begin;
+        size_t                             end;
+        bool                               lazy_metadata;
+    };
+
+    void _materialize_children() const
+    {
+        if (_lazy_children && !_lazy_children_loaded)
+        {
+            ErrorStatus error_status;
+            if (!const_cast<Composition*>(this)->materialize(&error_status))
+            {
+                throw std::runtime_error(error_status.full_description);
+            }
+        }
+    }
+
+    // The children can no longer be read from the file once the list of
+    // children has been modified.
+    void _drop_lazy_children() noexcept
+    {
+        _lazy_children.reset();
+        _lazy_children_loaded = false;
+    }
+
+    // Read the children from the file, defined with the JSON reader in
+    // deserialization.cpp.
+    bool _read_lazy_children(
+        std::vector<Retainer<Composable>>* children,
+        ErrorStatus*                       error_status) const;
+
     // XXX: python implementation is O(n^2) in number of children
     std::vector<Composable*>
     _children_at_time(RationalTime, ErrorStatus* error_status = nullptr) const;
@@ -224,6 +351,11 @@ private:
     // This is for fast lookup only, and varies automatically
     // as _children is mutated.
     std::set<Composable*> _child_set;
+
+    std::unique_ptr<_LazyChildren> _lazy_children;
+    bool                           _lazy_children_loaded = false;
+
+    std::unique_ptr<_RangeIndex> _range_index;
 };
 
 template <typename T>
@@ -247,7 +379,7 @@ Composition::find_children(
     else
     {
         // otherwise search all the children
-        children = _children;
+        children = this->children();
     }
     for (const auto& child: children)
     {
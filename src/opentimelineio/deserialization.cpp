@@ -5,14 +5,19 @@
 #include "opentime/timeRange.h"
 #include "opentime/timeTransform.h"
 #include "opentimelineio/color.h"
+#include "opentimelineio/composition.h"
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/serializableObjectWithMetadata.h"
+#include "opentimelineio/typedArray.h"
+#include "binaryEncoding.h"
 #include "stringUtils.h"
 
 #define RAPIDJSON_NAMESPACE OTIO_rapidjson
 #include <rapidjson/cursorstreamwrapper.h>
 #include <rapidjson/error/en.h>
 #include <rapidjson/filereadstream.h>
+#include <rapidjson/istreamwrapper.h>
+#include <rapidjson/memorystream.h>
 #include <rapidjson/reader.h>
 
 #if defined(_WINDOWS)
@@ -27,12 +32,161 @@
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
+/**
+ * The text consumed by the JSON reader while capture is active.
+ */
+struct RawJSONCapture
+{
+    bool        active = false;
+    std::string text;
+};
+
+/**
+ * Input stream wrapper for lazy reading.  It copies the characters the reader
+ * takes into a RawJSONCapture, so that the decoder can keep the text of a
+ * value instead of decoding it, and it can skip over arrays without the
+ * reader seeing their contents.
+ */
+template <typename InputStream>
+class LazyReadStreamWrapper
+{
+public:
+    typedef typename InputStream::Ch Ch;
+
+    LazyReadStreamWrapper(
+        InputStream&    stream,
+        RawJSONCapture& capture,
+        size_t          offset)
+        : _stream(stream)
+        , _capture(capture)
+        , _offset(offset)
+    {}
+
+    Ch Peek() const { return _inject ? *_inject : _stream.Peek(); }
+
+    Ch Take()
+    {
+        if (_inject)
+        {
+            Ch c = *_inject++;
+            if (*_inject == '\0')
+            {
+                _inject = nullptr;
+            }
+            return c;
+        }
+
+        Ch c = _stream.Take();
+        if (_capture.active)
+        {
+            _capture.text.push_back(c);
+        }
+        return c;
+    }
+
+    // Skip the array following the key the reader has just read, and return
+    // the byte offsets of its first and one past its last character in the
+    // input.  The reader sees an empty array instead.  This only tracks
+    // nesting and strings, the skipped text is checked when it is read.
+    // Return false, leaving the value for the reader, if it is not an array.
+    bool skip_array(size_t* begin, size_t* end)
+    {
+        _skip_whitespace();
+        if (_stream.Peek() != ':')
+        {
+            return false;
+        }
+        _stream.Take();
+        _skip_whitespace();
+        if (_stream.Peek() != '[')
+        {
+            _inject = ":";
+            return false;
+        }
+
+        *begin           = _offset + _stream.Tell();
+        size_t depth     = 0;
+        bool   in_string = false;
+        for (;;)
+        {
+            Ch c = _stream.Take();
+            if (c == '\0')
+            {
+                // let the reader report the truncated input
+                _inject = ":";
+                return false;
+            }
+            else if (in_string)
+            {
+                if (c == '\\')
+                {
+                    _stream.Take();
+                }
+                else if (c == '"')
+                {
+                    in_string = false;
+                }
+            }
+            else if (c == '"')
+            {
+                in_string = true;
+            }
+            else if (c == '[' || c == '{')
+            {
+                depth++;
+            }
+            else if ((c == ']' || c == '}') && --depth == 0)
+            {
+                break;
+            }
+        }
+        *end    = _offset + _stream.Tell();
+        _inject = ":[]";
+        return true;
+    }
+
+    size_t Tell() const { return _stream.Tell(); }
+
+    // the reader never writes to the stream, it does not parse in place
+    Ch* PutBegin()
+    {
+        assert(false);
+        return nullptr;
+    }
+    void   Put(Ch) { assert(false); }
+    void   Flush() { assert(false); }
+    size_t PutEnd(Ch*)
+    {
+        assert(false);
+        return 0;
+    }
+
+private:
+    void _skip_whitespace()
+    {
+        for (Ch c = _stream.Peek();
+             c == ' ' || c == '\n' || c == '\r' || c == '\t';
+             c = _stream.Peek())
+        {
+            _stream.Take();
+        }
+    }
+
+    InputStream&    _stream;
+    RawJSONCapture& _capture;
+    size_t          _offset;
+    char const*     _inject = nullptr;
+};
+
 class JSONDecoder : public OTIO_rapidjson::
                         BaseReaderHandler<OTIO_rapidjson::UTF8<>, JSONDecoder>
 {
 public:
-    JSONDecoder(std::function<size_t()> line_number_function)
+    JSONDecoder(
+        std::function<size_t()> line_number_function,
+        RawJSONCapture*         metadata_capture = nullptr)
         : _line_number_function{ line_number_function }
+        , _metadata_capture{ metadata_capture }
     {
         using namespace std::placeholders;
         _error_function = std::bind(&JSONDecoder::_error, this, _1);
@@ -55,6 +209,29 @@ public:
         {
             _resolver.finalize(_error_function);
         }
+
+        // the children were read as an empty list, point the compositions
+        // at the file instead
+        if (!has_errored())
+        {
+            for (auto& e: _lazy_compositions)
+            {
+                e.first->_lazy_children.reset(
+                    new Composition::_LazyChildren(std::move(e.second)));
+            }
+        }
+    }
+
+    // Skip the children of tracks and stacks, recording where they are in
+    // the file instead.
+    void read_children_lazily(
+        std::shared_ptr<std::string const>    file_name,
+        bool                                  lazy_metadata,
+        std::function<bool(size_t*, size_t*)> skip_array)
+    {
+        _lazy_children_file  = file_name;
+        _lazy_metadata       = lazy_metadata;
+        _skip_children_array = skip_array;
     }
 
     bool Null() { return store(std::any()); }
@@ -76,6 +253,11 @@ public:
     bool
     String(const char* str, OTIO_rapidjson::SizeType length, bool /* copy */)
     {
+        if (_skip_children_array && _metadata_depth == 0 && !_stack.empty()
+            && _stack.back().is_dict && _stack.back().cur_key == "OTIO_SCHEMA")
+        {
+            _stack.back().schema.assign(str, length);
+        }
         return store(std::any(std::string(str, length)));
     }
 
@@ -86,6 +268,18 @@ public:
             return false;
         }
 
+        if (_metadata_depth > 0)
+        {
+            // schema objects have to be decoded along with the rest of the
+            // file, so that references to and from them are resolved
+            std::string key(str, length);
+            if (key == "OTIO_SCHEMA" || key == "OTIO_REF_ID")
+            {
+                _metadata_has_schema = true;
+            }
+            return true;
+        }
+
         if (_stack.empty() || !_stack.back().is_dict)
         {
             _internal_error(
@@ -94,6 +288,21 @@ public:
         }
 
         _stack.back().cur_key = std::string(str, length);
+
+        // start capturing, the value is kept as text if it is an object
+        if (_metadata_capture && _stack.back().cur_key == "metadata")
+        {
+            _metadata_capture->active = true;
+            _metadata_capture->text.clear();
+        }
+        else if (
+            _skip_children_array && _stack.back().cur_key == "children"
+            && _has_lazy_children(_stack.back().schema))
+        {
+            auto& top = _stack.back();
+            top.lazy_children =
+                _skip_children_array(&top.children_begin, &top.children_end);
+        }
         return true;
     }
 
@@ -104,6 +313,13 @@ public:
             return false;
         }
 
+        if (_metadata_depth > 0)
+        {
+            _metadata_depth++;
+            return true;
+        }
+        _stop_metadata_capture();
+
         _stack.emplace_back(_DictOrArray{ false /* is_dict*/ });
         return true;
     }
@@ -115,6 +331,18 @@ public:
             return false;
         }
 
+        if (_metadata_depth > 0)
+        {
+            _metadata_depth++;
+            return true;
+        }
+        else if (_metadata_capture && _metadata_capture->active)
+        {
+            _metadata_depth      = 1;
+            _metadata_has_schema = false;
+            return true;
+        }
+
         _stack.emplace_back(_DictOrArray{ true /* is_dict*/ });
         return true;
     }
@@ -126,6 +354,12 @@ public:
             return false;
         }
 
+        if (_metadata_depth > 0)
+        {
+            _metadata_depth--;
+            return true;
+        }
+
         if (_stack.empty())
         {
             _internal_error(
@@ -158,6 +392,11 @@ public:
             return false;
         }
 
+        if (_metadata_depth > 0)
+        {
+            return --_metadata_depth > 0 || _store_metadata();
+        }
+
         if (_stack.empty())
         {
             _internal_error(
@@ -176,13 +415,37 @@ public:
             {
                 // when we end a dictionary, we immediately convert it
                 // to the type it really represents, if it is a schema object.
+                AnyDictionary dict(
+                    std::make_move_iterator(top.items.begin()),
+                    std::make_move_iterator(top.items.end()));
                 SerializableObject::Reader reader(
-                    top.dict,
+                    dict,
                     _error_function,
                     nullptr,
                     static_cast<int>(_line_number_function()));
+                bool const   lazy_children  = top.lazy_children;
+                size_t const children_begin = top.children_begin;
+                size_t const children_end   = top.children_end;
                 _stack.pop_back();
-                store(reader._decode(_resolver));
+
+                std::any decoded = reader._decode(_resolver);
+                if (lazy_children
+                    && decoded.type() == typeid(SerializableObject::Retainer<>))
+                {
+                    if (auto composition = dynamic_cast<Composition*>(
+                            std::any_cast<SerializableObject::Retainer<>&>(
+                                decoded)
+                                .value))
+                    {
+                        _lazy_compositions.emplace_back(
+                            composition,
+                            Composition::_LazyChildren{ _lazy_children_file,
+                                                        children_begin,
+                                                        children_end,
+                                                        _lazy_metadata });
+                    }
+                }
+                store(std::move(decoded));
             }
         }
         return true;
@@ -195,6 +458,12 @@ public:
             return false;
         }
 
+        if (_metadata_depth > 0)
+        {
+            return true;
+        }
+        _stop_metadata_capture();
+
         if (_stack.empty())
         {
             _root.swap(a);
@@ -204,11 +473,11 @@ public:
             auto& top = _stack.back();
             if (top.is_dict)
             {
-                top.dict.emplace(_stack.back().cur_key, a);
+                top.items.emplace_back(std::move(top.cur_key), std::move(a));
             }
             else
             {
-                top.array.emplace_back(a);
+                top.array.emplace_back(std::move(a));
             }
         }
         return true;
@@ -242,22 +511,92 @@ public:
         _error_status = error_status;
     }
 
+    // Only the children of tracks and stacks are read lazily, which is what
+    // it takes to open a file with many tracks and only look at some of them.
+    static bool _has_lazy_children(std::string const& schema)
+    {
+        return schema.compare(0, 6, "Track.") == 0
+               || schema.compare(0, 6, "Stack.") == 0;
+    }
+
+    void _stop_metadata_capture()
+    {
+        if (_metadata_capture)
+        {
+            _metadata_capture->active = false;
+        }
+    }
+
+    // Store the captured metadata object, which starts right after its key.
+    bool _store_metadata()
+    {
+        _stop_metadata_capture();
+
+        std::string& text  = _metadata_capture->text;
+        size_t const begin = text.find('{');
+        if (!_metadata_has_schema)
+        {
+            AnyDictionary dict;
+            dict._set_raw_json(text.substr(begin));
+            return store(std::any(std::move(dict)));
+        }
+
+        // decode it now, feeding it to this decoder with capture and lazy
+        // children turned off so that the objects go through the same
+        // resolver
+        std::string           json    = text.substr(begin);
+        RawJSONCapture* const capture = _metadata_capture;
+        auto const            skip    = std::move(_skip_children_array);
+        _metadata_capture             = nullptr;
+        _skip_children_array          = nullptr;
+
+        OTIO_rapidjson::Reader       reader;
+        OTIO_rapidjson::StringStream ss(json.c_str());
+        bool const                   status =
+            reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(ss, *this);
+
+        _metadata_capture    = capture;
+        _skip_children_array = skip;
+        return status;
+    }
+
     ErrorStatus _error_status;
 
     struct _DictOrArray
     {
         _DictOrArray(bool is_dict) { this->is_dict = is_dict; }
 
-        bool          is_dict;
-        AnyDictionary dict;
-        AnyVector     array;
-        std::string   cur_key;
+        // the items of an object are collected in file order and sorted
+        // into an AnyDictionary once the object ends
+        bool                                          is_dict;
+        std::vector<std::pair<std::string, std::any>> items;
+        AnyVector                                     array;
+        std::string                                   cur_key;
+
+        // when reading children lazily, the schema of the object and where
+        // its children are in the file
+        std::string schema;
+        bool        lazy_children  = false;
+        size_t      children_begin = 0;
+        size_t      children_end   = 0;
     };
 
     std::vector<_DictOrArray>               _stack;
     std::function<void(ErrorStatus const&)> _error_function;
     std::function<size_t()>                 _line_number_function;
 
+    // set when metadata objects are kept as text, see AnyDictionary::raw_json
+    RawJSONCapture* _metadata_capture;
+    int             _metadata_depth      = 0;
+    bool            _metadata_has_schema = false;
+
+    // set when the children of compositions are read lazily
+    std::function<bool(size_t*, size_t*)> _skip_children_array;
+    std::shared_ptr<std::string const>    _lazy_children_file;
+    bool                                  _lazy_metadata = false;
+    std::vector<std::pair<Composition*, Composition::_LazyChildren>>
+        _lazy_compositions;
+
     SerializableObject::Reader::_Resolver _resolver;
 };
 
@@ -324,6 +663,13 @@ SerializableObject::Reader::_fix_reference_ids(
     _Resolver&              resolver,
     int                     line_number)
 {
+    // dictionaries still held as JSON text have no references in them, and
+    // iterating over them would decode them
+    if (m.raw_json())
+    {
+        return;
+    }
+
     for (auto& e: m)
     {
         _fix_reference_ids(e.second, error_function, resolver, line_number);
@@ -634,6 +980,47 @@ SerializableObject::Reader::_decode(_Resolver& resolver)
                          IMATH_NAMESPACE::Box2d(std::move(min), std::move(max)))
                    : std::any();
     }
+    else if (schema_name_and_version == "TypedArray.1")
+    {
+        std::string dtype, data;
+        if (!_fetch("dtype", &dtype) || !_fetch("data", &data))
+        {
+            return std::any();
+        }
+
+        if (dtype == Float64Array::dtype())
+        {
+            Float64Array array;
+            if (array.set_from_base64(data))
+            {
+                return std::any(std::move(array));
+            }
+        }
+        else if (dtype == Int64Array::dtype())
+        {
+            Int64Array array;
+            if (array.set_from_base64(data))
+            {
+                return std::any(std::move(array));
+            }
+        }
+        else
+        {
+            _error(ErrorStatus(
+                ErrorStatus::MALFORMED_SCHEMA,
+                string_printf(
+                    "unsupported TypedArray dtype '%s'",
+                    dtype.c_str())));
+            return std::any();
+        }
+
+        _error(ErrorStatus(
+            ErrorStatus::MALFORMED_SCHEMA,
+            string_printf(
+                "invalid data for TypedArray of dtype '%s'",
+                dtype.c_str())));
+        return std::any();
+    }
     else
     {
         std::string ref_id;
@@ -727,6 +1114,19 @@ SerializableObject::Reader::read(std::string const& key, std::string* value)
     return true;
 }
 
+bool
+SerializableObject::Reader::read(std::string const& key, InternedString* value)
+{
+    std::string text;
+    if (!read(key, &text))
+    {
+        return false;
+    }
+
+    *value = InternedString(text);
+    return true;
+}
+
 bool
 SerializableObject::Reader::read(std::string const& key, RationalTime* value)
 {
@@ -876,19 +1276,58 @@ SerializableObject::Reader::read(std::string const& key, std::any* value)
     }
 }
 
-bool
-deserialize_json_from_string(
-    std::string const& input,
-    std::any*          destination,
-    ErrorStatus*       error_status)
+void
+AnyDictionary::_decode_json(std::string const& json, AnyDictionary* result)
 {
-    OTIO_rapidjson::Reader                            reader;
-    OTIO_rapidjson::StringStream                      ss(input.c_str());
-    OTIO_rapidjson::CursorStreamWrapper<decltype(ss)> csw(ss);
-    JSONDecoder handler(std::bind(&decltype(csw)::GetLine, &csw));
+    OTIO_rapidjson::Reader       reader;
+    OTIO_rapidjson::StringStream ss(json.c_str());
+    JSONDecoder                  handler([] { return size_t(0); });
 
-    bool status =
-        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
+    // the text was checked when it was captured, and holds no schema objects
+    if (reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(ss, handler)
+        && handler._root.type() == typeid(AnyDictionary))
+    {
+        result->swap(std::any_cast<AnyDictionary&>(handler._root));
+    }
+}
+
+namespace {
+
+template <unsigned parse_flags, typename InputStream>
+bool
+_deserialize_json_from_stream(
+    InputStream&                       input,
+    std::any*                          destination,
+    ErrorStatus*                       error_status,
+    bool                               lazy_metadata,
+    std::shared_ptr<std::string const> lazy_children_file = nullptr,
+    size_t                             offset             = 0)
+{
+    OTIO_rapidjson::Reader                           reader;
+    OTIO_rapidjson::CursorStreamWrapper<InputStream> csw(input);
+
+    bool           status;
+    RawJSONCapture capture;
+    JSONDecoder    handler(
+        std::bind(&decltype(csw)::GetLine, &csw),
+        lazy_metadata ? &capture : nullptr);
+    if (lazy_metadata || lazy_children_file)
+    {
+        LazyReadStreamWrapper<decltype(csw)> ls(csw, capture, offset);
+        if (lazy_children_file)
+        {
+            using namespace std::placeholders;
+            handler.read_children_lazily(
+                lazy_children_file,
+                lazy_metadata,
+                std::bind(&decltype(ls)::skip_array, &ls, _1, _2));
+        }
+        status = reader.Parse<parse_flags>(ls, handler);
+    }
+    else
+    {
+        status = reader.Parse<parse_flags>(csw, handler);
+    }
     handler.finalize();
 
     if (handler.has_errored(error_status))
@@ -917,47 +1356,403 @@ deserialize_json_from_string(
     return true;
 }
 
-bool
-deserialize_json_from_file(
-    std::string const& file_name,
-    std::any*          destination,
-    ErrorStatus*       error_status)
+FILE*
+_open_file(std::string const& file_name, ErrorStatus* error_status)
 {
-
     FILE* fp = nullptr;
 #if defined(_WINDOWS)
     const int wlen =
         MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
     std::vector<wchar_t> wchars(wlen);
     MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
-    if (_wfopen_s(&fp, wchars.data(), L"r") != 0)
+    if (_wfopen_s(&fp, wchars.data(), L"rb") != 0)
     {
         fp = nullptr;
     }
 #else  // _WINDOWS
-    fp = fopen(file_name.c_str(), "r");
+    fp = fopen(file_name.c_str(), "rb");
 #endif // _WINDOWS
-    if (!fp)
+    if (!fp && error_status)
     {
-        if (error_status)
+        *error_status = ErrorStatus(ErrorStatus::FILE_OPEN_FAILED, file_name);
+    }
+    return fp;
+}
+
+/**
+ * Reads the binary encoding described in binaryEncoding.h, handing the
+ * values to a JSONDecoder as the JSON reader would.
+ */
+class BinaryReader
+{
+public:
+    BinaryReader(uint8_t const* data, size_t size)
+        : _data(data)
+        , _end(data + size)
+    {}
+
+    // Returns true if it read a whole value.  Otherwise error is set to what
+    // was wrong with the data, or left empty if the decoder failed.
+    bool read(JSONDecoder& handler, std::string* error)
+    {
+        using namespace binary_encoding;
+
+        if (size_t(_end - _data) < magic_size
+            || std::memcmp(_data, magic, magic_size) != 0)
         {
-            *error_status =
-                ErrorStatus(ErrorStatus::FILE_OPEN_FAILED, file_name);
+            *error = "not OpenTimelineIO binary data";
+            return false;
+        }
+        _data += magic_size;
+
+        // whether each object or array being read is an object
+        std::vector<bool> nesting;
+        for (;;)
+        {
+            uint8_t tag;
+            if (!nesting.empty() && nesting.back())
+            {
+                if (!_read_tag(&tag, error))
+                {
+                    return false;
+                }
+                if (tag == object_end)
+                {
+                    nesting.pop_back();
+                    if (!handler.EndObject(0))
+                    {
+                        return false;
+                    }
+                    if (nesting.empty())
+                    {
+                        break;
+                    }
+                    continue;
+                }
+
+                char const* key;
+                size_t      length;
+                if (!_read_string(tag, &key, &length, error)
+                    || !handler.Key(key, length, false))
+                {
+                    return false;
+                }
+            }
+
+            if (!_read_tag(&tag, error))
+            {
+                return false;
+            }
+
+            bool ok = true;
+            switch (tag)
+            {
+                case null:
+                    ok = handler.Null();
+                    break;
+                case false_value:
+                case true_value:
+                    ok = handler.Bool(tag == true_value);
+                    break;
+                case int64: {
+                    int64_t value;
+                    ok = _read_numbers(&value, 1, error)
+                         && handler.Int64(value);
+                    break;
+                }
+                case double_value: {
+                    double value;
+                    ok = _read_numbers(&value, 1, error)
+                         && handler.Double(value);
+                    break;
+                }
+                case string:
+                case new_string:
+                case string_ref: {
+                    char const* value;
+                    size_t      length;
+                    ok = _read_string(tag, &value, &length, error)
+                         && handler.String(value, length, false);
+                    break;
+                }
+                case object_begin:
+                    nesting.push_back(true);
+                    ok = handler.StartObject();
+                    break;
+                case array_begin:
+                    nesting.push_back(false);
+                    ok = handler.StartArray();
+                    break;
+                case array_end:
+                    if (nesting.empty() || nesting.back())
+                    {
+                        *error = "unexpected end of array";
+                        return false;
+                    }
+                    nesting.pop_back();
+                    ok = handler.EndArray(0);
+                    break;
+                case rational_time: {
+                    double n[2];
+                    ok = _read_numbers(n, 2, error)
+                         && handler.store(std::any(RationalTime(n[0], n[1])));
+                    break;
+                }
+                case time_range: {
+                    double n[4];
+                    ok = _read_numbers(n, 4, error)
+                         && handler.store(std::any(TimeRange(
+                             RationalTime(n[0], n[1]),
+                             RationalTime(n[2], n[3]))));
+                    break;
+                }
+                case time_transform: {
+                    double n[4];
+                    ok = _read_numbers(n, 4, error)
+                         && handler.store(std::any(TimeTransform(
+                             RationalTime(n[0], n[1]),
+                             n[2],
+                             n[3])));
+                    break;
+                }
+                case float64_array:
+                    ok = _read_typed_array<double>(handler, error);
+                    break;
+                case int64_array:
+                    ok = _read_typed_array<int64_t>(handler, error);
+                    break;
+                default:
+                    *error = string_printf("unknown tag %d", int(tag));
+                    return false;
+            }
+
+            if (!ok)
+            {
+                return false;
+            }
+            if (nesting.empty())
+            {
+                break;
+            }
+        }
+
+        if (_data != _end)
+        {
+            *error = "unexpected data after the end of the value";
+            return false;
+        }
+        return true;
+    }
+
+private:
+    bool _truncated(std::string* error)
+    {
+        *error = "unexpected end of data";
+        return false;
+    }
+
+    bool _read_tag(uint8_t* tag, std::string* error)
+    {
+        if (_data == _end)
+        {
+            return _truncated(error);
+        }
+        *tag = *_data++;
+        return true;
+    }
+
+    bool _read_varint(size_t* value, std::string* error)
+    {
+        uint64_t result = 0;
+        for (int shift = 0; shift < 64; shift += 7)
+        {
+            if (_data == _end)
+            {
+                return _truncated(error);
+            }
+            uint8_t const byte = *_data++;
+            result |= uint64_t(byte & 0x7f) << shift;
+            if (!(byte & 0x80))
+            {
+                *value = size_t(result);
+                return true;
+            }
         }
+        *error = "malformed length";
         return false;
     }
 
-    OTIO_rapidjson::Reader reader;
+    template <typename T>
+    bool _read_numbers(T* numbers, size_t count, std::string* error)
+    {
+        if (size_t(_end - _data) / 8 < count)
+        {
+            return _truncated(error);
+        }
+        binary_encoding::copy_little_endian(numbers, _data, count);
+        _data += count * 8;
+        return true;
+    }
+
+    bool _read_string(
+        uint8_t      tag,
+        char const** value,
+        size_t*      length,
+        std::string* error)
+    {
+        if (tag == binary_encoding::string_ref)
+        {
+            size_t index;
+            if (!_read_varint(&index, error))
+            {
+                return false;
+            }
+            if (index >= _strings.size())
+            {
+                *error = "string index out of range";
+                return false;
+            }
+            *value  = _strings[index].first;
+            *length = _strings[index].second;
+            return true;
+        }
+        if (tag != binary_encoding::string
+            && tag != binary_encoding::new_string)
+        {
+            *error = "expected a string";
+            return false;
+        }
+        if (!_read_varint(length, error))
+        {
+            return false;
+        }
+        if (size_t(_end - _data) < *length)
+        {
+            return _truncated(error);
+        }
+        *value = reinterpret_cast<char const*>(_data);
+        _data += *length;
+        if (tag == binary_encoding::new_string)
+        {
+            _strings.emplace_back(*value, *length);
+        }
+        return true;
+    }
+
+    template <typename T>
+    bool _read_typed_array(JSONDecoder& handler, std::string* error)
+    {
+        size_t count;
+        if (!_read_varint(&count, error))
+        {
+            return false;
+        }
+        if (size_t(_end - _data) / 8 < count)
+        {
+            return _truncated(error);
+        }
+        TypedArray<T> array(count);
+        return _read_numbers(array.data(), count, error)
+               && handler.store(std::any(std::move(array)));
+    }
+
+    uint8_t const* _data;
+    uint8_t const* _end;
+
+    // the strings are not copied, they point into the data
+    std::vector<std::pair<char const*, size_t>> _strings;
+};
+
+} // namespace
+
+bool
+deserialize_json_from_string(
+    std::string const& input,
+    std::any*          destination,
+    ErrorStatus*       error_status,
+    bool               lazy_metadata)
+{
+    OTIO_rapidjson::StringStream ss(input.c_str());
+    return _deserialize_json_from_stream<OTIO_rapidjson::kParseNanAndInfFlag>(
+        ss,
+        destination,
+        error_status,
+        lazy_metadata);
+}
+
+bool
+deserialize_json_from_buffer(
+    void const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status,
+    bool         lazy_metadata)
+{
+    OTIO_rapidjson::MemoryStream ms(static_cast<char const*>(data), size);
+    return _deserialize_json_from_stream<OTIO_rapidjson::kParseNanAndInfFlag>(
+        ms,
+        destination,
+        error_status,
+        lazy_metadata);
+}
+
+bool
+deserialize_json_from_stream(
+    std::istream& input,
+    std::any*     destination,
+    ErrorStatus*  error_status,
+    bool          lazy_metadata)
+{
+    OTIO_rapidjson::IStreamWrapper isw(input);
+    return _deserialize_json_from_stream<OTIO_rapidjson::kParseNanAndInfFlag>(
+        isw,
+        destination,
+        error_status,
+        lazy_metadata);
+}
+
+bool
+deserialize_json_from_file(
+    std::string const& file_name,
+    std::any*          destination,
+    ErrorStatus*       error_status,
+    bool               lazy_metadata,
+    bool               lazy_children)
+{
+    FILE* fp = _open_file(file_name, error_status);
+    if (!fp)
+    {
+        return false;
+    }
 
     char                           readBuffer[65536];
     OTIO_rapidjson::FileReadStream fs(fp, readBuffer, sizeof(readBuffer));
-    OTIO_rapidjson::CursorStreamWrapper<decltype(fs)> csw(fs);
-    JSONDecoder handler(std::bind(&decltype(csw)::GetLine, &csw));
 
     bool status =
-        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
+        _deserialize_json_from_stream<OTIO_rapidjson::kParseNanAndInfFlag>(
+            fs,
+            destination,
+            error_status,
+            lazy_metadata,
+            lazy_children ? std::make_shared<std::string const>(file_name)
+                          : nullptr);
     fclose(fp);
 
+    return status;
+}
+
+bool
+deserialize_binary_from_buffer(
+    void const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status)
+{
+    BinaryReader reader(static_cast<uint8_t const*>(data), size);
+    JSONDecoder  handler([] { return size_t(0); });
+
+    std::string error;
+    bool const  status = reader.read(handler, &error);
     handler.finalize();
 
     if (handler.has_errored(error_status))
@@ -967,17 +1762,11 @@ deserialize_json_from_file(
 
     if (!status)
     {
-        auto msg = GetParseError_En(reader.GetParseErrorCode());
         if (error_status)
         {
             *error_status = ErrorStatus(
-                ErrorStatus::JSON_PARSE_ERROR,
-                string_printf(
-                    "JSON parse error on input string: %s "
-                    "(line %d, column %d)",
-                    msg,
-                    csw.GetLine(),
-                    csw.GetColumn()));
+                ErrorStatus::MALFORMED_SCHEMA,
+                "binary decoding error: " + error);
         }
         return false;
     }
@@ -986,4 +1775,98 @@ deserialize_json_from_file(
     return true;
 }
 
+bool
+Composition::_read_lazy_children(
+    std::vector<Retainer<Composable>>* children,
+    ErrorStatus*                       error_status) const
+{
+    _LazyChildren const& lazy = *_lazy_children;
+    FILE*                fp   = _open_file(*lazy.file_name, error_status);
+    if (!fp)
+    {
+        return false;
+    }
+
+#if defined(_WINDOWS)
+    if (_fseeki64(fp, static_cast<__int64>(lazy.begin), SEEK_SET) != 0)
+#else  // _WINDOWS
+    if (fseeko(fp, static_cast<off_t>(lazy.begin), SEEK_SET) != 0)
+#endif // _WINDOWS
+    {
+        fclose(fp);
+        if (error_status)
+        {
+            *error_status =
+                ErrorStatus(ErrorStatus::FILE_OPEN_FAILED, *lazy.file_name);
+        }
+        return false;
+    }
+
+    // the children are read lazily too, so a track in a stack is only read
+    // when it is needed
+    constexpr unsigned parse_flags = OTIO_rapidjson::kParseNanAndInfFlag
+                                     | OTIO_rapidjson::kParseStopWhenDoneFlag;
+
+    char                           readBuffer[65536];
+    OTIO_rapidjson::FileReadStream fs(fp, readBuffer, sizeof(readBuffer));
+    std::any                       result;
+    bool const status = _deserialize_json_from_stream<parse_flags>(
+        fs,
+        &result,
+        error_status,
+        lazy.lazy_metadata,
+        lazy.file_name,
+        lazy.begin);
+    size_t const end = lazy.begin + fs.Tell();
+    fclose(fp);
+
+    if (!status)
+    {
+        return false;
+    }
+
+    // the file has changed since it was opened
+    if (end != lazy.end || result.type() != typeid(AnyVector))
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::MALFORMED_SCHEMA,
+                string_printf(
+                    "children of %s have changed in %s",
+                    name().c_str(),
+                    lazy.file_name->c_str()));
+        }
+        return false;
+    }
+
+    auto& items = std::any_cast<AnyVector&>(result);
+    children->clear();
+    children->reserve(items.size());
+    for (auto& e: items)
+    {
+        Composable* child = nullptr;
+        if (e.type() == typeid(SerializableObject::Retainer<>))
+        {
+            child = dynamic_cast<Composable*>(
+                std::any_cast<SerializableObject::Retainer<>&>(e).value);
+        }
+        if (!child)
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::TYPE_MISMATCH,
+                    string_printf(
+                        "children of %s in %s are not all composables",
+                        name().c_str(),
+                        lazy.file_name->c_str()));
+            }
+            return false;
+        }
+        children->emplace_back(child);
+    }
+    return true;
+}
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
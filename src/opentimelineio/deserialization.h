@@ -7,20 +7,70 @@
 #include "opentimelineio/version.h"
 
 #include <any>
+#include <istream>
 #include <string>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 /// @brief Deserialize JSON data from a string.
+///
+/// If lazy_metadata is true, "metadata" objects that hold no schema objects
+/// are kept as JSON text, which is decoded the first time the dictionary is
+/// accessed, and written back verbatim if it is not modified (see
+/// AnyDictionary::raw_json()).  This makes reading files with a lot of
+/// metadata faster and use less memory when most of it is never looked at.
 bool deserialize_json_from_string(
     std::string const& input,
     std::any*          destination,
-    ErrorStatus*       error_status = nullptr);
+    ErrorStatus*       error_status  = nullptr,
+    bool               lazy_metadata = false);
+
+/// @brief Deserialize JSON data from size bytes of memory.
+///
+/// The data is parsed in place, it is not copied into a string first and it
+/// does not need to be null terminated.  See deserialize_json_from_string()
+/// for lazy_metadata.
+bool deserialize_json_from_buffer(
+    void const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status  = nullptr,
+    bool         lazy_metadata = false);
+
+/// @brief Deserialize JSON data from an input stream.
+///
+/// The stream is read incrementally, the whole document is never held in
+/// memory.  See deserialize_json_from_string() for lazy_metadata.
+bool deserialize_json_from_stream(
+    std::istream& input,
+    std::any*     destination,
+    ErrorStatus*  error_status  = nullptr,
+    bool          lazy_metadata = false);
 
 /// @brief Deserialize JSON data from a file.
+///
+/// See deserialize_json_from_string() for lazy_metadata.
+///
+/// If lazy_children is true, the children of tracks and stacks are not read.
+/// Their place in the file is recorded instead, and they are read from the
+/// file the first time they are accessed (see Composition::materialize()).
+/// This makes opening a large file to look at a few tracks fast, but the
+/// file must not change while the timeline is in use.
 bool deserialize_json_from_file(
     std::string const& file_name,
     std::any*          destination,
-    ErrorStatus*       error_status = nullptr);
+    ErrorStatus*       error_status  = nullptr,
+    bool               lazy_metadata = false,
+    bool               lazy_children = false);
+
+/// @brief Deserialize data in the binary encoding written by
+/// serialize_binary_to_string().
+///
+/// The data is read in place, it is not copied first.
+bool deserialize_binary_from_buffer(
+    void const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status = nullptr);
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -0,0 +1,367 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/editJournal.h"
+#include "opentimelineio/composition.h"
+#include "opentimelineio/item.h"
+
+#include <utility>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+// Each change holds what the object held before it, and undoing or redoing
+// the change swaps that with what the object holds now, so the same record
+// serves both ways.
+struct EditJournal::_Change
+{
+    enum class Kind
+    {
+        source_range,
+        insert_child,
+        remove_child,
+        set_child,
+        set_children
+    };
+
+    Kind                                                  kind;
+    SerializableObject::Retainer<Item>                    item;
+    SerializableObject::Retainer<Composition>             composition;
+    int                                                   index = 0;
+    std::optional<TimeRange>                              source_range;
+    SerializableObject::Retainer<Composable>              child;
+    std::vector<SerializableObject::Retainer<Composable>> children;
+};
+
+namespace {
+
+using _Change = EditJournal::_Change;
+
+thread_local EditJournal* _current_journal = nullptr;
+
+thread_local EditJournal::Recording* _current_recording = nullptr;
+
+// Stops recording on this thread while undoing or redoing.
+class _Suspend
+{
+public:
+    _Suspend()
+        : _journal(_current_journal)
+    {
+        _current_journal = nullptr;
+    }
+
+    ~_Suspend() { _current_journal = _journal; }
+
+private:
+    EditJournal* _journal;
+};
+
+bool
+_apply_change(_Change& change, bool undo, ErrorStatus* error_status)
+{
+    switch (change.kind)
+    {
+        case _Change::Kind::source_range: {
+            std::optional<TimeRange> source_range = change.item->source_range();
+            change.item->set_source_range(change.source_range);
+            change.source_range = std::move(source_range);
+            return true;
+        }
+        case _Change::Kind::insert_child:
+        case _Change::Kind::remove_child: {
+            bool const remove =
+                (change.kind == _Change::Kind::insert_child) == undo;
+            auto const& children = change.composition->children();
+            if (remove)
+            {
+                if (change.index >= int(children.size())
+                    || children[change.index].value != change.child.value)
+                {
+                    if (error_status)
+                    {
+                        *error_status = ErrorStatus(
+                            ErrorStatus::NOT_A_CHILD_OF,
+                            "the child to remove is not at its recorded index",
+                            change.composition);
+                    }
+                    return false;
+                }
+                return change.composition->remove_child(
+                    change.index,
+                    error_status);
+            }
+            if (change.index > int(children.size()))
+            {
+                if (error_status)
+                {
+                    *error_status = ErrorStatus(
+                        ErrorStatus::ILLEGAL_INDEX,
+                        "the recorded index is past the end of the children",
+                        change.composition);
+                }
+                return false;
+            }
+            return change.composition->insert_child(
+                change.index,
+                change.child,
+                error_status);
+        }
+        case _Change::Kind::set_child: {
+            auto const& children = change.composition->children();
+            if (change.index >= int(children.size()))
+            {
+                if (error_status)
+                {
+                    *error_status = ErrorStatus(
+                        ErrorStatus::ILLEGAL_INDEX,
+                        "the recorded index is past the end of the children",
+                        change.composition);
+                }
+                return false;
+            }
+            SerializableObject::Retainer<Composable> child =
+                children[change.index];
+            if (!change.composition
+                     ->set_child(change.index, change.child, error_status))
+            {
+                return false;
+            }
+            change.child = std::move(child);
+            return true;
+        }
+        case _Change::Kind::set_children: {
+            std::vector<SerializableObject::Retainer<Composable>> children =
+                change.composition->children();
+            std::vector<Composable*> replacement;
+            replacement.reserve(change.children.size());
+            for (auto const& child: change.children)
+            {
+                replacement.push_back(child);
+            }
+            change.composition->clear_children();
+            if (!change.composition->set_children(replacement, error_status))
+            {
+                std::vector<Composable*> restored;
+                restored.reserve(children.size());
+                for (auto const& child: children)
+                {
+                    restored.push_back(child);
+                }
+                change.composition->set_children(restored);
+                return false;
+            }
+            change.children = std::move(children);
+            return true;
+        }
+    }
+    return false;
+}
+
+} // namespace
+
+EditJournal::Recording::Recording(EditJournal& journal)
+    : _journal(&journal)
+    , _previous(_current_journal)
+    , _outer(_current_recording)
+{
+    _current_journal   = _journal;
+    _current_recording = this;
+    ++_journal->_depth;
+}
+
+EditJournal::Recording::~Recording()
+{
+    _current_journal   = _previous;
+    _current_recording = _outer;
+    if (--_journal->_depth == 0)
+    {
+        _journal->_end_step();
+    }
+}
+
+bool
+EditJournal::Recording::is_current() const noexcept
+{
+    return _current_recording == this;
+}
+
+EditJournal::EditJournal(size_t max_steps)
+    : _max_steps(max_steps)
+{}
+
+EditJournal::~EditJournal()
+{}
+
+void
+EditJournal::set_max_steps(size_t max_steps)
+{
+    _max_steps = max_steps;
+    if (_max_steps && _undo.size() > _max_steps)
+    {
+        _undo.erase(_undo.begin(), _undo.end() - _max_steps);
+    }
+}
+
+bool
+EditJournal::undo(ErrorStatus* error_status)
+{
+    if (_undo.empty())
+    {
+        return false;
+    }
+    if (!_apply(_undo.back(), true, error_status))
+    {
+        return false;
+    }
+    _redo.push_back(std::move(_undo.back()));
+    _undo.pop_back();
+    return true;
+}
+
+bool
+EditJournal::redo(ErrorStatus* error_status)
+{
+    if (_redo.empty())
+    {
+        return false;
+    }
+    if (!_apply(_redo.back(), false, error_status))
+    {
+        return false;
+    }
+    _undo.push_back(std::move(_redo.back()));
+    _redo.pop_back();
+    return true;
+}
+
+void
+EditJournal::clear()
+{
+    _recording.clear();
+    _undo.clear();
+    _redo.clear();
+}
+
+bool
+EditJournal::is_recording() noexcept
+{
+    return _current_journal != nullptr;
+}
+
+bool
+EditJournal::_apply(_Step& step, bool undo, ErrorStatus* error_status)
+{
+    _Suspend suspend;
+
+    size_t const count = step.size();
+    for (size_t i = 0; i < count; ++i)
+    {
+        _Change& change = step[undo ? count - 1 - i : i];
+        if (!_apply_change(change, undo, error_status))
+        {
+            // put back the changes made so far, so the step can be retried
+            while (i > 0)
+            {
+                --i;
+                _apply_change(step[undo ? count - 1 - i : i], !undo, nullptr);
+            }
+            return false;
+        }
+    }
+    return true;
+}
+
+void
+EditJournal::_add(_Change&& change)
+{
+    _recording.push_back(std::move(change));
+}
+
+void
+EditJournal::_end_step()
+{
+    if (_recording.empty())
+    {
+        return;
+    }
+
+    _redo.clear();
+    _undo.push_back(std::move(_recording));
+    _recording.clear();
+    set_max_steps(_max_steps);
+}
+
+void
+EditJournal::_record_source_range(Item* item)
+{
+    if (!_current_journal)
+    {
+        return;
+    }
+
+    _Change change{ _Change::Kind::source_range };
+    change.item         = item;
+    change.source_range = item->source_range();
+    _current_journal->_add(std::move(change));
+}
+
+void
+EditJournal::_record_insert_child(Composition* composition, int index)
+{
+    if (!_current_journal)
+    {
+        return;
+    }
+
+    _Change change{ _Change::Kind::insert_child };
+    change.composition = composition;
+    change.index       = index;
+    change.child       = composition->children()[index];
+    _current_journal->_add(std::move(change));
+}
+
+void
+EditJournal::_record_remove_child(Composition* composition, int index)
+{
+    if (!_current_journal)
+    {
+        return;
+    }
+
+    _Change change{ _Change::Kind::remove_child };
+    change.composition = composition;
+    change.index       = index;
+    change.child       = composition->children()[index];
+    _current_journal->_add(std::move(change));
+}
+
+void
+EditJournal::_record_set_child(Composition* composition, int index)
+{
+    if (!_current_journal)
+    {
+        return;
+    }
+
+    _Change change{ _Change::Kind::set_child };
+    change.composition = composition;
+    change.index       = index;
+    change.child       = composition->children()[index];
+    _current_journal->_add(std::move(change));
+}
+
+void
+EditJournal::_record_set_children(Composition* composition)
+{
+    if (!_current_journal)
+    {
+        return;
+    }
+
+    _Change change{ _Change::Kind::set_children };
+    change.composition = composition;
+    change.children    = composition->children();
+    _current_journal->_add(std::move(change));
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -0,0 +1,136 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include <cstddef>
+#include <vector>
+
+#include "opentimelineio/errorStatus.h"
+#include "opentimelineio/version.h"
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+class Composable;
+class Composition;
+class Item;
+
+/// @brief Records the changes made to items and compositions, so that they
+/// can be undone and redone.
+///
+/// Rather than keeping a copy of the timeline for each undo step, the journal
+/// records what each change replaced: the source range of an item, or a child
+/// of a composition that was inserted, removed or replaced.  So an undo step
+/// costs memory, and time to undo and redo, in proportion to the objects that
+/// changed, not to the size of the timeline.
+///
+/// The changes made on a thread while a Recording is in scope make up one
+/// step:
+///
+/// @code
+/// EditJournal journal;
+/// {
+///     EditJournal::Recording recording(journal);
+///     algo::overwrite(clip, track, range);
+/// }
+/// journal.undo();
+/// @endcode
+///
+/// The journal records source ranges, set with Item::set_source_range(),
+/// and the children of compositions, which are everything the functions in
+/// algo/editAlgorithm.h change.  Other changes are not recorded, and undoing
+/// a step expects the objects to be as the step left them, apart from those.
+///
+/// Starting a new step discards the steps that were undone.  If max_steps()
+/// is not zero, the oldest steps are discarded to keep at most that many.
+class EditJournal
+{
+public:
+    /// @brief Records the changes made on the current thread into a journal
+    /// while in scope.
+    ///
+    /// Recordings must be destroyed in the reverse order they were created
+    /// in on a thread.  Changes are recorded into the innermost one, and
+    /// nested recordings into the same journal make up a single step.
+    class Recording
+    {
+    public:
+        explicit Recording(EditJournal& journal);
+        ~Recording();
+
+        Recording(Recording const&)            = delete;
+        Recording& operator=(Recording const&) = delete;
+
+        /// @brief Return whether this is the innermost recording of the
+        /// calling thread, which is the only one that may be destroyed.
+        bool is_current() const noexcept;
+
+    private:
+        EditJournal* _journal;
+        EditJournal* _previous;
+        Recording*   _outer;
+    };
+
+    /// @brief Create a journal that keeps at most max_steps undo steps,
+    /// or all of them if max_steps is zero.
+    explicit EditJournal(size_t max_steps = 0);
+    ~EditJournal();
+
+    EditJournal(EditJournal const&)            = delete;
+    EditJournal& operator=(EditJournal const&) = delete;
+
+    /// @brief Return the maximum number of undo steps kept.
+    size_t max_steps() const noexcept { return _max_steps; }
+
+    /// @brief Set the maximum number of undo steps kept, discarding the
+    /// oldest ones if there are more.
+    void set_max_steps(size_t max_steps);
+
+    /// @brief Return the number of steps that can be undone.
+    size_t undo_count() const noexcept { return _undo.size(); }
+
+    /// @brief Return the number of steps that can be redone.
+    size_t redo_count() const noexcept { return _redo.size(); }
+
+    /// @brief Undo the last step.
+    ///
+    /// Returns false if there is nothing to undo, or if the step could not
+    /// be undone because the objects were changed without being recorded, in
+    /// which case the changes that were undone are made again.
+    bool undo(ErrorStatus* error_status = nullptr);
+
+    /// @brief Redo the last step that was undone.
+    bool redo(ErrorStatus* error_status = nullptr);
+
+    /// @brief Discard all the steps.
+    void clear();
+
+    /// @brief Return whether changes made on the current thread are being
+    /// recorded.
+    static bool is_recording() noexcept;
+
+    // Called by Item and Composition before they change.
+    static void _record_source_range(Item* item);
+    static void _record_insert_child(Composition* composition, int index);
+    static void _record_remove_child(Composition* composition, int index);
+    static void _record_set_child(Composition* composition, int index);
+    static void _record_set_children(Composition* composition);
+
+    // A recorded change, defined in editJournal.cpp.
+    struct _Change;
+
+private:
+    using _Step = std::vector<_Change>;
+
+    bool _apply(_Step& step, bool undo, ErrorStatus* error_status);
+    void _add(_Change&& change);
+    void _end_step();
+
+    size_t             _max_steps;
+    size_t             _depth = 0;
+    _Step              _recording;
+    std::vector<_Step> _undo;
+    std::vector<_Step> _redo;
+};
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -27,7 +27,7 @@ void
 ExternalReference::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
-    writer.write("target_url", _target_url);
+    writer.write("target_url", _target_url.str());
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
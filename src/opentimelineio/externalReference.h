@@ -4,6 +4,7 @@
 #pragma once
 
 #include "opentimelineio/mediaReference.h"
+#include "opentimelineio/stringPool.h"
 #include "opentimelineio/version.h"
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -35,7 +36,7 @@ public:
             std::nullopt);
 
     /// @brief Return the media file URL.
-    std::string target_url() const noexcept { return _target_url; }
+    std::string target_url() const noexcept { return _target_url.str(); }
 
     /// @brief Set the media file URL.
     void set_target_url(std::string const& target_url)
@@ -50,7 +51,7 @@ protected:
     void write_to(Writer&) const override;
 
 private:
-    std::string _target_url;
+    InternedString _target_url;
 };
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -3,6 +3,8 @@
 
 #include "opentimelineio/imageSequenceReference.h"
 
+#include <algorithm>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 ImageSequenceReference::ImageSequenceReference(
@@ -93,8 +95,8 @@ ImageSequenceReference::frame_for_time(
     return (_start_frame + frame_offset);
 }
 
-std::string
-ImageSequenceReference::target_url_for_image_number(
+bool
+ImageSequenceReference::check_image_number(
     int          image_number,
     ErrorStatus* error_status) const
 {
@@ -106,7 +108,7 @@ ImageSequenceReference::target_url_for_image_number(
                 ErrorStatus::ILLEGAL_INDEX,
                 "Zero rate sequence has no frames.");
         }
-        return std::string();
+        return false;
     }
     else if (
         !this->available_range().has_value()
@@ -118,7 +120,7 @@ ImageSequenceReference::target_url_for_image_number(
                 ErrorStatus::ILLEGAL_INDEX,
                 "Zero duration sequences has no frames.");
         }
-        return std::string();
+        return false;
     }
     else if (image_number >= this->number_of_images_in_sequence())
     {
@@ -126,37 +128,70 @@ ImageSequenceReference::target_url_for_image_number(
         {
             *error_status = ErrorStatus(ErrorStatus::ILLEGAL_INDEX);
         }
-        return std::string();
+        return false;
     }
-    const int  file_image_num = _start_frame + (image_number * _frame_step);
-    const bool is_negative    = (file_image_num < 0);
+    return true;
+}
 
-    std::string image_num_string = std::to_string(abs(file_image_num));
+std::string
+ImageSequenceReference::url_prefix() const
+{
+    std::string prefix;
+    prefix.reserve(_target_url_base.size() + 1 + _name_prefix.size());
+    prefix.append(_target_url_base.c_str(), _target_url_base.size());
 
-    std::string zero_pad = std::string();
-    if (static_cast<int>(image_num_string.length()) < _frame_zero_padding)
+    // If the base does not include a trailing slash, add it
+    if (!prefix.empty() && prefix.back() != '/')
     {
-        zero_pad =
-            std::string(_frame_zero_padding - image_num_string.length(), '0');
+        prefix += '/';
     }
+    prefix += _name_prefix;
+    return prefix;
+}
+
+void
+ImageSequenceReference::append_image_number(std::string& url, int image_number)
+    const
+{
+    const int  file_image_num = _start_frame + (image_number * _frame_step);
+    const bool is_negative    = (file_image_num < 0);
+
+    // Write the digits backwards into a buffer large enough for any int
+    char     digits[16];
+    char*    end   = digits + sizeof(digits);
+    char*    begin = end;
+    unsigned value = is_negative ? 0u - unsigned(file_image_num)
+                                 : unsigned(file_image_num);
+    do
+    {
+        *--begin = char('0' + value % 10);
+        value /= 10;
+    } while (value);
 
-    std::string sign = std::string();
     if (is_negative)
     {
-        sign = "-";
+        url += '-';
+    }
+    if (end - begin < _frame_zero_padding)
+    {
+        url.append(_frame_zero_padding - (end - begin), '0');
     }
+    url.append(begin, end);
+}
 
-    // If the base does not include a trailing slash, add it
-    std::string path_sep            = std::string();
-    const auto  target_url_base_len = _target_url_base.length();
-    if (target_url_base_len > 0
-        && _target_url_base.compare(target_url_base_len - 1, 1, "/") != 0)
+std::string
+ImageSequenceReference::target_url_for_image_number(
+    int          image_number,
+    ErrorStatus* error_status) const
+{
+    if (!check_image_number(image_number, error_status))
     {
-        path_sep = "/";
+        return std::string();
     }
 
-    std::string out_string = _target_url_base + path_sep + _name_prefix + sign
-                             + zero_pad + image_num_string + _name_suffix;
+    std::string out_string = url_prefix();
+    append_image_number(out_string, image_number);
+    out_string += _name_suffix;
     if (error_status)
     {
         *error_status = ErrorStatus(ErrorStatus::OK);
@@ -164,6 +199,61 @@ ImageSequenceReference::target_url_for_image_number(
     return out_string;
 }
 
+std::vector<std::string>
+ImageSequenceReference::target_urls_for_image_range(
+    int          start_image_number,
+    int          count,
+    ErrorStatus* error_status) const
+{
+    if (count < 0)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::ILLEGAL_INDEX,
+                "The number of images cannot be negative.");
+        }
+        return std::vector<std::string>();
+    }
+    if (count == 0)
+    {
+        return std::vector<std::string>();
+    }
+    if (!check_image_number(start_image_number, error_status))
+    {
+        return std::vector<std::string>();
+    }
+
+    // Compare against the images left after the start instead of computing
+    // the last image number, which can overflow
+    if (int64_t(count)
+        > int64_t(this->number_of_images_in_sequence()) - start_image_number)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(ErrorStatus::ILLEGAL_INDEX);
+        }
+        return std::vector<std::string>();
+    }
+
+    // Build the part of the URL before the frame number once, and each URL
+    // in a single allocation
+    std::string const prefix = url_prefix();
+    size_t const      size   = prefix.size() + _name_suffix.size()
+                               + std::max(_frame_zero_padding, 11) + 1;
+
+    std::vector<std::string> urls(count);
+    for (int i = 0; i < count; ++i)
+    {
+        std::string& url = urls[i];
+        url.reserve(size);
+        url = prefix;
+        append_image_number(url, start_image_number + i);
+        url += _name_suffix;
+    }
+    return urls;
+}
+
 RationalTime
 ImageSequenceReference::presentation_time_for_image_number(
     int          image_number,
@@ -183,6 +273,46 @@ ImageSequenceReference::presentation_time_for_image_number(
     return time_multiplier.applied_to(frame_duration());
 }
 
+std::vector<int>
+ImageSequenceReference::frames_for_times(
+    std::vector<RationalTime> const& times,
+    ErrorStatus*                     error_status) const
+{
+    std::vector<int> frames;
+    if (times.empty())
+    {
+        return frames;
+    }
+    if (!this->available_range().has_value())
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(ErrorStatus::INVALID_TIME_RANGE);
+        }
+        return frames;
+    }
+
+    TimeRange const    range = this->available_range().value();
+    RationalTime const start = range.start_time();
+    frames.resize(times.size());
+    for (size_t i = 0; i < times.size(); ++i)
+    {
+        if (!range.contains(times[i]))
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::INVALID_TIME_RANGE,
+                    "time " + std::to_string(i)
+                        + " is outside the available range");
+            }
+            return std::vector<int>();
+        }
+        frames[i] = _start_frame + (times[i] - start).to_frames(_rate);
+    }
+    return frames;
+}
+
 bool
 ImageSequenceReference::read_from(Reader& reader)
 {
@@ -245,7 +375,7 @@ ImageSequenceReference::write_to(Writer& writer) const
         static_cast<int64_t>(_frame_zero_padding);
 
     Parent::write_to(writer);
-    writer.write("target_url_base", _target_url_base);
+    writer.write("target_url_base", _target_url_base.str());
     writer.write("name_prefix", _name_prefix);
     writer.write("name_suffix", _name_suffix);
     writer.write("start_frame", start_frame_value);
@@ -4,8 +4,11 @@
 #pragma once
 
 #include "opentimelineio/mediaReference.h"
+#include "opentimelineio/stringPool.h"
 #include "opentimelineio/version.h"
 
+#include <vector>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 /// @brief A reference to an image sequence.
@@ -66,7 +69,10 @@ public:
             std::nullopt);
 
     /// @brief Return the URL base.
-    std::string target_url_base() const noexcept { return _target_url_base; }
+    std::string target_url_base() const noexcept
+    {
+        return _target_url_base.str();
+    }
 
     /// @brief Set the URL base.
     void set_target_url_base(std::string const& target_url_base)
@@ -146,11 +152,28 @@ public:
         RationalTime const& time,
         ErrorStatus*        error_status = nullptr) const;
 
+    /// @brief Return the frames for the given times.
+    ///
+    /// This is the same as calling frame_for_time() for each of the times.
+    std::vector<int> frames_for_times(
+        std::vector<RationalTime> const& times,
+        ErrorStatus*                     error_status = nullptr) const;
+
     /// @brief Return the target URL for the given image number.
     std::string target_url_for_image_number(
         int          image_number,
         ErrorStatus* error_status = nullptr) const;
 
+    /// @brief Return the target URLs for count images, starting with the
+    /// given image number.
+    ///
+    /// This is the same as calling target_url_for_image_number() for each of
+    /// the images, but faster for many images.
+    std::vector<std::string> target_urls_for_image_range(
+        int          start_image_number,
+        int          count,
+        ErrorStatus* error_status = nullptr) const;
+
     /// @brief Return the presentation time for the given image number.
     RationalTime presentation_time_for_image_number(
         int          image_number,
@@ -163,7 +186,7 @@ protected:
     void write_to(Writer&) const override;
 
 private:
-    std::string        _target_url_base;
+    InternedString     _target_url_base;
     std::string        _name_prefix;
     std::string        _name_suffix;
     int                _start_frame;
@@ -173,6 +196,9 @@ private:
     MissingFramePolicy _missing_frame_policy;
 
     RationalTime frame_duration() const noexcept;
+    bool         check_image_number(int image_number, ErrorStatus*) const;
+    std::string  url_prefix() const;
+    void         append_image_number(std::string& url, int image_number) const;
 };
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -3,6 +3,7 @@
 
 #include "opentimelineio/item.h"
 #include "opentimelineio/composition.h"
+#include "opentimelineio/editJournal.h"
 #include "opentimelineio/effect.h"
 #include "opentimelineio/marker.h"
 
@@ -29,6 +30,17 @@ Item::Item(
 Item::~Item()
 {}
 
+void
+Item::set_source_range(std::optional<TimeRange> const& source_range)
+{
+    EditJournal::_record_source_range(this);
+    _source_range = source_range;
+    if (Composition* composition = parent())
+    {
+        composition->_child_range_changed(this);
+    }
+}
+
 bool
 Item::visible() const
 {
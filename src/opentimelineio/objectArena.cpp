@@ -0,0 +1,177 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/objectArena.h"
+
+#include <atomic>
+#include <cstdlib>
+#include <new>
+
+#if defined(_WIN32)
+#    ifndef WIN32_LEAN_AND_MEAN
+#        define WIN32_LEAN_AND_MEAN
+#    endif
+#    include <windows.h>
+#else
+#    include <sys/mman.h>
+#endif
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+struct ObjectArena::_Block
+{
+    // the objects allocated from the block, plus one while the arena
+    // allocates from it
+    std::atomic<size_t> live{ 1 };
+    size_t              used = 0;
+};
+
+namespace {
+
+// Every allocation starts with the block it was made from, or null if it was
+// made with malloc.
+struct alignas(std::max_align_t) _Header
+{
+    ObjectArena::_Block* block;
+};
+
+constexpr size_t _alignment  = alignof(std::max_align_t);
+constexpr size_t _block_size = 256 * 1024;
+constexpr size_t _block_start =
+    (sizeof(ObjectArena::_Block) + _alignment - 1) / _alignment * _alignment;
+constexpr size_t _max_arena_size = (_block_size - _block_start) / 8;
+
+thread_local ObjectArena* _current_arena = nullptr;
+
+// Blocks are mapped from the system rather than allocated with malloc: the
+// objects' strings and metadata are freed around them, and malloc merging
+// those with a freed block into a large free chunk makes it tidy up the
+// whole heap, which costs more than the block saves.
+void*
+_map_block()
+{
+#if defined(_WIN32)
+    void* memory = VirtualAlloc(
+        nullptr,
+        _block_size,
+        MEM_RESERVE | MEM_COMMIT,
+        PAGE_READWRITE);
+    return memory;
+#else
+    void* memory = mmap(
+        nullptr,
+        _block_size,
+        PROT_READ | PROT_WRITE,
+        MAP_PRIVATE | MAP_ANONYMOUS,
+        -1,
+        0);
+    return memory == MAP_FAILED ? nullptr : memory;
+#endif
+}
+
+void
+_unmap_block(void* memory) noexcept
+{
+#if defined(_WIN32)
+    VirtualFree(memory, 0, MEM_RELEASE);
+#else
+    munmap(memory, _block_size);
+#endif
+}
+
+void
+_release(ObjectArena::_Block* block) noexcept
+{
+    if (block->live.fetch_sub(1, std::memory_order_acq_rel) == 1)
+    {
+        block->~_Block();
+        _unmap_block(block);
+    }
+}
+
+} // namespace
+
+ObjectArena::ObjectArena()
+    : _previous(_current_arena)
+{
+    _current_arena = this;
+}
+
+ObjectArena::~ObjectArena()
+{
+    _current_arena = _previous;
+    if (_block)
+    {
+        _release(_block);
+    }
+}
+
+bool
+ObjectArena::is_current() const noexcept
+{
+    return _current_arena == this;
+}
+
+void*
+ObjectArena::allocate(size_t size)
+{
+    size_t const total =
+        sizeof(_Header) + (size + _alignment - 1) / _alignment * _alignment;
+
+    if (_current_arena && total <= _max_arena_size)
+    {
+        return _current_arena->_allocate(total);
+    }
+
+    void* memory = std::malloc(total);
+    if (!memory)
+    {
+        throw std::bad_alloc();
+    }
+    return new (memory) _Header{ nullptr } + 1;
+}
+
+void
+ObjectArena::deallocate(void* pointer) noexcept
+{
+    if (!pointer)
+    {
+        return;
+    }
+
+    _Header* header = static_cast<_Header*>(pointer) - 1;
+    if (header->block)
+    {
+        _release(header->block);
+    }
+    else
+    {
+        std::free(header);
+    }
+}
+
+void*
+ObjectArena::_allocate(size_t total)
+{
+    if (!_block || _block_start + _block->used + total > _block_size)
+    {
+        void* memory = _map_block();
+        if (!memory)
+        {
+            throw std::bad_alloc();
+        }
+        if (_block)
+        {
+            _release(_block);
+        }
+        _block = new (memory) _Block;
+    }
+
+    char* memory =
+        reinterpret_cast<char*>(_block) + _block_start + _block->used;
+    _block->used += total;
+    _block->live.fetch_add(1, std::memory_order_relaxed);
+    return new (memory) _Header{ _block } + 1;
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -0,0 +1,67 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include <cstddef>
+
+#include "opentimelineio/version.h"
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @brief Allocates the objects created on a thread while it is in scope
+/// from large blocks, instead of one at a time.
+///
+/// Reading a file creates a great many small objects, and allocating and
+/// freeing them one at a time takes a large part of the time it takes to read
+/// and to free a big timeline.  Put an arena around a deserialize call to
+/// allocate the objects it creates from blocks they share:
+///
+/// @code
+/// {
+///     ObjectArena arena;
+///     deserialize_json_from_file(file_name, &result);
+/// }
+/// @endcode
+///
+/// Only SerializableObject instances are allocated from the arena, not the
+/// strings, containers and metadata they hold.  Objects keep their normal
+/// ownership: each one is deleted when it is no longer retained, whether
+/// that is before or after the arena goes out of scope, and a block is freed
+/// once all the objects in it have been deleted.  So objects can be detached
+/// from the graph they were read with and retained elsewhere, but such an
+/// object keeps its whole block allocated.
+///
+/// Arenas must be destroyed in the reverse order they were created in on a
+/// thread.  Objects are allocated from the innermost one.
+class ObjectArena
+{
+public:
+    ObjectArena();
+    ~ObjectArena();
+
+    ObjectArena(ObjectArena const&)            = delete;
+    ObjectArena& operator=(ObjectArena const&) = delete;
+
+    /// @brief Return whether this is the innermost arena of the calling
+    /// thread, which is the only one that may be destroyed.
+    bool is_current() const noexcept;
+
+    /// @brief Return memory for an object, from the innermost arena of this
+    /// thread if there is one.
+    static void* allocate(size_t size);
+
+    /// @brief Free memory returned by allocate().
+    static void deallocate(void* pointer) noexcept;
+
+    // A block objects are allocated from, defined in objectArena.cpp.
+    struct _Block;
+
+private:
+    void* _allocate(size_t size);
+
+    ObjectArena* _previous;
+    _Block*      _block = nullptr;
+};
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
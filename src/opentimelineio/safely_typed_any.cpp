@@ -77,6 +77,18 @@ create_safely_typed_any(IMATH_NAMESPACE::Box2d&& value)
     return std::any(value);
 }
 
+std::any
+create_safely_typed_any(Float64Array&& value)
+{
+    return std::any(std::move(value));
+}
+
+std::any
+create_safely_typed_any(Int64Array&& value)
+{
+    return std::any(std::move(value));
+}
+
 std::any
 create_safely_typed_any(AnyVector&& value)
 {
@@ -167,6 +179,18 @@ safely_cast_box_any(std::any const& a)
     return std::any_cast<IMATH_NAMESPACE::Box2d>(a);
 }
 
+Float64Array
+safely_cast_float64_array_any(std::any const& a)
+{
+    return std::any_cast<Float64Array>(a);
+}
+
+Int64Array
+safely_cast_int64_array_any(std::any const& a)
+{
+    return std::any_cast<Int64Array>(a);
+}
+
 AnyDictionary
 safely_cast_any_dictionary_any(std::any const& a)
 {
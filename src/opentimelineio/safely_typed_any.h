@@ -24,6 +24,7 @@
 #include "opentime/timeTransform.h"
 #include "opentimelineio/color.h"
 #include "opentimelineio/serializableObject.h"
+#include "opentimelineio/typedArray.h"
 #include "opentimelineio/version.h"
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -43,6 +44,8 @@ std::any create_safely_typed_any(Color&&);
 std::any create_safely_typed_any(TimeTransform&&);
 std::any create_safely_typed_any(IMATH_NAMESPACE::V2d&&);
 std::any create_safely_typed_any(IMATH_NAMESPACE::Box2d&&);
+std::any create_safely_typed_any(Float64Array&&);
+std::any create_safely_typed_any(Int64Array&&);
 std::any create_safely_typed_any(AnyVector&&);
 std::any create_safely_typed_any(AnyDictionary&&);
 std::any create_safely_typed_any(SerializableObject*);
@@ -64,6 +67,8 @@ TimeTransform          safely_cast_time_transform_any(std::any const& a);
 Color                  safely_cast_color_any(std::any const& a);
 IMATH_NAMESPACE::V2d   safely_cast_point_any(std::any const& a);
 IMATH_NAMESPACE::Box2d safely_cast_box_any(std::any const& a);
+Float64Array           safely_cast_float64_array_any(std::any const& a);
+Int64Array             safely_cast_int64_array_any(std::any const& a);
 
 SerializableObject* safely_cast_retainer_any(std::any const& a);
 
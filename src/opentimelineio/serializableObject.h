@@ -10,6 +10,8 @@
 #include "opentimelineio/anyVector.h"
 #include "opentimelineio/color.h"
 #include "opentimelineio/errorStatus.h"
+#include "opentimelineio/objectArena.h"
+#include "opentimelineio/stringPool.h"
 #include "opentimelineio/typeRegistry.h"
 #include "opentimelineio/version.h"
 
@@ -49,6 +51,17 @@ public:
     /// external scripting system is holding a reference to them).
     bool possibly_delete();
 
+    /// @brief Objects are allocated from the current ObjectArena, if any.
+    static void* operator new(size_t size)
+    {
+        return ObjectArena::allocate(size);
+    }
+
+    static void operator delete(void* pointer) noexcept
+    {
+        ObjectArena::deallocate(pointer);
+    }
+
     /// @brief Serialize this object to a JSON file.
     ///
     /// @param file_name The file name.
@@ -123,6 +136,7 @@ public:
         bool read(std::string const& key, int* dest);
         bool read(std::string const& key, double* dest);
         bool read(std::string const& key, std::string* dest);
+        bool read(std::string const& key, InternedString* dest);
         bool read(std::string const& key, RationalTime* dest);
         bool read(std::string const& key, TimeRange* dest);
         bool read(std::string const& key, class TimeTransform* dest);
@@ -481,6 +495,9 @@ public:
             write(key, retainer.value);
         }
 
+        /// @brief Fail the write, for objects that cannot be written.
+        void error(ErrorStatus const& error_status);
+
     private:
         /// Convenience routines for converting various STL structures of specific
         /// types to a parallel hierarchy holding std::any.
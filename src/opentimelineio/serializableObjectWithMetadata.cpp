@@ -28,7 +28,7 @@ SerializableObjectWithMetadata::write_to(Writer& writer) const
 {
     SerializableObject::write_to(writer);
     writer.write("metadata", _metadata);
-    writer.write("name", _name);
+    writer.write("name", _name.str());
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -4,6 +4,7 @@
 #pragma once
 
 #include "opentimelineio/serializableObject.h"
+#include "opentimelineio/stringPool.h"
 #include "opentimelineio/version.h"
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -30,7 +31,7 @@ public:
         AnyDictionary const& metadata = AnyDictionary());
 
     /// @brief Return the object name.
-    std::string name() const noexcept { return _name; }
+    std::string name() const noexcept { return _name.str(); }
 
     /// @brief Set the object name.
     void set_name(std::string const& name) { _name = name; }
@@ -41,6 +42,13 @@ public:
     /// @brief Return the object metadata.
     AnyDictionary metadata() const noexcept { return _metadata; }
 
+    /// @brief Return a reference to the object metadata, for reading it
+    /// without a copy.
+    ///
+    /// Unlike the non-const metadata(), this does not discard the raw JSON
+    /// of metadata that was read lazily.
+    AnyDictionary const& metadata_ref() const noexcept { return _metadata; }
+
 protected:
     virtual ~SerializableObjectWithMetadata();
 
@@ -48,8 +56,8 @@ protected:
     void write_to(Writer&) const override;
 
 private:
-    std::string   _name;
-    AnyDictionary _metadata;
+    InternedString _name;
+    AnyDictionary  _metadata;
 };
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
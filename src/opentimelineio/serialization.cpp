@@ -2,14 +2,18 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include "opentimelineio/serialization.h"
+#include "binaryEncoding.h"
 #include "errorStatus.h"
 #include "opentimelineio/anyDictionary.h"
 #include "opentimelineio/color.h"
+#include "opentimelineio/composable.h"
 #include "opentimelineio/serializableObject.h"
+#include "opentimelineio/typedArray.h"
 #include "opentimelineio/unknownSchema.h"
 #include "stringUtils.h"
 #include <cstddef>
 #include <string>
+#include <unordered_map>
 
 #define RAPIDJSON_NAMESPACE OTIO_rapidjson
 #include <rapidjson/ostreamwrapper.h>
@@ -17,7 +21,10 @@
 #include <rapidjson/stringbuffer.h>
 #include <rapidjson/writer.h>
 
+#include <atomic>
+#include <filesystem>
 #include <fstream>
+#include <thread>
 
 #if defined(_WINDOWS)
 #    ifndef WIN32_LEAN_AND_MEAN
@@ -59,6 +66,15 @@ public:
 
     virtual bool encoding_to_anydict() { return false; }
 
+    // Write the JSON text of an object as is, returning false if the encoder
+    // cannot do that.
+    virtual bool write_raw_object(std::string const&) { return false; }
+
+    // Called after the start_object() and end_object() calls of schema
+    // objects, for encoders that record where objects are in their output.
+    virtual void start_schema_object(SerializableObject const*) {}
+    virtual void end_schema_object() {}
+
     virtual void start_object() = 0;
     virtual void end_object()   = 0;
 
@@ -80,6 +96,8 @@ public:
     virtual void write_value(struct SerializableObject::ReferenceId) = 0;
     virtual void write_value(IMATH_NAMESPACE::Box2d const&)          = 0;
     virtual void write_value(IMATH_NAMESPACE::V2d const&)            = 0;
+    virtual void write_value(Float64Array const&)                    = 0;
+    virtual void write_value(Int64Array const&)                      = 0;
 
 protected:
     void _error(ErrorStatus const& error_status)
@@ -325,6 +343,16 @@ public:
             _store(std::any(value));
         }
     }
+
+    void write_value(Float64Array const& value) override
+    {
+        _write_typed_array(value);
+    }
+
+    void write_value(Int64Array const& value) override
+    {
+        _write_typed_array(value);
+    }
     // @}
 
     void start_array(size_t /* n */) override
@@ -431,6 +459,24 @@ public:
     }
 
 private:
+    template <typename T>
+    void _write_typed_array(TypedArray<T> const& value)
+    {
+        if (_result_object_policy == ResultObjectPolicy::OnlyAnyDictionary)
+        {
+            AnyDictionary result{
+                { "OTIO_SCHEMA", "TypedArray.1" },
+                { "dtype", std::string(value.dtype()) },
+                { "data", value.to_base64() },
+            };
+            _store(std::any(std::move(result)));
+        }
+        else
+        {
+            _store(std::any(value));
+        }
+    }
+
     std::any                                _root;
     SerializableObject::Reader::_Resolver   _resolver;
     std::function<void(ErrorStatus const&)> _error_function;
@@ -552,6 +598,14 @@ public:
 
     void write_value(double value) { _writer.Double(value); }
 
+    bool write_raw_object(std::string const& json)
+    {
+        return _writer.RawValue(
+            json.c_str(),
+            json.size(),
+            OTIO_rapidjson::kObjectType);
+    }
+
     void write_value(RationalTime const& value)
     {
         _writer.StartObject();
@@ -670,6 +724,10 @@ public:
         _writer.EndObject();
     }
 
+    void write_value(Float64Array const& value) { _write_typed_array(value); }
+
+    void write_value(Int64Array const& value) { _write_typed_array(value); }
+
     void start_array(size_t) { _writer.StartArray(); }
 
     void start_object() { _writer.StartObject(); }
@@ -679,9 +737,340 @@ public:
     void end_object() { _writer.EndObject(); }
 
 private:
+    template <typename T>
+    void _write_typed_array(TypedArray<T> const& value)
+    {
+        _writer.StartObject();
+
+        _writer.Key("OTIO_SCHEMA");
+        _writer.String("TypedArray.1");
+
+        _writer.Key("dtype");
+        _writer.String(value.dtype());
+
+        _writer.Key("data");
+        _writer.String(value.to_base64().c_str());
+
+        _writer.EndObject();
+    }
+
     RapidJSONWriterType& _writer;
 };
 
+/**
+ * Output stream wrapper that counts the characters written.
+ */
+template <typename OutputStream>
+class CountingStreamWrapper
+{
+public:
+    typedef typename OutputStream::Ch Ch;
+
+    CountingStreamWrapper(OutputStream& stream)
+        : _stream(stream)
+    {}
+
+    void Put(Ch c)
+    {
+        _stream.Put(c);
+        ++_count;
+    }
+
+    void Flush() { _stream.Flush(); }
+
+    size_t count() const noexcept { return _count; }
+
+private:
+    OutputStream& _stream;
+    size_t        _count = 0;
+};
+
+/**
+ * RapidJSON output stream that writes to a std::ostream in blocks, rather
+ * than one character at a time like OTIO_rapidjson::OStreamWrapper.
+ */
+class BufferedOStreamWrapper
+{
+public:
+    typedef char Ch;
+
+    BufferedOStreamWrapper(std::ostream& stream)
+        : _stream(stream)
+    {}
+
+    ~BufferedOStreamWrapper() { Flush(); }
+
+    void Put(Ch c)
+    {
+        if (_size == sizeof(_buffer))
+        {
+            Flush();
+        }
+        _buffer[_size++] = c;
+    }
+
+    void Flush()
+    {
+        // once the stream has failed the rest of the output is dropped
+        if (_size && _stream)
+        {
+            _stream.write(_buffer, std::streamsize(_size));
+        }
+        _size = 0;
+    }
+
+private:
+    std::ostream& _stream;
+    char          _buffer[4096];
+    size_t        _size = 0;
+};
+
+/**
+ * JSON encoder that records where the composables it writes are in its
+ * output, see serialize_json_to_file().
+ */
+template <typename RapidJSONWriterType, typename OutputStream>
+class RangeRecordingJSONEncoder : public JSONEncoder<RapidJSONWriterType>
+{
+public:
+    RangeRecordingJSONEncoder(
+        RapidJSONWriterType&                 writer,
+        CountingStreamWrapper<OutputStream>& stream,
+        std::vector<JSONObjectRange>*        object_ranges)
+        : JSONEncoder<RapidJSONWriterType>(writer)
+        , _stream(stream)
+        , _object_ranges(object_ranges)
+    {}
+
+    void start_schema_object(SerializableObject const* object) override
+    {
+        if (!dynamic_cast<Composable const*>(object))
+        {
+            _open_ranges.push_back(npos);
+            return;
+        }
+
+        // the opening brace has just been written
+        _open_ranges.push_back(_object_ranges->size());
+        _object_ranges->push_back({ object, _stream.count() - 1, 0 });
+    }
+
+    void end_schema_object() override
+    {
+        size_t const index = _open_ranges.back();
+        _open_ranges.pop_back();
+        if (index != npos)
+        {
+            (*_object_ranges)[index].end = _stream.count();
+        }
+    }
+
+private:
+    static constexpr size_t npos = size_t(-1);
+
+    CountingStreamWrapper<OutputStream>& _stream;
+    std::vector<JSONObjectRange>*        _object_ranges;
+    std::vector<size_t>                  _open_ranges;
+};
+
+/**
+ * This encoder writes the binary encoding described in binaryEncoding.h.
+ */
+class BinaryEncoder : public Encoder
+{
+public:
+    BinaryEncoder(std::string& output)
+        : _output(output)
+    {
+        _output.append(binary_encoding::magic, binary_encoding::magic_size);
+    }
+
+    virtual ~BinaryEncoder() {}
+
+    void write_key(std::string const& key) override { _write_string(key); }
+
+    void write_null_value() override { _write_tag(binary_encoding::null); }
+
+    void write_value(bool value) override
+    {
+        _write_tag(
+            value ? binary_encoding::true_value : binary_encoding::false_value);
+    }
+
+    void write_value(int value) override { write_value(int64_t(value)); }
+
+    void write_value(int64_t value) override
+    {
+        _write_tag(binary_encoding::int64);
+        _write_numbers(&value, 1);
+    }
+
+    void write_value(uint64_t value) override
+    {
+        // the JSON reader keeps the low 63 bits of unsigned numbers too
+        write_value(static_cast<int64_t>(value & 0x7FFFFFFFFFFFFFFF));
+    }
+
+    void write_value(std::string const& value) override
+    {
+        _write_string(value);
+    }
+
+    void write_value(double value) override
+    {
+        _write_tag(binary_encoding::double_value);
+        _write_numbers(&value, 1);
+    }
+
+    void write_value(RationalTime const& value) override
+    {
+        double const numbers[] = { value.value(), value.rate() };
+        _write_tag(binary_encoding::rational_time);
+        _write_numbers(numbers, 2);
+    }
+
+    void write_value(TimeRange const& value) override
+    {
+        double const numbers[] = { value.start_time().value(),
+                                   value.start_time().rate(),
+                                   value.duration().value(),
+                                   value.duration().rate() };
+        _write_tag(binary_encoding::time_range);
+        _write_numbers(numbers, 4);
+    }
+
+    void write_value(TimeTransform const& value) override
+    {
+        double const numbers[] = { value.offset().value(),
+                                   value.offset().rate(),
+                                   value.scale(),
+                                   value.rate() };
+        _write_tag(binary_encoding::time_transform);
+        _write_numbers(numbers, 4);
+    }
+
+    void write_value(Color const& value) override
+    {
+        start_object();
+        _write_item("OTIO_SCHEMA", std::string("Color.1"));
+        _write_item("r", value.r());
+        _write_item("g", value.g());
+        _write_item("b", value.b());
+        _write_item("a", value.a());
+        _write_item("name", value.name());
+        end_object();
+    }
+
+    void write_value(SerializableObject::ReferenceId value) override
+    {
+        start_object();
+        _write_item("OTIO_SCHEMA", std::string("SerializableObjectRef.1"));
+        _write_item("id", value.id);
+        end_object();
+    }
+
+    void write_value(IMATH_NAMESPACE::V2d const& value) override
+    {
+        start_object();
+        _write_item("OTIO_SCHEMA", std::string("V2d.1"));
+        _write_item("x", value.x);
+        _write_item("y", value.y);
+        end_object();
+    }
+
+    void write_value(IMATH_NAMESPACE::Box2d const& value) override
+    {
+        start_object();
+        _write_item("OTIO_SCHEMA", std::string("Box2d.1"));
+        write_key("min");
+        write_value(value.min);
+        write_key("max");
+        write_value(value.max);
+        end_object();
+    }
+
+    void write_value(Float64Array const& value) override
+    {
+        _write_tag(binary_encoding::float64_array);
+        _write_varint(value.size());
+        _write_numbers(value.data(), value.size());
+    }
+
+    void write_value(Int64Array const& value) override
+    {
+        _write_tag(binary_encoding::int64_array);
+        _write_varint(value.size());
+        _write_numbers(value.data(), value.size());
+    }
+
+    void start_array(size_t) override
+    {
+        _write_tag(binary_encoding::array_begin);
+    }
+
+    void start_object() override { _write_tag(binary_encoding::object_begin); }
+
+    void end_array() override { _write_tag(binary_encoding::array_end); }
+
+    void end_object() override { _write_tag(binary_encoding::object_end); }
+
+private:
+    template <typename T>
+    void _write_item(char const* key, T const& value)
+    {
+        write_key(key);
+        write_value(value);
+    }
+
+    void _write_tag(binary_encoding::Tag tag) { _output.push_back(char(tag)); }
+
+    void _write_varint(uint64_t value)
+    {
+        while (value >= 0x80)
+        {
+            _output.push_back(char((value & 0x7f) | 0x80));
+            value >>= 7;
+        }
+        _output.push_back(char(value));
+    }
+
+    template <typename T>
+    void _write_numbers(T const* numbers, size_t count)
+    {
+        static_assert(sizeof(T) == 8, "numbers are written as 8 bytes");
+        size_t const offset = _output.size();
+        _output.resize(offset + count * 8);
+        binary_encoding::copy_little_endian(&_output[offset], numbers, count);
+    }
+
+    // Short strings, which are the keys and most of the values that repeat,
+    // are written once and referred to by their index after that.
+    void _write_string(std::string const& value)
+    {
+        if (value.size() <= binary_encoding::max_shared_string)
+        {
+            auto const found = _strings.find(value);
+            if (found != _strings.end())
+            {
+                _write_tag(binary_encoding::string_ref);
+                _write_varint(found->second);
+                return;
+            }
+            _strings.emplace(value, _strings.size());
+            _write_tag(binary_encoding::new_string);
+        }
+        else
+        {
+            _write_tag(binary_encoding::string);
+        }
+        _write_varint(value.size());
+        _output.append(value);
+    }
+
+    std::string&                            _output;
+    std::unordered_map<std::string, size_t> _strings;
+};
+
 template <typename T>
 bool
 _simple_any_comparison(std::any const& lhs, std::any const& rhs)
@@ -753,6 +1142,12 @@ SerializableObject::Writer::_build_dispatch_tables()
         _encoder.write_value(
             std::any_cast<IMATH_NAMESPACE::Box2d const&>(value));
     };
+    wt[&typeid(Float64Array)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<Float64Array const&>(value));
+    };
+    wt[&typeid(Int64Array)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<Int64Array const&>(value));
+    };
 
     /*
      * These next recurse back through the Writer itself:
@@ -798,6 +1193,8 @@ SerializableObject::Writer::_build_dispatch_tables()
         &_simple_any_comparison<IMATH_NAMESPACE::V2d>;
     et[&typeid(IMATH_NAMESPACE::Box2d)] =
         &_simple_any_comparison<IMATH_NAMESPACE::Box2d>;
+    et[&typeid(Float64Array)] = &_simple_any_comparison<Float64Array>;
+    et[&typeid(Int64Array)]   = &_simple_any_comparison<Int64Array>;
 
     /*
      * These next recurse back through the Writer itself:
@@ -894,6 +1291,12 @@ SerializableObject::Writer::write_root(
     return !encoder.has_errored(error_status);
 }
 
+void
+SerializableObject::Writer::error(ErrorStatus const& error_status)
+{
+    _encoder._error(error_status);
+}
+
 void
 SerializableObject::Writer::_encoder_write_key(std::string const& key)
 {
@@ -1103,6 +1506,7 @@ SerializableObject::Writer::write(
     }
 
     _encoder.start_object();
+    _encoder.start_schema_object(value);
 
 #ifdef OTIO_INSTANCING_SUPPORT
     _encoder.write_key("OTIO_REF_ID");
@@ -1126,6 +1530,7 @@ SerializableObject::Writer::write(
     }
 
     _encoder.end_object();
+    _encoder.end_schema_object();
 
 #ifndef OTIO_INSTANCING_SUPPORT
     auto valueEntry = _id_for_object.find(value);
@@ -1161,6 +1566,14 @@ SerializableObject::Writer::write(
 {
     _encoder_write_key(key);
 
+    // metadata that was read lazily and never modified is written back
+    // exactly as it was read
+    std::string const* json = value.raw_json();
+    if (json && _encoder.write_raw_object(*json))
+    {
+        return;
+    }
+
     _encoder.start_object();
 
     for (const auto& e: value)
@@ -1386,59 +1799,253 @@ serialize_json_to_string(
         error_status);
 }
 
+std::string
+serialize_binary_to_string(const std::any& value, ErrorStatus* error_status)
+{
+    std::string   output;
+    BinaryEncoder binary_encoder(output);
+
+    if (!SerializableObject::Writer::write_root(
+            value,
+            binary_encoder,
+            nullptr,
+            error_status))
+    {
+        return std::string();
+    }
+
+    return output;
+}
+
+namespace {
+
+template <typename JSONWriter, typename JSONEncoderType>
 bool
-serialize_json_to_file(
+_serialize_json_pretty(
     std::any const&           value,
-    std::string const&        file_name,
+    JSONWriter&               json_writer,
+    JSONEncoderType&          json_encoder,
     const schema_version_map* schema_version_targets,
     ErrorStatus*              error_status,
     int                       indent)
 {
+    if (indent >= 0)
+    {
+        json_writer.SetIndent(' ', indent);
+    }
+
+    return SerializableObject::Writer::write_root(
+        value,
+        json_encoder,
+        schema_version_targets,
+        error_status);
+}
+
+bool
+_serialize_json_to_ofstream(
+    std::any const&               value,
+    std::ofstream&                os,
+    const schema_version_map*     schema_version_targets,
+    ErrorStatus*                  error_status,
+    int                           indent,
+    std::vector<JSONObjectRange>* object_ranges)
+{
+    OTIO_rapidjson::OStreamWrapper osw(os);
+
+    if (object_ranges)
+    {
+        CountingStreamWrapper<decltype(osw)> cs(osw);
+        OTIO_rapidjson::PrettyWriter<
+            decltype(cs),
+            OTIO_rapidjson::UTF8<>,
+            OTIO_rapidjson::UTF8<>,
+            OTIO_rapidjson::CrtAllocator,
+            OTIO_rapidjson::kWriteNanAndInfFlag>
+            json_writer(cs);
+        RangeRecordingJSONEncoder<decltype(json_writer), decltype(osw)>
+            json_encoder(json_writer, cs, object_ranges);
+        return _serialize_json_pretty(
+            value,
+            json_writer,
+            json_encoder,
+            schema_version_targets,
+            error_status,
+            indent);
+    }
+
+    OTIO_rapidjson::PrettyWriter<
+        decltype(osw),
+        OTIO_rapidjson::UTF8<>,
+        OTIO_rapidjson::UTF8<>,
+        OTIO_rapidjson::CrtAllocator,
+        OTIO_rapidjson::kWriteNanAndInfFlag>
+                                       json_writer(osw);
+    JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+    return _serialize_json_pretty(
+        value,
+        json_writer,
+        json_encoder,
+        schema_version_targets,
+        error_status,
+        indent);
+}
+
+} // namespace
 
+bool
+serialize_json_to_file(
+    std::any const&               value,
+    std::string const&            file_name,
+    const schema_version_map*     schema_version_targets,
+    ErrorStatus*                  error_status,
+    int                           indent,
+    std::vector<JSONObjectRange>* object_ranges)
+{
 #if defined(_WINDOWS)
     const int wlen =
         MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
     std::vector<wchar_t> wchars(wlen);
     MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
-    std::ofstream os(wchars.data());
+    std::filesystem::path const path(wchars.data());
 #else  // _WINDOWS
-    std::ofstream os(file_name);
+    std::filesystem::path const path(file_name);
 #endif // _WINDOWS
 
-    if (!os.is_open())
+    // The file is written next to the destination and then moved over it,
+    // so that the children of compositions read lazily from the destination
+    // can still be read while it is written, and so that a failed write
+    // leaves the destination as it was.
+    static std::atomic<unsigned> temp_count{ 0 };
+    std::filesystem::path temp_path = path;
+    temp_path += string_printf(
+        ".%zx-%u.tmp",
+        std::hash<std::thread::id>()(std::this_thread::get_id()),
+        temp_count++);
+
+    bool success;
     {
-        if (error_status)
+        // the offsets are only right if newlines are not translated
+        auto const mode = object_ranges ? std::ios::out | std::ios::binary
+                                        : std::ios::out;
+        std::ofstream os(temp_path, mode);
+        if (!os.is_open())
         {
-            *error_status =
-                ErrorStatus(ErrorStatus::FILE_WRITE_FAILED, file_name);
+            if (error_status)
+            {
+                *error_status =
+                    ErrorStatus(ErrorStatus::FILE_WRITE_FAILED, file_name);
+            }
+            return false;
+        }
+
+        success = _serialize_json_to_ofstream(
+            value,
+            os,
+            schema_version_targets,
+            error_status,
+            indent,
+            object_ranges);
+
+        os.close();
+        if (success && os.fail())
+        {
+            success = false;
+            if (error_status)
+            {
+                *error_status =
+                    ErrorStatus(ErrorStatus::FILE_WRITE_FAILED, file_name);
+            }
         }
-        return false;
     }
 
-    OTIO_rapidjson::OStreamWrapper osw(os);
-    bool                           status;
+    std::error_code ec;
+    if (success)
+    {
+        // keep the permissions of a file that is replaced
+        auto const status = std::filesystem::status(path, ec);
+        if (!ec && std::filesystem::exists(status))
+        {
+            std::filesystem::permissions(temp_path, status.permissions(), ec);
+        }
 
-    OTIO_rapidjson::PrettyWriter<
-        decltype(osw),
-        OTIO_rapidjson::UTF8<>,
-        OTIO_rapidjson::UTF8<>,
-        OTIO_rapidjson::CrtAllocator,
-        OTIO_rapidjson::kWriteNanAndInfFlag>
-                                       json_writer(osw);
-    JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+        std::filesystem::rename(temp_path, path, ec);
+        if (ec)
+        {
+            success = false;
+            if (error_status)
+            {
+                *error_status =
+                    ErrorStatus(ErrorStatus::FILE_WRITE_FAILED, file_name);
+            }
+        }
+    }
 
-    if (indent >= 0)
+    if (!success)
     {
-        json_writer.SetIndent(' ', indent);
+        std::filesystem::remove(temp_path, ec);
     }
+    return success;
+}
 
-    status = SerializableObject::Writer::write_root(
-        value,
-        json_encoder,
-        schema_version_targets,
-        error_status);
+bool
+serialize_json_to_stream(
+    std::any const&           value,
+    std::ostream&             output,
+    const schema_version_map* schema_version_targets,
+    ErrorStatus*              error_status,
+    int                       indent)
+{
+    bool success;
+    {
+        BufferedOStreamWrapper bos(output);
+        if (indent > 0)
+        {
+            OTIO_rapidjson::PrettyWriter<
+                decltype(bos),
+                OTIO_rapidjson::UTF8<>,
+                OTIO_rapidjson::UTF8<>,
+                OTIO_rapidjson::CrtAllocator,
+                OTIO_rapidjson::kWriteNanAndInfFlag>
+                                               json_writer(bos);
+            JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+            success = _serialize_json_pretty(
+                value,
+                json_writer,
+                json_encoder,
+                schema_version_targets,
+                error_status,
+                indent);
+        }
+        else
+        {
+            OTIO_rapidjson::Writer<
+                decltype(bos),
+                OTIO_rapidjson::UTF8<>,
+                OTIO_rapidjson::UTF8<>,
+                OTIO_rapidjson::CrtAllocator,
+                OTIO_rapidjson::kWriteNanAndInfFlag>
+                                               json_writer(bos);
+            JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+            success = SerializableObject::Writer::write_root(
+                value,
+                json_encoder,
+                schema_version_targets,
+                error_status);
+        }
+    }
+    output.flush();
 
-    return status;
+    if (success && !output)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::FILE_WRITE_FAILED,
+                "failed to write to stream");
+        }
+        return false;
+    }
+    return success;
 }
 
 SerializableObject::Writer::~Writer()
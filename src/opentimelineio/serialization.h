@@ -8,8 +8,10 @@
 #include "opentimelineio/version.h"
 
 #include <any>
+#include <ostream>
 #include <string>
 #include <unordered_map>
+#include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
@@ -20,12 +22,51 @@ std::string serialize_json_to_string(
     ErrorStatus*              error_status           = nullptr,
     int                       indent                 = 4);
 
-/// @brief Serialize JSON data to a file.
-bool serialize_json_to_file(
+/// @brief Serialize data to a string in the binary encoding.
+///
+/// The binary encoding holds the same data as JSON, with numbers, times and
+/// typed arrays written as their bytes and repeated keys and short strings
+/// written once, so that it is smaller and much faster to write and read.
+/// It is meant for handing objects between processes, for example when they
+/// are pickled, not for storage: it is not a file format, it may change from
+/// one version of OpenTimelineIO to the next, and schemas can not be
+/// downgraded in it.
+std::string serialize_binary_to_string(
+    const std::any& value,
+    ErrorStatus*    error_status = nullptr);
+
+/// @brief Serialize JSON data to an output stream.
+///
+/// The JSON is written to the stream as it is encoded, the whole document is
+/// never held in memory.  As for serialize_json_to_string(), an indent of 0
+/// or less writes compact JSON.
+bool serialize_json_to_stream(
     const std::any&           value,
-    std::string const&        file_name,
+    std::ostream&             output,
     const schema_version_map* schema_version_targets = nullptr,
     ErrorStatus*              error_status           = nullptr,
     int                       indent                 = 4);
 
+/// @brief Where a composable was written in a JSON file.
+struct JSONObjectRange
+{
+    SerializableObject const* object;
+    size_t                    begin; ///< Offset of the opening brace.
+    size_t                    end;   ///< Offset one past the closing brace.
+};
+
+/// @brief Serialize JSON data to a file.
+///
+/// If object_ranges is not null, the byte range each composable was written
+/// to is appended to it, in the order the objects start in the file.  This
+/// is what the .otio.idx index that lets readers load part of a file is made
+/// from.
+bool serialize_json_to_file(
+    const std::any&               value,
+    std::string const&            file_name,
+    const schema_version_map*     schema_version_targets = nullptr,
+    ErrorStatus*                  error_status           = nullptr,
+    int                           indent                 = 4,
+    std::vector<JSONObjectRange>* object_ranges          = nullptr);
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -0,0 +1,249 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/stringPool.h"
+
+#include <atomic>
+#include <cstdlib>
+#include <cstring>
+#include <functional>
+#include <mutex>
+#include <new>
+#include <string_view>
+#include <vector>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+struct InternedString::_Entry
+{
+    std::atomic<size_t> references{ 1 };
+    size_t              size = 0;
+
+    char* text() noexcept { return reinterpret_cast<char*>(this + 1); }
+};
+
+namespace {
+
+using _Entry = InternedString::_Entry;
+
+// The distinct strings, in an open addressed hash table with linear probing.
+// Entries are small and short names are common, so the table holds just a
+// pointer per slot, and the text is stored right after each entry.
+struct _Pool
+{
+    std::mutex           mutex;
+    std::vector<_Entry*> slots;
+    size_t               count = 0;
+};
+
+_Pool&
+_pool()
+{
+    // never destroyed, strings may outlive static destruction
+    static _Pool* pool = new _Pool;
+    return *pool;
+}
+
+size_t
+_hash(char const* text, size_t size) noexcept
+{
+    return std::hash<std::string_view>()(std::string_view(text, size));
+}
+
+size_t
+_find_slot(_Pool const& pool, char const* text, size_t size) noexcept
+{
+    size_t const mask = pool.slots.size() - 1;
+    size_t       i    = _hash(text, size) & mask;
+    while (_Entry* entry = pool.slots[i])
+    {
+        if (entry->size == size && std::memcmp(entry->text(), text, size) == 0)
+        {
+            break;
+        }
+        i = (i + 1) & mask;
+    }
+    return i;
+}
+
+void
+_grow(_Pool& pool)
+{
+    std::vector<_Entry*> old_slots(
+        pool.slots.empty() ? 1024 : pool.slots.size() * 2,
+        nullptr);
+    pool.slots.swap(old_slots);
+    for (_Entry* entry: old_slots)
+    {
+        if (entry)
+        {
+            pool.slots[_find_slot(pool, entry->text(), entry->size)] = entry;
+        }
+    }
+}
+
+void
+_erase_slot(_Pool& pool, size_t i) noexcept
+{
+    // shift the entries that follow back, so lookups never stop at the hole
+    size_t const mask = pool.slots.size() - 1;
+    size_t       hole = i;
+    for (size_t j = (i + 1) & mask; pool.slots[j]; j = (j + 1) & mask)
+    {
+        _Entry* entry = pool.slots[j];
+        size_t  home  = _hash(entry->text(), entry->size) & mask;
+        if (((j - home) & mask) >= ((j - hole) & mask))
+        {
+            pool.slots[hole] = entry;
+            hole             = j;
+        }
+    }
+    pool.slots[hole] = nullptr;
+    --pool.count;
+}
+
+_Entry*
+_acquire(char const* text, size_t size)
+{
+    _Pool&                      pool = _pool();
+    std::lock_guard<std::mutex> lock(pool.mutex);
+
+    if ((pool.count + 1) * 2 > pool.slots.size())
+    {
+        _grow(pool);
+    }
+
+    size_t const i = _find_slot(pool, text, size);
+    if (_Entry* entry = pool.slots[i])
+    {
+        entry->references.fetch_add(1, std::memory_order_relaxed);
+        return entry;
+    }
+
+    void* memory = std::malloc(sizeof(_Entry) + size + 1);
+    if (!memory)
+    {
+        throw std::bad_alloc();
+    }
+    _Entry* entry = new (memory) _Entry;
+    entry->size   = size;
+    std::memcpy(entry->text(), text, size);
+    entry->text()[size] = '\0';
+
+    pool.slots[i] = entry;
+    ++pool.count;
+    return entry;
+}
+
+void
+_release(_Entry* entry) noexcept
+{
+    // only the last reference has to take the lock, to remove the entry
+    // before another thread can find it
+    size_t references = entry->references.load(std::memory_order_relaxed);
+    while (references > 1)
+    {
+        if (entry->references.compare_exchange_weak(
+                references,
+                references - 1,
+                std::memory_order_acq_rel))
+        {
+            return;
+        }
+    }
+
+    _Pool&                      pool = _pool();
+    std::lock_guard<std::mutex> lock(pool.mutex);
+    if (entry->references.fetch_sub(1, std::memory_order_acq_rel) == 1)
+    {
+        _erase_slot(pool, _find_slot(pool, entry->text(), entry->size));
+        entry->~_Entry();
+        std::free(entry);
+    }
+}
+
+} // namespace
+
+InternedString::InternedString(std::string const& text)
+    : _entry(text.empty() ? nullptr : _acquire(text.data(), text.size()))
+{}
+
+InternedString::InternedString(InternedString const& other) noexcept
+    : _entry(other._entry)
+{
+    if (_entry)
+    {
+        _entry->references.fetch_add(1, std::memory_order_relaxed);
+    }
+}
+
+InternedString::InternedString(InternedString&& other) noexcept
+    : _entry(other._entry)
+{
+    other._entry = nullptr;
+}
+
+InternedString::~InternedString()
+{
+    if (_entry)
+    {
+        _release(_entry);
+    }
+}
+
+InternedString&
+InternedString::operator=(InternedString const& other) noexcept
+{
+    InternedString copy(other);
+    std::swap(_entry, copy._entry);
+    return *this;
+}
+
+InternedString&
+InternedString::operator=(InternedString&& other) noexcept
+{
+    std::swap(_entry, other._entry);
+    return *this;
+}
+
+std::string
+InternedString::str() const
+{
+    return _entry ? std::string(_entry->text(), _entry->size) : std::string();
+}
+
+char const*
+InternedString::c_str() const noexcept
+{
+    return _entry ? _entry->text() : "";
+}
+
+size_t
+InternedString::size() const noexcept
+{
+    return _entry ? _entry->size : 0;
+}
+
+StringPoolStats
+string_pool_stats()
+{
+    _Pool&                      pool = _pool();
+    std::lock_guard<std::mutex> lock(pool.mutex);
+
+    StringPoolStats stats;
+    for (_Entry* entry: pool.slots)
+    {
+        if (entry)
+        {
+            size_t const references =
+                entry->references.load(std::memory_order_relaxed);
+            stats.strings += 1;
+            stats.references += references;
+            stats.bytes += entry->size;
+            stats.deduplicated_bytes += (references - 1) * entry->size;
+        }
+    }
+    return stats;
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -0,0 +1,93 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include <cstddef>
+#include <string>
+
+#include "opentimelineio/version.h"
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @brief An immutable string whose text is shared by every InternedString
+/// holding the same text.
+///
+/// The text is kept in a process-wide pool, once for each distinct string,
+/// and freed when the last InternedString holding it is destroyed.  Names
+/// and URLs are stored this way, because large timelines tend to repeat
+/// them many times over.  An empty InternedString holds nothing.
+///
+/// InternedString is safe to use from multiple threads, as long as a single
+/// instance is not modified on one thread while used on another.
+class InternedString
+{
+public:
+    /// @brief Create an empty string.
+    InternedString() noexcept = default;
+
+    /// @brief Create a string holding the given text.
+    InternedString(std::string const& text);
+
+    InternedString(InternedString const& other) noexcept;
+    InternedString(InternedString&& other) noexcept;
+
+    ~InternedString();
+
+    InternedString& operator=(InternedString const& other) noexcept;
+    InternedString& operator=(InternedString&& other) noexcept;
+
+    /// @brief Return the text.
+    std::string str() const;
+
+    /// @brief Return the text, which is null terminated.
+    char const* c_str() const noexcept;
+
+    /// @brief Return the length of the text.
+    size_t size() const noexcept;
+
+    /// @brief Return whether the text is empty.
+    bool empty() const noexcept { return !_entry; }
+
+    /// @brief Return whether two strings hold the same text.
+    friend bool
+    operator==(InternedString const& lhs, InternedString const& rhs) noexcept
+    {
+        return lhs._entry == rhs._entry;
+    }
+
+    /// @brief Return whether two strings hold different text.
+    friend bool
+    operator!=(InternedString const& lhs, InternedString const& rhs) noexcept
+    {
+        return lhs._entry != rhs._entry;
+    }
+
+    // The shared text, defined in stringPool.cpp.
+    struct _Entry;
+
+private:
+    _Entry* _entry = nullptr;
+};
+
+/// @brief Statistics about the strings in the pool.
+struct StringPoolStats
+{
+    /// @brief The number of distinct strings in the pool.
+    size_t strings = 0;
+
+    /// @brief The number of InternedString instances holding them.
+    size_t references = 0;
+
+    /// @brief The length of the text of the distinct strings.
+    size_t bytes = 0;
+
+    /// @brief The length of the text that would have been stored as well
+    /// if every reference held its own copy.
+    size_t deduplicated_bytes = 0;
+};
+
+/// @brief Return statistics about the strings in the pool.
+StringPoolStats string_pool_stats();
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -0,0 +1,276 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/timelineAlgorithm.h"
+#include "opentimelineio/clip.h"
+#include "opentimelineio/effect.h"
+#include "opentimelineio/marker.h"
+#include "opentimelineio/serializableCollection.h"
+#include "opentimelineio/trackAlgorithm.h"
+
+#include <algorithm>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+Timeline*
+timeline_trimmed_to_range(
+    Timeline*    in_timeline,
+    TimeRange    trim_range,
+    ErrorStatus* error_status)
+{
+    // the tracks are cloned as they are trimmed
+    Stack*                                 in_stack = in_timeline->tracks();
+    SerializableObject::Retainer<Timeline> new_timeline(
+        dynamic_cast<Timeline*>(Composition::_clone_without_children(
+            in_timeline,
+            in_stack,
+            error_status)));
+    if (is_error(error_status) || !new_timeline)
+    {
+        return nullptr;
+    }
+
+    Stack* new_stack = new_timeline.value->tracks();
+
+    for (auto const& child: in_stack->children())
+    {
+        Track* track = dynamic_retainer_cast<Track>(child);
+        if (!track)
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::TYPE_MISMATCH,
+                    "expected child of type Track*",
+                    child);
+            }
+            return nullptr;
+        }
+
+        // put the trim range into the space of the children of the track
+        auto const track_trim_range =
+            in_stack->transformed_time_range(trim_range, track, error_status);
+        if (is_error(error_status))
+        {
+            return nullptr;
+        }
+
+        // the track's own source range trims its children as well, the
+        // children are trimmed to both
+        auto const track_source_range = track->source_range();
+        auto       children_range     = track_trim_range;
+        bool       empty              = false;
+        if (track_source_range)
+        {
+            empty = !track_trim_range.intersects(*track_source_range);
+            children_range = track_source_range->clamped(track_trim_range);
+        }
+
+        SerializableObject::Retainer<Track> new_track(
+            track_trimmed_to_range(track, children_range, error_status));
+        if (is_error(error_status) || !new_track)
+        {
+            return nullptr;
+        }
+
+        if (track_source_range)
+        {
+            if (empty)
+            {
+                new_track.value->clear_children();
+            }
+
+            // the trimmed children start where the trim range meets the
+            // first child, which may be after the start of the trim range,
+            // so the source range keeps them at the same time in the stack
+            auto const start = track_trim_range.start_time();
+            auto const end   = std::max(
+                start,
+                std::min(
+                    track_trim_range.end_time_exclusive(),
+                    track_source_range->end_time_exclusive()));
+            auto content_start = start;
+            if (!new_track.value->children().empty())
+            {
+                content_start = std::max(
+                    children_range.start_time(),
+                    RationalTime(0, start.rate()));
+            }
+            auto const source_range = TimeRange::range_from_start_end_time(
+                start - content_start,
+                end - content_start);
+
+            // which is only needed if the children do not already fill it
+            auto const available_range =
+                new_track.value->available_range(error_status);
+            if (is_error(error_status))
+            {
+                return nullptr;
+            }
+            if (source_range.start_time().value() != 0
+                || source_range.duration() != available_range.duration())
+            {
+                new_track.value->set_source_range(source_range);
+            }
+            else
+            {
+                new_track.value->set_source_range(std::nullopt);
+            }
+        }
+
+        if (!new_stack->append_child(new_track, error_status))
+        {
+            return nullptr;
+        }
+    }
+
+    return new_timeline.take_value();
+}
+
+static void
+_add_metadata_keys(
+    SerializableObjectWithMetadata const* object,
+    std::map<std::string, int>&           keys)
+{
+    // read through a const reference, so that lazily read metadata keeps its
+    // raw JSON
+    for (auto const& entry: object->metadata_ref())
+    {
+        ++keys[entry.first];
+    }
+}
+
+// Add the object and the objects in it to the statistics, and return its
+// nesting depth.
+static int
+_add_statistics(SerializableObject* object, TimelineStatistics& statistics)
+{
+    ++statistics.schema_counts[object->schema_name()];
+    if (auto with_metadata =
+            dynamic_cast<SerializableObjectWithMetadata*>(object))
+    {
+        _add_metadata_keys(with_metadata, statistics.metadata_keys);
+    }
+
+    if (auto item = dynamic_cast<Item*>(object))
+    {
+        for (auto const& marker: item->markers())
+        {
+            _add_statistics(marker, statistics);
+        }
+        for (auto const& effect: item->effects())
+        {
+            _add_statistics(effect, statistics);
+        }
+    }
+
+    if (auto timeline = dynamic_cast<Timeline*>(object))
+    {
+        return _add_statistics(timeline->tracks(), statistics) + 1;
+    }
+    else if (auto clip = dynamic_cast<Clip*>(object))
+    {
+        ++statistics.clip_count;
+        _add_metadata_keys(clip, statistics.clip_metadata_keys);
+
+        ErrorStatus     error_status;
+        TimeRange const range = clip->trimmed_range(&error_status);
+        if (!is_error(error_status))
+        {
+            ++statistics.clip_rates[range.duration().rate()];
+        }
+
+        if (MediaReference* media_reference = clip->media_reference())
+        {
+            ++statistics.media_reference_kinds[media_reference->schema_name()];
+            _add_statistics(media_reference, statistics);
+        }
+    }
+    else if (auto composition = dynamic_cast<Composition*>(object))
+    {
+        if (auto track = dynamic_cast<Track*>(composition))
+        {
+            ++statistics.track_kinds[track->kind()];
+        }
+
+        int depth = 0;
+        for (auto const& child: composition->children())
+        {
+            depth = std::max(depth, _add_statistics(child, statistics) + 1);
+        }
+        return depth;
+    }
+    else if (auto collection = dynamic_cast<SerializableCollection*>(object))
+    {
+        for (auto const& child: collection->children())
+        {
+            if (child)
+            {
+                _add_statistics(child, statistics);
+            }
+        }
+    }
+    return 1;
+}
+
+TimelineStatistics
+timeline_statistics(SerializableObject* root)
+{
+    TimelineStatistics statistics;
+    if (!root)
+    {
+        return statistics;
+    }
+
+    statistics.deepest_nesting = _add_statistics(root, statistics);
+
+    // the overall durations are computed from the tracks, rather than
+    // from the children counted above
+    Stack* stack = dynamic_cast<Stack*>(root);
+    if (auto timeline = dynamic_cast<Timeline*>(root))
+    {
+        stack = timeline->tracks();
+    }
+    if (stack)
+    {
+        statistics.track_count = int(stack->children().size());
+
+        ErrorStatus     error_status;
+        TimeRange const range = stack->trimmed_range(&error_status);
+        if (!is_error(error_status))
+        {
+            statistics.range = range;
+        }
+
+        for (auto const& child: stack->children())
+        {
+            auto track = dynamic_cast<Track*>(child.value);
+            if (!track)
+            {
+                continue;
+            }
+
+            ErrorStatus        track_error_status;
+            RationalTime const duration = track->duration(&track_error_status);
+            if (is_error(track_error_status))
+            {
+                continue;
+            }
+            auto found = statistics.track_kind_durations.find(track->kind());
+            if (found == statistics.track_kind_durations.end())
+            {
+                statistics.track_kind_durations.emplace(
+                    track->kind(),
+                    duration);
+            }
+            else if (found->second < duration)
+            {
+                found->second = duration;
+            }
+        }
+    }
+
+    return statistics;
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
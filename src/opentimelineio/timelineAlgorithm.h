@@ -0,0 +1,76 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/timeline.h"
+#include "opentimelineio/version.h"
+
+#include <map>
+#include <optional>
+#include <string>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @brief Trim the timeline to the given range.
+///
+/// The range is in the space of the timeline's stack and is mapped into
+/// the space of each track.  Only the children that intersect the range
+/// are cloned.  A track with a source range is given one that keeps its
+/// trimmed children at the same time in the stack.
+Timeline* timeline_trimmed_to_range(
+    Timeline*    in_timeline,
+    TimeRange    trim_range,
+    ErrorStatus* error_status = nullptr);
+
+/// @brief Statistics about a timeline and the objects in it.
+///
+/// When the root is a stack, it is used as the timeline's stack.
+struct TimelineStatistics
+{
+    /// @brief The number of objects of each schema, by schema name.
+    std::map<std::string, int> schema_counts;
+
+    /// @brief The number of tracks in the timeline's stack.
+    int track_count = 0;
+
+    /// @brief The number of clips.
+    int clip_count = 0;
+
+    /// @brief The depth of the deepest object: 1 for an object that is not
+    /// a composition, plus 1 for each composition and timeline above it.
+    int deepest_nesting = 0;
+
+    /// @brief The trimmed range of the timeline's stack, if it can be
+    /// computed.
+    std::optional<TimeRange> range;
+
+    /// @brief The number of tracks of each kind, including nested tracks.
+    std::map<std::string, int> track_kinds;
+
+    /// @brief The duration of the longest track of each kind in the
+    /// timeline's stack.
+    std::map<std::string, RationalTime> track_kind_durations;
+
+    /// @brief The number of clips whose trimmed range has each rate.
+    std::map<double, int> clip_rates;
+
+    /// @brief The number of objects that have each metadata key.
+    std::map<std::string, int> metadata_keys;
+
+    /// @brief The number of clips that have each metadata key.
+    std::map<std::string, int> clip_metadata_keys;
+
+    /// @brief The number of clips using each schema of media reference.
+    std::map<std::string, int> media_reference_kinds;
+};
+
+/// @brief Compute statistics about the timeline, or any other object, and
+/// the objects in it, in a single traversal.
+///
+/// The objects counted are the object itself, and the children, markers,
+/// effects and active media references of the objects in it, including the
+/// tracks of timelines and the children of serializable collections.
+TimelineStatistics timeline_statistics(SerializableObject* root);
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -55,6 +55,11 @@ Track::range_of_child_at_index(int index, ErrorStatus* error_status) const
         return TimeRange();
     }
 
+    if (auto range = _indexed_range_of_child_at_index(index))
+    {
+        return *range;
+    }
+
     Composable*  child          = children()[index];
     RationalTime child_duration = child->duration(error_status);
     if (is_error(error_status))
@@ -2,6 +2,8 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include "opentimelineio/trackAlgorithm.h"
+#include "opentimelineio/effect.h"
+#include "opentimelineio/marker.h"
 #include "opentimelineio/transition.h"
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -12,26 +14,25 @@ track_trimmed_to_range(
     TimeRange    trim_range,
     ErrorStatus* error_status)
 {
-    Track* new_track = dynamic_cast<Track*>(in_track->clone(error_status));
-    if (is_error(error_status) || !new_track)
+    // a single pass over the children of the input computes their ranges,
+    // only the children that intersect the trim range are cloned
+    auto track_map = in_track->range_of_all_children(error_status);
+    if (is_error(error_status))
     {
         return nullptr;
     }
 
-    auto track_map = new_track->range_of_all_children(error_status);
-    if (is_error(error_status))
+    // only the children that are kept are cloned
+    SerializableObject::Retainer<Track> new_track(dynamic_cast<Track*>(
+        Composition::_clone_without_children(in_track, in_track, error_status)));
+    if (is_error(error_status) || !new_track)
     {
         return nullptr;
     }
 
-    std::vector<Composable*> children_copy(
-        new_track->children().begin(),
-        new_track->children().end());
-
-    for (size_t i = children_copy.size(); i--;)
+    for (auto const& child: in_track->children())
     {
-        Composable* child          = children_copy[i];
-        auto        child_range_it = track_map.find(child);
+        auto child_range_it = track_map.find(child);
         if (child_range_it == track_map.end())
         {
             if (error_status)
@@ -46,26 +47,24 @@ track_trimmed_to_range(
         auto child_range = child_range_it->second;
         if (!trim_range.intersects(child_range))
         {
-            new_track->remove_child(static_cast<int>(i), error_status);
-            if (is_error(error_status))
-            {
-                return nullptr;
-            }
+            continue;
         }
-        else if (!trim_range.contains(child_range))
+
+        std::optional<TimeRange> child_source_range;
+        if (!trim_range.contains(child_range))
         {
-            if (dynamic_cast<Transition*>(child))
+            if (dynamic_retainer_cast<Transition>(child))
             {
                 if (error_status)
                 {
                     *error_status = ErrorStatus(
                         ErrorStatus::CANNOT_TRIM_TRANSITION,
-                        "Cannot trim in the middle of a transition");
+                        "Cannot trim in the middle of a Transition.");
                 }
                 return nullptr;
             }
 
-            Item* child_item = dynamic_cast<Item*>(child);
+            Item* child_item = dynamic_retainer_cast<Item>(child);
             if (!child_item)
             {
                 if (error_status)
@@ -77,7 +76,7 @@ track_trimmed_to_range(
                 }
                 return nullptr;
             }
-            auto child_source_range = child_item->trimmed_range(error_status);
+            auto trimmed = child_item->trimmed_range(error_status);
             if (is_error(error_status))
             {
                 return nullptr;
@@ -87,26 +86,45 @@ track_trimmed_to_range(
             {
                 auto trim_amount =
                     trim_range.start_time() - child_range.start_time();
-                child_source_range = TimeRange(
-                    child_source_range.start_time() + trim_amount,
-                    child_source_range.duration() - trim_amount);
+                trimmed = TimeRange(
+                    trimmed.start_time() + trim_amount,
+                    trimmed.duration() - trim_amount);
             }
 
             auto trim_end  = trim_range.end_time_exclusive();
             auto child_end = child_range.end_time_exclusive();
             if (trim_end < child_end)
             {
-                auto trim_amount   = child_end - trim_end;
-                child_source_range = TimeRange(
-                    child_source_range.start_time(),
-                    child_source_range.duration() - trim_amount);
+                auto trim_amount = child_end - trim_end;
+                trimmed          = TimeRange(
+                    trimmed.start_time(),
+                    trimmed.duration() - trim_amount);
             }
 
-            child_item->set_source_range(child_source_range);
+            child_source_range = trimmed;
+        }
+
+        auto new_child =
+            dynamic_cast<Composable*>(child.value->clone(error_status));
+        if (is_error(error_status) || !new_child)
+        {
+            return nullptr;
+        }
+        SerializableObject::Retainer<Composable> new_child_retainer(new_child);
+
+        if (child_source_range)
+        {
+            dynamic_cast<Item*>(new_child)->set_source_range(
+                child_source_range);
+        }
+
+        if (!new_track.value->append_child(new_child, error_status))
+        {
+            return nullptr;
         }
     }
 
-    return new_track;
+    return new_track.take_value();
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
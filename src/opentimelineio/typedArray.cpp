@@ -0,0 +1,140 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/typedArray.h"
+
+#include <algorithm>
+#include <cstring>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+static char const _base64_alphabet[] =
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+
+static bool
+_is_little_endian()
+{
+    uint16_t const one = 1;
+    return *reinterpret_cast<uint8_t const*>(&one) == 1;
+}
+
+template <typename T>
+char const*
+TypedArray<T>::dtype()
+{
+    return std::is_floating_point<T>::value ? "float64" : "int64";
+}
+
+template <typename T>
+std::string
+TypedArray<T>::to_base64() const
+{
+    size_t const   size  = this->size() * sizeof(T);
+    uint8_t const* bytes = reinterpret_cast<uint8_t const*>(this->data());
+
+    std::vector<uint8_t> swapped;
+    if (!_is_little_endian())
+    {
+        swapped.assign(bytes, bytes + size);
+        for (size_t i = 0; i < size; i += sizeof(T))
+        {
+            std::reverse(swapped.begin() + i, swapped.begin() + i + sizeof(T));
+        }
+        bytes = swapped.data();
+    }
+
+    std::string result;
+    result.reserve((size + 2) / 3 * 4);
+    for (size_t i = 0; i < size; i += 3)
+    {
+        uint32_t chunk = uint32_t(bytes[i]) << 16;
+        if (i + 1 < size)
+        {
+            chunk |= uint32_t(bytes[i + 1]) << 8;
+        }
+        if (i + 2 < size)
+        {
+            chunk |= uint32_t(bytes[i + 2]);
+        }
+
+        result.push_back(_base64_alphabet[(chunk >> 18) & 0x3f]);
+        result.push_back(_base64_alphabet[(chunk >> 12) & 0x3f]);
+        result.push_back(
+            i + 1 < size ? _base64_alphabet[(chunk >> 6) & 0x3f] : '=');
+        result.push_back(i + 2 < size ? _base64_alphabet[chunk & 0x3f] : '=');
+    }
+    return result;
+}
+
+template <typename T>
+bool
+TypedArray<T>::set_from_base64(std::string const& data)
+{
+    if (data.size() % 4 != 0)
+    {
+        return false;
+    }
+
+    std::vector<uint8_t> bytes;
+    bytes.reserve(data.size() / 4 * 3);
+    for (size_t i = 0; i < data.size(); i += 4)
+    {
+        uint32_t chunk   = 0;
+        int      padding = 0;
+        for (size_t j = 0; j < 4; ++j)
+        {
+            char const c = data[i + j];
+            chunk <<= 6;
+            if (c == '=' && i + 4 == data.size() && j >= 2)
+            {
+                ++padding;
+                continue;
+            }
+            if (padding)
+            {
+                return false;
+            }
+            char const* p = std::strchr(_base64_alphabet, c);
+            if (c == '\0' || !p)
+            {
+                return false;
+            }
+            chunk |= uint32_t(p - _base64_alphabet);
+        }
+
+        bytes.push_back(uint8_t(chunk >> 16));
+        if (padding < 2)
+        {
+            bytes.push_back(uint8_t(chunk >> 8));
+        }
+        if (padding < 1)
+        {
+            bytes.push_back(uint8_t(chunk));
+        }
+    }
+
+    if (bytes.size() % sizeof(T) != 0)
+    {
+        return false;
+    }
+
+    if (!_is_little_endian())
+    {
+        for (size_t i = 0; i < bytes.size(); i += sizeof(T))
+        {
+            std::reverse(bytes.begin() + i, bytes.begin() + i + sizeof(T));
+        }
+    }
+
+    this->resize(bytes.size() / sizeof(T));
+    if (!bytes.empty())
+    {
+        std::memcpy(this->data(), bytes.data(), bytes.size());
+    }
+    return true;
+}
+
+template class TypedArray<double>;
+template class TypedArray<int64_t>;
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
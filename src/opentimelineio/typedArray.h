@@ -0,0 +1,63 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+#include "opentimelineio/version.h"
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @brief A contiguous array of numbers of a single type.
+///
+/// Typed arrays are stored in metadata like any other value, but unlike an
+/// AnyVector of numbers their elements are not boxed individually.  They are
+/// serialized as an object with the schema "TypedArray.1", holding the name
+/// of the element type and the base64 encoded little endian bytes of the
+/// elements.  Versions of OpenTimelineIO without typed arrays read such an
+/// object as an unknown schema and write it back unchanged.
+template <typename T>
+class TypedArray : public std::vector<T>
+{
+public:
+    struct Schema
+    {
+        static auto constexpr name   = "TypedArray";
+        static int constexpr version = 1;
+    };
+
+    using std::vector<T>::vector;
+
+    TypedArray() = default;
+
+    explicit TypedArray(std::vector<T> const& values)
+        : std::vector<T>(values)
+    {}
+
+    explicit TypedArray(std::vector<T>&& values)
+        : std::vector<T>(std::move(values))
+    {}
+
+    /// @brief Return the name of the element type, "float64" or "int64".
+    static char const* dtype();
+
+    /// @brief Return the base64 encoded little endian bytes of the elements.
+    std::string to_base64() const;
+
+    /// @brief Set the elements from base64 encoded little endian bytes.
+    ///
+    /// Returns false if data is not valid base64 or its length is not a
+    /// multiple of the element size.
+    bool set_from_base64(std::string const& data);
+};
+
+/// @brief A contiguous array of 64-bit floating point numbers.
+using Float64Array = TypedArray<double>;
+
+/// @brief A contiguous array of 64-bit integers.
+using Int64Array = TypedArray<int64_t>;
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
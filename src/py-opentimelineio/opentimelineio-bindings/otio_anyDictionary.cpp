@@ -27,5 +27,12 @@ void otio_any_dictionary_bindings(py::module m) {
         .def("__internal_setitem__", &AnyDictionaryProxy::set_item, "key"_a, "item"_a)
         .def("__delitem__", &AnyDictionaryProxy::del_item, "key"_a)
         .def("__len__", &AnyDictionaryProxy::len)
-        .def("__iter__", &AnyDictionaryProxy::iter, py::return_value_policy::reference_internal);
+        .def("__iter__", &AnyDictionaryProxy::iter, py::return_value_policy::reference_internal)
+        .def("to_dict", [](AnyDictionaryProxy* d, bool deep) {
+            return any_dictionary_to_py_dict(d->fetch_any_dictionary(), deep);
+        }, "deep"_a = true, R"docstring(Return the contents as a python :class:`dict`, converted in a single pass.
+
+:param bool deep: also convert nested dictionaries and lists to :class:`dict` and :class:`list`,
+                  instead of returning :class:`AnyDictionary` and :class:`AnyVector` views of them
+)docstring");
 }
@@ -24,7 +24,14 @@ void otio_any_vector_bindings(py::module m) {
         .def("__internal_delitem__", &AnyVectorProxy::del_item, "index"_a)
         .def("__len__", &AnyVectorProxy::len)
         .def("__internal_insert", &AnyVectorProxy::insert)
-        .def("__iter__", &AnyVectorProxy::iter, py::return_value_policy::reference_internal);
+        .def("__iter__", &AnyVectorProxy::iter, py::return_value_policy::reference_internal)
+        .def("to_list", [](AnyVectorProxy* v, bool deep) {
+            return any_vector_to_py_list(v->fetch_any_vector(), deep);
+        }, "deep"_a = true, R"docstring(Return the contents as a python :class:`list`, converted in a single pass.
+
+:param bool deep: also convert nested dictionaries and lists to :class:`dict` and :class:`list`,
+                  instead of returning :class:`AnyDictionary` and :class:`AnyVector` views of them
+)docstring");
 }
 
 
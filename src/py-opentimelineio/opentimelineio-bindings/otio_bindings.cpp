@@ -10,15 +10,185 @@
 #include "otio_errorStatusHandler.h"
 #include "opentimelineio/serialization.h"
 #include "opentimelineio/deserialization.h"
+#include "opentimelineio/algo/editAlgorithm.h"
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/typeRegistry.h"
 #include "opentimelineio/stackAlgorithm.h"
+#include "opentimelineio/stringPool.h"
+#include "opentimelineio/timelineAlgorithm.h"
+#include "opentimelineio/trackAlgorithm.h"
 
 #include <Imath/ImathBox.h>
 
+#include <algorithm>
+#include <istream>
+#include <ostream>
+#include <streambuf>
+
 namespace py = pybind11;
 using namespace pybind11::literals;
 
+// A std::streambuf that pulls its data in chunks from the read() method of a
+// python file-like object, returning either bytes (utf-8) or str.  Python
+// errors raised by read() end the stream and are re-raised by
+// rethrow_read_error() once the parser has stopped.
+class PyReadStreambuf : public std::streambuf {
+public:
+    PyReadStreambuf(py::object stream, size_t chunk_size)
+        : _read(stream.attr("read")),
+          _chunk_size(chunk_size) {
+    }
+
+    void rethrow_read_error() {
+        if (_read_error) {
+            std::rethrow_exception(_read_error);
+        }
+    }
+
+protected:
+    int_type underflow() override {
+        if (gptr() < egptr()) {
+            return traits_type::to_int_type(*gptr());
+        }
+
+        try {
+            // str chunks are utf-8 encoded by the cast
+            _buffer = _read(_chunk_size).cast<std::string>();
+        } catch (...) {
+            _read_error = std::current_exception();
+            _buffer.clear();
+        }
+
+        if (_buffer.empty()) {
+            return traits_type::eof();
+        }
+
+        char* data = &_buffer[0];
+        setg(data, data, data + _buffer.size());
+        return traits_type::to_int_type(*gptr());
+    }
+
+private:
+    py::object _read;
+    size_t _chunk_size;
+    std::string _buffer;
+    std::exception_ptr _read_error;
+};
+
+// A contiguous, read-only view of the memory of a python bytes-like object.
+// The buffer is released when the view goes out of scope, so the object can
+// be resized again even if reading from it raised.
+class PyBufferView {
+public:
+    explicit PyBufferView(py::handle object) {
+        if (PyObject_GetBuffer(object.ptr(), &_view, PyBUF_SIMPLE) != 0) {
+            throw py::error_already_set();
+        }
+    }
+
+    ~PyBufferView() {
+        PyBuffer_Release(&_view);
+    }
+
+    PyBufferView(PyBufferView const&) = delete;
+    PyBufferView& operator=(PyBufferView const&) = delete;
+
+    void const* data() const { return _view.buf; }
+    size_t size() const { return size_t(_view.len); }
+
+private:
+    Py_buffer _view;
+};
+
+// A std::streambuf that collects what is written to it in chunks and passes
+// each to a python write function, as bytes or, for text streams, as str.
+// The function is called with the GIL held, so the writer can run without it
+// in between.  Python errors raised by the function fail the stream and are
+// re-raised by rethrow_write_error() once the writer has stopped.
+class PyWriteStreambuf : public std::streambuf {
+public:
+    PyWriteStreambuf(py::object write, bool text, size_t chunk_size)
+        : _write(write),
+          _text(text),
+          _buffer(std::max(chunk_size, size_t(4)), '\0') {
+        char* data = &_buffer[0];
+        setp(data, data + _buffer.size());
+    }
+
+    void rethrow_write_error() {
+        if (_write_error) {
+            std::rethrow_exception(_write_error);
+        }
+    }
+
+protected:
+    int_type overflow(int_type c) override {
+        if (!write_chunk(false)) {
+            return traits_type::eof();
+        }
+        if (!traits_type::eq_int_type(c, traits_type::eof())) {
+            *pptr() = traits_type::to_char_type(c);
+            pbump(1);
+        }
+        return traits_type::not_eof(c);
+    }
+
+    int sync() override {
+        return write_chunk(true) ? 0 : -1;
+    }
+
+private:
+    bool write_chunk(bool all) {
+        if (_write_error) {
+            return false;
+        }
+
+        size_t const size = size_t(pptr() - pbase());
+        size_t chunk = size;
+        if (_text && !all) {
+            // a str can only hold whole utf-8 sequences, the end of one that
+            // is cut off is kept for the next chunk
+            size_t start = size;
+            while (start > 0 && size - start < 3
+                   && (static_cast<unsigned char>(_buffer[start - 1]) & 0xC0) == 0x80) {
+                --start;
+            }
+            if (start > 0) {
+                unsigned char const lead = _buffer[start - 1];
+                size_t const length = lead < 0xC0 ? 1 : lead < 0xE0 ? 2 : lead < 0xF0 ? 3 : 4;
+                if (start - 1 + length > size) {
+                    chunk = start - 1;
+                }
+            }
+        }
+
+        if (chunk) {
+            py::gil_scoped_acquire acquire;
+            try {
+                if (_text) {
+                    _write(py::str(_buffer.data(), chunk));
+                } else {
+                    _write(py::bytes(_buffer.data(), chunk));
+                }
+            } catch (...) {
+                _write_error = std::current_exception();
+                return false;
+            }
+        }
+
+        std::copy(_buffer.begin() + chunk, _buffer.begin() + size, _buffer.begin());
+        char* data = &_buffer[0];
+        setp(data, data + _buffer.size());
+        pbump(int(size - chunk));
+        return true;
+    }
+
+    py::object _write;
+    bool _text;
+    std::string _buffer;
+    std::exception_ptr _write_error;
+};
+
 // temporarily disabling this feature while I chew on it
 const static bool EXCEPTION_ON_DOUBLE_REGISTER = false;
 
@@ -178,6 +348,7 @@ PYBIND11_MODULE(_otio, m) {
     otio_any_dictionary_bindings(m);
     otio_any_vector_bindings(m);
     otio_imath_bindings(m);
+    otio_typed_array_bindings(m);
     otio_serializable_object_bindings(m);
     otio_tests_bindings(m);
 
@@ -221,30 +392,196 @@ PYBIND11_MODULE(_otio, m) {
           "filename"_a,
           "schema_version_targets"_a,
           "indent"_a)
+     .def("_serialize_json_to_stream",
+          [](
+              PyAny* pyAny,
+              py::object write,
+              bool text,
+              const schema_version_map& schema_version_targets,
+              int indent,
+              size_t chunk_size
+          ) {
+              PyWriteStreambuf buffer(write, text, chunk_size);
+              std::ostream output(&buffer);
+
+              bool success;
+              ErrorStatus error_status;
+              {
+                  py::gil_scoped_release release;
+                  success = serialize_json_to_stream(
+                          pyAny->a,
+                          output,
+                          &schema_version_targets,
+                          &error_status,
+                          indent
+                  );
+              }
+
+              // a failure to write takes precedence over the error it causes
+              buffer.rethrow_write_error();
+              if (is_error(error_status)) {
+                  auto err = ErrorStatusHandler();
+                  err.error_status = error_status;
+              }
+              return success;
+          },
+          "value"_a,
+          "write"_a,
+          "text"_a,
+          "schema_version_targets"_a,
+          "indent"_a,
+          "chunk_size"_a)
+     .def("_serialize_json_to_file_with_object_ranges",
+          [](
+              PyAny* pyAny,
+              std::string filename,
+              const schema_version_map& schema_version_targets,
+              int indent
+          ) {
+              std::vector<JSONObjectRange> object_ranges;
+              serialize_json_to_file(
+                      pyAny->a,
+                      filename,
+                      &schema_version_targets,
+                      ErrorStatusHandler(),
+                      indent,
+                      &object_ranges
+              );
+
+              py::list result;
+              for (auto const& e: object_ranges) {
+                  result.append(py::make_tuple(
+                      const_cast<SerializableObject*>(e.object),
+                      e.begin,
+                      e.end));
+              }
+              return result;
+          },
+          "value"_a,
+          "filename"_a,
+          "schema_version_targets"_a,
+          "indent"_a)
+     .def("_serialize_binary",
+          [](PyAny* pyAny) {
+              return py::bytes(
+                  serialize_binary_to_string(pyAny->a, ErrorStatusHandler()));
+          },
+          "value"_a)
+     .def("_deserialize_binary",
+          [](py::buffer data) {
+              // the data is read in place, the buffer is not copied
+              std::any result;
+              ErrorStatus error_status;
+              {
+                  PyBufferView view(data);
+                  deserialize_binary_from_buffer(
+                      view.data(), view.size(), &result, &error_status);
+              }
+
+              if (is_error(error_status)) {
+                  auto err = ErrorStatusHandler();
+                  err.error_status = error_status;
+              }
+              return any_to_py(result, true /*top_level*/);
+          },
+          "data"_a)
      .def("deserialize_json_from_string",
-          [](std::string input) {
+          [](py::object input, bool lazy_metadata) {
+              // the json is parsed in place, from the utf-8 encoding python
+              // keeps of a str or from the memory of a bytes-like object
               std::any result;
-              deserialize_json_from_string(input, &result, ErrorStatusHandler());
+              ErrorStatus error_status;
+              if (PyUnicode_Check(input.ptr())) {
+                  Py_ssize_t size;
+                  char const* data = PyUnicode_AsUTF8AndSize(input.ptr(), &size);
+                  if (!data) {
+                      throw py::error_already_set();
+                  }
+                  deserialize_json_from_buffer(
+                      data, size_t(size), &result, &error_status, lazy_metadata);
+              } else {
+                  PyBufferView view(input);
+                  deserialize_json_from_buffer(
+                      view.data(), view.size(), &result, &error_status,
+                      lazy_metadata);
+              }
+
+              if (is_error(error_status)) {
+                  auto err = ErrorStatusHandler();
+                  err.error_status = error_status;
+              }
               return any_to_py(result, true /*top_level*/);
-          }, "input"_a,
+          },
+          "input"_a,
+          "lazy_metadata"_a = false,
           R"docstring(Deserialize json string to in-memory objects.
 
-:param str input: json string to deserialize
+The json is parsed in place, without copying it first.
+
+:param input: json string to deserialize, a str or a bytes-like object holding
+              utf-8, for example bytes, bytearray, memoryview or mmap
+:param bool lazy_metadata: keep metadata as json text until it is first accessed,
+                           metadata that is never modified is written back verbatim
 
 :returns: root object in the string (usually a Timeline or SerializableCollection)
 :rtype: SerializableObject
 
+)docstring")
+     .def("deserialize_json_from_stream",
+          [](py::object stream, size_t chunk_size, bool lazy_metadata) {
+              PyReadStreambuf buffer(stream, chunk_size);
+              std::istream input(&buffer);
+
+              std::any result;
+              ErrorStatus error_status;
+              deserialize_json_from_stream(
+                  input, &result, &error_status, lazy_metadata);
+
+              // a failure to read takes precedence over the parse error it
+              // causes
+              buffer.rethrow_read_error();
+              if (is_error(error_status)) {
+                  auto err = ErrorStatusHandler();
+                  err.error_status = error_status;
+              }
+
+              return any_to_py(result, true /*top_level*/);
+          },
+          "stream"_a,
+          "chunk_size"_a = 65536,
+          "lazy_metadata"_a = false,
+          R"docstring(Deserialize json read incrementally from a file-like object.
+
+The document is parsed as it is read, it is never held in memory as a whole.
+
+:param stream: object with a ``read(size)`` method returning bytes (utf-8) or str,
+               for example an open file, a ``zipfile`` member or a socket file
+:param int chunk_size: number of bytes or characters requested per ``read`` call
+:param bool lazy_metadata: keep metadata as json text until it is first accessed,
+                           metadata that is never modified is written back verbatim
+
+:returns: root object in the stream (usually a Timeline or SerializableCollection)
+:rtype: SerializableObject
+
 )docstring")
      .def("deserialize_json_from_file",
-          [](std::string filename) {
+          [](std::string filename, bool lazy_metadata, bool lazy_children) {
               std::any result;
-              deserialize_json_from_file(filename, &result, ErrorStatusHandler());
+              deserialize_json_from_file(
+                  filename, &result, ErrorStatusHandler(), lazy_metadata,
+                  lazy_children);
               return any_to_py(result, true /*top_level*/);
           }, 
           "filename"_a,
+          "lazy_metadata"_a = false,
+          "lazy_children"_a = false,
           R"docstring(Deserialize json file to in-memory objects.
 
 :param str filename: path to json file to read
+:param bool lazy_metadata: keep metadata as json text until it is first accessed,
+                           metadata that is never modified is written back verbatim
+:param bool lazy_children: read the children of tracks and stacks from the file when
+                           they are first accessed, the file must not change meanwhile
 
 :returns: root object in the file (usually a Timeline or SerializableCollection)
 :rtype: SerializableObject
@@ -275,10 +612,124 @@ PYBIND11_MODULE(_otio, m) {
         .def(py::init([](Color c) { return new PyAny(c); }))
         .def(py::init([](IMATH_NAMESPACE::V2d v2d) { return new PyAny(v2d); }))
         .def(py::init([](IMATH_NAMESPACE::Box2d box2d) { return new PyAny(box2d); }))
+        .def(py::init([](Float64Array a) { return new PyAny(a); }))
+        .def(py::init([](Int64Array a) { return new PyAny(a); }))
         .def(py::init([](AnyVectorProxy* p) { return new PyAny(p->fetch_any_vector()); }))
         .def(py::init([](AnyDictionaryProxy* p) { return new PyAny(p->fetch_any_dictionary()); }))
         ;
 
+    m.def("metadata_table", [](py::iterable objects, py::iterable keys, py::object default_value) {
+            // each key is a metadata key or a sequence of keys into nested
+            // dictionaries
+            std::vector<std::vector<std::string>> paths;
+            std::vector<py::list> columns;
+            py::dict result;
+            for (auto key: keys) {
+                py::object column_key;
+                if (py::isinstance<py::str>(key)) {
+                    paths.push_back({ key.cast<std::string>() });
+                    column_key = py::reinterpret_borrow<py::object>(key);
+                }
+                else {
+                    paths.push_back(key.cast<std::vector<std::string>>());
+                    column_key = py::tuple(py::cast(paths.back()));
+                }
+                columns.emplace_back();
+                result[column_key] = columns.back();
+            }
+
+            for (auto item: objects) {
+                if (!py::isinstance<SerializableObjectWithMetadata>(item)) {
+                    throw py::type_error(string_printf(
+                        "metadata_table expects objects with metadata, got %s",
+                        py::str(item.get_type()).cast<std::string>().c_str()));
+                }
+                AnyDictionary& metadata =
+                    item.cast<SerializableObjectWithMetadata*>()->metadata();
+
+                for (size_t i = 0; i < paths.size(); ++i) {
+                    AnyDictionary* d = &metadata;
+                    std::any const* value = nullptr;
+                    for (auto const& path_key: paths[i]) {
+                        if (!d) {
+                            value = nullptr;
+                            break;
+                        }
+                        auto e = d->find(path_key);
+                        if (e == d->end()) {
+                            value = nullptr;
+                            break;
+                        }
+                        value = &e->second;
+                        d = compare_typeids(value->type(), typeid(AnyDictionary))
+                                ? &temp_safely_cast_any_dictionary_any(*value)
+                                : nullptr;
+                    }
+                    columns[i].append(value ? any_to_native_py(*value) : default_value);
+                }
+            }
+
+            return result;
+        }, "objects"_a, "keys"_a, "default"_a = py::none(),
+        R"docstring(Collect metadata values from many objects in a single pass.
+
+Returns a dictionary mapping each key to a list with one value per object, which can
+be passed directly to, for example, ``pandas.DataFrame``.  Values are converted to
+native python objects, nested dictionaries and lists included.
+
+.. code-block:: python
+
+    otio.core.metadata_table(
+        timeline.find_clips(),
+        ["reel", ("cmx_3600", "comments")]
+    )
+
+:param objects: iterable of objects with metadata, for example clips
+:param keys: metadata keys, or tuples of keys to look up values in nested dictionaries
+:param default: value used where an object does not have the key
+
+:returns: dictionary of key to list of values, in the order of ``objects``
+:rtype: dict
+)docstring");
+
+    m.def("_value_to_any", [](py::object value) -> py::object {
+            if (py::isinstance<PyAny>(value)) {
+                return value;
+            }
+            auto result = new PyAny;
+            py_to_any(value, &result->a);
+            return py::cast(result, py::return_value_policy::take_ownership);
+        }, "value"_a,
+        R"docstring(Convert a python value to a :class:`PyAny` holding its C++ equivalent.
+
+Mappings are converted to AnyDictionary and sequences other than str to AnyVector,
+recursively, in a single pass in C++.
+
+:raises TypeError: for values of types that OpenTimelineIO does not support
+:raises ValueError: for non-string keys, integers outside of the range of int64_t and
+                    containers that contain themselves
+)docstring");
+
+    m.def("string_pool_stats", []() {
+            StringPoolStats stats = string_pool_stats();
+            py::dict result;
+            result["strings"] = stats.strings;
+            result["references"] = stats.references;
+            result["bytes"] = stats.bytes;
+            result["deduplicated_bytes"] = stats.deduplicated_bytes;
+            return result;
+        },
+        R"docstring(Return statistics about the pool of shared strings.
+
+Object names and media reference URLs are stored once for each distinct string, and
+shared by all the objects that hold the same text.
+
+:returns: dictionary with the number of distinct ``strings``, the number of
+          ``references`` to them, the ``bytes`` of text they hold, and the
+          ``deduplicated_bytes`` of text that sharing them saves
+:rtype: dict[str, int]
+)docstring");
+
     m.def("register_serializable_object_type", &register_python_type,
           "class_object"_a, "schema_name"_a, "schema_version"_a);
     m.def("set_type_record", &set_type_record, "serializable_obejct"_a, "schema_name"_a);
@@ -325,6 +776,131 @@ The CORE_VERSION_MAP maps OTIO release versions to maps of schema name to schema
     m.def("flatten_stack", [](std::vector<Track*> tracks) {
             return flatten_stack(tracks, ErrorStatusHandler());
         }, "tracks"_a);        
+    m.def("track_trimmed_to_range", [](Track* t, TimeRange trim_range) {
+            return track_trimmed_to_range(t, trim_range, ErrorStatusHandler());
+        }, "in_track"_a, "trim_range"_a);
+    m.def("timeline_trimmed_to_range", [](Timeline* t, TimeRange trim_range) {
+            return timeline_trimmed_to_range(t, trim_range, ErrorStatusHandler());
+        }, "in_timeline"_a, "trim_range"_a);
+    m.def("timeline_statistics", [](SerializableObject* root) {
+            TimelineStatistics statistics = timeline_statistics(root);
+            auto to_dict = [](auto const& counts) {
+                py::dict result;
+                for (auto const& count: counts) {
+                    result[py::cast(count.first)] = py::cast(count.second);
+                }
+                return result;
+            };
+            py::dict result;
+            result["schema_counts"] = to_dict(statistics.schema_counts);
+            result["track_count"] = statistics.track_count;
+            result["clip_count"] = statistics.clip_count;
+            result["deepest_nesting"] = statistics.deepest_nesting;
+            result["range"] = statistics.range ? py::cast(*statistics.range) : py::none();
+            result["track_kinds"] = to_dict(statistics.track_kinds);
+            result["track_kind_durations"] = to_dict(statistics.track_kind_durations);
+            result["clip_rates"] = to_dict(statistics.clip_rates);
+            result["metadata_keys"] = to_dict(statistics.metadata_keys);
+            result["clip_metadata_keys"] = to_dict(statistics.clip_metadata_keys);
+            result["media_reference_kinds"] = to_dict(statistics.media_reference_kinds);
+            return result;
+        }, "root"_a.none(false));
+
+    using algo::EditTransaction;
+    using algo::ReferencePoint;
+
+    py::enum_<ReferencePoint>(m, "ReferencePoint", "How :meth:`EditTransaction.fill` places an item into a gap.")
+        .value("Source", ReferencePoint::Source, "Use the range of the item.")
+        .value("Sequence", ReferencePoint::Sequence, "Trim the item to the gap.")
+        .value("Fit", ReferencePoint::Fit, "Fit the item to the gap with a time warp.");
+
+    py::class_<EditTransaction>(m, "EditTransaction", R"docstring(
+Apply a sequence of edits to a track as one transaction.
+
+While the transaction is open, the track keeps an index of the ranges of its children, which
+each edit only updates from the first child it changes, instead of every edit computing
+them all over again.  This makes applying a long list of edits, such as a conform change
+list, to a long track much faster.  The edits are applied to the track as they are made.
+
+Used as a context manager, the transaction is committed when the block exits normally, and
+rolled back, restoring the children of the track and their source ranges, if it raises:
+
+.. code-block:: python
+
+    with otio.algorithms.EditTransaction(track) as transaction:
+        for event in change_list:
+            transaction.overwrite(event.clip, event.range)
+
+A transaction that is neither committed nor rolled back is rolled back when it is
+destroyed.  While it is open, change the track and its children only through the
+transaction, or by setting their source ranges.
+)docstring")
+        .def(py::init([](Track* track) { return new EditTransaction(track); }),
+             "track"_a.none(false), py::keep_alive<1, 2>())
+        .def_property_readonly("track", &EditTransaction::track)
+        .def_property_readonly("is_open", &EditTransaction::is_open)
+        .def("overwrite", [](EditTransaction* t, Item* item, TimeRange const& range,
+                             bool remove_transitions, Item* fill_template) {
+                t->overwrite(item, range, remove_transitions, fill_template, ErrorStatusHandler());
+            }, "item"_a.none(false), "range"_a, "remove_transitions"_a = true,
+            "fill_template"_a = nullptr,
+            "Overwrite the range of the track with the item, splitting the items it overlaps.")
+        .def("insert", [](EditTransaction* t, Item* item, RationalTime const& time,
+                          bool remove_transitions, Item* fill_template) {
+                t->insert(item, time, remove_transitions, fill_template, ErrorStatusHandler());
+            }, "item"_a.none(false), "time"_a, "remove_transitions"_a = true,
+            "fill_template"_a = nullptr,
+            "Insert the item at the time, splitting the item at that time.")
+        .def("trim", [](EditTransaction* t, Item* item, RationalTime const& delta_in,
+                        RationalTime const& delta_out, Item* fill_template) {
+                t->trim(item, delta_in, delta_out, fill_template, ErrorStatusHandler());
+            }, "item"_a.none(false), "delta_in"_a, "delta_out"_a, "fill_template"_a = nullptr,
+            "Adjust the start time or duration of the item, filling the time it leaves.")
+        .def("slice", [](EditTransaction* t, RationalTime const& time, bool remove_transitions) {
+                t->slice(time, remove_transitions, ErrorStatusHandler());
+            }, "time"_a, "remove_transitions"_a = true,
+            "Split the item at the time in two.")
+        .def("slip", [](EditTransaction* t, Item* item, RationalTime const& delta) {
+                t->slip(item, delta, ErrorStatusHandler());
+            }, "item"_a.none(false), "delta"_a,
+            "Move the start time of the item without changing its duration.")
+        .def("slide", [](EditTransaction* t, Item* item, RationalTime const& delta) {
+                t->slide(item, delta, ErrorStatusHandler());
+            }, "item"_a.none(false), "delta"_a,
+            "Move the item by adjusting the duration of the item before it.")
+        .def("ripple", [](EditTransaction* t, Item* item, RationalTime const& delta_in,
+                          RationalTime const& delta_out) {
+                t->ripple(item, delta_in, delta_out, ErrorStatusHandler());
+            }, "item"_a.none(false), "delta_in"_a, "delta_out"_a,
+            "Adjust the source range of the item without affecting other items.")
+        .def("roll", [](EditTransaction* t, Item* item, RationalTime const& delta_in,
+                        RationalTime const& delta_out) {
+                t->roll(item, delta_in, delta_out, ErrorStatusHandler());
+            }, "item"_a.none(false), "delta_in"_a, "delta_out"_a,
+            "Adjust the source range of the item and of its neighbors to fit.")
+        .def("fill", [](EditTransaction* t, Item* item, RationalTime const& track_time,
+                        ReferencePoint reference_point) {
+                t->fill(item, track_time, reference_point, ErrorStatusHandler());
+            }, "item"_a.none(false), "track_time"_a,
+            "reference_point"_a = ReferencePoint::Source,
+            "Place the item into the gap at the time.")
+        .def("remove", [](EditTransaction* t, RationalTime const& time, bool fill,
+                          Item* fill_template) {
+                t->remove(time, fill, fill_template, ErrorStatusHandler());
+            }, "time"_a, "fill"_a = true, "fill_template"_a = nullptr,
+            "Remove the item at the time, filling its place with a gap unless fill is false.")
+        .def("commit", &EditTransaction::commit, "Keep the edits and close the transaction.")
+        .def("rollback", &EditTransaction::rollback, "Undo the edits and close the transaction.")
+        .def("__enter__", [](EditTransaction* t) { return t; },
+             py::return_value_policy::reference)
+        .def("__exit__", [](EditTransaction* t, py::object exc_type, py::args) {
+                if (exc_type.is_none()) {
+                    t->commit();
+                }
+                else {
+                    t->rollback();
+                }
+            });
 
     void _build_any_to_py_dispatch_table();
     _build_any_to_py_dispatch_table();
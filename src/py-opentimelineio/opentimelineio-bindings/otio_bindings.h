@@ -9,5 +9,6 @@ void otio_exception_bindings(pybind11::module);
 void otio_any_dictionary_bindings(pybind11::module);
 void otio_any_vector_bindings(pybind11::module);
 void otio_imath_bindings(pybind11::module);
+void otio_typed_array_bindings(pybind11::module);
 void otio_serializable_object_bindings(pybind11::module);
 void otio_tests_bindings(pybind11::module);
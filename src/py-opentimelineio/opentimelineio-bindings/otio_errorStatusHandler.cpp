@@ -27,6 +27,10 @@ struct _CannotComputeAvailableRangeException : public OTIOException {
     using  OTIOException::OTIOException;
 };
 
+struct _CannotTrimTransitionsException : public OTIOException {
+    using  OTIOException::OTIOException;
+};
+
 ErrorStatusHandler::~ErrorStatusHandler() noexcept(false) {
     if (!is_error(error_status)) {
         return;
@@ -63,6 +67,8 @@ ErrorStatusHandler::~ErrorStatusHandler() noexcept(false) {
         throw _NotAChildException(full_details());
     case ErrorStatus::CANNOT_COMPUTE_AVAILABLE_RANGE:
         throw _CannotComputeAvailableRangeException(full_details());
+    case ErrorStatus::CANNOT_TRIM_TRANSITION:
+        throw _CannotTrimTransitionsException(details());
     case ErrorStatus::OBJECT_CYCLE:
         throw py::value_error("Detected SerializableObject cycle while copying/serializing: " + details());
     case ErrorStatus::MEDIA_REFERENCES_DO_NOT_CONTAIN_ACTIVE_KEY:
@@ -99,4 +105,5 @@ void otio_exception_bindings(py::module m) {
     py::register_exception<_NotAChildException>(m, "NotAChildError", otio_exception.ptr());
     py::register_exception<_UnsupportedSchemaException>(m, "UnsupportedSchemaError", otio_exception.ptr());
     py::register_exception<_CannotComputeAvailableRangeException>(m, "CannotComputeAvailableRangeError", otio_exception.ptr());
+    py::register_exception<_CannotTrimTransitionsException>(m, "CannotTrimTransitionsError", otio_exception.ptr());
 }
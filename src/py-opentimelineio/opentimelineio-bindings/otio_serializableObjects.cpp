@@ -10,6 +10,7 @@
 #include "opentimelineio/color.h"
 #include "opentimelineio/composable.h"
 #include "opentimelineio/composition.h"
+#include "opentimelineio/editJournal.h"
 #include "opentimelineio/effect.h"
 #include "opentimelineio/externalReference.h"
 #include "opentimelineio/freezeFrame.h"
@@ -21,6 +22,7 @@
 #include "opentimelineio/marker.h"
 #include "opentimelineio/mediaReference.h"
 #include "opentimelineio/missingReference.h"
+#include "opentimelineio/objectArena.h"
 #include "opentimelineio/stack.h"
 #include "opentimelineio/timeEffect.h"
 #include "opentimelineio/timeline.h"
@@ -155,7 +157,138 @@ private:
     size_t _it;
 };
 
+// Read the children of a composition read lazily, raising the error if that
+// fails rather than the RuntimeError that accessing them throws.
+static Composition* _materialized(Composition* c) {
+    c->materialize(ErrorStatusHandler());
+    return c;
+}
+
+// Python scope for an ObjectArena, which is created on __enter__ so that it
+// is destroyed on the thread it was created on.  Python does not guarantee
+// that scopes exit in order, on the thread they were entered on (coroutines
+// and generators can interleave them), so __exit__ checks that the arena is
+// the innermost one of the calling thread before destroying it.
+struct ObjectArenaContext {
+    std::unique_ptr<ObjectArena> arena;
+
+    ~ObjectArenaContext() {
+        // an arena that was never exited properly may still be the current
+        // arena, or the previous one of another, of the thread it was
+        // created on, so it is left allocated rather than destroyed from
+        // under it
+        if (arena && !arena->is_current()) {
+            arena.release();
+        }
+    }
+};
+
+// Python scope for an EditJournal::Recording, for the same reasons.
+struct EditJournalRecording {
+    EditJournal* journal;
+    std::unique_ptr<EditJournal::Recording> recording;
+
+    ~EditJournalRecording() {
+        // as for ObjectArenaContext, a recording that was never exited
+        // properly is left in place, along with its journal, which the
+        // thread it was created on may still record into
+        if (recording && !recording->is_current()) {
+            recording.release();
+            py::cast(journal).inc_ref();
+        }
+    }
+};
+
 static void define_bases1(py::module m) {
+    py::class_<ObjectArenaContext>(m, "ObjectArena", R"docstring(
+Context manager that allocates the objects created on this thread inside it, for example
+by reading a file, from large blocks instead of one at a time. This makes reading and freeing
+big timelines faster.
+
+.. code-block:: python
+
+    with otio.core.ObjectArena():
+        timeline = otio.adapters.read_from_file("big.otio")
+
+The objects can be used as usual after the block, and are freed when no longer referenced.
+A block is freed once all the objects in it have been, so keeping a few objects of a large
+timeline that was read in an arena alive keeps more memory allocated.
+)docstring")
+        .def(py::init<>())
+        .def("__enter__", [](ObjectArenaContext* context) {
+                if (context->arena) {
+                    throw py::value_error("ObjectArena is already in use");
+                }
+                context->arena.reset(new ObjectArena);
+                return context;
+            }, py::return_value_policy::reference)
+        .def("__exit__", [](ObjectArenaContext* context, py::args) {
+                if (context->arena && !context->arena->is_current()) {
+                    throw std::runtime_error(
+                        "ObjectArena exited out of order: arenas must exit in the"
+                        " reverse order they were entered in, on the thread that"
+                        " entered them");
+                }
+                context->arena.reset();
+            });
+
+    py::class_<EditJournalRecording>(m, "_EditJournalRecording")
+        .def("__enter__", [](EditJournalRecording* context) {
+                if (context->recording) {
+                    throw py::value_error("the recording is already in use");
+                }
+                context->recording.reset(new EditJournal::Recording(*context->journal));
+                return context;
+            }, py::return_value_policy::reference)
+        .def("__exit__", [](EditJournalRecording* context, py::args) {
+                if (context->recording && !context->recording->is_current()) {
+                    throw std::runtime_error(
+                        "EditJournal recording exited out of order: recordings must"
+                        " exit in the reverse order they were entered in, on the"
+                        " thread that entered them");
+                }
+                context->recording.reset();
+            });
+
+    py::class_<EditJournal>(m, "EditJournal", R"docstring(
+Records the changes made to the source ranges of items and to the children of compositions,
+so that they can be undone and redone without keeping a copy of the timeline for each step.
+
+The changes made on this thread inside a :meth:`record` block make up one undo step:
+
+.. code-block:: python
+
+    journal = otio.core.EditJournal(max_steps=100)
+    with journal.record():
+        track.append(clip)
+        track[0].source_range = new_range
+    journal.undo()
+    journal.redo()
+
+Each step holds what the changes replaced, so it costs memory, and time to undo and redo,
+in proportion to the objects that changed.  Other changes, such as to metadata, are not
+recorded, and undoing a step expects the objects to be as it left them apart from those.
+Recording a new step discards the steps that were undone.
+)docstring")
+        .def(py::init<size_t>(), "max_steps"_a = 0)
+        .def_property("max_steps", &EditJournal::max_steps, &EditJournal::set_max_steps,
+                      "The maximum number of undo steps kept, or 0 to keep all of them.")
+        .def_property_readonly("undo_count", &EditJournal::undo_count)
+        .def_property_readonly("redo_count", &EditJournal::redo_count)
+        .def("record", [](EditJournal* journal) {
+                return new EditJournalRecording{ journal, nullptr };
+            }, py::keep_alive<0, 1>(),
+            "Return a context manager that records the changes made inside it as one step.")
+        .def("undo", [](EditJournal* journal) {
+                return journal->undo(ErrorStatusHandler());
+            }, "Undo the last step, returning False if there is none.")
+        .def("redo", [](EditJournal* journal) {
+                return journal->redo(ErrorStatusHandler());
+            }, "Redo the last step that was undone, returning False if there is none.")
+        .def("clear", &EditJournal::clear, "Discard all the steps.")
+        .def_static("is_recording", &EditJournal::is_recording,
+                    "Return whether changes made on this thread are being recorded.");
+
     py::class_<SerializableObject, managing_ptr<SerializableObject>>(m, "SerializableObject", py::dynamic_attr(), "Superclass for all classes whose instances can be serialized.")
         .def(py::init<>())
         .def_property_readonly("_dynamic_fields", [](SerializableObject* s) {
@@ -563,7 +696,25 @@ Should be subclassed (for example by :class:`.Track` and :class:`.Stack`), not u
                 return py::make_tuple(py::cast(result.first), py::cast(result.second));
             }, "child"_a)
         .def("has_clips", &Composition::has_clips)
+        .def_property_readonly("is_materialized", &Composition::is_materialized, R"docstring(
+False for a composition read with ``lazy_children`` whose children have not been read yet.
+)docstring")
+        .def("materialize", [](Composition* c) {
+                c->materialize(ErrorStatusHandler());
+            }, R"docstring(
+Read the children of a composition read with ``lazy_children``, if that has not been done yet.
+
+Accessing the children reads them too, and raises the same errors.
+)docstring")
+        .def("dematerialize", &Composition::dematerialize, R"docstring(
+Drop the children of a composition read with ``lazy_children``, to read them from the file again
+when they are next accessed. Changes made to the children since they were read are lost.
+
+Returns False, keeping the children, if the composition was not read lazily or its children
+have been set, inserted or removed since.
+)docstring")
         .def("__internal_getitem__", [](Composition* c, int index) {
+                _materialized(c);
                 index = adjusted_vector_index(index, c->children());
                 if (index < 0 || index >= int(c->children().size())) {
                     throw py::index_error();
@@ -571,23 +722,28 @@ Should be subclassed (for example by :class:`.Track` and :class:`.Stack`), not u
                 return c->children()[index].value;
             }, "index"_a)
         .def("__internal_setitem__", [](Composition* c, int index, Composable* composable) {
+                _materialized(c);
                 index = adjusted_vector_index(index, c->children());
                 c->set_child(index, composable, ErrorStatusHandler());
             }, "index"_a, "item"_a)
         .def("__internal_delitem__", [](Composition* c, int index) {
+                _materialized(c);
                 index = adjusted_vector_index(index, c->children());
                 c->remove_child(index, ErrorStatusHandler());
             }, "index"_a)
         .def("__internal_insert", [](Composition* c, int index, Composable &composable) {
+                _materialized(c);
                 index = adjusted_vector_index(index, c->children());
                 c->insert_child(index, &composable, ErrorStatusHandler());
             }, "index"_a, "item"_a)
-        .def("__contains__", &Composition::has_child, "composable"_a)
+        .def("__contains__", [](Composition* c, Composable* composable) {
+                return _materialized(c)->has_child(composable);
+            }, "composable"_a)
         .def("__len__", [](Composition* c) {
-                return c->children().size();
+                return _materialized(c)->children().size();
             })
         .def("__iter__", [](Composition* c) {
-                return new CompositionIterator(c);
+                return new CompositionIterator(_materialized(c));
             });
 
     composable_class
@@ -892,6 +1048,12 @@ A list of all the frame URLs in the sequence can be generated, regardless of fra
 
     [ref.target_url_for_image_number(i) for i in range(ref.number_of_images_in_sequence())]
 
+or, faster:
+
+.. code-block:: python
+
+    ref.target_urls_for_image_range(0, ref.number_of_images_in_sequence())
+
 Negative ``start_frame`` is also handled. The above example with a ``start_frame`` of ``-1`` would yield the first three target urls as:
 
 - ``file:///show/sequence/shot/sample_image_sequence.-0001.exr``
@@ -951,6 +1113,12 @@ Negative ``start_frame`` is also handled. The above example with a ``start_frame
         .def("frame_for_time", [](ImageSequenceReference *seq_ref, RationalTime time) {
                 return seq_ref->frame_for_time(time, ErrorStatusHandler());
         }, "time"_a, "Given a :class:`.RationalTime` within the available range, returns the frame number.")
+        .def("frames_for_times", [](ImageSequenceReference *seq_ref, std::vector<RationalTime> const& times) {
+                return seq_ref->frames_for_times(times, ErrorStatusHandler());
+        }, "times"_a, R"docstring(Given a list of :class:`.RationalTime` within the available range, returns a list of their frame numbers.
+
+This is the same as calling :meth:`frame_for_time` for each time, in a single call.
+)docstring")
         .def("target_url_for_image_number", [](ImageSequenceReference *seq_ref, int image_number) {
                 return seq_ref->target_url_for_image_number(
                         image_number,
@@ -964,6 +1132,21 @@ This is roughly equivalent to:
 
    f"{target_url_prefix}{(start_frame + (image_number * frame_step)):0{value_zero_padding}}{target_url_postfix}"
 
+)docstring")
+        .def("target_urls_for_image_range", [](ImageSequenceReference *seq_ref, int start_image_number, int count) {
+                return seq_ref->target_urls_for_image_range(
+                        start_image_number,
+                        count,
+                        ErrorStatusHandler()
+                );
+        }, "start_image_number"_a, "count"_a, R"docstring(Returns a list of the ``target_url`` for ``count`` images, starting with ``start_image_number``.
+
+This is the same as, but much faster than:
+
+.. code-block:: python
+
+   [ref.target_url_for_image_number(i) for i in range(start_image_number, start_image_number + count)]
+
 )docstring")
         .def("presentation_time_for_image_number", [](ImageSequenceReference *seq_ref, int image_number) {
                 return seq_ref->presentation_time_for_image_number(
@@ -0,0 +1,174 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include <pybind11/pybind11.h>
+
+#include "otio_bindings.h"
+#include "otio_utils.h"
+#include "opentimelineio/stringUtils.h"
+#include "opentimelineio/typedArray.h"
+
+#include <cstring>
+
+namespace py = pybind11;
+using namespace pybind11::literals;
+
+using namespace opentimelineio::OPENTIMELINEIO_VERSION;
+
+// True if a buffer with the given format and item size holds elements of
+// type T.  Integer formats are matched by size, since 'l' is 64 bits on some
+// platforms and 32 on others.
+template <typename T>
+static bool _buffer_matches(py::buffer_info const& info) {
+    if (info.itemsize != ssize_t(sizeof(T)) || info.ndim != 1) {
+        return false;
+    }
+
+    std::string format = info.format;
+    if (!format.empty() && std::strchr("@=", format[0])) {
+        format.erase(0, 1);
+    }
+
+    if (std::is_floating_point<T>::value) {
+        return format == "d";
+    }
+    return format == "q" || format == "l";
+}
+
+template <typename T>
+static bool _copy_from_buffer(py::handle o, TypedArray<T>* result) {
+    if (!PyObject_CheckBuffer(o.ptr())) {
+        return false;
+    }
+
+    py::buffer_info info = py::reinterpret_borrow<py::buffer>(o).request();
+    if (!_buffer_matches<T>(info)) {
+        return false;
+    }
+
+    result->resize(size_t(info.shape[0]));
+    if (info.strides[0] == ssize_t(sizeof(T))) {
+        if (!result->empty()) {
+            std::memcpy(result->data(), info.ptr, result->size() * sizeof(T));
+        }
+    }
+    else {
+        char const* p = static_cast<char const*>(info.ptr);
+        for (size_t i = 0; i < result->size(); ++i, p += info.strides[0]) {
+            std::memcpy(&(*result)[i], p, sizeof(T));
+        }
+    }
+    return true;
+}
+
+bool py_buffer_to_typed_array(py::handle o, std::any* result) {
+    Float64Array f;
+    if (_copy_from_buffer(o, &f)) {
+        *result = create_safely_typed_any(std::move(f));
+        return true;
+    }
+
+    Int64Array i;
+    if (_copy_from_buffer(o, &i)) {
+        *result = create_safely_typed_any(std::move(i));
+        return true;
+    }
+    return false;
+}
+
+template <typename T>
+static size_t _checked_index(TypedArray<T> const& a, int64_t index) {
+    if (index < 0) {
+        index += int64_t(a.size());
+    }
+    if (index < 0 || index >= int64_t(a.size())) {
+        throw py::index_error("array index out of range");
+    }
+    return size_t(index);
+}
+
+template <typename T>
+static py::list _to_list(TypedArray<T> const& a) {
+    py::list result(a.size());
+    for (size_t i = 0; i < a.size(); ++i) {
+        result[i] = py::cast(a[i]);
+    }
+    return result;
+}
+
+template <typename T>
+static void _define_typed_array(py::module m, char const* name, char const* doc) {
+    using Array = TypedArray<T>;
+
+    py::class_<Array>(m, name, py::buffer_protocol(), doc)
+        .def(py::init<>())
+        .def(py::init([name](py::object values) {
+            Array result;
+            if (!_copy_from_buffer(values, &result)) {
+                for (auto v: values) {
+                    try {
+                        result.push_back(v.cast<T>());
+                    }
+                    catch (py::cast_error const&) {
+                        throw py::type_error(string_printf(
+                            "%s cannot hold a value of type '%s'",
+                            name,
+                            std::string(py::str(v.get_type())).c_str()));
+                    }
+                }
+            }
+            return result;
+        }), "values"_a, R"docstring(Create an array from an iterable of numbers, or copy it from an
+object supporting the buffer protocol, such as a one dimensional NumPy array, with a matching
+element type.)docstring")
+        .def_buffer([](Array& a) {
+            // arrays are values, so views of them are read-only
+            return py::buffer_info(
+                a.data(),
+                ssize_t(a.size()),
+                true /*readonly*/);
+        })
+        .def_property_readonly_static("dtype", [](py::object) {
+            return std::string(Array::dtype());
+        }, "The name of the element type, matching the NumPy dtype name.")
+        .def("__len__", [](Array const& a) { return a.size(); })
+        .def("__getitem__", [](Array const& a, int64_t index) {
+            return a[_checked_index(a, index)];
+        })
+        .def("__iter__", [](Array const& a) {
+            return py::make_iterator(a.begin(), a.end());
+        }, py::keep_alive<0, 1>())
+        .def("__eq__", [](Array const& lhs, Array const& rhs) {
+            return lhs == rhs;
+        }, py::is_operator())
+        .def("__ne__", [](Array const& lhs, Array const& rhs) {
+            return lhs != rhs;
+        }, py::is_operator())
+        .def("__copy__", [](Array const& a) { return Array(a); })
+        .def("__deepcopy__", [](Array const& a, py::dict) { return Array(a); }, "memo"_a)
+        .def("tolist", &_to_list<T>, "Return the elements as a python :class:`list`.")
+        .def("__repr__", [name](Array const& a) {
+            return string_printf(
+                "otio.core.%s(%s)",
+                name,
+                std::string(py::repr(_to_list(a))).c_str());
+        });
+}
+
+void otio_typed_array_bindings(py::module m) {
+    _define_typed_array<double>(m, "Float64Array", R"docstring(
+A contiguous, fixed length array of 64-bit floating point numbers that can be stored in metadata.
+
+Arrays are immutable values.  They support the buffer protocol, so ``numpy.asarray(array)`` and
+``memoryview(array)`` view the elements without copying them, but the views are read-only.  To
+change an array stored in metadata, assign a new one.
+)docstring");
+
+    _define_typed_array<int64_t>(m, "Int64Array", R"docstring(
+A contiguous, fixed length array of 64-bit integers that can be stored in metadata.
+
+Arrays are immutable values.  They support the buffer protocol, so ``numpy.asarray(array)`` and
+``memoryview(array)`` view the elements without copying them, but the views are read-only.  To
+change an array stored in metadata, assign a new one.
+)docstring");
+}
@@ -13,8 +13,11 @@
 
 #include <Imath/ImathBox.h>
 
-#include <map>
+#include <algorithm>
+#include <cstdint>
 #include <cstring>
+#include <map>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -65,6 +68,8 @@ void _build_any_to_py_dispatch_table() {
     t[&typeid(Color)] = [](std::any const& a, bool) { return py::cast(safely_cast_color_any(a)); };
     t[&typeid(IMATH_NAMESPACE::V2d)] = [](std::any const& a, bool) { return py::cast(safely_cast_point_any(a)); };
     t[&typeid(IMATH_NAMESPACE::Box2d)] = [](std::any const& a, bool) { return py::cast(safely_cast_box_any(a)); };
+    t[&typeid(Float64Array)] = [](std::any const& a, bool) { return py::cast(safely_cast_float64_array_any(a)); };
+    t[&typeid(Int64Array)] = [](std::any const& a, bool) { return py::cast(safely_cast_int64_array_any(a)); };
     t[&typeid(SerializableObject::Retainer<>)] = [](std::any const& a, bool) {
         SerializableObject* so = safely_cast_retainer_any(a);
         return py::cast(managing_ptr<SerializableObject>(so)); };
@@ -98,15 +103,206 @@ void _build_any_to_py_dispatch_table() {
     }
 }
 
-static py::object _value_to_any = py::none();
+// Python types accepted in AnyDictionary / AnyVector containers, listed in
+// the error raised for anything else.
+static const char* _supported_value_types =
+    "('int', 'float', 'str', 'bool', 'list', 'dictionary', "
+    "'opentime.RationalTime', 'opentime.TimeRange', 'opentime.TimeTransform', "
+    "'opentimelineio.core.Color', 'opentimelineio.core.Float64Array', "
+    "'opentimelineio.core.Int64Array', 'opentimelineio.core.SerializableObject')";
+
+static py::object _mapping_abc = py::none();
+static py::object _sequence_abc = py::none();
+
+// Converts a python value to an std::any in a single walk.  Mappings become
+// AnyDictionary, sequences other than str become AnyVector, everything else
+// goes through the PyAny constructors.  _path holds the containers being
+// converted, a container that contains itself is an error.
+class PyToAnyConverter {
+public:
+    PyToAnyConverter() {
+        if (_mapping_abc.is_none()) {
+            py::object abc = py::module::import("collections.abc");
+            _mapping_abc = abc.attr("Mapping");
+            _sequence_abc = abc.attr("Sequence");
+        }
+    }
+
+    void convert(py::handle o, std::any* result) {
+        PyObject* p = o.ptr();
+
+        if (p == Py_None) {
+            *result = std::any();
+        }
+        else if (PyBool_Check(p)) {
+            *result = create_safely_typed_any(p == Py_True);
+        }
+        else if (PyLong_Check(p)) {
+            int overflow = 0;
+            long long value = PyLong_AsLongLongAndOverflow(p, &overflow);
+            if (overflow) {
+                throw py::value_error(string_printf(
+                    "A value of %s is outside of the range of integers that "
+                    "OpenTimelineIO supports, [%lld, %lld], which is the range "
+                    "of C++ int64_t.",
+                    py::str(o).cast<std::string>().c_str(),
+                    (long long) INT64_MIN,
+                    (long long) INT64_MAX));
+            }
+            if (value == -1 && PyErr_Occurred()) {
+                throw py::error_already_set();
+            }
+            *result = create_safely_typed_any(int64_t(value));
+        }
+        else if (PyFloat_Check(p)) {
+            *result = create_safely_typed_any(double(PyFloat_AS_DOUBLE(p)));
+        }
+        else if (PyUnicode_Check(p)) {
+            Py_ssize_t size = 0;
+            const char* data = PyUnicode_AsUTF8AndSize(p, &size);
+            if (!data) {
+                PyErr_Clear();
+                throw_incompatible_type(o);
+            }
+            *result = create_safely_typed_any(std::string(data, size));
+        }
+        else if (py::isinstance<PyAny>(o)) {
+            result->swap(o.cast<PyAny*>()->a);
+        }
+        else if (py::isinstance<SerializableObject>(o)) {
+            *result = create_safely_typed_any(o.cast<SerializableObject*>());
+        }
+        else if (py::isinstance<Float64Array>(o)) {
+            *result = create_safely_typed_any(Float64Array(o.cast<Float64Array const&>()));
+        }
+        else if (py::isinstance<Int64Array>(o)) {
+            *result = create_safely_typed_any(Int64Array(o.cast<Int64Array const&>()));
+        }
+        else if (py::isinstance<AnyDictionaryProxy>(o)) {
+            AnyDictionary d = o.cast<AnyDictionaryProxy*>()->fetch_any_dictionary();
+            *result = create_safely_typed_any(std::move(d));
+        }
+        else if (py::isinstance<AnyVectorProxy>(o)) {
+            AnyVector v = o.cast<AnyVectorProxy*>()->fetch_any_vector();
+            *result = create_safely_typed_any(std::move(v));
+        }
+        else if (PyDict_Check(p) || py::isinstance(o, _mapping_abc)) {
+            convert_mapping(o, result);
+        }
+        else if (PyList_Check(p) || PyTuple_Check(p) || py::isinstance(o, _sequence_abc)) {
+            convert_sequence(o, result);
+        }
+        else {
+            convert_other(o, result);
+        }
+    }
 
-static void py_to_any(py::object const& o, std::any* result) {
-    if (_value_to_any.is_none()) {
-        py::object core = py::module::import("opentimelineio.core");
-        _value_to_any = core.attr("_value_to_any");
+private:
+    void enter(py::handle o) {
+        if (std::find(_path.begin(), _path.end(), o.ptr()) != _path.end()) {
+            throw py::value_error("circular reference converting dictionary to C++ datatype");
+        }
+        _path.push_back(o.ptr());
     }
 
-    result->swap(_value_to_any(o).cast<PyAny*>()->a);
+    void convert_mapping(py::handle o, std::any* result) {
+        enter(o);
+
+        // python mappings are not sorted, collect the items and sort them
+        // into the AnyDictionary once
+        std::vector<std::pair<std::string, std::any>> items;
+        auto add_item = [&](py::handle key, py::handle value) {
+            if (!PyUnicode_Check(key.ptr())) {
+                throw py::value_error(string_printf(
+                    "key '%s' is not a string",
+                    py::str(key).cast<std::string>().c_str()));
+            }
+            items.emplace_back(key.cast<std::string>(), std::any());
+            convert(value, &items.back().second);
+        };
+
+        if (PyDict_CheckExact(o.ptr())) {
+            items.reserve(size_t(PyDict_GET_SIZE(o.ptr())));
+            PyObject* key;
+            PyObject* value;
+            Py_ssize_t pos = 0;
+            while (PyDict_Next(o.ptr(), &pos, &key, &value)) {
+                add_item(key, value);
+            }
+        }
+        else {
+            for (auto item: o.attr("items")()) {
+                py::tuple kv = py::reinterpret_borrow<py::tuple>(item);
+                add_item(kv[0], kv[1]);
+            }
+        }
+
+        _path.pop_back();
+        *result = create_safely_typed_any(AnyDictionary(
+            std::make_move_iterator(items.begin()),
+            std::make_move_iterator(items.end())));
+    }
+
+    void convert_sequence(py::handle o, std::any* result) {
+        enter(o);
+
+        AnyVector v;
+        if (PyList_Check(o.ptr()) || PyTuple_Check(o.ptr())) {
+            v.reserve(size_t(PySequence_Fast_GET_SIZE(o.ptr())));
+        }
+        for (auto item: o) {
+            v.emplace_back();
+            convert(item, &v.back());
+        }
+
+        _path.pop_back();
+        *result = create_safely_typed_any(std::move(v));
+    }
+
+    void convert_other(py::handle o, std::any* result) {
+        // one dimensional float64 and int64 buffers, like NumPy arrays,
+        // become typed arrays
+        if (py_buffer_to_typed_array(o, result)) {
+            return;
+        }
+
+        py::object py_any;
+        try {
+            py_any = py::type::of<PyAny>()(o);
+        }
+        catch (py::error_already_set& e) {
+            if (e.matches(PyExc_TypeError)) {
+                throw_incompatible_type(o);
+            }
+            if (e.matches(PyExc_RuntimeError)) {
+                throw py::value_error(string_printf(
+                    "The value '%s' of type '%s' is incompatible with "
+                    "OpenTimelineIO. OpenTimelineIO only supports the following "
+                    "value types in AnyDictionary containers (like the .metadata "
+                    "dictionary): %s.",
+                    py::str(o).cast<std::string>().c_str(),
+                    py::str(o.get_type()).cast<std::string>().c_str(),
+                    _supported_value_types));
+            }
+            throw;
+        }
+        result->swap(py_any.cast<PyAny*>()->a);
+    }
+
+    [[noreturn]] static void throw_incompatible_type(py::handle o) {
+        throw py::type_error(string_printf(
+            "A value of type '%s' is incompatible with OpenTimelineIO. "
+            "OpenTimelineIO only supports the following value types in "
+            "AnyDictionary containers (like the .metadata dictionary): %s.",
+            py::str(o.get_type()).cast<std::string>().c_str(),
+            _supported_value_types));
+    }
+
+    std::vector<PyObject*> _path;
+};
+
+void py_to_any(py::handle o, std::any* result) {
+    PyToAnyConverter().convert(o, result);
 }
 
 AnyDictionary py_to_any_dictionary(py::object const& o) {
@@ -144,6 +340,33 @@ py::object any_to_py(std::any const& a, bool top_level) {
     return e->second(a, top_level);
 }
 
+py::object any_to_native_py(std::any const& a) {
+    if (compare_typeids(a.type(), typeid(AnyDictionary))) {
+        return any_dictionary_to_py_dict(temp_safely_cast_any_dictionary_any(a), true);
+    }
+    if (compare_typeids(a.type(), typeid(AnyVector))) {
+        return any_vector_to_py_list(temp_safely_cast_any_vector_any(a), true);
+    }
+    return any_to_py(a);
+}
+
+py::dict any_dictionary_to_py_dict(AnyDictionary const& d, bool deep) {
+    py::dict result;
+    for (auto const& e: d) {
+        result[plain_string(e.first)] = deep ? any_to_native_py(e.second) : any_to_py(e.second);
+    }
+    return result;
+}
+
+py::list any_vector_to_py_list(AnyVector const& v, bool deep) {
+    py::list result(v.size());
+    for (size_t i = 0; i < v.size(); ++i) {
+        py::object item = deep ? any_to_native_py(v[i]) : any_to_py(v[i]);
+        PyList_SET_ITEM(result.ptr(), Py_ssize_t(i), item.release().ptr());
+    }
+    return result;
+}
+
 struct KeepaliveMonitor {
     SerializableObject* _so;
     pybind11::object _keep_alive;
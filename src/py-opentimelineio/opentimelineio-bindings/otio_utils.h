@@ -148,8 +148,13 @@ struct PyAny {
 };
 
 pybind11::object any_to_py(std::any const& a, bool top_level = false);
+pybind11::object any_to_native_py(std::any const& a);
+pybind11::dict any_dictionary_to_py_dict(AnyDictionary const& d, bool deep);
+pybind11::list any_vector_to_py_list(AnyVector const& v, bool deep);
 pybind11::object plain_string(std::string const& s);
 pybind11::object plain_int(int i);
 AnyDictionary py_to_any_dictionary(pybind11::object const& o);
+void py_to_any(pybind11::handle o, std::any* result);
+bool py_buffer_to_typed_array(pybind11::handle o, std::any* result);
 
 bool compare_typeids(std::type_info const& lhs, std::type_info const& rhs);
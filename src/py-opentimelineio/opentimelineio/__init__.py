@@ -24,4 +24,5 @@ from . import (
     algorithms,
     url_utils,
     versioning,
+    service,
 )
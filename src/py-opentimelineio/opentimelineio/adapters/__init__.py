@@ -29,12 +29,14 @@ from .adapter import Adapter  # noqa
 from . import (  # noqa: F401
     otio_json,  # core JSON adapter
     file_bundle_utils,  # utilities for working with OTIO file bundles
+    read_cache,  # opt-in cache of parsed files
 )
 
 __all__ = [
     'Adapter',
     'otio_json',
     'file_bundle_utils',
+    'read_cache',
     'suffixes_with_defined_adapters',
     'available_adapter_names',
     'from_filepath',
@@ -126,6 +128,10 @@ def read_from_file(
 
     If adapter_name is None, try and infer the adapter name from the filepath.
 
+    If the ``OTIO_READ_CACHE_DIR`` environment variable is set, results are
+    cached on disk and unchanged files are loaded from the cache, see
+    :mod:`.read_cache`.
+
     .. code-block:: python
        :caption: Example
 
@@ -140,6 +146,15 @@ def read_from_file(
 
     adapter = _from_filepath_or_name(string_filepath, adapter_name)
 
+    if read_cache.cache_dir():
+        return read_cache.read_from_file(
+            adapter,
+            string_filepath,
+            media_linker_name=media_linker_name,
+            media_linker_argument_map=media_linker_argument_map,
+            **adapter_argument_map
+        )
+
     return adapter.read_from_file(
         filepath=string_filepath,
         media_linker_name=media_linker_name,
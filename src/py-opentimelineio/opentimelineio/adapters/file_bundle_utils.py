@@ -5,6 +5,10 @@
 
 import os
 import copy
+import shutil
+import zlib
+import contextlib
+import concurrent.futures
 
 from .. import (
     exceptions,
@@ -23,6 +27,12 @@ BUNDLE_VERSION_FILE = "version.txt"
 BUNDLE_PLAYLIST_PATH = "content.otio"
 BUNDLE_DIR_NAME = "media"
 
+# number of files copied concurrently into a bundle by default
+DEFAULT_COPY_WORKERS = 4
+
+# size of the blocks read from media files
+_COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 class NotAFileOnDisk(exceptions.OTIOError):
     pass
@@ -34,6 +44,32 @@ class MediaReferencePolicy:
     AllMissing = "AllMissing"
 
 
+class MediaLinkPolicy:
+    """How media files are put into an otiod bundle.
+
+    ``Hardlink`` and ``Reflink`` fall back to a regular copy when the
+    filesystem does not support them or the bundle is on another device.
+    ``Reflink`` uses ``os.copy_file_range``, which shares the data blocks on
+    filesystems that support it (btrfs, XFS, NFS 4.2 and others).
+    """
+    Copy = "Copy"
+    Hardlink = "Hardlink"
+    Reflink = "Reflink"
+
+
+class SkipExistingPolicy:
+    """When to skip media that is already present in the destination bundle.
+
+    ``Never`` always writes the media.  The other policies allow writing over
+    an existing bundle and skip media files whose size, size and modification
+    time or content checksum match the existing file in the bundle.
+    """
+    Never = "Never"
+    SizeMatches = "SizeMatches"
+    SizeAndMtimeMatch = "SizeAndMtimeMatch"
+    ChecksumMatches = "ChecksumMatches"
+
+
 def reference_cloned_and_missing(orig_mr, reason_missing):
     """Replace orig_mr with a missing reference with the same metadata.
 
@@ -65,41 +101,97 @@ def _guarantee_unique_basenames(path_list, adapter_name):
         basename_to_source_fn[new_basename] = fn
 
 
-def _prepped_otio_for_bundle_and_manifest(
+class _RelinkPlan:
+    """The changes bundling makes to the media references of an OTIO.
+
+    ``replacements`` lists ``(clip, new_media_reference)`` pairs for every
+    clip whose media reference changes and ``path_to_reference_map`` maps the
+    absolute path of every file that goes into the bundle to the new media
+    references pointing at it, which the adapters relink to the location of
+    the file inside the bundle.
+
+    New media references are copies, the input OTIO is only changed while
+    the plan is applied.
+    """
+
+    def __init__(self):
+        self.replacements = []
+        self.path_to_reference_map = {}
+
+    def apply(self):
+        """Replace the media references of the planned clips."""
+
+        for cl, media_reference in self.replacements:
+            cl.media_reference = media_reference
+
+    @contextlib.contextmanager
+    def applied(self):
+        """Apply the plan for the duration of the with block, restoring the
+        original media references afterwards.
+        """
+
+        originals = [
+            (cl, cl.media_reference) for cl, _ in self.replacements
+        ]
+        try:
+            self.apply()
+            yield
+        finally:
+            for cl, media_reference in originals:
+                cl.media_reference = media_reference
+
+
+def _existing_files(paths, workers=DEFAULT_COPY_WORKERS):
+    """Return the subset of paths that are existing files, checking them on a
+    pool of workers.
+    """
+
+    paths = list(paths)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, workers or 1)
+    ) as executor:
+        return {
+            path
+            for path, is_file in zip(paths, executor.map(os.path.isfile, paths))
+            if is_file
+        }
+
+
+def _relink_plan(
     input_otio,    # otio to process
     media_policy,  # how to handle media references (see: MediaReferencePolicy)
     adapter_name,  # just for error messages
+    workers=DEFAULT_COPY_WORKERS,  # number of concurrent file checks
 ):
-    """ Create a new OTIO based on input_otio that has had media references
-    replaced according to the media_policy.  Return that new OTIO and a
-    mapping of all the absolute file paths (not URLs) to be used in the bundle,
-    mapped to MediaReferences associated with those files.  Media references in
-    the OTIO will be relinked by the adapters to point to their output
-    locations.
+    """ Build a :class:`_RelinkPlan` that replaces the media references of
+    input_otio according to the media_policy, without copying input_otio.
 
-    The otio[dz] adapters use this function to do further relinking and build
-    their bundles.
+    Each distinct target file is checked once, the checks run on a pool of
+    workers.
 
     This is considered an internal API.
 
     media_policy is expected to be of type MediaReferencePolicy.
     """
 
-    # make sure the incoming OTIO isn't edited
-    result_otio = copy.deepcopy(input_otio)
-
-    path_to_reference_map = {}
-    invalid_files = set()
-
-    # result_otio is manipulated in place
-    for cl in result_otio.find_clips():
-        if media_policy == MediaReferencePolicy.AllMissing:
-            cl.media_reference = reference_cloned_and_missing(
-                cl.media_reference,
-                f"{media_policy} specified as the MediaReferencePolicy"
+    plan = _RelinkPlan()
+
+    if media_policy == MediaReferencePolicy.AllMissing:
+        for cl in input_otio.find_clips():
+            plan.replacements.append(
+                (
+                    cl,
+                    reference_cloned_and_missing(
+                        cl.media_reference,
+                        f"{media_policy} specified as the MediaReferencePolicy"
+                    )
+                )
             )
-            continue
+        return plan
 
+    # first pass: find the target file of every clip without touching disk
+    clip_targets = []
+    for cl in input_otio.find_clips():
         try:
             target_url = cl.media_reference.target_url
         except AttributeError:
@@ -113,40 +205,51 @@ def _prepped_otio_for_bundle_and_manifest(
         # "" is interpreted as a relative path, relative to cwd of the python
         # process
         if parsed_url.scheme not in ("file", ""):
-            if media_policy is MediaReferencePolicy.ErrorIfNotFile:
+            if media_policy == MediaReferencePolicy.ErrorIfNotFile:
                 raise NotAFileOnDisk(
                     f"The {adapter_name} adapter only works with media"
                     " reference target_url attributes that begin with 'file:'."
                     f"  Got a target_url of:  '{target_url}'"
                 )
-            if media_policy is MediaReferencePolicy.MissingIfNotFile:
-                cl.media_reference = reference_cloned_and_missing(
-                    cl.media_reference,
-                    "target_url is not a file scheme url (start with url:)"
+            if media_policy == MediaReferencePolicy.MissingIfNotFile:
+                plan.replacements.append(
+                    (
+                        cl,
+                        reference_cloned_and_missing(
+                            cl.media_reference,
+                            "target_url is not a file scheme url (start with"
+                            " url:)"
+                        )
+                    )
                 )
                 continue
 
         # get an absolute path to the target file
         target_file = os.path.abspath(url_utils.filepath_from_url(target_url))
-
-        # if the file hasn't already been checked
-        if (
-            target_file not in path_to_reference_map
-            and target_file not in invalid_files
-            and (
-                not os.path.exists(target_file)
-                or not os.path.isfile(target_file)
-            )
-        ):
-            invalid_files.add(target_file)
-
-        if target_file in invalid_files:
-            if media_policy is MediaReferencePolicy.ErrorIfNotFile:
+        clip_targets.append((cl, target_file))
+
+    # check each distinct file once
+    valid_files = _existing_files(
+        {target_file for _, target_file in clip_targets},
+        workers
+    )
+
+    # second pass: plan the new references, in clip order.  References that
+    # are shared between clips stay shared.
+    cloned_references = {}
+    for cl, target_file in clip_targets:
+        if target_file not in valid_files:
+            if media_policy == MediaReferencePolicy.ErrorIfNotFile:
                 raise NotAFileOnDisk(target_file)
-            if media_policy is MediaReferencePolicy.MissingIfNotFile:
-                cl.media_reference = reference_cloned_and_missing(
-                    cl.media_reference,
-                    "target_url target is not a file or does not exist"
+            if media_policy == MediaReferencePolicy.MissingIfNotFile:
+                plan.replacements.append(
+                    (
+                        cl,
+                        reference_cloned_and_missing(
+                            cl.media_reference,
+                            "target_url target is not a file or does not exist"
+                        )
+                    )
                 )
 
                 # do not need to relink it in the future or add this target to
@@ -154,15 +257,51 @@ def _prepped_otio_for_bundle_and_manifest(
                 # not exist.
                 continue
 
+        media_reference = cl.media_reference
+        if media_reference not in cloned_references:
+            cloned_references[media_reference] = copy.deepcopy(media_reference)
+        new_reference = cloned_references[media_reference]
+
+        plan.replacements.append((cl, new_reference))
+
         # add the media reference to the list of references that point at this
         # file, they will need to be relinked
-        path_to_reference_map.setdefault(target_file, []).append(
-            cl.media_reference
+        plan.path_to_reference_map.setdefault(target_file, []).append(
+            new_reference
         )
 
-    _guarantee_unique_basenames(path_to_reference_map.keys(), adapter_name)
+    _guarantee_unique_basenames(plan.path_to_reference_map.keys(), adapter_name)
+
+    return plan
+
+
+def _prepped_otio_for_bundle_and_manifest(
+    input_otio,    # otio to process
+    media_policy,  # how to handle media references (see: MediaReferencePolicy)
+    adapter_name,  # just for error messages
+):
+    """ Create a new OTIO based on input_otio that has had media references
+    replaced according to the media_policy.  Return that new OTIO and a
+    mapping of all the absolute file paths (not URLs) to be used in the bundle,
+    mapped to MediaReferences associated with those files.  Media references in
+    the OTIO will be relinked by the adapters to point to their output
+    locations.
+
+    The otio[dz] adapters use :func:`_relink_plan` instead, which does not
+    copy the whole input_otio.
+
+    This is considered an internal API.
+
+    media_policy is expected to be of type MediaReferencePolicy.
+    """
+
+    # make sure the incoming OTIO isn't edited
+    result_otio = copy.deepcopy(input_otio)
+
+    plan = _relink_plan(result_otio, media_policy, adapter_name)
+    plan.apply()
 
-    return result_otio, path_to_reference_map
+    return result_otio, plan.path_to_reference_map
 
 
 def _total_file_size_of(filepaths):
@@ -170,3 +309,121 @@ def _total_file_size_of(filepaths):
     for fn in filepaths:
         fsize += os.path.getsize(fn)
     return fsize
+
+
+def _file_checksum(fileobj):
+    crc = 0
+    for chunk in iter(lambda: fileobj.read(_COPY_CHUNK_SIZE), b""):
+        crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _existing_file_matches(src, dst, skip_existing):
+    """Return True if the file at dst can be kept instead of copying src."""
+
+    if skip_existing == SkipExistingPolicy.Never:
+        return False
+
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+
+    if skip_existing == SkipExistingPolicy.SizeMatches:
+        return True
+
+    if skip_existing == SkipExistingPolicy.SizeAndMtimeMatch:
+        return src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+
+    if skip_existing == SkipExistingPolicy.ChecksumMatches:
+        with open(src, "rb") as src_file, open(dst, "rb") as dst_file:
+            return _file_checksum(src_file) == _file_checksum(dst_file)
+
+    raise exceptions.OTIOError(f"Unknown SkipExistingPolicy: {skip_existing}")
+
+
+def _reflink_file(src, dst):
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        remaining = os.fstat(src_file.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(
+                src_file.fileno(),
+                dst_file.fileno(),
+                remaining
+            )
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+def _copy_media_file(src, dst, link_policy, skip_existing):
+    """Put src at dst according to link_policy.  Return False if the file
+    was skipped because it is already present.
+    """
+
+    if _existing_file_matches(src, dst, skip_existing):
+        return False
+
+    if os.path.lexists(dst):
+        os.remove(dst)
+
+    if link_policy == MediaLinkPolicy.Hardlink:
+        try:
+            os.link(src, dst)
+            return True
+        except OSError:
+            pass
+    elif link_policy == MediaLinkPolicy.Reflink and hasattr(
+        os,
+        "copy_file_range"
+    ):
+        try:
+            _reflink_file(src, dst)
+            shutil.copystat(src, dst)
+            return True
+        except OSError:
+            if os.path.lexists(dst):
+                os.remove(dst)
+    elif link_policy not in (MediaLinkPolicy.Copy, MediaLinkPolicy.Reflink):
+        raise exceptions.OTIOError(f"Unknown MediaLinkPolicy: {link_policy}")
+
+    # copy2 preserves the modification time, so SizeAndMtimeMatch works when
+    # re-bundling
+    shutil.copy2(src, dst)
+    return True
+
+
+def _copy_media_files(
+    src_to_dst_map,
+    workers=DEFAULT_COPY_WORKERS,
+    link_policy=MediaLinkPolicy.Copy,
+    skip_existing=SkipExistingPolicy.Never,
+):
+    """Copy the media files in src_to_dst_map using a pool of workers.
+
+    Returns the list of source paths that were actually copied.
+    """
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, workers or 1)
+    ) as executor:
+        futures = {
+            executor.submit(
+                _copy_media_file,
+                src,
+                dst,
+                link_policy,
+                skip_existing
+            ): src
+            for src, dst in src_to_dst_map.items()
+        }
+
+        return sorted(
+            futures[future]
+            for future in concurrent.futures.as_completed(futures)
+            if future.result()
+        )
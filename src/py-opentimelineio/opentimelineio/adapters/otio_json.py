@@ -5,39 +5,67 @@
 
 from .. import (
     core,
+    schema,
     versioning,
     exceptions
 )
 
+import json
 import os
+import re
 
 _DEFAULT_VERSION_ENVVAR = "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL"
 
+# The index written next to an .otio file by write_to_file(write_index=True)
+# is a json file named after it with this suffix, for example
+# "edit.otio.idx".
+INDEX_SUFFIX = ".idx"
+_INDEX_VERSION = 1
 
-def read_from_file(filepath):
+# Every object is written starting with its schema
+_WRITTEN_SCHEMA_RE = re.compile(rb'\{\s*"OTIO_SCHEMA"\s*:\s*"([^"]*)"')
+_WRITTEN_SCHEMA_CHUNK_SIZE = 4096
+
+
+def read_from_file(filepath, lazy_metadata=False, lazy_children=False):
     """
     De-serializes an OpenTimelineIO object from a file
 
     Args:
         filepath (str): The path to an otio file to read from
+        lazy_metadata (bool): Keep metadata as json text until it is first\
+            accessed. Metadata that is never modified is written back verbatim.
+        lazy_children (bool): Read the children of tracks and stacks from\
+            the file when they are first accessed. The file must not change\
+            while the timeline is in use.
 
     Returns:
         OpenTimeline: An OpenTimeline object
     """
-    return core.deserialize_json_from_file(filepath)
+    return core.deserialize_json_from_file(
+        filepath,
+        lazy_metadata=lazy_metadata,
+        lazy_children=lazy_children
+    )
 
 
-def read_from_string(input_str):
+def read_from_string(input_str, lazy_metadata=False):
     """
     De-serializes an OpenTimelineIO object from a json string
 
     Args:
-        input_str (str): A string containing json serialized otio contents
+        input_str (str): A string containing json serialized otio contents,\
+            or a bytes-like object holding them utf-8 encoded.
+        lazy_metadata (bool): Keep metadata as json text until it is first\
+            accessed. Metadata that is never modified is written back verbatim.
 
     Returns:
         OpenTimeline: An OpenTimeline object
     """
-    return core.deserialize_json_from_string(input_str)
+    return core.deserialize_json_from_string(
+        input_str,
+        lazy_metadata=lazy_metadata
+    )
 
 
 def _fetch_downgrade_map_from_env():
@@ -112,7 +140,8 @@ def write_to_file(
         input_otio,
         filepath,
         target_schema_versions=None,
-        indent=4
+        indent=4,
+        write_index=False
 ):
     """
     Serializes an OpenTimelineIO object into a file
@@ -123,6 +152,8 @@ def write_to_file(
         filepath (str): The name of an otio file to write to
         indent (int): number of spaces for each json indentation level.\
             Use -1 for no indentation or newlines.
+        write_index (bool): Also write an index of the file to\
+            filepath + ".idx", see read_index().
 
     If target_schema_versions is None and the environment variable
     "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL" is set, will read a map out of
@@ -145,9 +176,199 @@ def write_to_file(
     ):
         target_schema_versions = _fetch_downgrade_map_from_env()
 
-    return core.serialize_json_to_file(
+    if not write_index:
+        return core.serialize_json_to_file(
+            input_otio,
+            filepath,
+            target_schema_versions,
+            indent
+        )
+
+    object_ranges = []
+    core.serialize_json_to_file(
         input_otio,
         filepath,
         target_schema_versions,
-        indent
+        indent,
+        object_ranges=object_ranges
     )
+    _write_index(input_otio, filepath, object_ranges)
+    return True
+
+
+def _written_schema(f, begin, end):
+    # the schema as written, which is not the one of the object in memory
+    # when it was downgraded to target_schema_versions
+    f.seek(begin)
+    head = b""
+    while len(head) < end - begin:
+        chunk = f.read(
+            min(_WRITTEN_SCHEMA_CHUNK_SIZE, end - begin - len(head))
+        )
+        if not chunk:
+            break
+        head += chunk
+        match = _WRITTEN_SCHEMA_RE.match(head)
+        if match:
+            return match.group(1).decode("utf-8")
+    raise ValueError(f"No schema written at offset {begin} of {f.name}")
+
+
+def _write_index(input_otio, filepath, object_ranges):
+    ranges = {id(obj): (begin, end) for obj, begin, end in object_ranges}
+
+    if isinstance(input_otio, schema.Timeline):
+        stack = input_otio.tracks
+    elif isinstance(input_otio, schema.Stack):
+        stack = input_otio
+    else:
+        stack = None
+
+    top = stack
+    if top is None and isinstance(input_otio, core.Composition):
+        top = input_otio
+
+    stat = os.stat(filepath)
+    with open(filepath, "rb") as f:
+        def entry(path, obj):
+            begin, end = ranges[id(obj)]
+            return {
+                "path": path,
+                "schema": _written_schema(f, begin, end),
+                "name": obj.name,
+                "begin": begin,
+                "end": end,
+            }
+
+        root_schema = _written_schema(f, 0, stat.st_size)
+        objects = []
+        for i, child in enumerate(top or []):
+            objects.append(entry([i], child))
+            if isinstance(child, core.Composition):
+                objects.extend(
+                    entry([i, j], c) for j, c in enumerate(child)
+                )
+
+    duration = None
+    if stack is not None:
+        d = stack.duration()
+        duration = {"value": d.value, "rate": d.rate}
+
+    try:
+        clip_count = len(input_otio.find_clips())
+    except AttributeError:
+        clip_count = 0
+
+    index = {
+        "OTIO_INDEX": _INDEX_VERSION,
+        "file_size": stat.st_size,
+        "file_mtime_ns": stat.st_mtime_ns,
+        "schema": root_schema,
+        "name": getattr(input_otio, "name", ""),
+        "duration": duration,
+        "track_count": len(stack) if stack is not None else 0,
+        "clip_count": clip_count,
+        "objects": objects,
+    }
+    with open(filepath + INDEX_SUFFIX, "w") as f:
+        json.dump(index, f, indent=1)
+
+
+def read_index(filepath):
+    """
+    Reads the index written next to an otio file by\
+    write_to_file(write_index=True).
+
+    The index holds a summary of the file, and the byte range of each track\
+    and of each child of a track so that they can be read on their own, see\
+    read_indexed_object().  It looks like this:
+
+        {
+            "OTIO_INDEX": 1,
+            "file_size": 51234,
+            "file_mtime_ns": 1700000000000000000,
+            "schema": "Timeline.1",
+            "name": "edit",
+            "duration": {"value": 240.0, "rate": 24.0},
+            "track_count": 2,
+            "clip_count": 12,
+            "objects": [
+                {
+                    "path": [0],
+                    "schema": "Track.1",
+                    "name": "V1",
+                    "begin": 412,
+                    "end": 20511
+                },
+                ...
+            ]
+        }
+
+    Paths are lists of child indices from the tracks of a timeline, or from\
+    the root when it is a track or stack.  Schemas are the ones written to\
+    the file, after any downgrade to target_schema_versions.  The duration\
+    and track count are those of the tracks of a timeline, or of the root\
+    when it is a stack.  Otherwise the duration is null and the track count\
+    is 0.
+
+    Args:
+        filepath (str): The path to an otio file
+
+    Returns:
+        dict: The index, or None if there is no index or it is out of date
+    """
+    try:
+        with open(filepath + INDEX_SUFFIX) as f:
+            index = json.load(f)
+        stat = os.stat(filepath)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(index, dict)
+        or index.get("OTIO_INDEX") != _INDEX_VERSION
+        or index.get("file_size") != stat.st_size
+        or index.get("file_mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+
+    return index
+
+
+def read_indexed_object(filepath, path, index=None):
+    """
+    Reads one track, or one child of a track, from an otio file without\
+    reading the rest of the file, using the index next to it.
+
+    Args:
+        filepath (str): The path to an otio file
+        path (list): Child indices of the object, see read_index()
+        index (dict): The index of the file, if already read with\
+            read_index()
+
+    Returns:
+        Composable: The object, which has no parent
+
+    Raises:
+        otio.exceptions.CouldNotReadFileError: if the file has no index or\
+            it is out of date
+        IndexError: if the path is not in the index
+    """
+    if index is None:
+        index = read_index(filepath)
+        if index is None:
+            raise exceptions.CouldNotReadFileError(
+                f"No up to date index for {filepath}"
+            )
+
+    path = list(path)
+    for entry in index["objects"]:
+        if entry["path"] == path:
+            break
+    else:
+        raise IndexError(f"{path} is not in the index of {filepath}")
+
+    with open(filepath, "rb") as f:
+        f.seek(entry["begin"])
+        text = f.read(entry["end"] - entry["begin"])
+    return core.deserialize_json_from_string(text)
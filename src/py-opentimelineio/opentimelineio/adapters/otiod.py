@@ -10,7 +10,6 @@ into a single directory named with a suffix of .otiod.
 """
 
 import os
-import shutil
 
 from . import (
     file_bundle_utils as utils,
@@ -60,10 +59,20 @@ def write_to_file(
     # see documentation in file_bundle_utils for more information on the
     # media_policy
     media_policy=utils.MediaReferencePolicy.ErrorIfNotFile,
-    dryrun=False
+    dryrun=False,
+    # number of media files copied concurrently
+    workers=utils.DEFAULT_COPY_WORKERS,
+    # see MediaLinkPolicy in file_bundle_utils, copy, hardlink or reflink
+    link_policy=utils.MediaLinkPolicy.Copy,
+    # see SkipExistingPolicy in file_bundle_utils.  Any policy other than
+    # Never allows updating an existing bundle, only copying changed media.
+    skip_existing=utils.SkipExistingPolicy.Never,
 ):
+    incremental = skip_existing != utils.SkipExistingPolicy.Never
 
-    if os.path.exists(filepath):
+    if os.path.exists(filepath) and not (
+        incremental and os.path.isdir(filepath)
+    ):
         raise exceptions.OTIOError(
             f"'{filepath}' exists, will not overwrite."
         )
@@ -91,11 +100,15 @@ def write_to_file(
     # - build the resulting structure (zip file, directory)
     # -------------------------------------------------------------------------
 
-    result_otio, path_to_mr_map = utils._prepped_otio_for_bundle_and_manifest(
+    # the input is not copied, only the media references that change are,
+    # and those are swapped in while the result is written
+    relink_plan = utils._relink_plan(
         input_otio,
         media_policy,
-        "OTIOD"
+        "OTIOD",
+        workers=workers,
     )
+    path_to_mr_map = relink_plan.path_to_reference_map
 
     # dryrun reports the total size of files
     if dryrun:
@@ -125,16 +138,22 @@ def write_to_file(
                 os.path.relpath(final_path, filepath)
             )
 
-    os.mkdir(filepath)
+    os.makedirs(os.path.join(filepath, utils.BUNDLE_DIR_NAME), exist_ok=True)
 
-    otio_json.write_to_file(
-        result_otio,
-        os.path.join(filepath, utils.BUNDLE_PLAYLIST_PATH)
+    # write the media files
+    utils._copy_media_files(
+        abspath_to_output_path_map,
+        workers=workers,
+        link_policy=link_policy,
+        skip_existing=skip_existing,
     )
 
-    # write the media files
-    os.mkdir(os.path.join(filepath, utils.BUNDLE_DIR_NAME))
-    for src, dst in abspath_to_output_path_map.items():
-        shutil.copyfile(src, dst)
+    # write the otio last, so that an interrupted update does not leave a
+    # content.otio that points at media that is not in the bundle yet
+    with relink_plan.applied():
+        otio_json.write_to_file(
+            input_otio,
+            os.path.join(filepath, utils.BUNDLE_PLAYLIST_PATH)
+        )
 
     return
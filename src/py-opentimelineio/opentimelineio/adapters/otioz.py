@@ -10,16 +10,24 @@ into a single zip file with the suffix .otioz.  Can error out if files aren't
 locally referenced or provide missing references
 
 Can also extract the content.otio file from an otioz bundle for processing.
+Individual media files can be read or extracted on demand with
+`media_extractors()`, without unpacking the rest of the bundle.
 
 Note that OTIOZ files _always_ use the unix style path separator ('/'). This
 ensures that regardless of which platform a bundle was created on, it can be
 read on unix and windows platforms.
 """
 
+import collections.abc
 import os
+import queue
+import tempfile
+import threading
 import zipfile
+import concurrent.futures
 
 from .. import (
+    core,
     exceptions,
     url_utils,
 )
@@ -59,9 +67,10 @@ def read_from_file(
             )
 
     with zipfile.ZipFile(filepath, 'r') as zi:
-        result = otio_json.read_from_string(
-            zi.read(utils.BUNDLE_PLAYLIST_PATH)
-        )
+        # parse the otio as it is decompressed, without first reading the
+        # whole member into memory
+        with zi.open(utils.BUNDLE_PLAYLIST_PATH) as content:
+            result = core.deserialize_json_from_stream(content)
 
         if extract_to_directory:
             zi.extractall(extract_to_directory)
@@ -69,15 +78,121 @@ def read_from_file(
     return result
 
 
+class MediaExtractor:
+    """Reads or extracts a single media file of an otioz bundle on demand."""
+
+    def __init__(self, zip_file, info):
+        self._zip_file = zip_file
+        self._info = info
+
+    @property
+    def bundle_path(self):
+        """Path of the media file inside the bundle, ie: media/file.mov"""
+        return self._info.filename
+
+    @property
+    def file_size(self):
+        """Size of the media file in bytes."""
+        return self._info.file_size
+
+    def open(self):
+        """Return a read-only file object streaming the media file out of the
+        bundle.
+        """
+        return self._zip_file.open(self._info)
+
+    def extract(self, directory):
+        """Extract the media file into directory, keeping its path inside the
+        bundle, and return the path of the extracted file.
+        """
+        return self._zip_file.extract(self._info, directory)
+
+    def __repr__(self):
+        return f"MediaExtractor({self.bundle_path!r})"
+
+
+class BundleMedia(collections.abc.Mapping):
+    """Mapping of the paths of the media files in an otioz bundle to
+    :class:`MediaExtractor` objects.
+
+    Holds the bundle open until :meth:`close` is called, or the end of the
+    ``with`` block when used as a context manager.
+    """
+
+    def __init__(self, filepath):
+        if not zipfile.is_zipfile(filepath):
+            raise exceptions.OTIOError(f"Not a zipfile: {filepath}")
+
+        self._zip_file = zipfile.ZipFile(filepath, 'r')
+        self._extractors = {
+            info.filename: MediaExtractor(self._zip_file, info)
+            for info in self._zip_file.infolist()
+            if (
+                info.filename.startswith(utils.BUNDLE_DIR_NAME + "/")
+                and not info.is_dir()
+            )
+        }
+
+    def __getitem__(self, bundle_path):
+        return self._extractors[bundle_path]
+
+    def __iter__(self):
+        return iter(self._extractors)
+
+    def __len__(self):
+        return len(self._extractors)
+
+    def for_reference(self, media_reference):
+        """Return the extractor for the target_url of media_reference, as
+        found in the content.otio of the bundle.
+        """
+        return self[url_utils.filepath_from_url(media_reference.target_url)]
+
+    def close(self):
+        self._zip_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def media_extractors(filepath):
+    """Return a :class:`BundleMedia` mapping for the otioz at filepath.
+
+    Nothing is extracted until asked for, so a single clip's media can be
+    pulled out of a large bundle:
+
+    .. code-block:: python
+
+        timeline = otio.adapters.read_from_file("big.otioz")
+        clip = timeline.find_clips()[0]
+        with otioz.media_extractors("big.otioz") as media:
+            media.for_reference(clip.media_reference).extract("/var/tmp/out")
+    """
+    return BundleMedia(filepath)
+
+
 def write_to_file(
     input_otio,
     filepath,
     # see documentation in file_bundle_utils for more information on the
     # media_policy
     media_policy=utils.MediaReferencePolicy.ErrorIfNotFile,
-    dryrun=False
+    dryrun=False,
+    # number of media files read ahead concurrently while writing the zip
+    workers=utils.DEFAULT_COPY_WORKERS,
+    # see SkipExistingPolicy in file_bundle_utils.  Any policy other than
+    # Never allows replacing an existing bundle, matching media is then
+    # taken from the existing bundle instead of the source files.
+    skip_existing=utils.SkipExistingPolicy.Never,
 ):
-    if os.path.exists(filepath):
+    incremental = skip_existing != utils.SkipExistingPolicy.Never
+
+    if os.path.exists(filepath) and not (
+        incremental and zipfile.is_zipfile(filepath)
+    ):
         raise exceptions.OTIOError(
             f"'{filepath}' exists, will not overwrite."
         )
@@ -93,11 +208,15 @@ def write_to_file(
     # - build the resulting structure (zip file, directory)
     # -------------------------------------------------------------------------
 
-    result_otio, path_to_mr_map = utils._prepped_otio_for_bundle_and_manifest(
+    # the input is not copied, only the media references that change are,
+    # and those are swapped in while the result is written
+    relink_plan = utils._relink_plan(
         input_otio,
         media_policy,
-        "OTIOZ"
+        "OTIOZ",
+        workers=workers,
     )
+    path_to_mr_map = relink_plan.path_to_reference_map
 
     # dryrun reports the total size of files
     if dryrun:
@@ -121,8 +240,156 @@ def write_to_file(
             mr.target_url = url_utils.url_from_filepath(final_path)
 
     # write the otioz file to the temp directory
-    otio_str = otio_json.write_to_string(result_otio)
+    with relink_plan.applied():
+        otio_str = otio_json.write_to_string(input_otio)
 
+    if os.path.exists(filepath):
+        # build the updated bundle next to the existing one, taking matching
+        # media from it, and then replace it
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(filepath)),
+            suffix=".otioz.tmp"
+        )
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(filepath, mode='r') as existing:
+                _write_bundle(
+                    tmp_path,
+                    otio_str,
+                    abspath_to_output_path_map,
+                    workers,
+                    existing,
+                    skip_existing
+                )
+            os.replace(tmp_path, filepath)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    else:
+        _write_bundle(
+            filepath,
+            otio_str,
+            abspath_to_output_path_map,
+            workers
+        )
+
+    return
+
+
+def _existing_member_matches(existing, src, dst, skip_existing):
+    try:
+        member = existing.getinfo(dst)
+    except KeyError:
+        return None
+
+    if member.file_size != os.path.getsize(src):
+        return None
+
+    if skip_existing == utils.SkipExistingPolicy.SizeAndMtimeMatch:
+        if member.date_time != zipfile.ZipInfo.from_file(src, dst).date_time:
+            return None
+    elif skip_existing == utils.SkipExistingPolicy.ChecksumMatches:
+        with open(src, "rb") as fi:
+            if member.CRC != utils._file_checksum(fi):
+                return None
+    elif skip_existing != utils.SkipExistingPolicy.SizeMatches:
+        raise exceptions.OTIOError(
+            f"Unknown SkipExistingPolicy: {skip_existing}"
+        )
+
+    return member
+
+
+def _read_ahead(open_fn, chunks, abort):
+    """Read the file returned by open_fn into the chunks queue.  A None marks
+    the end of the file and an exception is passed along to the writer.
+    Stops early if abort is set.
+    """
+
+    def put(item):
+        while not abort.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        with open_fn() as fi:
+            for chunk in iter(lambda: fi.read(utils._COPY_CHUNK_SIZE), b""):
+                if not put(chunk):
+                    return
+    except Exception as e:
+        put(e)
+    else:
+        put(None)
+
+
+def _write_media(
+    target,
+    abspath_to_output_path_map,
+    workers,
+    existing=None,
+    skip_existing=utils.SkipExistingPolicy.Never
+):
+    # A zip file is written sequentially, so the media is added one member at
+    # a time, but up to `workers` files are read ahead on worker threads so
+    # that reading the sources overlaps with writing the archive.  Each file
+    # buffers at most a few chunks, bounding the memory used.
+    abort = threading.Event()
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, workers or 1)
+    ) as executor:
+        pending = []
+        for src, dst in abspath_to_output_path_map.items():
+            member = None
+            if existing is not None:
+                member = _existing_member_matches(
+                    existing,
+                    src,
+                    dst,
+                    skip_existing
+                )
+
+            if member is not None:
+                zinfo = zipfile.ZipInfo(dst, member.date_time)
+                zinfo.external_attr = member.external_attr
+                zinfo.file_size = member.file_size
+                open_fn = lambda name=dst: existing.open(name)  # noqa: E731
+            else:
+                zinfo = zipfile.ZipInfo.from_file(src, dst)
+                open_fn = lambda path=src: open(path, "rb")  # noqa: E731
+
+            # write the media (uncompressed)
+            zinfo.compress_type = zipfile.ZIP_STORED
+
+            chunks = queue.Queue(maxsize=4)
+            executor.submit(_read_ahead, open_fn, chunks, abort)
+            pending.append((zinfo, chunks))
+
+        try:
+            for zinfo, chunks in pending:
+                with target.open(zinfo, mode='w') as fo:
+                    for chunk in iter(chunks.get, None):
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        fo.write(chunk)
+        except BaseException:
+            # release the readers that are still waiting on full queues
+            abort.set()
+            raise
+
+
+def _write_bundle(
+    filepath,
+    otio_str,
+    abspath_to_output_path_map,
+    workers,
+    existing=None,
+    skip_existing=utils.SkipExistingPolicy.Never
+):
     with zipfile.ZipFile(filepath, mode='w') as target:
         # write the version file (compressed)
         target.writestr(
@@ -150,8 +417,10 @@ def write_to_file(
             compress_type=zipfile.ZIP_DEFLATED
         )
 
-        # write the media (uncompressed)
-        for src, dst in abspath_to_output_path_map.items():
-            target.write(src, dst, compress_type=zipfile.ZIP_STORED)
-
-    return
+        _write_media(
+            target,
+            abspath_to_output_path_map,
+            workers,
+            existing,
+            skip_existing
+        )
@@ -0,0 +1,315 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Opt-in on-disk cache of parsed files for :func:`.read_from_file`.
+
+Reading a file normally parses it, runs the schema upgrade functions, the
+``post_adapter_read`` hooks and the media linker.  When the cache is enabled,
+the result of all of that is stored as a snapshot in the cache directory and
+later reads of the unchanged file load the snapshot instead.  Snapshots are
+stored as compact otio_json at the current schema versions, so loading one
+skips the adapter, the upgrade functions, the hooks and the media linker.
+
+The cache is configured with environment variables:
+
+``OTIO_READ_CACHE_DIR``
+    Directory holding the snapshots.  The cache is only used if this is set.
+
+``OTIO_READ_CACHE_VALIDATION``
+    How a file is recognized as unchanged.  ``content`` (the default) keys
+    snapshots on a hash of the file contents.  ``stat`` keys them on the path,
+    modification time and size of the file, which avoids reading the file but
+    can miss changes that preserve both.
+
+``OTIO_READ_CACHE_MAX_MB``
+    Upper bound on the size of the cache directory in megabytes, defaults to
+    1024.  The least recently used snapshots are removed first.
+
+Snapshot keys also include the OTIO version, the registered schema versions,
+the adapter, the media linker that is used (resolving
+``$OTIO_DEFAULT_MEDIA_LINKER``), the hook scripts that run after reading and
+all of the arguments passed to :func:`.read_from_file`.
+
+Bundles that are directories, like otiod, are recognized as unchanged by
+their ``content.otio`` and the list of their media files.  Reads with
+arguments that have side effects besides returning the timeline, like
+``extract_to_directory`` for otioz, always go to the adapter.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+from .. import (
+    core,
+    exceptions,
+    hooks,
+    media_linker,
+    plugins,
+)
+from . import file_bundle_utils
+
+CACHE_DIR_ENVVAR = "OTIO_READ_CACHE_DIR"
+VALIDATION_ENVVAR = "OTIO_READ_CACHE_VALIDATION"
+MAX_MB_ENVVAR = "OTIO_READ_CACHE_MAX_MB"
+
+VALIDATION_MODES = ("content", "stat")
+DEFAULT_MAX_MB = 1024
+
+_SNAPSHOT_SUFFIX = ".otio"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# read arguments that do more than choose what is read, reads using them are
+# not cached
+_SIDE_EFFECT_ARGUMENTS = ("extract_to_directory",)
+
+# the hooks run by Adapter.read_from_file
+_READ_HOOKS = ("post_adapter_read", "post_media_linker")
+
+
+def cache_dir():
+    """Return the cache directory, or None if the cache is disabled."""
+
+    return os.environ.get(CACHE_DIR_ENVVAR) or None
+
+
+def _validation_mode():
+    mode = os.environ.get(VALIDATION_ENVVAR) or "content"
+    if mode not in VALIDATION_MODES:
+        raise exceptions.InvalidEnvironmentVariableError(
+            "Environment variable '{}' is set to '{}', must be one of: {}".format(
+                VALIDATION_ENVVAR,
+                mode,
+                ", ".join(VALIDATION_MODES)
+            )
+        )
+    return mode
+
+
+def _max_bytes():
+    value = os.environ.get(MAX_MB_ENVVAR) or DEFAULT_MAX_MB
+    try:
+        return int(value) * 1024 * 1024
+    except ValueError:
+        raise exceptions.InvalidEnvironmentVariableError(
+            "Environment variable '{}' is set to '{}', must be an integer"
+            " number of megabytes.".format(MAX_MB_ENVVAR, value)
+        )
+
+
+def _file_fingerprint(filepath, mode):
+    if os.path.isdir(filepath):
+        return _bundle_fingerprint(filepath, mode)
+
+    if mode == "stat":
+        st = os.stat(filepath)
+        return "{}:{}:{}".format(
+            os.path.abspath(filepath),
+            st.st_mtime_ns,
+            st.st_size
+        )
+
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as fi:
+        for chunk in iter(lambda: fi.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _bundle_fingerprint(dirpath, mode):
+    """Fingerprint a bundle directory by its playlist and the path and size
+    of every other file in it.  The mtime of the directory itself does not
+    change when the files in it are rewritten.
+    """
+
+    playlist = os.path.join(dirpath, file_bundle_utils.BUNDLE_PLAYLIST_PATH)
+    files = []
+    for root, _, names in os.walk(dirpath):
+        for name in names:
+            path = os.path.join(root, name)
+            if path == playlist:
+                continue
+            st = os.stat(path)
+            files.append(
+                (
+                    os.path.relpath(path, dirpath),
+                    st.st_size,
+                    st.st_mtime_ns if mode == "stat" else None,
+                )
+            )
+
+    return {
+        "playlist": (
+            _file_fingerprint(playlist, mode)
+            if os.path.isfile(playlist) else None
+        ),
+        "files": sorted(files),
+    }
+
+
+def _media_linker_name(media_linker_name):
+    """Return the name of the media linker a read uses, with the default
+    linker policy resolved from the environment.
+    """
+
+    if (
+        media_linker_name == media_linker.MediaLinkingPolicy.ForceDefaultLinker
+        or not media_linker_name
+    ):
+        return os.environ.get("OTIO_DEFAULT_MEDIA_LINKER") or None
+    return media_linker_name
+
+
+def _hook_scripts():
+    """Return the hook scripts run after a read, with their files."""
+
+    manifest = plugins.ActiveManifest()
+    result = {}
+    for hook in _READ_HOOKS:
+        scripts = []
+        for name in hooks.scripts_attached_to(hook):
+            script = manifest.from_name(name, "hook_scripts")
+            scripts.append((name, script.module_abs_path()))
+        result[hook] = scripts
+    return result
+
+
+def is_cacheable(**read_arguments):
+    """Return whether a read with read_arguments can be cached, which it can
+    not if any of them has side effects.
+    """
+
+    return not any(read_arguments.get(a) for a in _SIDE_EFFECT_ARGUMENTS)
+
+
+def snapshot_key(adapter_name, filepath, **read_arguments):
+    """Return the key of the snapshot for reading filepath with adapter_name
+    and read_arguments.
+    """
+
+    otio_module = sys.modules[__name__.split(".")[0]]
+    description = {
+        "otio_version": getattr(otio_module, "__version__", None),
+        "schema_versions": dict(core.type_version_map()),
+        "adapter": adapter_name,
+        "file": _file_fingerprint(filepath, _validation_mode()),
+        "arguments": read_arguments,
+        "media_linker": _media_linker_name(
+            read_arguments.get(
+                "media_linker_name",
+                media_linker.MediaLinkingPolicy.ForceDefaultLinker
+            )
+        ),
+        "hooks": _hook_scripts(),
+    }
+
+    return hashlib.sha256(
+        json.dumps(description, sort_keys=True, default=repr).encode("utf-8")
+    ).hexdigest()
+
+
+def _snapshot_path(key):
+    return os.path.join(cache_dir(), key + _SNAPSHOT_SUFFIX)
+
+
+def load(key):
+    """Return the object stored under key, or None if there is no usable
+    snapshot.
+    """
+
+    path = _snapshot_path(key)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        result = core.deserialize_json_from_file(path)
+    except (OSError, ValueError, exceptions.OTIOError):
+        # unreadable or truncated snapshot, drop it and read the source again
+        _remove(path)
+        return None
+
+    # mark the snapshot as recently used
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return result
+
+
+def store(key, input_otio):
+    """Store input_otio under key and prune the cache to its size limit.
+
+    Failing to write the snapshot is not an error, the cache is skipped.
+    """
+
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            core.serialize_json_to_file(input_otio, tmp_path, indent=-1)
+            os.replace(tmp_path, _snapshot_path(key))
+        finally:
+            _remove(tmp_path)
+    except (OSError, ValueError, exceptions.OTIOError):
+        return
+
+    prune(_max_bytes())
+
+
+def prune(max_bytes):
+    """Remove the least recently used snapshots until the cache holds at
+    most max_bytes.
+    """
+
+    directory = cache_dir()
+    try:
+        entries = [
+            (e.stat().st_mtime_ns, e.stat().st_size, e.path)
+            for e in os.scandir(directory)
+            if e.is_file() and e.name.endswith(_SNAPSHOT_SUFFIX)
+        ]
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def clear():
+    """Remove every snapshot from the cache directory."""
+
+    prune(0)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def read_from_file(adapter, filepath, **read_arguments):
+    """Read filepath with adapter, going through the snapshot cache unless
+    read_arguments have side effects.
+    """
+
+    if not is_cacheable(**read_arguments):
+        return adapter.read_from_file(filepath=filepath, **read_arguments)
+
+    key = snapshot_key(adapter.name, filepath, **read_arguments)
+
+    result = load(key)
+    if result is None:
+        result = adapter.read_from_file(filepath=filepath, **read_arguments)
+        store(key, result)
+
+    return result
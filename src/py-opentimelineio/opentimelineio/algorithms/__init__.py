@@ -19,5 +19,13 @@ from .filter import (
     filtered_with_sequence_context
 )
 from .timeline_algo import (
+    timeline_statistics,
     timeline_trimmed_to_range
 )
+from .media_algo import (
+    verify_media
+)
+from .. _otio import (
+    EditTransaction,
+    ReferencePoint,
+)
@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Algorithms for the media referenced by OTIO objects."""
+
+import os
+import threading
+import urllib.parse
+from concurrent import futures
+
+from .. import (
+    schema,
+    url_utils,
+)
+
+# The status verify_media() gives the clips whose media it could not check,
+# when asked to report them.
+NOT_CHECKED = "not checked"
+
+# The names of the files in the directories listed so far, by absolute path.
+_DIRECTORY_LISTINGS = {}
+_DIRECTORY_LISTINGS_LOCK = threading.Lock()
+
+
+def _list_directory(path):
+    try:
+        with os.scandir(path) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except OSError:
+        names = frozenset()
+
+    with _DIRECTORY_LISTINGS_LOCK:
+        _DIRECTORY_LISTINGS[path] = names
+    return names
+
+
+def _local_path(url):
+    """Return the path of a file url or plain path, or None for other urls."""
+    if urllib.parse.urlparse(url).scheme not in ("", "file"):
+        return None
+    return os.path.abspath(url_utils.filepath_from_url(url))
+
+
+def _external_file(media_reference):
+    url = media_reference.target_url
+    path = _local_path(url) if url else None
+    if path is None:
+        return None
+    return os.path.split(path)
+
+
+def _image_sequence_files(media_reference):
+    count = media_reference.number_of_images_in_sequence()
+    if not count:
+        return None
+    urls = media_reference.target_urls_for_image_range(0, count)
+
+    # the frames only differ after the last separator, which is in the part
+    # of the url before the frame number
+    path = _local_path(urls[0])
+    if path is None:
+        return None
+    start = urls[0].rfind("/") + 1
+    names = [url[start:] for url in urls]
+    if any("%" in name for name in names):
+        names = [urllib.parse.unquote(name) for name in names]
+    return os.path.dirname(path), names
+
+
+def _missing_frames(media_reference, names, listing):
+    missing = []
+    first = None
+    for image_number, name in enumerate(names):
+        if name not in listing:
+            if first is None:
+                first = image_number
+        elif first is not None:
+            missing.append((first, image_number - 1))
+            first = None
+    if first is not None:
+        missing.append((first, len(names) - 1))
+
+    start_frame = media_reference.start_frame
+    frame_step = media_reference.frame_step
+    return [
+        (start_frame + first * frame_step, start_frame + last * frame_step)
+        for first, last in missing
+    ]
+
+
+def verify_media(timeline, workers=None, refresh=False, report_unchecked=False):
+    """
+    Check that the media referenced by the clips in a timeline is on disk.
+
+    The file of each :class:`.ExternalReference` and every frame of each
+    :class:`.ImageSequenceReference` in its available range are checked.
+    Rather than checking for each file, the directories they are in are
+    listed once, on ``workers`` threads, and the files are looked up in those
+    listings.  The listings are kept for later calls, so checking again
+    after the files on disk have changed needs ``refresh``.
+
+    Only local files, given as ``file`` urls or paths, are checked.  Other
+    media, image sequences without an available range and clips without an
+    :class:`.ExternalReference` or :class:`.ImageSequenceReference` are left
+    out, unless ``report_unchecked`` is set.
+
+    :param timeline: A :class:`.Timeline`, or any object with ``find_clips()``
+    :param int workers: The number of threads listing directories, or None
+        for the :class:`concurrent.futures.ThreadPoolExecutor` default
+    :param bool refresh: List the directories again, even if they were
+        listed before
+    :param bool report_unchecked: Also return the clips whose media could not
+        be checked, mapped to :data:`NOT_CHECKED`
+    :returns: A dict from each clip with missing media to None if the file of
+        an :class:`.ExternalReference` is missing, or to the list of missing
+        ``(first_frame, last_frame)`` ranges, inclusive, of an
+        :class:`.ImageSequenceReference`
+    :rtype: dict
+    """
+    missing = {}
+    files = []
+    for clip in timeline.find_clips():
+        media_reference = clip.media_reference
+        if isinstance(media_reference, schema.ExternalReference):
+            media_files = _external_file(media_reference)
+        elif isinstance(media_reference, schema.ImageSequenceReference):
+            media_files = _image_sequence_files(media_reference)
+        else:
+            media_files = None
+        if media_files is not None:
+            files.append((clip, media_reference, media_files))
+        elif report_unchecked:
+            missing[clip] = NOT_CHECKED
+
+    directories = {directory for _, _, (directory, _) in files}
+    with _DIRECTORY_LISTINGS_LOCK:
+        listings = {
+            directory: _DIRECTORY_LISTINGS.get(directory)
+            for directory in directories
+        }
+    unlisted = [
+        directory for directory, names in listings.items()
+        if refresh or names is None
+    ]
+    if unlisted:
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for directory, names in zip(
+                unlisted, executor.map(_list_directory, unlisted)
+            ):
+                listings[directory] = names
+
+    for clip, media_reference, (directory, names) in files:
+        listing = listings[directory]
+        if isinstance(names, str):
+            if names not in listing:
+                missing[clip] = None
+        else:
+            frames = _missing_frames(media_reference, names, listing)
+            if frames:
+                missing[clip] = frames
+    return missing
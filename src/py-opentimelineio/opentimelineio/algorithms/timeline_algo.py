@@ -3,10 +3,8 @@
 
 """Algorithms for timeline objects."""
 
-import copy
-
-from . import (
-    track_algo
+from .. import (
+    _otio,
 )
 
 
@@ -22,24 +20,51 @@ def timeline_trimmed_to_range(in_timeline, trim_range):
     just setting the :py:class:`.Track`\'s source_range but sometimes you want to
     really cut away the stuff outside and that's what this function is meant for.
 
+    The trim_range is in the space of the timeline's tracks stack and is mapped
+    into the space of each track, so a track with a source_range is trimmed
+    relative to its start.  Such tracks are returned with their children
+    trimmed to the source_range, and with a source_range that keeps the
+    children at the same time in the stack.
+    Only the items that intersect the trim_range are copied.
+
     :param Timeline in_timeline: Timeline to trim
     :param TimeRange trim_range:
     :returns: New trimmed timeline
     :rtype: Timeline
     """
-    new_timeline = copy.deepcopy(in_timeline)
-
-    for track_num, child_track in enumerate(in_timeline.tracks):
-        # @TODO: put the trim_range into the space of the tracks
-        # new_range = new_timeline.tracks.transformed_time_range(
-        #     trim_range,
-        #     child_track
-        # )
-
-        # trim the track and assign it to the new stack.
-        new_timeline.tracks[track_num] = track_algo.track_trimmed_to_range(
-            child_track,
-            trim_range
-        )
-
-    return new_timeline
+    return _otio.timeline_trimmed_to_range(in_timeline, trim_range)
+
+
+def timeline_statistics(in_timeline):
+    """
+    Returns statistics about a timeline, or any other OTIO object, and the
+    objects in it, all computed in a single traversal.
+
+    The objects counted are the object itself, and the children, markers,
+    effects and active media references of the objects in it, including the
+    tracks of timelines and the children of serializable collections.  When
+    the object is a stack, it is used as the timeline's stack.
+
+    The statistics are a dictionary with:
+
+    - ``schema_counts``: the number of objects of each schema, by schema name
+    - ``track_count``: the number of tracks in the timeline's stack
+    - ``clip_count``: the number of clips
+    - ``deepest_nesting``: the depth of the deepest object, counting each
+      composition and timeline above it
+    - ``range``: the trimmed range of the timeline's stack, or None
+    - ``track_kinds``: the number of tracks of each kind, including nested
+      tracks
+    - ``track_kind_durations``: the duration of the longest track of each kind
+      in the timeline's stack
+    - ``clip_rates``: the number of clips whose trimmed range has each rate
+    - ``metadata_keys``: the number of objects that have each metadata key
+    - ``clip_metadata_keys``: the number of clips that have each metadata key
+    - ``media_reference_kinds``: the number of clips using each schema of
+      media reference
+
+    :param in_timeline: Timeline, or other object, to compute statistics for
+    :returns: Statistics about the object
+    :rtype: dict
+    """
+    return _otio.timeline_statistics(in_timeline)
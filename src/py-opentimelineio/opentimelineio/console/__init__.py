@@ -17,5 +17,6 @@ from . import (
     console_utils,
     autogen_serialized_datamodel,
     otiopluginfo,
+    otioservice,
 )
 
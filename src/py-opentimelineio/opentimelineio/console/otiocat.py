@@ -66,6 +66,20 @@ def _parsed_args():
         'key=value. Values are strings, numbers or Python literals: True, '
         'False, etc. Can be used multiple times: -M burrito="bar" -M taco=12.'
     )
+    parser.add_argument(
+        '-p',
+        '--path',
+        type=str,
+        default=None,
+        help=(
+            'Print only the object at this path instead of the whole file.'
+            '  The path is a comma separated list of child indices from the'
+            ' tracks of a timeline, for example 0 for the first track or 0,2'
+            ' for its third child.  If there is an up to date .otio.idx index'
+            ' next to the file, only that object is read, unless there are'
+            ' adapter arguments or hook scripts, which need the whole file.'
+        )
+    )
 
     return parser.parse_args()
 
@@ -93,6 +107,85 @@ def _otio_compatible_file_to_json_string(
     )
 
 
+def _link_media(result, media_linker_name, media_linker_argument_map):
+    """Link the media of the clips in result as reading the file does."""
+
+    if not otio.media_linker.from_name(media_linker_name):
+        return
+
+    if isinstance(result, otio.schema.Clip):
+        clips = [result]
+    else:
+        clips = result.find_clips()
+    for clip in clips:
+        media_reference = otio.media_linker.linked_media_reference(
+            clip,
+            media_linker_name,
+            media_linker_argument_map
+        )
+        if media_reference is not None:
+            clip.media_reference = media_reference
+
+
+def _can_read_from_index(adapter_argument_map):
+    """Return whether reading only an object from the index gives the same
+    result as reading the whole file, which it does not if there are adapter
+    arguments or hook scripts that would see the whole file.
+    """
+
+    return not adapter_argument_map and not any(
+        otio.hooks.scripts_attached_to(hook)
+        for hook in ("post_adapter_read", "post_media_linker")
+    )
+
+
+def _otio_object_at_path_to_json_string(
+        fpath,
+        path,
+        media_linker_name,
+        hooks_args,
+        media_linker_argument_map,
+        adapter_argument_map
+):
+    """Return the json of the object at path in the file at fpath, reading
+    only that object if the file has an index and nothing else needs the
+    whole file.
+
+    Raises ValueError if there is no object at path.
+    """
+
+    adapter = otio.adapters.from_name("otio_json")
+    index = None
+    if _can_read_from_index(adapter_argument_map):
+        index = otio.adapters.otio_json.read_index(fpath)
+    if index is not None:
+        try:
+            result = otio.adapters.otio_json.read_indexed_object(
+                fpath,
+                path,
+                index
+            )
+        except IndexError:
+            raise ValueError(f"{fpath} has no object at path {path}")
+        _link_media(result, media_linker_name, media_linker_argument_map)
+        return adapter.write_to_string(result)
+
+    result = otio.adapters.read_from_file(
+        fpath,
+        hook_function_argument_map=hooks_args,
+        media_linker_name=media_linker_name,
+        media_linker_argument_map=media_linker_argument_map,
+        **adapter_argument_map
+    )
+    if isinstance(result, otio.schema.Timeline):
+        result = result.tracks
+    for i in path:
+        if not isinstance(result, otio.core.Composition) or i >= len(result):
+            raise ValueError(f"{fpath} has no object at path {path}")
+        result = result[i]
+    return adapter.write_to_string(result)
+
+
 def main():
     """Parse arguments and call _otio_compatible_file_to_json_string."""
 
@@ -119,7 +212,33 @@ def main():
         sys.stderr.write("\n" + str(exc) + "\n")
         sys.exit(1)
 
+    path = None
+    if args.path is not None:
+        try:
+            path = [int(i) for i in args.path.split(",")]
+            if any(i < 0 for i in path):
+                raise ValueError(args.path)
+        except ValueError:
+            sys.stderr.write(f"\nInvalid path: {args.path}\n")
+            sys.exit(1)
+
     for fpath in args.filepath:
+        if path is not None:
+            try:
+                text = _otio_object_at_path_to_json_string(
+                    fpath,
+                    path,
+                    media_linker_name,
+                    hooks_args,
+                    media_linker_argument_map,
+                    read_adapter_arg_map
+                )
+            except ValueError as exc:
+                sys.stderr.write("\n" + str(exc) + "\n")
+                sys.exit(1)
+            print(text)
+            continue
+
         print(
             _otio_compatible_file_to_json_string(
                 fpath,
@@ -4,8 +4,12 @@
 # Copyright Contributors to the OpenTimelineIO project
 
 import argparse
-import sys
 import copy
+import glob
+import os
+import sys
+import time
+from concurrent import futures
 
 import opentimelineio as otio
 
@@ -151,6 +155,51 @@ def _parsed_args():
         ),
     )
 
+    batch_args = parser.add_argument_group(
+        title="Batch Arguments",
+        description=(
+            "Arguments that convert many files, in place of -i/--input.  "
+            "-o/--output is then a pattern for the output paths, where "
+            "{dir} is the directory of each input file, relative to "
+            "--input-dir if it is given, {stem} is its name without the "
+            "extension and {ext} its extension, eg: -o 'out/{dir}/{stem}.otio'."
+            "  The files are converted on --jobs processes, each reporting "
+            "when it is done, and the conversion continues past files that "
+            "fail."
+        )
+    )
+    batch_args.add_argument(
+        '--input-glob',
+        type=str,
+        default=None,
+        help=(
+            "Convert the files matching this pattern, where '**' matches any "
+            "number of directories, eg: --input-glob 'edits/**/*.edl'."
+        ),
+    )
+    batch_args.add_argument(
+        '--input-list',
+        type=str,
+        default=None,
+        help="Convert the files listed in this file, one path per line.",
+    )
+    batch_args.add_argument(
+        '--input-dir',
+        type=str,
+        default=None,
+        help=(
+            "Convert the files in this directory and its subdirectories "
+            "that an adapter can read."
+        ),
+    )
+    batch_args.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes converting files in parallel.",
+    )
+
     result = parser.parse_args()
 
     # print version information to the shell
@@ -164,8 +213,23 @@ def _parsed_args():
                 print(f"   {plugin.dist.name} {plugin.dist.version}")
         parser.exit()
 
-    if not result.input:
+    batch_inputs = [
+        option for option, value in (
+            ("--input-glob", result.input_glob),
+            ("--input-list", result.input_list),
+            ("--input-dir", result.input_dir),
+        )
+        if value is not None
+    ]
+    if len(batch_inputs) > 1:
+        parser.error(f"{batch_inputs[0]} and {batch_inputs[1]} are exclusive.")
+    if batch_inputs and result.input:
+        parser.error(f"-i/--input and {batch_inputs[0]} are exclusive.")
+    if not batch_inputs and not result.input:
         parser.error("-i/--input is a required argument")
+    result.batch = bool(batch_inputs)
+    if result.jobs < 1:
+        parser.error("--jobs needs to be at least 1.")
     if not result.output:
         parser.error("-o/--output is a required argument")
 
@@ -201,23 +265,63 @@ def _parsed_args():
     return result
 
 
-def main():
-    """Parse arguments and convert the files."""
-
-    args = _parsed_args()
+def _convert(input_path, output_path, options, print_tracks=False):
+    """Convert one file, with the options built by _conversion_options."""
 
-    in_adapter = args.input_adapter
+    in_adapter = options["input_adapter"]
     if in_adapter is None:
-        in_adapter = otio.adapters.from_filepath(args.input).name
+        in_adapter = otio.adapters.from_filepath(input_path).name
 
-    out_adapter = args.output_adapter
+    out_adapter = options["output_adapter"]
     if out_adapter is None:
-        out_adapter = otio.adapters.from_filepath(args.output).name
+        out_adapter = otio.adapters.from_filepath(output_path).name
 
-    media_linker_name = otio.console.console_utils.media_linker_name(
-        args.media_linker
+    result_tl = otio.adapters.read_from_file(
+        input_path,
+        in_adapter,
+        hook_function_argument_map=options["hooks_args"],
+        media_linker_name=options["media_linker_name"],
+        media_linker_argument_map=options["ml_args"],
+        **options["read_adapter_arg_map"]
     )
 
+    if options["tracks"]:
+        result_tracks = copy.deepcopy(otio.schema.Stack())
+        del result_tracks[:]
+        for track in options["tracks"].split(","):
+            tr = result_tl.tracks[int(track)]
+            del result_tl.tracks[int(track)]
+            if print_tracks:
+                print(f"track {track} is of kind: '{tr.kind}'")
+            result_tracks.append(tr)
+        result_tl.tracks = result_tracks
+
+    # handle trim arguments, which are kept as (value, rate) pairs so the
+    # options can be sent to the batch processes
+    if options["trim"] is not None:
+        begin, end = (
+            otio.opentime.RationalTime(value, rate)
+            for value, rate in options["trim"]
+        )
+        result_tl = otio.algorithms.timeline_trimmed_to_range(
+            result_tl,
+            otio.opentime.range_from_start_end_time(begin, end)
+        )
+
+    otio.adapters.write_to_file(
+        result_tl,
+        output_path,
+        out_adapter,
+        hook_function_argument_map=options["hooks_args"],
+        **options["write_adapter_arg_map"]
+    )
+
+
+def _conversion_options(args):
+    """Return the options for _convert from the parsed arguments, exiting
+    with an error if they are malformed.
+    """
+
     try:
         read_adapter_arg_map = otio.console.console_utils.arg_list_to_map(
             args.adapter_arg,
@@ -231,52 +335,187 @@ def main():
             args.media_linker_arg,
             "media linker"
         )
+        write_adapter_arg_map = otio.console.console_utils.arg_list_to_map(
+            args.output_adapter_arg,
+            "output adapter"
+        )
     except ValueError as exc:
         sys.stderr.write("\n" + str(exc) + "\n")
         sys.exit(1)
 
-    result_tl = otio.adapters.read_from_file(
-        args.input,
-        in_adapter,
-        hook_function_argument_map=hooks_args,
-        media_linker_name=media_linker_name,
-        media_linker_argument_map=ml_args,
-        **read_adapter_arg_map
-    )
+    trim = None
+    if args.begin is not None and args.end is not None:
+        trim = (
+            (args.begin.value, args.begin.rate),
+            (args.end.value, args.end.rate),
+        )
 
-    if args.tracks:
-        result_tracks = copy.deepcopy(otio.schema.Stack())
-        del result_tracks[:]
-        for track in args.tracks.split(","):
-            tr = result_tl.tracks[int(track)]
-            del result_tl.tracks[int(track)]
-            print(f"track {track} is of kind: '{tr.kind}'")
-            result_tracks.append(tr)
-        result_tl.tracks = result_tracks
+    return {
+        "input_adapter": args.input_adapter,
+        "output_adapter": args.output_adapter,
+        "media_linker_name": otio.console.console_utils.media_linker_name(
+            args.media_linker
+        ),
+        "read_adapter_arg_map": read_adapter_arg_map,
+        "hooks_args": hooks_args,
+        "ml_args": ml_args,
+        "write_adapter_arg_map": write_adapter_arg_map,
+        "tracks": args.tracks,
+        "trim": trim,
+    }
 
-    # handle trim arguments
-    if args.begin is not None and args.end is not None:
-        result_tl = otio.algorithms.timeline_trimmed_to_range(
-            result_tl,
-            otio.opentime.range_from_start_end_time(args.begin, args.end)
+
+def _batch_inputs(args):
+    """Return (input path, {dir} of its output path) for each file to convert
+    in batch mode.
+    """
+
+    if args.input_glob is not None:
+        paths = sorted(
+            path for path in glob.glob(args.input_glob, recursive=True)
+            if os.path.isfile(path)
         )
+        return [(path, os.path.dirname(path)) for path in paths]
+
+    if args.input_list is not None:
+        with open(args.input_list) as fi:
+            paths = [line.strip() for line in fi]
+        return [(path, os.path.dirname(path)) for path in paths if path]
+
+    suffixes = otio.adapters.suffixes_with_defined_adapters(read=True)
+    inputs = []
+    for dirpath, dirnames, filenames in os.walk(args.input_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            suffix = os.path.splitext(filename)[1][1:].lower()
+            if suffix in suffixes:
+                inputs.append((
+                    os.path.join(dirpath, filename),
+                    os.path.relpath(dirpath, args.input_dir),
+                ))
+    return inputs
+
+
+def _batch_output_path(pattern, input_path, directory):
+    stem, ext = os.path.splitext(os.path.basename(input_path))
+    return os.path.normpath(
+        pattern.format(dir=directory or ".", stem=stem, ext=ext[1:])
+    )
+
+
+# The options of the batch this worker process converts files for.
+_BATCH_OPTIONS = None
+
+
+def _init_batch_worker(options):
+    global _BATCH_OPTIONS
+    _BATCH_OPTIONS = options
+
+    # load the manifest and the adapters given on the command line once for
+    # all the files the process converts
+    otio.plugins.ActiveManifest()
+    for name in (options["input_adapter"], options["output_adapter"]):
+        if name is not None:
+            otio.adapters.from_name(name).module()
+
+
+def _convert_batch_file(input_path, output_path):
+    """Convert one file of a batch, and return the error message if it
+    failed, or None.
+    """
 
     try:
-        write_adapter_arg_map = otio.console.console_utils.arg_list_to_map(
-            args.output_adapter_arg,
-            "output adapter"
-        )
-    except ValueError as exc:
-        sys.stderr.write("\n" + str(exc) + "\n")
-        sys.exit(1)
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        _convert(input_path, output_path, _BATCH_OPTIONS)
+    except Exception as err:
+        return f"{type(err).__name__}: {err}"
+    return None
 
-    otio.adapters.write_to_file(
-        result_tl,
-        args.output,
-        out_adapter,
-        hook_function_argument_map=hooks_args,
-        **write_adapter_arg_map
+
+def _convert_batch(args, options):
+    """Convert the files of a batch on args.jobs processes, and return
+    whether they were all converted.
+    """
+
+    pairs = []
+    inputs_by_output = {}
+    for input_path, directory in _batch_inputs(args):
+        output_path = _batch_output_path(args.output, input_path, directory)
+        if output_path in inputs_by_output:
+            sys.stderr.write(
+                "ERROR: {} and {} would both be converted to {}\n".format(
+                    inputs_by_output[output_path], input_path, output_path
+                )
+            )
+            sys.exit(1)
+        inputs_by_output[output_path] = input_path
+        pairs.append((input_path, output_path))
+
+    begin = time.perf_counter()
+    failures = 0
+
+    def report(input_path, output_path, error):
+        nonlocal failures
+        if error is None:
+            print(f"{input_path} -> {output_path}", flush=True)
+        else:
+            failures += 1
+            sys.stderr.write(f"FAILED {input_path}: {error}\n")
+            sys.stderr.flush()
+
+    if args.jobs == 1 or len(pairs) < 2:
+        _init_batch_worker(options)
+        for input_path, output_path in pairs:
+            report(
+                input_path,
+                output_path,
+                _convert_batch_file(input_path, output_path)
+            )
+    else:
+        with futures.ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(pairs)),
+            initializer=_init_batch_worker,
+            initargs=(options,),
+        ) as executor:
+            pending = {
+                executor.submit(_convert_batch_file, *pair): pair
+                for pair in pairs
+            }
+            for future in futures.as_completed(pending):
+                try:
+                    error = future.result()
+                except Exception as err:
+                    # the worker died, ie: a BrokenProcessPool fails every
+                    # file still pending, which still counts as failures
+                    error = f"{type(err).__name__}: {err}"
+                report(*pending[future], error)
+
+    elapsed = time.perf_counter() - begin
+    print(
+        "converted {} of {} files in {:.2f} s ({:.1f} files/s)".format(
+            len(pairs) - failures,
+            len(pairs),
+            elapsed,
+            len(pairs) / elapsed if elapsed > 0 else 0.0,
+        )
     )
+    return failures == 0
+
+
+def main():
+    """Parse arguments and convert the files."""
+
+    args = _parsed_args()
+    options = _conversion_options(args)
+
+    if args.batch:
+        if not _convert_batch(args, options):
+            sys.exit(1)
+        return
+
+    _convert(args.input, args.output, options, print_tracks=True)
 
 
 if __name__ == '__main__':
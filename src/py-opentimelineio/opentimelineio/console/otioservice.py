@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Run a local service that caches parsed OTIO files and answers queries about
+them over a Unix domain socket.  See opentimelineio.service for the protocol.
+"""
+
+import argparse
+import sys
+
+import opentimelineio as otio
+
+
+def _parsed_args():
+    """ parse commandline arguments with argparse """
+
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        '-s',
+        '--socket',
+        type=str,
+        default=otio.service.default_socket_path(),
+        help='Path of the Unix domain socket to listen on.  Defaults to '
+        '$OTIO_SERVICE_SOCKET if set.'
+    )
+    parser.add_argument(
+        '--max-memory',
+        type=int,
+        default=otio.service.DEFAULT_MAX_BYTES // (1024 * 1024),
+        help='Upper bound of the timeline cache in megabytes, measured as the '
+        'size on disk of the cached files.'
+    )
+    parser.add_argument(
+        '-m',
+        '--media-linker',
+        type=str,
+        default="Default",
+        help=(
+            "Specify a media linker.  'Default' means use the "
+            "$OTIO_DEFAULT_MEDIA_LINKER if set, 'None' or '' means explicitly "
+            "disable the linker, and anything else is interpreted as the name"
+            " of the media linker to use."
+        )
+    )
+    parser.add_argument(
+        '-M',
+        '--media-linker-arg',
+        type=str,
+        default=[],
+        action='append',
+        help='Extra arguments to be passed to the media linker in the form of '
+        'key=value. Values are strings, numbers or Python literals: True, '
+        'False, etc. Can be used multiple times: -M burrito="bar" -M taco=12.'
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Parse arguments and run the service until interrupted."""
+
+    args = _parsed_args()
+
+    media_linker_name = otio.console.console_utils.media_linker_name(
+        args.media_linker
+    )
+
+    try:
+        media_linker_argument_map = otio.console.console_utils.arg_list_to_map(
+            args.media_linker_arg,
+            "media linker"
+        )
+    except ValueError as exc:
+        sys.stderr.write("\n" + str(exc) + "\n")
+        sys.exit(1)
+
+    try:
+        otio.service.serve(
+            args.socket,
+            max_bytes=args.max_memory * 1024 * 1024,
+            media_linker_name=media_linker_name,
+            media_linker_argument_map=media_linker_argument_map,
+        )
+    except otio.exceptions.OTIOError as exc:
+        sys.stderr.write("ERROR: " + str(exc) + "\n")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,15 @@ def _parsed_args():
         nargs='+',
         help='files to operate on'
     )
+    parser.add_argument(
+        '--from-index',
+        action='store_true',
+        help=(
+            'If there is an up to date .otio.idx index next to a file, print'
+            ' only the statistics the index holds instead of parsing the file'
+            ' and running all the checks.'
+        )
+    )
 
     return parser.parse_args()
 
@@ -31,33 +40,52 @@ def _parsed_args():
 TESTS = []
 
 
-def stat_check(name):
+def stat_check(name, from_index=None):
+    """Register a check, which is called with the object read from the file
+    and its statistics (see otio.algorithms.timeline_statistics()).
+    from_index, if given, computes the same statistic from the index of a
+    file (see otio_json.read_index()), so that the file does not need to be
+    read.
+    """
     def real_stat_check(fn):
-        TESTS.append((name, fn))
+        TESTS.append((name, fn, from_index))
         return fn
     return real_stat_check
 
 
+def _index_duration(index):
+    duration = index["duration"]
+    if duration is None:
+        raise AttributeError("no duration")
+    return otio.opentime.RationalTime(duration["value"], duration["rate"])
+
+
+def _na_without_tracks(fn):
+    def wrapped(index):
+        try:
+            return fn(_index_duration(index))
+        except AttributeError:
+            return "n/a"
+    return wrapped
+
+
 @stat_check("parsed")
-def _did_parse(input):
+def _did_parse(input, statistics):
     return input and True or False
 
 
-@stat_check("top level object")
-def _top_level_object(input):
+@stat_check("top level object", from_index=lambda index: index["schema"])
+def _top_level_object(input, statistics):
     return f"{input.schema_name()}.{input.schema_version()}"
 
 
-@stat_check("number of tracks")
-def _num_tracks(input):
-    try:
-        return len(input.tracks)
-    except AttributeError:
-        return 0
+@stat_check("number of tracks", from_index=lambda index: index["track_count"])
+def _num_tracks(input, statistics):
+    return statistics["track_count"]
 
 
 @stat_check("Tracks are the same length")
-def _equal_length_tracks(tl):
+def _equal_length_tracks(tl, statistics):
     if not tl.tracks:
         return True
     for i, track in enumerate(tl.tracks):
@@ -74,70 +102,86 @@ def _equal_length_tracks(tl):
 
 
 @stat_check("deepest nesting")
-def _deepest_nesting(input):
-    def depth(parent):
-        if not isinstance(parent, otio.core.Composition):
-            return 1
-        d = 0
-        for child in parent:
-            d = max(d, depth(child) + 1)
-        return d
-    if isinstance(input, otio.schema.Timeline):
-        return depth(input.tracks) + 1
-    else:
-        return depth(input)
-
-
-@stat_check("number of clips")
-def _num_clips(input):
-    return len(list(input.find_clips()))
-
-
-@stat_check("total duration")
-def _total_duration(input):
+def _deepest_nesting(input, statistics):
+    return statistics["deepest_nesting"]
+
+
+@stat_check("number of clips", from_index=lambda index: index["clip_count"])
+def _num_clips(input, statistics):
+    return statistics["clip_count"]
+
+
+def _duration(statistics):
+    if statistics["range"] is None:
+        raise AttributeError("no duration")
+    return statistics["range"].duration
+
+
+@stat_check("total duration", from_index=_na_without_tracks(lambda d: d))
+def _total_duration(input, statistics):
     try:
-        return input.tracks.duration()
+        return _duration(statistics)
     except AttributeError:
         return "n/a"
 
 
-@stat_check("total duration in timecode")
-def _total_duration_timecode(input):
+@stat_check(
+    "total duration in timecode",
+    from_index=_na_without_tracks(
+        lambda d: otio.opentime.to_timecode(d, d.rate)
+    )
+)
+def _total_duration_timecode(input, statistics):
     try:
-        d = input.tracks.duration()
+        d = _duration(statistics)
         return otio.opentime.to_timecode(d, d.rate)
     except AttributeError:
         return "n/a"
 
 
-@stat_check("top level rate")
-def _top_level_rate(input):
+@stat_check("top level rate", from_index=_na_without_tracks(lambda d: d.rate))
+def _top_level_rate(input, statistics):
     try:
-        return input.tracks.duration().rate
+        return _duration(statistics).rate
     except AttributeError:
         return "n/a"
 
 
 @stat_check("clips with cdl data")
-def _clips_with_cdl_data(input):
-    return len(list(c for c in input.find_clips() if 'cdl' in c.metadata))
+def _clips_with_cdl_data(input, statistics):
+    return statistics["clip_metadata_keys"].get("cdl", 0)
 
 
 @stat_check("Tracks with non standard types")
-def _sequences_with_non_standard_types(input):
-    return len(
-        list(
-            c
-            for c in input.find_children(descended_from_type=otio.schema.Track)
-            if c.kind not in (otio.schema.TrackKind.__dict__)
-        )
+def _sequences_with_non_standard_types(input, statistics):
+    return sum(
+        count
+        for kind, count in statistics["track_kinds"].items()
+        if kind not in (otio.schema.TrackKind.__dict__)
     )
 
 
+@stat_check("objects by schema")
+def _schema_counts(input, statistics):
+    return statistics["schema_counts"]
+
+
+@stat_check("clips by rate")
+def _clip_rates(input, statistics):
+    return statistics["clip_rates"]
+
+
+@stat_check("media reference kinds")
+def _media_reference_kinds(input, statistics):
+    return statistics["media_reference_kinds"]
+
+
 def _stat_otio(input_otio):
-    for (test, testfunc) in TESTS:
+    # all the statistics are computed in a single pass over the objects
+    statistics = otio.algorithms.timeline_statistics(input_otio)
+    for (test, testfunc, _) in TESTS:
         try:
-            print(f"{test}: {testfunc(input_otio)}")
+            print(f"{test}: {testfunc(input_otio, statistics)}")
         except (otio.exceptions.OTIOError) as e:
             sys.stderr.write(
                 "There was an OTIO Error: "
@@ -149,11 +193,24 @@ def _stat_otio(input_otio):
             continue
 
 
+def _stat_index(index):
+    for (test, _, from_index) in TESTS:
+        if from_index is not None:
+            print(f"{test}: {from_index(index)}")
+
+
 def main():
     """  main entry point  """
     args = _parsed_args()
 
     for fp in args.filepath:
+        index = None
+        if args.from_index:
+            index = otio.adapters.otio_json.read_index(fp)
+        if index is not None:
+            _stat_index(index)
+            continue
+
         try:
             parsed_otio = otio.adapters.read_from_file(fp)
         except (otio.exceptions.OTIOError) as e:
@@ -12,6 +12,8 @@ as concise examples of how OTIO can be used to perform common
 workflow tasks."""
 
 import argparse
+import contextlib
+import io
 import os
 import pathlib
 import re
@@ -19,6 +21,7 @@ import sys
 
 from urllib.request import urlopen
 
+from concurrent import futures
 from copy import deepcopy
 
 import opentimelineio as otio
@@ -47,111 +50,27 @@ def main():
     # Often there will be just one, but this tool in general enough
     # to operate on several. This is essential when the --stack or
     # --concatenate arguments are used.
-    if args.input:
+    #
+    # Phases 2 to 7 are the steps returned by timeline_steps(). With --jobs,
+    # each input is read and run through the steps that work on one timeline
+    # at a time in a worker process, up to the first step that needs all the
+    # timelines, and the remaining steps run here.
+    steps = timeline_steps(args)
+    if args.input and args.jobs > 1 and len(args.input) > 1:
+        separate_steps = 0
+        while separate_steps < len(steps) and not steps[separate_steps][0]:
+            separate_steps += 1
+        timelines = read_and_process_inputs(
+            args.input, args, separate_steps, args.jobs
+        )
+        steps = steps[separate_steps:]
+    elif args.input:
         timelines = read_inputs(args.input)
     else:
         timelines = []
 
-    # Phase 2: Filter (remove stuff)...
-
-    if args.video_only:
-        for timeline in timelines:
-            keep_only_video_tracks(timeline)
-
-    if args.audio_only:
-        for timeline in timelines:
-            keep_only_audio_tracks(timeline)
-
-    if args.remove_transitions:
-        timelines = filter_transitions(timelines)
-
-    if args.remove_effects:
-        timelines = filter_effects(timelines)
-
-    if args.only_tracks_with_name or args.only_tracks_with_index:
-        timelines = filter_tracks(
-            args.only_tracks_with_name,
-            args.only_tracks_with_index,
-            timelines
-        )
-
-    if args.only_clips_with_name or args.only_clips_with_name_regex:
-        timelines = filter_clips(
-            args.only_clips_with_name,
-            args.only_clips_with_name_regex,
-            timelines
-        )
-
-    if args.trim:
-        for timeline in timelines:
-            trim_timeline(args.trim[0], args.trim[1], timeline)
-
-    # Phase 3: Combine timelines
-
-    if args.stack:
-        timelines = [stack_timelines(timelines)]
-
-    if args.concat:
-        timelines = [concatenate_timelines(timelines)]
-
-    # Phase 4: Combine (or add) tracks
-
-    if args.flatten:
-        for timeline in timelines:
-            flatten_timeline(
-                timeline,
-                which_tracks=args.flatten,
-                keep=args.keep_flattened_tracks
-            )
-
-    # Phase 5: Relinking media
-
-    if args.relink_by_name:
-        for timeline in timelines:
-            for folder in args.relink_by_name:
-                relink_by_name(timeline, folder)
-
-    if args.copy_media_to_folder:
-        for timeline in timelines:
-            copy_media_to_folder(timeline, args.copy_media_to_folder)
-
-    # Phase 6: Remove/Redaction
-
-    if args.remove_metadata_key:
-        for timeline in timelines:
-            for key in args.remove_metadata_key:
-                remove_metadata_key(timeline, key)
-
-    if args.redact:
-        for timeline in timelines:
-            redact_timeline(timeline)
-
-    # Phase 7: Inspection
-
-    if args.stats:
-        for timeline in timelines:
-            print_timeline_stats(timeline)
-
-    if args.inspect:
-        for timeline in timelines:
-            inspect_timelines(args.inspect, timeline)
-
-    should_summarize = (args.list_clips or
-                        args.list_media or
-                        args.verify_media or
-                        args.list_tracks or
-                        args.list_markers or
-                        args.verify_ranges)
-    if should_summarize:
-        for timeline in timelines:
-            summarize_timeline(
-                args.list_tracks,
-                args.list_clips,
-                args.list_media,
-                args.verify_media,
-                args.list_markers,
-                args.verify_ranges,
-                timeline)
+    for _, step in steps:
+        timelines = step(timelines)
 
     # Final Phase: Output
 
@@ -252,6 +171,19 @@ otiotool -i playlist.otio --only-audio --list-tracks --inspect "Interview"
         are supported. Use '-' to read OTIO from standard input."""
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar='N',
+        help="""Read and process multiple input files on N processes.  The
+        steps that combine the timelines, --stack, --concat,
+        --copy-media-to-folder and --redact, and the ones after them, still
+        run on all of the timelines in one process.  The output is the same,
+        and in the same order, as with one process."""
+    )
+
     # Filter...
     track_type_group = parser.add_mutually_exclusive_group()
     track_type_group.add_argument(
@@ -464,6 +396,9 @@ otiotool -i playlist.otio --only-audio --list-tracks --inspect "Interview"
     if not any([args.input, args.list_versions]):
         parser.error("Must specify at least one of --input or --list-versions.")
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
     # Check some options combination.
     if args.keep_flattened_tracks and not args.flatten:
         parser.error("Cannot use --keep-flattened-tracks without also using --flatten.")
@@ -486,6 +421,200 @@ def read_inputs(input_paths):
     return timelines
 
 
+def timeline_steps(args):
+    """Return the steps that main() runs on the list of timelines after
+    reading them, for the given command line arguments, in order.
+
+    Each step is a (combines, function) pair, where the function takes the
+    list of timelines and returns the resulting list, and combines is True if
+    the step needs all of the timelines at once, or gives a different result
+    when they are processed separately, rather than working on each timeline
+    on its own.
+    """
+
+    def each(function):
+        def step(timelines):
+            for timeline in timelines:
+                function(timeline)
+            return timelines
+        return step
+
+    steps = []
+
+    # Phase 2: Filter (remove stuff)...
+
+    if args.video_only:
+        steps.append((False, each(keep_only_video_tracks)))
+
+    if args.audio_only:
+        steps.append((False, each(keep_only_audio_tracks)))
+
+    if args.remove_transitions:
+        steps.append((False, filter_transitions))
+
+    if args.remove_effects:
+        steps.append((False, filter_effects))
+
+    if args.only_tracks_with_name or args.only_tracks_with_index:
+        steps.append((False, lambda timelines: filter_tracks(
+            args.only_tracks_with_name,
+            args.only_tracks_with_index,
+            timelines
+        )))
+
+    if args.only_clips_with_name or args.only_clips_with_name_regex:
+        steps.append((False, lambda timelines: filter_clips(
+            args.only_clips_with_name,
+            args.only_clips_with_name_regex,
+            timelines
+        )))
+
+    if args.trim:
+        steps.append((False, each(
+            lambda timeline: trim_timeline(args.trim[0], args.trim[1], timeline)
+        )))
+
+    # Phase 3: Combine timelines
+
+    if args.stack:
+        steps.append((True, lambda timelines: [stack_timelines(timelines)]))
+
+    if args.concat:
+        steps.append(
+            (True, lambda timelines: [concatenate_timelines(timelines)])
+        )
+
+    # Phase 4: Combine (or add) tracks
+
+    if args.flatten:
+        steps.append((False, each(lambda timeline: flatten_timeline(
+            timeline,
+            which_tracks=args.flatten,
+            keep=args.keep_flattened_tracks
+        ))))
+
+    # Phase 5: Relinking media
+
+    if args.relink_by_name:
+        def relink(timeline):
+            for folder in args.relink_by_name:
+                relink_by_name(timeline, folder)
+        steps.append((False, each(relink)))
+
+    if args.copy_media_to_folder:
+        # the timelines share the folder, and media copied for one of them is
+        # reused by the next ones
+        steps.append((True, each(
+            lambda timeline: copy_media_to_folder(
+                timeline, args.copy_media_to_folder
+            )
+        )))
+
+    # Phase 6: Remove/Redaction
+
+    if args.remove_metadata_key:
+        def remove_keys(timeline):
+            for key in args.remove_metadata_key:
+                remove_metadata_key(timeline, key)
+        steps.append((False, each(remove_keys)))
+
+    if args.redact:
+        # the redacted names are numbered across all of the timelines
+        steps.append((True, each(redact_timeline)))
+
+    # Phase 7: Inspection
+
+    if args.stats:
+        steps.append((False, each(print_timeline_stats)))
+
+    if args.inspect:
+        steps.append((False, each(
+            lambda timeline: inspect_timelines(args.inspect, timeline)
+        )))
+
+    should_summarize = (args.list_clips or
+                        args.list_media or
+                        args.verify_media or
+                        args.list_tracks or
+                        args.list_markers or
+                        args.verify_ranges)
+    if should_summarize:
+        steps.append((False, each(lambda timeline: summarize_timeline(
+            args.list_tracks,
+            args.list_clips,
+            args.list_media,
+            args.verify_media,
+            args.list_markers,
+            args.verify_ranges,
+            timeline
+        ))))
+
+    return steps
+
+
+def _process_input(args, step_count, input_path, text):
+    """Read one input and run it through the first step_count steps of
+    timeline_steps(args), in a worker process of read_and_process_inputs().
+
+    Returns the resulting timelines, serialized, and what each step printed.
+    """
+    if text is None:
+        timelines = [otio.adapters.read_from_file(input_path)]
+    else:
+        timelines = [otio.adapters.read_from_string(text, 'otio_json')]
+
+    printed = []
+    for _, step in timeline_steps(args)[:step_count]:
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            timelines = step(timelines)
+        printed.append(stdout.getvalue())
+
+    return (
+        [
+            otio.core.serialize_json_to_string(timeline, indent=-1)
+            for timeline in timelines
+        ],
+        printed,
+    )
+
+
+def read_and_process_inputs(input_paths, args, step_count, jobs):
+    """Read the timelines from the list of file paths given and run each of
+    them through the first step_count steps of timeline_steps(args), on up to
+    jobs processes.
+
+    The timelines are returned, and what the steps print is printed, in the
+    same order as if they were read with read_inputs() and run through the
+    steps here.
+    """
+    # standard input can only be read here
+    texts = [
+        sys.stdin.read() if input_path == '-' else None
+        for input_path in input_paths
+    ]
+
+    with futures.ProcessPoolExecutor(
+        max_workers=min(jobs, len(input_paths))
+    ) as executor:
+        results = list(executor.map(
+            _process_input,
+            [args] * len(input_paths),
+            [step_count] * len(input_paths),
+            input_paths,
+            texts,
+        ))
+
+    for step_index in range(step_count):
+        for _, printed in results:
+            sys.stdout.write(printed[step_index])
+
+    return [
+        otio.core.deserialize_json_from_string(text)
+        for serialized, _ in results
+        for text in serialized
+    ]
+
+
 def keep_only_video_tracks(timeline):
     """Remove all tracks except for video tracks from a timeline."""
     timeline.tracks[:] = timeline.video_tracks()
@@ -882,6 +1011,12 @@ def summarize_timeline(list_tracks, list_clips, list_media, verify_media,
     """Print a summary of a timeline, optionally listing the tracks, clips, media,
     and/or markers inside it."""
     print("TIMELINE:", timeline.name)
+    missing_media = {}
+    if verify_media:
+        missing_media = otio.algorithms.verify_media(
+            timeline,
+            report_unchecked=True
+        )
     for child in [timeline.tracks] + list(timeline.find_children()):
         if isinstance(child, otio.schema.Track):
             if list_tracks:
@@ -912,16 +1047,31 @@ def summarize_timeline(list_tracks, list_clips, list_media, verify_media,
                 else:
                     print("  CLIP:", child.name)
             if list_media or verify_media:
-                try:
-                    url = child.media_reference.target_url
-                except Exception:
-                    url = None
+                media_reference = child.media_reference
+                if isinstance(media_reference,
+                              otio.schema.ImageSequenceReference):
+                    url = media_reference.target_url_base
+                else:
+                    try:
+                        url = media_reference.target_url
+                    except Exception:
+                        url = None
                 detail = ""
-                if verify_media and url:
-                    if os.path.exists(url):
-                        detail = " EXISTS"
-                    else:
-                        detail = " NOT FOUND"
+                not_checked = (
+                    missing_media.get(child)
+                    is otio.algorithms.media_algo.NOT_CHECKED
+                )
+                if not verify_media or not_checked:
+                    pass
+                elif child not in missing_media:
+                    detail = " EXISTS"
+                elif missing_media[child] is None:
+                    detail = " NOT FOUND"
+                else:
+                    detail = " MISSING FRAMES " + ", ".join(
+                        f"{first}-{last}"
+                        for first, last in missing_media[child]
+                    )
                 print(f"    MEDIA{detail}: {url}")
 
         if list_markers and hasattr(child, 'markers'):
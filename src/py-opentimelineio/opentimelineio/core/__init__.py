@@ -3,6 +3,8 @@
 
 """Core implementation details and wrappers around the C++ library"""
 
+import io
+
 from .. _otio import ( # noqa
     # errors
     CannotComputeAvailableRangeError,
@@ -11,28 +13,42 @@ from .. _otio import ( # noqa
     Color,
     Composable,
     Composition,
+    EditJournal,
+    Float64Array,
+    Int64Array,
     Item,
     MediaReference,
+    ObjectArena,
     SerializableObject,
     SerializableObjectWithMetadata,
     Track,
 
     # functions
     deserialize_json_from_file,
+    deserialize_json_from_stream,
     deserialize_json_from_string,
     flatten_stack,
     install_external_keepalive_monitor,
     instance_from_schema,
+    metadata_table,
     register_serializable_object_type,
     register_upgrade_function,
     register_downgrade_function,
     set_type_record,
+    string_pool_stats,
     _serialize_json_to_string,
     _serialize_json_to_file,
+    _serialize_json_to_file_with_object_ranges,
+    _serialize_json_to_stream,
     type_version_map,
     release_to_schema_version_map,
 )
 
+from . _shared_memory import ( # noqa
+    SharedObjectHandle,
+    attach,
+    share,
+)
 from . _core_utils import ( # noqa
     add_method,
     _value_to_any,
@@ -51,17 +67,27 @@ __all__ = [
     'Color',
     'Composable',
     'Composition',
+    'EditJournal',
+    'Float64Array',
+    'Int64Array',
     'Item',
     'MediaReference',
+    'ObjectArena',
     'SerializableObject',
     'SerializableObjectWithMetadata',
+    'SharedObjectHandle',
     'Track',
+    'attach',
     'deserialize_json_from_file',
+    'deserialize_json_from_stream',
     'deserialize_json_from_string',
     'flatten_stack',
     'install_external_keepalive_monitor',
     'instance_from_schema',
+    'metadata_table',
     'set_type_record',
+    'share',
+    'string_pool_stats',
     'add_method',
     'upgrade_function_for',
     'downgrade_function_from',
@@ -69,6 +95,7 @@ __all__ = [
     'deprecated_field',
     'serialize_json_to_string',
     'serialize_json_to_file',
+    'serialize_json_to_stream',
     'register_type',
     'type_version_map',
     'release_to_schema_version_map',
@@ -103,7 +130,8 @@ def serialize_json_to_file(
         root,
         filename,
         schema_version_targets=None,
-        indent=4
+        indent=4,
+        object_ranges=None
 ):
     """Serialize root to a json file.  Optionally downgrade resulting schemas
     to schema_version_targets.
@@ -117,10 +145,25 @@ def serialize_json_to_file(
                                                   OpenTimelineIO.
     :param int indent: number of spaces for each json indentation level. Use -1
                        for no indentation or newlines.
+    :param list object_ranges: optional list to append a
+                               ``(composable, begin, end)`` tuple to for each
+                               composable written, giving the byte range of
+                               its json object in the file.
 
     :returns: true for success, false for failure
     :rtype: bool
     """
+    if object_ranges is not None:
+        object_ranges.extend(
+            _serialize_json_to_file_with_object_ranges(
+                _value_to_any(root),
+                filename,
+                schema_version_targets or {},
+                indent
+            )
+        )
+        return True
+
     return _serialize_json_to_file(
         _value_to_any(root),
         filename,
@@ -129,6 +172,51 @@ def serialize_json_to_file(
     )
 
 
+def serialize_json_to_stream(
+        root,
+        stream,
+        schema_version_targets=None,
+        indent=4,
+        chunk_size=65536
+):
+    """Serialize root as json written incrementally to a file-like object.
+    Optionally downgrade resulting schemas to schema_version_targets.
+
+    The json is written in chunks as it is encoded, it is never held in
+    memory as a whole, and other python threads can run while it is encoded.
+    The objects must not be changed until this returns.
+
+    :param SerializableObject root: root object to serialize
+    :param stream: object with a ``write`` method, or a socket, to write the
+                   json to.  Text streams (:class:`io.TextIOBase`) are
+                   written str, anything else utf-8 encoded bytes, for
+                   example an open binary file, :class:`io.BytesIO` or a
+                   :class:`gzip.GzipFile`.
+    :param dict[str, int] schema_version_targets: optional dictionary mapping
+                                                  schema name to desired schema
+                                                  version, for downgrading the
+                                                  result to be compatible with
+                                                  older versions of
+                                                  OpenTimelineIO.
+    :param int indent: number of spaces for each json indentation level. Use -1
+                       for no indentation or newlines.
+    :param int chunk_size: largest number of bytes, or of utf-8 encoded
+                           bytes of a str, passed to each ``write`` call
+
+    :returns: true for success, false for failure
+    :rtype: bool
+    """
+    write = getattr(stream, "write", None) or stream.sendall
+    return _serialize_json_to_stream(
+        _value_to_any(root),
+        write,
+        isinstance(stream, io.TextIOBase),
+        schema_version_targets or {},
+        indent,
+        chunk_size
+    )
+
+
 def register_type(classobj, schemaname=None):
     """Decorator for registering a SerializableObject type
 
@@ -4,6 +4,7 @@
 import types
 import collections.abc
 import copy
+import pickle
 
 from .. import (
     _otio,
@@ -12,7 +13,6 @@ from .. _otio import (
     SerializableObject,
     AnyDictionary,
     AnyVector,
-    PyAny
 )
 
 
@@ -27,6 +27,8 @@ SUPPORTED_VALUE_TYPES = (
     "opentime.TimeRange",
     "opentime.TimeTransform",
     "opentimelineio.core.Color",
+    "opentimelineio.core.Float64Array",
+    "opentimelineio.core.Int64Array",
     "opentimelineio.core.SerializableObject"
 )
 
@@ -39,79 +41,10 @@ def _is_nonstring_sequence(v):
     return isinstance(v, collections.abc.Sequence) and not _is_str(v)
 
 
-def _value_to_any(value, ids=None):
-    if isinstance(value, PyAny):
-        return value
-
-    if isinstance(value, SerializableObject):
-        return PyAny(value)
-    if isinstance(value, collections.abc.Mapping):
-        if ids is None:
-            ids = set()
-        d = AnyDictionary()
-        for (k, v) in value.items():
-            if not _is_str(k):
-                raise ValueError(f"key '{k}' is not a string")
-            if id(v) in ids:
-                raise ValueError(
-                    "circular reference converting dictionary to C++ datatype"
-                )
-            ids.add(id(v))
-            d[k] = _value_to_any(v, ids)
-            ids.discard(id(v))
-        return PyAny(d)
-    elif _is_nonstring_sequence(value):
-        if ids is None:
-            ids = set()
-        vec = AnyVector()
-        for v in value:
-            if id(v) in ids:
-                raise ValueError(
-                    "circular reference converting dictionary to C++ datatype"
-                )
-            ids.add(id(v))
-            vec.append(_value_to_any(v, ids))
-            ids.discard(id(v))
-        return PyAny(vec)
-    else:
-        try:
-            return PyAny(value)
-        except TypeError:
-            # raise an OTIO-specific error
-            raise TypeError(
-                "A value of type '{}' is incompatible with OpenTimelineIO. "
-                "OpenTimelineIO only supports the following value types in "
-                "AnyDictionary containers (like the .metadata dictionary): "
-                "{}.".format(
-                    type(value),
-                    SUPPORTED_VALUE_TYPES,
-                )
-            )
-        except RuntimeError:
-            # communicate about integer range first
-            biginttype = int
-            if isinstance(value, biginttype):
-                raise ValueError(
-                    "A value of {} is outside of the range of integers that "
-                    "OpenTimelineIO supports, [{}, {}], which is the range of "
-                    "C++ int64_t.".format(
-                        value,
-                        -9223372036854775808,
-                        9223372036854775807,
-                    )
-                )
-
-            # general catch all for invalid type
-            raise ValueError(
-                "The value '{}' of type '{}' is incompatible with OpenTimelineIO. "
-                "OpenTimelineIO only supports the following value types in "
-                "AnyDictionary containers (like the .metadata dictionary): "
-                "{}.".format(
-                    value,
-                    type(value),
-                    SUPPORTED_VALUE_TYPES,
-                )
-            )
+# Converts python values (recursively for dictionaries and lists) into a
+# PyAny, implemented in C++.  See SUPPORTED_VALUE_TYPES for the types that
+# can be converted.
+_value_to_any = _otio._value_to_any
 
 
 _marker_ = object()
@@ -389,3 +322,21 @@ def __deepcopy__(self, *args, **kwargs):
 @add_method(SerializableObject)
 def __copy__(self, *args, **kwargs):
     raise ValueError("SerializableObjects may not be shallow copied.")
+
+
+def _from_binary(data):
+    """Unpickle an object pickled by SerializableObject.__reduce_ex__."""
+    return _otio._deserialize_binary(data)
+
+
+@add_method(SerializableObject)
+def __reduce_ex__(self, protocol):
+    # The object and the objects it holds are pickled in the binary encoding,
+    # which with protocol 5 is handed over as an out-of-band buffer, so that
+    # a buffer_callback can send it without copying it into the pickle.
+    # Objects of schemas defined in Python can only be unpickled where their
+    # classes are registered.
+    data = _otio._serialize_binary(_value_to_any(self))
+    if protocol >= 5:
+        data = pickle.PickleBuffer(data)
+    return (_from_binary, (data,))
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Handing objects to other processes through shared memory."""
+
+import os
+import sys
+from multiprocessing import (
+    resource_tracker,
+    shared_memory,
+)
+
+from .. _otio import (
+    _deserialize_binary,
+    _serialize_binary,
+)
+from . _core_utils import _value_to_any
+
+# On Windows shared memory is freed when the last process using it closes
+# it, so the sharing process keeps it open.
+_KEPT_OPEN = {}
+
+
+def _open(name=None, size=0, track=True):
+    """Open or create shared memory, leaving it to be freed by the caller
+    rather than when this process exits if track is False.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(
+            name, create=name is None, size=size, track=track
+        )
+
+    memory = shared_memory.SharedMemory(name, create=name is None, size=size)
+    if not track and os.name != "nt":
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+class SharedObjectHandle:
+    """A handle to an object put in shared memory by :func:`share`.
+
+    Handles are small and can be pickled, so they can be sent to another
+    process, which gets the object with :func:`attach`.
+    """
+
+    def __init__(self, name, size):
+        #: The name of the shared memory block.
+        self.name = name
+        #: The size of the encoded object, in bytes.
+        self.size = size
+
+    def __repr__(self):
+        return f"otio.core.SharedObjectHandle({self.name!r}, {self.size})"
+
+    def unlink(self):
+        """Free the shared memory, for a handle that is not attached, or was
+        attached with ``unlink=False``.
+        """
+        memory = _open(self.name)
+        memory.close()
+        memory.unlink()
+        _KEPT_OPEN.pop(self.name, None)
+
+
+def share(root):
+    """Put an object, and the objects it holds, in shared memory.
+
+    The object is written in the binary encoding, which another process reads
+    in place with :func:`attach`, rather than as JSON text that would be
+    copied through a pipe and parsed.  The shared memory belongs to the
+    process that attaches the object, which frees it, so each handle should be
+    attached or unlinked once.
+
+    :param SerializableObject root: The object to share
+    :returns: A handle to the shared object
+    :rtype: SharedObjectHandle
+    """
+    data = _serialize_binary(_value_to_any(root))
+
+    memory = _open(size=len(data), track=False)
+    memory.buf[:len(data)] = data
+    handle = SharedObjectHandle(memory.name, len(data))
+    if os.name == "nt":
+        _KEPT_OPEN[memory.name] = memory
+    else:
+        memory.close()
+    return handle
+
+
+def attach(handle, unlink=True):
+    """Read an object put in shared memory by :func:`share`.
+
+    :param SharedObjectHandle handle: The handle returned by :func:`share`
+    :param bool unlink: Free the shared memory after reading the object.  If
+        several processes attach the same handle, all but the last one should
+        pass False.
+    :returns: A new copy of the shared object
+    :rtype: SerializableObject
+    """
+    memory = _open(handle.name, track=unlink)
+    try:
+        data = memory.buf[:handle.size]
+        try:
+            return _deserialize_binary(data)
+        finally:
+            data.release()
+    finally:
+        memory.close()
+        if unlink:
+            memory.unlink()
+            _KEPT_OPEN.pop(handle.name, None)
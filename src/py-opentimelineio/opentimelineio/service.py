@@ -0,0 +1,518 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""A local, persistent service that answers queries about OTIO files.
+
+Tools that repeatedly look at the same large ``.otio`` files (review tools,
+farm scripts, hooks) can ask a long running :class:`TimelineServer` instead
+of starting an interpreter and re-parsing the file every time.  Parsed
+timelines are held in an LRU cache keyed on ``(path, mtime, size)``, so an
+edited file is re-read automatically.  The cache is bounded by the size on
+disk of the files it holds, not by the memory their timelines use.
+
+The server listens on a Unix domain socket and speaks newline delimited
+JSON.  Each request is a single JSON object with a ``command`` key and the
+arguments for that command, each response is a single JSON object of the
+form ``{"status": "ok", "result": ...}`` or
+``{"status": "error", "error": "...", "type": "..."}``.  Because the protocol
+is plain text, any client that can write to a Unix socket (``socat``,
+``nc -U``) can talk to the service without importing OTIO at all.
+
+Times are exchanged as ``{"value": float, "rate": float}`` objects and
+ranges as ``{"start_time": time, "duration": time}`` objects.
+
+Available commands:
+
+- ``ping``: returns ``"pong"``
+- ``cache_info``: returns statistics about the timeline cache
+- ``stats``: summary information about the file at ``path``
+- ``clips``: a list describing every clip in the file at ``path``
+- ``child_at_time``: the child of each track (or of track number ``track``)
+  at ``time``, searching nested compositions unless ``shallow_search`` is set
+- ``trimmed_to_range``: the otio_json text of the timeline at ``path``
+  trimmed to ``range``
+
+.. code-block:: python
+   :caption: Example
+
+    from opentimelineio import service
+
+    service.query("stats", path="/shows/abc/edit.otio")
+
+The service does not use the network and has no dependencies beyond the
+python standard library.
+"""
+
+import collections
+import errno
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from concurrent import futures
+
+from . import (
+    adapters,
+    algorithms,
+    exceptions,
+    media_linker,
+    opentime,
+    schema,
+)
+
+__all__ = [
+    'DEFAULT_MAX_BYTES',
+    'TimelineCache',
+    'TimelineServer',
+    'default_socket_path',
+    'serve',
+    'query',
+]
+
+#: Default upper bound for the cache, in bytes of the cached files on disk,
+#: see :class:`TimelineCache`.
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def default_socket_path():
+    """Return the socket path used when none is given explicitly.
+
+    This is ``$OTIO_SERVICE_SOCKET`` if set, otherwise a per-user path in the
+    temporary directory.
+    """
+
+    path = os.environ.get("OTIO_SERVICE_SOCKET")
+    if path:
+        return path
+
+    try:
+        user = os.getuid()
+    except AttributeError:
+        user = os.environ.get("USERNAME", "user")
+
+    return os.path.join(tempfile.gettempdir(), f"otio-service-{user}.sock")
+
+
+def _check_unix_sockets():
+    if not hasattr(socket, "AF_UNIX"):
+        raise exceptions.NotSupportedError(
+            "The OTIO service requires Unix domain socket support, which is not"
+            " available on this platform."
+        )
+
+
+class TimelineCache:
+    """A thread safe LRU cache of parsed OTIO files.
+
+    Entries are keyed on the absolute path, the modification time and the
+    size of the file, so a file that has changed on disk is re-read the next
+    time it is requested.
+
+    The cache is bounded by ``max_bytes``, measured as the on-disk size of
+    the files it holds, not as the memory used by the parsed object graphs,
+    which is larger by a factor that depends on the files.  The on-disk size
+    is known before a file is read and does not change, so it is a cheap and
+    stable proxy.  The least recently used entries are evicted first.  A
+    single file larger than ``max_bytes`` is still returned but is not
+    retained.
+
+    Files are read without holding the lock, so a slow read does not block
+    other requests.  Concurrent requests for a file that is being read wait
+    for that read rather than starting another.
+    """
+
+    def __init__(
+        self,
+        max_bytes=DEFAULT_MAX_BYTES,
+        media_linker_name=media_linker.MediaLinkingPolicy.ForceDefaultLinker,
+        media_linker_argument_map=None,
+    ):
+        self.max_bytes = max_bytes
+        self.media_linker_name = media_linker_name
+        self.media_linker_argument_map = media_linker_argument_map
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # futures of the reads in progress, by key
+        self._reading = {}
+
+    @staticmethod
+    def key_for(path):
+        """Return the ``(path, mtime, size)`` cache key for path."""
+
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size)
+
+    def get(self, path):
+        """Return the parsed contents of path, reading it if necessary."""
+
+        key = self.key_for(path)
+
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            reading = self._reading.get(key)
+            if reading is not None:
+                # another request is reading the file, wait for it
+                self.hits += 1
+                wait = True
+            else:
+                self.misses += 1
+                reading = self._reading[key] = futures.Future()
+                wait = False
+
+        if wait:
+            return reading.result()
+        return self._read(key, reading)
+
+    def _read(self, key, reading):
+        try:
+            result = adapters.read_from_file(
+                key[0],
+                media_linker_name=self.media_linker_name,
+                media_linker_argument_map=self.media_linker_argument_map,
+            )
+        except BaseException as e:
+            with self._lock:
+                del self._reading[key]
+            reading.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._reading[key]
+
+            # drop any stale entries for the same file
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                self._evict(stale)
+
+            size = key[2]
+            if size <= self.max_bytes:
+                while self._entries and self._total_bytes + size > self.max_bytes:
+                    self._evict(next(iter(self._entries)))
+                self._entries[key] = result
+                self._total_bytes += size
+
+        reading.set_result(result)
+        return result
+
+    def _evict(self, key):
+        del self._entries[key]
+        self._total_bytes -= key[2]
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def info(self):
+        """Return a dictionary of statistics about the cache."""
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "paths": [k[0] for k in self._entries],
+            }
+
+
+def _time_to_json(rt):
+    if rt is None:
+        return None
+    return {"value": rt.value, "rate": rt.rate}
+
+
+def _range_to_json(tr):
+    if tr is None:
+        return None
+    return {
+        "start_time": _time_to_json(tr.start_time),
+        "duration": _time_to_json(tr.duration),
+    }
+
+
+def _time_from_json(data):
+    try:
+        return opentime.RationalTime(data["value"], data["rate"])
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"expected a time of the form {{'value': v, 'rate': r}}, got: {data}"
+        )
+
+
+def _range_from_json(data):
+    try:
+        return opentime.TimeRange(
+            _time_from_json(data["start_time"]),
+            _time_from_json(data["duration"]),
+        )
+    except (KeyError, TypeError):
+        raise ValueError(
+            "expected a range of the form {'start_time': t, 'duration': t},"
+            f" got: {data}"
+        )
+
+
+def _tracks_of(input_otio):
+    try:
+        return input_otio.tracks
+    except AttributeError:
+        raise exceptions.NotSupportedError(
+            f"expected a Timeline, got a {input_otio.schema_name()}"
+        )
+
+
+def _describe_item(item):
+    result = {
+        "name": item.name,
+        "schema": f"{item.schema_name()}.{item.schema_version()}",
+        "source_range": _range_to_json(item.source_range),
+    }
+    try:
+        result["range_in_parent"] = _range_to_json(item.range_in_parent())
+    except exceptions.OTIOError:
+        result["range_in_parent"] = None
+
+    return result
+
+
+def _cmd_stats(server, path):
+    input_otio = server.cache.get(path)
+    result = {
+        "schema": f"{input_otio.schema_name()}.{input_otio.schema_version()}",
+        "name": input_otio.name,
+        "clips": len(input_otio.find_clips()),
+    }
+
+    if isinstance(input_otio, schema.Timeline):
+        duration = input_otio.duration()
+        result.update(
+            {
+                "tracks": len(input_otio.tracks),
+                "video_tracks": len(input_otio.video_tracks()),
+                "audio_tracks": len(input_otio.audio_tracks()),
+                "duration": _time_to_json(duration),
+                "rate": duration.rate,
+            }
+        )
+
+    return result
+
+
+def _cmd_clips(server, path):
+    result = []
+    for clip in server.cache.get(path).find_clips():
+        desc = _describe_item(clip)
+        parent = clip.parent()
+        desc["track"] = parent.name if parent is not None else None
+        desc["target_url"] = getattr(clip.media_reference, "target_url", None)
+        result.append(desc)
+
+    return result
+
+
+def _cmd_child_at_time(server, path, time, track=None, shallow_search=False):
+    tracks = _tracks_of(server.cache.get(path))
+    search_time = _time_from_json(time)
+
+    if track is None:
+        indices = range(len(tracks))
+    else:
+        indices = [track]
+
+    result = []
+    for index in indices:
+        child = tracks[index].child_at_time(search_time, shallow_search)
+        desc = _describe_item(child) if child is not None else None
+        result.append({"track": index, "child": desc})
+
+    return result
+
+
+def _cmd_trimmed_to_range(server, path, range):
+    input_otio = server.cache.get(path)
+    _tracks_of(input_otio)
+
+    trimmed = algorithms.timeline_trimmed_to_range(
+        input_otio,
+        _range_from_json(range)
+    )
+    return adapters.otio_json.write_to_string(trimmed)
+
+
+def _cmd_cache_info(server):
+    return server.cache.info()
+
+
+def _cmd_ping(server):
+    return "pong"
+
+
+COMMANDS = {
+    "ping": _cmd_ping,
+    "cache_info": _cmd_cache_info,
+    "stats": _cmd_stats,
+    "clips": _cmd_clips,
+    "child_at_time": _cmd_child_at_time,
+    "trimmed_to_range": _cmd_trimmed_to_range,
+}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    _ServerBase = socketserver.ThreadingUnixStreamServer
+else:
+    _ServerBase = object
+
+
+def _is_stale_socket(path):
+    """Return whether path is a socket that no server is listening on.
+
+    Raises an ``EADDRINUSE`` OSError if a server is listening on it.
+    """
+
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return False
+    except FileNotFoundError:
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return True
+
+    raise OSError(
+        errno.EADDRINUSE,
+        "Another OTIO service is listening on this socket",
+        path
+    )
+
+
+class TimelineServer(_ServerBase):
+    """Serve queries about OTIO files over a Unix domain socket.
+
+    Each connection is handled on its own thread and may send any number of
+    requests, one per line.  All connections share a single
+    :class:`TimelineCache`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path=None, cache=None):
+        _check_unix_sockets()
+
+        self.socket_path = socket_path or default_socket_path()
+        self.cache = cache if cache is not None else TimelineCache()
+
+        # clean up after a server that did not shut down cleanly, but not
+        # from under one that is running
+        if _is_stale_socket(self.socket_path):
+            os.unlink(self.socket_path)
+
+        super().__init__(self.socket_path, _RequestHandler)
+
+    def dispatch(self, line):
+        """Run the request encoded in line and return the response object."""
+
+        try:
+            request = json.loads(line)
+            command = request.pop("command")
+            fn = COMMANDS[command]
+        except (ValueError, AttributeError, KeyError):
+            return {
+                "status": "error",
+                "type": "ValueError",
+                "error": (
+                    "requests must be JSON objects with a 'command' key naming"
+                    " one of: {}".format(", ".join(sorted(COMMANDS)))
+                ),
+            }
+
+        try:
+            return {"status": "ok", "result": fn(self, **request)}
+        except Exception as e:
+            return {"status": "error", "type": type(e).__name__, "error": str(e)}
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(socket_path=None, max_bytes=DEFAULT_MAX_BYTES, **cache_arguments):
+    """Run a :class:`TimelineServer` until interrupted."""
+
+    server = TimelineServer(
+        socket_path,
+        TimelineCache(max_bytes=max_bytes, **cache_arguments)
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def query(command, socket_path=None, timeout=None, **arguments):
+    """Send a single command to a running service and return its result.
+
+    Paths are made absolute before being sent, since the service does not
+    share the caller's working directory.  Errors reported by the service
+    are raised as :class:`~opentimelineio.exceptions.ServiceError`.
+    """
+
+    _check_unix_sockets()
+
+    if "path" in arguments:
+        arguments["path"] = os.path.abspath(os.fspath(arguments["path"]))
+
+    request = dict(arguments, command=command)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+
+    if not line:
+        raise exceptions.ServiceError("the service closed the connection")
+
+    response = json.loads(line)
+    if response["status"] != "ok":
+        raise exceptions.ServiceError(
+            "{}: {}".format(response.get("type"), response.get("error"))
+        )
+
+    return response["result"]
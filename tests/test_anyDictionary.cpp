@@ -0,0 +1,143 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "utils.h"
+
+#include <opentimelineio/anyDictionary.h>
+
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace otio = opentimelineio::OPENTIMELINEIO_VERSION;
+
+static std::vector<std::string>
+keys(otio::AnyDictionary const& d)
+{
+    std::vector<std::string> result;
+    for (auto const& e: d)
+    {
+        result.push_back(e.first);
+    }
+    return result;
+}
+
+int
+main(int argc, char** argv)
+{
+    Tests tests;
+
+    tests.add_test("test_sorted_iteration", [] {
+        otio::AnyDictionary d;
+        d["c"] = 3;
+        d["a"] = 1;
+        d.emplace("b", 2);
+        d.insert({ "d", 4 });
+        assertEqual(keys(d), std::vector<std::string>({ "a", "b", "c", "d" }));
+        assertEqual(std::any_cast<int>(d.rbegin()->second), 4);
+    });
+
+    tests.add_test("test_insert_keeps_existing", [] {
+        otio::AnyDictionary d;
+        assertTrue(d.emplace("a", 1).second);
+        auto result = d.emplace("a", 2);
+        assertFalse(result.second);
+        assertEqual(std::any_cast<int>(result.first->second), 1);
+
+        std::vector<otio::AnyDictionary::value_type> items = {
+            { "z", 1 }, { "a", 2 }, { "m", 3 }, { "m", 4 }, { "b", 5 }
+        };
+        d.insert(items.begin(), items.end());
+        assertEqual(
+            keys(d),
+            std::vector<std::string>({ "a", "b", "m", "z" }));
+        assertEqual(std::any_cast<int>(d["a"]), 1);
+        assertEqual(std::any_cast<int>(d["m"]), 3);
+
+        otio::AnyDictionary from_list{ { "y", 1 }, { "x", 2 }, { "y", 3 } };
+        assertEqual(from_list.size(), size_t(2));
+        assertEqual(std::any_cast<int>(from_list.at("y")), 1);
+    });
+
+    tests.add_test("test_lookup", [] {
+        otio::AnyDictionary d{ { "a", 1 }, { "c", 3 }, { "e", 5 } };
+        assertTrue(d.has_key("c"));
+        assertFalse(d.has_key("b"));
+        assertEqual(d.count("e"), size_t(1));
+        assertTrue(d.find("f") == d.end());
+        assertEqual(d.lower_bound("b")->first, std::string("c"));
+        assertEqual(d.upper_bound("c")->first, std::string("e"));
+        assertTrue(d.upper_bound("e") == d.end());
+
+        int value = 0;
+        assertTrue(d.get_if_set("a", &value));
+        assertEqual(value, 1);
+
+        bool thrown = false;
+        try
+        {
+            d.at("b");
+        }
+        catch (std::out_of_range const&)
+        {
+            thrown = true;
+        }
+        assertTrue(thrown);
+
+        assertEqual(d.erase("c"), size_t(1));
+        assertEqual(d.erase("c"), size_t(0));
+        assertEqual(keys(d), std::vector<std::string>({ "a", "e" }));
+    });
+
+    tests.add_test("test_references_are_stable", [] {
+        otio::AnyDictionary d;
+        d["m"]         = 1;
+        std::any& m    = d["m"];
+        std::any* addr = &m;
+        for (int i = 0; i < 100; ++i)
+        {
+            d["key_" + std::to_string(i)] = i;
+        }
+        assertEqual(static_cast<void const*>(&d["m"]),
+                    static_cast<void const*>(addr));
+
+        // the upgrade function idiom, the right hand side is evaluated
+        // before the new key is inserted
+        d["n"] = d["m"];
+        assertEqual(std::any_cast<int>(d["n"]), 1);
+
+        d.erase("key_1");
+        d["key_1"] = 10;
+        assertEqual(std::any_cast<int>(d["m"]), 1);
+        assertEqual(d.size(), size_t(102));
+    });
+
+    tests.add_test("test_mutation_stamp", [] {
+        otio::AnyDictionary* d = new otio::AnyDictionary;
+        auto* stamp = d->get_or_create_mutation_stamp();
+        int64_t last = stamp->stamp;
+
+        // inserting a new key moves items, so it bumps the stamp
+        (*d)["a"] = 1;
+        assertTrue(stamp->stamp > last);
+        last = stamp->stamp;
+
+        // assigning to an existing key does not
+        (*d)["a"] = 2;
+        d->emplace("a", 3);
+        assertEqual(stamp->stamp, last);
+
+        otio::AnyDictionary moved(std::move(*d));
+        assertTrue(stamp->stamp > last);
+        assertTrue(d->empty());
+        assertEqual(std::any_cast<int>(moved["a"]), 2);
+
+        delete d;
+        assertEqual(stamp->stamp, int64_t(-1));
+        assertTrue(stamp->any_dictionary == nullptr);
+        delete stamp;
+    });
+
+    tests.run(argc, argv);
+    return 0;
+}
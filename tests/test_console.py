@@ -12,6 +12,8 @@ import pathlib
 import platform
 
 import io
+from concurrent import futures
+from unittest import mock
 
 from tempfile import TemporaryDirectory  # noqa: F401
 import tempfile
@@ -114,6 +116,28 @@ class OTIOStatTest(ConsoleTester, unittest.TestCase):
         self.run_test()
         self.assertIn("top level object: Timeline.1", sys.stdout.getvalue())
 
+    def test_index(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "indexed.otio")
+            otio.adapters.write_to_file(timeline, path, write_index=True)
+
+            sys.argv = ['otiostat', path, '--from-index']
+            self.run_test()
+            from_index = sys.stdout.getvalue()
+
+            # the index is only used when asked for
+            sys.stdout = io.StringIO()
+            sys.argv = ['otiostat', path]
+            self.run_test()
+            full = sys.stdout.getvalue()
+
+        self.assertIn("top level object: Timeline.1", from_index)
+        self.assertNotIn("deepest nesting", from_index)
+        self.assertIn("deepest nesting", full)
+        for line in from_index.splitlines():
+            self.assertIn(line, full)
+
 
 OTIOStatTest_ShellOut = CreateShelloutTest(OTIOStatTest)
 
@@ -157,6 +181,62 @@ class OTIOCatTests(ConsoleTester, unittest.TestCase):
         # read results back in
         self.assertIn('error: media linker', sys.stderr.getvalue())
 
+    def test_path(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        expected = otio.adapters.write_to_string(timeline.tracks[0][1])
+
+        sys.argv = ['otiocat', SCREENING_EXAMPLE_PATH, "-p", "0,1"]
+        self.run_test()
+        self.assertEqual(sys.stdout.getvalue(), expected + "\n")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "indexed.otio")
+            otio.adapters.write_to_file(timeline, path, write_index=True)
+
+            sys.stdout = io.StringIO()
+            sys.argv = ['otiocat', path, "-p", "0,1"]
+            self.run_test()
+            self.assertEqual(sys.stdout.getvalue(), expected + "\n")
+
+            if self.SHELL_OUT:
+                return
+
+            # with hook scripts the whole file is read, so that they run
+            sys.stdout = io.StringIO()
+            with mock.patch.object(
+                otio.hooks,
+                "scripts_attached_to",
+                return_value=["a_hook"]
+            ), mock.patch.object(
+                otio.adapters.otio_json,
+                "read_index",
+                side_effect=AssertionError("the index is read")
+            ), mock.patch.object(
+                otio.hooks,
+                "run",
+                side_effect=lambda hook, tl, extra_args=None: tl
+            ) as run:
+                self.run_test()
+            self.assertIn(
+                "post_adapter_read",
+                [call.args[0] for call in run.call_args_list]
+            )
+            self.assertEqual(sys.stdout.getvalue(), expected + "\n")
+
+    def test_bad_path(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "indexed.otio")
+            otio.adapters.write_to_file(timeline, path, write_index=True)
+
+            for fpath in (SCREENING_EXAMPLE_PATH, path):
+                for bad_path in ("0,1,0", "0,100", "-1"):
+                    sys.stderr = io.StringIO()
+                    sys.argv = ['otiocat', fpath, "-p", bad_path]
+                    with self.assertRaises(SystemExit):
+                        self.run_test()
+                    self.assertNotIn("Traceback", sys.stderr.getvalue())
+
 
 OTIOCatTests_OnShell = CreateShelloutTest(OTIOCatTests)
 
@@ -291,6 +371,163 @@ class OTIOConvertTests(ConsoleTester, unittest.TestCase):
             # read results back in
             self.assertIn('error: media linker', sys.stderr.getvalue())
 
+    def test_batch_glob(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for jobs in ("1", "2"):
+                sys.stdout = io.StringIO()
+                output = os.path.join(temp_dir, jobs, "{stem}.{ext}.otio")
+                sys.argv = [
+                    'otioconvert',
+                    '--input-glob', os.path.join(SAMPLE_DATA_DIR, "*.otio"),
+                    '-o', output,
+                    '--jobs', jobs,
+                ]
+                out, err = self.run_test()
+
+                converted = sorted(os.listdir(os.path.join(temp_dir, jobs)))
+                self.assertIn("simple_cut.otio.otio", converted)
+                self.assertIn(
+                    f"converted {len(converted)} of {len(converted)} files",
+                    out
+                )
+                self.assertEqual(err, "")
+
+            result = otio.adapters.read_from_file(
+                os.path.join(temp_dir, "2", "simple_cut.otio.otio")
+            )
+            self.assertJsonEqual(
+                result,
+                otio.adapters.read_from_file(SIMPLE_CUT_PATH)
+            )
+
+    def test_batch_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "in")
+            os.makedirs(os.path.join(input_dir, "reel1"))
+            otio.adapters.write_to_file(
+                otio.adapters.read_from_file(SIMPLE_CUT_PATH),
+                os.path.join(input_dir, "reel1", "cut.otio")
+            )
+            otio.adapters.write_to_file(
+                otio.adapters.read_from_file(TRANSITION_PATH),
+                os.path.join(input_dir, "transition.otio")
+            )
+            with open(os.path.join(input_dir, "notes.txt"), "w") as fo:
+                fo.write("not a timeline")
+
+            sys.argv = [
+                'otioconvert',
+                '--input-dir', input_dir,
+                '-o', os.path.join(temp_dir, "out", "{dir}", "{stem}.otio"),
+                '--tracks', '0',
+            ]
+            out, _ = self.run_test()
+
+            self.assertIn("converted 2 of 2 files", out)
+            self.assertTrue(
+                os.path.exists(os.path.join(temp_dir, "out", "transition.otio"))
+            )
+            result = otio.adapters.read_from_file(
+                os.path.join(temp_dir, "out", "reel1", "cut.otio")
+            )
+            self.assertEqual(len(result.tracks), 1)
+
+    def test_batch_errors(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            broken = os.path.join(temp_dir, "broken.otio")
+            with open(broken, "w") as fo:
+                fo.write("{")
+            file_list = os.path.join(temp_dir, "files.txt")
+            with open(file_list, "w") as fo:
+                fo.write(f"{SIMPLE_CUT_PATH}\n{broken}\n\n")
+
+            sys.argv = [
+                'otioconvert',
+                '--input-list', file_list,
+                '-o', os.path.join(temp_dir, "out", "{stem}.otio"),
+                '-j', '2',
+            ]
+            with self.assertRaises(SystemExit):
+                self.run_test()
+
+            self.assertIn("converted 1 of 2 files", sys.stdout.getvalue())
+            self.assertIn(f"FAILED {broken}: ", sys.stderr.getvalue())
+            self.assertTrue(
+                os.path.exists(os.path.join(temp_dir, "out", "simple_cut.otio"))
+            )
+
+            # both inputs would be written to the same file
+            sys.argv = [
+                'otioconvert',
+                '--input-list', file_list,
+                '-o', os.path.join(temp_dir, "out", "same.otio"),
+            ]
+            with self.assertRaises(SystemExit):
+                self.run_test()
+            self.assertIn("would both be converted to", sys.stderr.getvalue())
+
+    def test_batch_broken_pool(self):
+        if self.SHELL_OUT:
+            # the process pool cannot be replaced in another process
+            return
+
+        class BrokenPoolExecutor(futures.ThreadPoolExecutor):
+            """Fails every file after the first, as a pool whose worker died
+            does.
+            """
+
+            def __init__(self, max_workers, initializer, initargs):
+                super().__init__(max_workers, initializer=initializer,
+                                 initargs=initargs)
+                self.submitted = 0
+
+            def submit(self, fn, *args):
+                self.submitted += 1
+                if self.submitted == 1:
+                    return super().submit(fn, *args)
+                future = futures.Future()
+                future.set_exception(
+                    futures.process.BrokenProcessPool("worker died")
+                )
+                return future
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_list = os.path.join(temp_dir, "files.txt")
+            with open(file_list, "w") as fo:
+                fo.write(f"{SIMPLE_CUT_PATH}\n{MULTITRACK_PATH}\n")
+                fo.write(f"{SCREENING_EXAMPLE_PATH}\n")
+
+            sys.argv = [
+                'otioconvert',
+                '--input-list', file_list,
+                '-o', os.path.join(temp_dir, "out", "{stem}.otio"),
+                '-j', '2',
+            ]
+            with mock.patch.object(
+                otio_console.otioconvert.futures,
+                "ProcessPoolExecutor",
+                BrokenPoolExecutor
+            ):
+                with self.assertRaises(SystemExit):
+                    self.run_test()
+
+        self.assertIn("converted 1 of 3 files", sys.stdout.getvalue())
+        self.assertEqual(
+            sys.stderr.getvalue().count("BrokenProcessPool: worker died"),
+            2
+        )
+
+    def test_batch_argument_error(self):
+        sys.argv = [
+            'otioconvert',
+            '-i', SIMPLE_CUT_PATH,
+            '--input-dir', SAMPLE_DATA_DIR,
+            '-o', "{stem}.otio",
+        ]
+        with self.assertRaises(SystemExit):
+            self.run_test()
+        self.assertIn("are exclusive", sys.stderr.getvalue())
+
 
 OTIOConvertTests_OnShell = CreateShelloutTest(OTIOConvertTests)
 
@@ -500,6 +737,51 @@ TRACK:  (Audio)
     MEDIA NOT FOUND: file://localhost/D%3a/media/sc01_sh010_anim.mov
 """, out)
 
+    def test_verify_media_unchecked(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            timeline = otio.schema.Timeline(name="unchecked")
+            timeline.tracks.append(otio.schema.Track())
+            timeline.tracks[0].append(
+                otio.schema.Clip(
+                    name="no range",
+                    media_reference=otio.schema.ImageSequenceReference(
+                        otio.url_utils.url_from_filepath(temp_dir) + "/",
+                        "shot.",
+                        ".exr",
+                    )
+                )
+            )
+            timeline.tracks[0].append(
+                otio.schema.Clip(
+                    name="remote",
+                    media_reference=otio.schema.ExternalReference(
+                        "https://example.com/movie.mov"
+                    )
+                )
+            )
+            path = os.path.join(temp_dir, "unchecked.otio")
+            otio.adapters.write_to_file(timeline, path)
+
+            sys.argv = [
+                'otiotool',
+                '-i', path,
+                '--list-clips',
+                '--verify-media'
+            ]
+            out, err = self.run_test()
+
+        # media that could not be checked gets no status
+        self.assertEqual(
+            "TIMELINE: unchecked\n"
+            "  CLIP: no range\n"
+            "    MEDIA: {}/\n"
+            "  CLIP: remote\n"
+            "    MEDIA: https://example.com/movie.mov\n".format(
+                otio.url_utils.url_from_filepath(temp_dir)
+            ),
+            out
+        )
+
     def test_video_only(self):
         sys.argv = [
             'otiotool',
@@ -932,6 +1214,58 @@ Duration: 00:02:16:18
                  "    MEDIA: file:///folder/credits.mov\n"),
                 out)
 
+    def _run_with_jobs(self, arguments, jobs):
+        # number the redacted names from the start in each run
+        counters = getattr(otio_console.otiotool, "__counters")
+        counters.clear()
+        self.addCleanup(counters.clear)
+
+        sys.stdout = io.StringIO()
+        sys.argv = ['otiotool', '--jobs', str(jobs)] + arguments
+        out, _ = self.run_test()
+        return out
+
+    def test_jobs(self):
+        inputs = [
+            MULTITRACK_PATH, PREMIERE_EXAMPLE_PATH,
+            SCREENING_EXAMPLE_PATH, SIMPLE_CUT_PATH,
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outputs = []
+            for jobs in (1, 3):
+                output = os.path.join(temp_dir, f"jobs{jobs}.otio")
+                out = self._run_with_jobs(
+                    ['-i'] + inputs + [
+                        '--video-only',
+                        '--flatten', 'video',
+                        '--stats',
+                        '--list-tracks',
+                        '--list-clips',
+                        '-o', output,
+                    ],
+                    jobs
+                )
+                outputs.append((out, otio.adapters.read_from_file(output)))
+
+            self.assertEqual(outputs[0][0], outputs[1][0])
+            self.assertIn("Name: Figure 1 - Simple Cut List", outputs[1][0])
+            self.assertJsonEqual(outputs[0][1], outputs[1][1])
+            self.assertEqual(len(outputs[1][1]), len(inputs))
+
+    def test_jobs_with_combining_steps(self):
+        for arguments in (
+            ['--stack', '--list-clips', '--stats'],
+            ['--concat', '--list-tracks'],
+            ['--only-clips-with-name-regex', 'sh0', '--redact', '--list-clips'],
+        ):
+            arguments = [
+                '-i', MULTITRACK_PATH, PREMIERE_EXAMPLE_PATH, SIMPLE_CUT_PATH,
+            ] + arguments
+            self.assertEqual(
+                self._run_with_jobs(arguments, 1),
+                self._run_with_jobs(arguments, 2)
+            )
+
 
 OTIOToolTest_ShellOut = CreateShelloutTest(OTIOToolTest)
 
@@ -90,6 +90,32 @@ class AnyDictionaryTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, r"Underlying C\+\+ AnyDictionary has been destroyed"):  # noqa
             next(it)
 
+    def test_to_dict(self):
+        d = opentimelineio.core._core_utils.AnyDictionary()
+        clip = opentimelineio.schema.Clip(name="clip")
+        d["a"] = {"b": [1, {"c": "d"}], "e": 2.5}
+        d["clip"] = clip
+
+        result = d.to_dict()
+        self.assertEqual(type(result), dict)
+        self.assertEqual(result["a"], {"b": [1, {"c": "d"}], "e": 2.5})
+        self.assertEqual(type(result["a"]["b"]), list)
+        self.assertIs(result["clip"], clip)
+
+        shallow = d.to_dict(deep=False)
+        self.assertIsInstance(
+            shallow["a"],
+            opentimelineio.core._core_utils.AnyDictionary
+        )
+        shallow["a"]["e"] = 3
+        self.assertEqual(d["a"]["e"], 3)
+
+        self.assertEqual(d["a"]["b"].to_list(), [1, {"c": "d"}])
+        self.assertIsInstance(
+            d["a"]["b"].to_list(deep=False)[1],
+            opentimelineio.core._core_utils.AnyDictionary
+        )
+
 
 class AnyVectorTests(unittest.TestCase):
     def test_main(self):
@@ -242,3 +268,92 @@ class AnyVectorTests(unittest.TestCase):
         deepcopied = copy.deepcopy(v)
         self.assertIsNot(v, deepcopied)
         self.assertIsNot(v[2], deepcopied[2])
+
+
+class ValueToAnyTests(unittest.TestCase):
+    def test_nested_values(self):
+        d = opentimelineio.core._core_utils.AnyDictionary()
+        clip = opentimelineio.schema.Clip(name="clip")
+        value = {
+            "int": 1,
+            "float": 2.5,
+            "bool": True,
+            "none": None,
+            "str": "text",
+            "list": [1, (2, 3), {"nested": ["a"]}],
+            "time": opentimelineio.opentime.RationalTime(1, 24),
+            "clip": clip,
+        }
+        d["value"] = value
+
+        result = d["value"]
+        self.assertEqual(list(result["list"][2]["nested"]), ["a"])
+        self.assertEqual(list(result["list"][1]), [2, 3])
+        self.assertIs(result["clip"], clip)
+        self.assertEqual(
+            {k: v for k, v in result.items() if k not in ("list", "clip")},
+            {k: v for k, v in value.items() if k not in ("list", "clip")}
+        )
+
+        # containers are copied
+        d["copy"] = d["value"]
+        d["copy"]["int"] = 2
+        self.assertEqual(d["value"]["int"], 1)
+
+    def test_errors(self):
+        d = opentimelineio.core._core_utils.AnyDictionary()
+
+        with self.assertRaisesRegex(ValueError, "key '1' is not a string"):
+            d["a"] = {"b": {1: 2}}
+
+        with self.assertRaisesRegex(ValueError, "C\\+\\+ int64_t"):
+            d["a"] = [1, [2 ** 64]]
+
+        with self.assertRaisesRegex(TypeError, "is incompatible with OpenTimelineIO"):
+            d["a"] = {"b": [object()]}
+
+        circular = []
+        circular.append({"list": circular})
+        with self.assertRaisesRegex(ValueError, "circular reference"):
+            d["a"] = circular
+
+        # the same object may appear more than once
+        shared = [1, 2]
+        d["a"] = [shared, shared]
+        self.assertEqual([list(v) for v in d["a"]], [[1, 2], [1, 2]])
+
+
+class MetadataTableTests(unittest.TestCase):
+    def test_metadata_table(self):
+        clips = [
+            opentimelineio.schema.Clip(
+                name=str(i),
+                metadata={"reel": f"R{i}", "vendor": {"take": i}}
+            )
+            for i in range(3)
+        ]
+        del clips[1].metadata["vendor"]
+
+        table = opentimelineio.core.metadata_table(
+            clips,
+            ["reel", ("vendor", "take"), "missing"]
+        )
+        self.assertEqual(
+            table,
+            {
+                "reel": ["R0", "R1", "R2"],
+                ("vendor", "take"): [0, None, 2],
+                "missing": [None, None, None],
+            }
+        )
+
+        table = opentimelineio.core.metadata_table(
+            clips,
+            ["vendor"],
+            default={}
+        )
+        self.assertEqual(table["vendor"], [{"take": 0}, {}, {"take": 2}])
+        self.assertEqual(type(table["vendor"][0]), dict)
+
+        with self.assertRaises(TypeError):
+            opentimelineio.core.metadata_table([1], ["reel"])
@@ -6,6 +6,7 @@
 #include <opentimelineio/mediaReference.h>
 #include <opentimelineio/clip.h>
 #include <opentimelineio/algo/editAlgorithm.h>
+#include <opentimelineio/editJournal.h>
 #include <opentimelineio/gap.h>
 #include <opentimelineio/stack.h>
 #include <opentimelineio/timeline.h>
@@ -3083,6 +3084,234 @@ main(int argc, char** argv)
                           });
     });
     
+    tests.add_test("test_edit_transaction", [] {
+        // the same edits with and without a transaction
+        auto make_track = [] {
+            otio::SerializableObject::Retainer<otio::Track> track =
+                new otio::Track();
+            for (int i = 0; i < 40; ++i)
+            {
+                track->append_child(new otio::Clip(
+                    "clip " + std::to_string(i),
+                    nullptr,
+                    TimeRange(
+                        RationalTime(i, 24.0),
+                        RationalTime(10 + i % 7, 24.0))));
+            }
+            return track;
+        };
+        auto edit = [](otio::Track* track, otio::algo::EditTransaction* tx) {
+            otio::ErrorStatus errorStatus;
+            for (int i = 0; i < 200; ++i)
+            {
+                const double duration = track->duration().value();
+                const RationalTime time((i * 37) % int(duration), 24.0);
+                auto clip = new otio::Clip(
+                    "edit " + std::to_string(i),
+                    nullptr,
+                    TimeRange(RationalTime(), RationalTime(3 + i % 5, 24.0)));
+                auto child = otio::dynamic_retainer_cast<otio::Item>(
+                    track->children()[(i * 13) % track->children().size()]);
+                switch (i % 6)
+                {
+                    case 0: {
+                        const TimeRange range(time, RationalTime(4, 24.0));
+                        tx ? tx->overwrite(clip, range, true, nullptr,
+                                           &errorStatus)
+                           : otio::algo::overwrite(clip, track, range, true,
+                                                   nullptr, &errorStatus);
+                        break;
+                    }
+                    case 1:
+                        tx ? tx->insert(clip, time, true, nullptr,
+                                        &errorStatus)
+                           : otio::algo::insert(clip, track, time, true,
+                                                nullptr, &errorStatus);
+                        break;
+                    case 2:
+                        tx ? tx->slice(time, true, &errorStatus)
+                           : otio::algo::slice(track, time, true,
+                                               &errorStatus);
+                        break;
+                    case 3:
+                        tx ? tx->remove(time, true, nullptr, &errorStatus)
+                           : otio::algo::remove(track, time, true, nullptr,
+                                                &errorStatus);
+                        break;
+                    case 4: {
+                        const RationalTime delta(-1, 24.0);
+                        tx ? tx->trim(child, RationalTime(), delta, nullptr,
+                                      &errorStatus)
+                           : otio::algo::trim(child, RationalTime(), delta,
+                                              nullptr, &errorStatus);
+                        break;
+                    }
+                    default: {
+                        const RationalTime delta(1, 24.0);
+                        tx ? tx->ripple(child, RationalTime(), delta,
+                                        &errorStatus)
+                           : otio::algo::ripple(child, RationalTime(), delta,
+                                                &errorStatus);
+                        break;
+                    }
+                }
+                if (!clip->parent())
+                {
+                    otio::SerializableObject::Retainer<> release(clip);
+                }
+                assertFalse(otio::is_error(errorStatus));
+            }
+        };
+
+        auto looped = make_track();
+        edit(looped, nullptr);
+
+        auto edited = make_track();
+        {
+            otio::algo::EditTransaction transaction(edited);
+            edit(edited, &transaction);
+            assertTrue(transaction.is_open());
+            transaction.commit();
+            assertFalse(transaction.is_open());
+
+            otio::ErrorStatus errorStatus;
+            transaction.slice(RationalTime(1, 24.0), true, &errorStatus);
+            assertTrue(otio::is_error(errorStatus));
+        }
+        assertTrue(edited->is_equivalent_to(*looped));
+        assertEqual(edited->duration(), looped->duration());
+
+        // rolling back restores the track, and is what happens to a
+        // transaction that is not committed
+        auto original = make_track();
+        auto rolled_back = make_track();
+        auto first = rolled_back->children()[0];
+        {
+            otio::algo::EditTransaction transaction(rolled_back);
+            edit(rolled_back, &transaction);
+        }
+        assertTrue(rolled_back->is_equivalent_to(*original));
+        assertTrue(rolled_back->children()[0].value == first.value);
+
+        // only children of the track can be edited
+        otio::SerializableObject::Retainer<otio::Clip> orphan =
+            new otio::Clip();
+        otio::algo::EditTransaction transaction(rolled_back);
+        otio::ErrorStatus errorStatus;
+        transaction.trim(orphan, RationalTime(1, 24.0), RationalTime(),
+                         nullptr, &errorStatus);
+        assertEqual(errorStatus.outcome, otio::ErrorStatus::NOT_A_CHILD_OF);
+        transaction.commit();
+    });
+
+    tests.add_test("test_edit_journal", [] {
+        otio::SerializableObject::Retainer<otio::Track> track =
+            new otio::Track();
+        for (int i = 0; i < 20; ++i)
+        {
+            track->append_child(new otio::Clip(
+                "clip " + std::to_string(i),
+                nullptr,
+                TimeRange(RationalTime(i, 24.0), RationalTime(12, 24.0))));
+        }
+
+        // record each edit as a step, keeping a copy of the track after it
+        otio::EditJournal journal;
+        std::vector<otio::SerializableObject::Retainer<otio::Track>> states;
+        states.push_back(
+            dynamic_cast<otio::Track*>(track->clone()));
+        otio::ErrorStatus errorStatus;
+        for (int i = 0; i < 30; ++i)
+        {
+            const RationalTime time((i * 29) % 200, 24.0);
+            auto clip = new otio::Clip(
+                "edit " + std::to_string(i),
+                nullptr,
+                TimeRange(RationalTime(), RationalTime(5 + i % 4, 24.0)));
+            auto child = otio::dynamic_retainer_cast<otio::Item>(
+                track->children()[(i * 7) % track->children().size()]);
+            {
+                otio::EditJournal::Recording recording(journal);
+                assertTrue(otio::EditJournal::is_recording());
+                switch (i % 5)
+                {
+                    case 0:
+                        otio::algo::overwrite(
+                            clip, track, TimeRange(time, RationalTime(8, 24.0)),
+                            true, nullptr, &errorStatus);
+                        break;
+                    case 1:
+                        otio::algo::insert(clip, track, time, true, nullptr,
+                                           &errorStatus);
+                        break;
+                    case 2:
+                        otio::algo::remove(track, time, true, nullptr,
+                                           &errorStatus);
+                        break;
+                    case 3:
+                        otio::algo::trim(child, RationalTime(1, 24.0),
+                                         RationalTime(-2, 24.0), nullptr,
+                                         &errorStatus);
+                        break;
+                    default:
+                        otio::algo::slice(track, time, true, &errorStatus);
+                        track->append_child(clip);
+                        break;
+                }
+            }
+            assertFalse(otio::EditJournal::is_recording());
+            if (!clip->parent())
+            {
+                otio::SerializableObject::Retainer<> release(clip);
+            }
+            assertFalse(otio::is_error(errorStatus));
+            states.push_back(dynamic_cast<otio::Track*>(track->clone()));
+        }
+        assertEqual(journal.undo_count(), size_t(30));
+
+        // undo and redo every step
+        for (size_t i = states.size() - 1; i > 0; --i)
+        {
+            assertTrue(journal.undo(&errorStatus));
+            assertTrue(track->is_equivalent_to(*states[i - 1]));
+        }
+        assertFalse(journal.undo(&errorStatus));
+        assertFalse(otio::is_error(errorStatus));
+        assertEqual(journal.redo_count(), size_t(30));
+        for (size_t i = 1; i < states.size(); ++i)
+        {
+            assertTrue(journal.redo(&errorStatus));
+            assertTrue(track->is_equivalent_to(*states[i]));
+        }
+        assertFalse(journal.redo());
+
+        // a new step discards the steps that were undone
+        journal.undo();
+        {
+            otio::EditJournal::Recording recording(journal);
+            track->remove_child(0);
+        }
+        assertEqual(journal.redo_count(), size_t(0));
+        assertEqual(journal.undo_count(), size_t(30));
+        journal.undo();
+        assertTrue(track->is_equivalent_to(*states[29]));
+
+        // only the last steps are kept
+        journal.set_max_steps(3);
+        assertEqual(journal.undo_count(), size_t(3));
+        while (journal.undo())
+        {}
+        assertTrue(track->is_equivalent_to(*states[26]));
+
+        // a step that no longer applies is left as it is
+        journal.redo();
+        track->clear_children();
+        assertFalse(journal.undo(&errorStatus));
+        assertTrue(otio::is_error(errorStatus));
+        assertTrue(track->children().empty());
+        assertEqual(journal.undo_count(), size_t(1));
+    });
+
     tests.run(argc, argv);
     return 0;
 }
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Test file for the edit algorithms."""
+
+import threading
+import unittest
+
+import opentimelineio as otio
+import opentimelineio.test_utils as otio_test_utils
+
+
+def _rt(value):
+    return otio.opentime.RationalTime(value, 24)
+
+
+def _clip(name, duration):
+    return otio.schema.Clip(
+        name=name,
+        source_range=otio.opentime.TimeRange(_rt(0), _rt(duration))
+    )
+
+
+def _make_track():
+    track = otio.schema.Track()
+    for i in range(5):
+        track.append(_clip("clip {}".format(i), 24))
+    return track
+
+
+class EditTransactionTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def test_commit(self):
+        track = _make_track()
+        with otio.algorithms.EditTransaction(track) as transaction:
+            self.assertTrue(transaction.is_open)
+            self.assertIs(transaction.track, track)
+            transaction.overwrite(
+                _clip("over", 12),
+                otio.opentime.TimeRange(_rt(30), _rt(12))
+            )
+            transaction.insert(_clip("insert", 6), _rt(0))
+            transaction.remove(_rt(100), fill=False)
+        self.assertFalse(transaction.is_open)
+
+        self.assertEqual(
+            [child.name for child in track],
+            ["insert", "clip 0", "clip 1", "over", "clip 1", "clip 2",
+             "clip 4"]
+        )
+        self.assertEqual(track.duration(), _rt(102))
+        self.assertEqual(
+            track.range_of_child_at_index(3),
+            otio.opentime.TimeRange(_rt(36), _rt(12))
+        )
+
+    def test_slice_remove_fill(self):
+        track = _make_track()
+        with otio.algorithms.EditTransaction(track) as transaction:
+            transaction.slice(_rt(36))
+            transaction.remove(_rt(30))
+            transaction.fill(
+                _clip("fill", 48),
+                _rt(26),
+                otio.algorithms.ReferencePoint.Sequence
+            )
+
+        self.assertEqual(
+            [(child.schema_name(), child.name) for child in track],
+            [("Clip", "clip 0"), ("Gap", ""), ("Clip", "fill"),
+             ("Clip", "clip 1"), ("Clip", "clip 2"), ("Clip", "clip 3"),
+             ("Clip", "clip 4")]
+        )
+        self.assertEqual(
+            track.range_of_child_at_index(2),
+            otio.opentime.TimeRange(_rt(26), _rt(10))
+        )
+        self.assertEqual(track.duration(), _rt(120))
+
+    def test_rollback_on_error(self):
+        track = _make_track()
+        original = track.deepcopy()
+        with self.assertRaises(RuntimeError):
+            with otio.algorithms.EditTransaction(track) as transaction:
+                transaction.insert(_clip("insert", 6), _rt(30))
+                transaction.trim(track[0], _rt(0), _rt(-12))
+                raise RuntimeError("abort the edits")
+        self.assertFalse(transaction.is_open)
+        self.assertIsOTIOEquivalentTo(track, original)
+
+    def test_not_a_child(self):
+        track = _make_track()
+        transaction = otio.algorithms.EditTransaction(track)
+        with self.assertRaises(otio.exceptions.NotAChildError):
+            transaction.trim(_clip("orphan", 24), _rt(0), _rt(-1))
+
+        transaction.rollback()
+        with self.assertRaises(ValueError):
+            transaction.slice(_rt(12))
+
+
+class EditJournalTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def test_undo_redo(self):
+        track = _make_track()
+        original = track.deepcopy()
+        journal = otio.core.EditJournal()
+
+        with journal.record():
+            self.assertTrue(otio.core.EditJournal.is_recording())
+            track.append(_clip("appended", 12))
+            del track[0]
+            track[1].source_range = otio.opentime.TimeRange(_rt(4), _rt(8))
+        self.assertFalse(otio.core.EditJournal.is_recording())
+        first_step = track.deepcopy()
+
+        with journal.record():
+            with otio.algorithms.EditTransaction(track) as transaction:
+                transaction.overwrite(
+                    _clip("over", 12),
+                    otio.opentime.TimeRange(_rt(30), _rt(12))
+                )
+        second_step = track.deepcopy()
+        self.assertEqual(journal.undo_count, 2)
+
+        self.assertTrue(journal.undo())
+        self.assertIsOTIOEquivalentTo(track, first_step)
+        self.assertTrue(journal.undo())
+        self.assertIsOTIOEquivalentTo(track, original)
+        self.assertFalse(journal.undo())
+        self.assertEqual(journal.redo_count, 2)
+
+        self.assertTrue(journal.redo())
+        self.assertTrue(journal.redo())
+        self.assertIsOTIOEquivalentTo(track, second_step)
+        self.assertFalse(journal.redo())
+
+    def test_max_steps(self):
+        track = _make_track()
+        journal = otio.core.EditJournal(max_steps=2)
+        for i in range(4):
+            with journal.record():
+                track.append(_clip("appended {}".format(i), 12))
+        self.assertEqual(journal.undo_count, 2)
+
+        journal.max_steps = 1
+        self.assertEqual(journal.undo_count, 1)
+        journal.undo()
+        self.assertEqual(len(track), 8)
+
+        journal.clear()
+        self.assertEqual(journal.redo_count, 0)
+
+    def test_step_no_longer_applies(self):
+        track = _make_track()
+        journal = otio.core.EditJournal()
+        with journal.record():
+            track.append(_clip("appended", 12))
+        track.clear()
+
+        with self.assertRaises(otio.exceptions.NotAChildError):
+            journal.undo()
+        self.assertEqual(len(track), 0)
+        self.assertEqual(journal.undo_count, 1)
+
+    def test_destroyed_composition_is_not_recorded(self):
+        journal = otio.core.EditJournal()
+        track = _make_track()
+        with journal.record():
+            otio.schema.Track()
+            del track
+        self.assertEqual(journal.undo_count, 0)
+
+        # a journal replaced while it holds a step
+        track = _make_track()
+        with journal.record():
+            track.append(_clip("appended", 12))
+        journal = otio.core.EditJournal()
+        with journal.record():
+            with otio.algorithms.EditTransaction(track) as transaction:
+                transaction.overwrite(
+                    _clip("over", 12),
+                    otio.opentime.TimeRange(_rt(30), _rt(12))
+                )
+        self.assertEqual(journal.undo_count, 1)
+        self.assertTrue(journal.undo())
+        self.assertEqual(len(track), 6)
+
+    def test_exit_out_of_order(self):
+        track = _make_track()
+        journal = otio.core.EditJournal()
+        outer = journal.record()
+        inner = journal.record()
+
+        outer.__enter__()
+        inner.__enter__()
+        track.append(_clip("appended", 12))
+        with self.assertRaises(RuntimeError):
+            outer.__exit__(None, None, None)
+        self.assertTrue(otio.core.EditJournal.is_recording())
+
+        inner.__exit__(None, None, None)
+        outer.__exit__(None, None, None)
+        self.assertFalse(otio.core.EditJournal.is_recording())
+        self.assertEqual(journal.undo_count, 1)
+
+    def test_exit_on_other_thread(self):
+        journal = otio.core.EditJournal()
+        recording = journal.record()
+        recording.__enter__()
+
+        errors = []
+
+        def exit_recording():
+            try:
+                recording.__exit__(None, None, None)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=exit_recording)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(otio.core.EditJournal.is_recording())
+
+        recording.__exit__(None, None, None)
+        self.assertFalse(otio.core.EditJournal.is_recording())
+
+
+if __name__ == '__main__':
+    unittest.main()
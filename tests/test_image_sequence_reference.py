@@ -326,6 +326,53 @@ class ImageSequenceReferenceTests(
             "file:///show/seq/shot/rndr/show_shot.0001.exr"
         )
 
+    def test_target_urls_for_image_range(self):
+        ref = otio.schema.ImageSequenceReference(
+            "file:///show/seq/shot/rndr",
+            "show_shot.",
+            ".exr",
+            frame_zero_padding=4,
+            available_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(0, 24),
+                otio.opentime.RationalTime(48, 24),
+            ),
+            start_frame=-3,
+            frame_step=1,
+            rate=24,
+        )
+
+        count = ref.number_of_images_in_sequence()
+        self.assertEqual(
+            ref.target_urls_for_image_range(0, count),
+            [ref.target_url_for_image_number(i) for i in range(count)]
+        )
+        self.assertEqual(
+            ref.target_urls_for_image_range(2, 3),
+            [
+                "file:///show/seq/shot/rndr/show_shot.-0001.exr",
+                "file:///show/seq/shot/rndr/show_shot.0000.exr",
+                "file:///show/seq/shot/rndr/show_shot.0001.exr",
+            ]
+        )
+        self.assertEqual(ref.target_urls_for_image_range(0, 0), [])
+
+        ref.frame_step = 2
+        ref.frame_zero_padding = 0
+        self.assertEqual(
+            ref.target_urls_for_image_range(10, 3),
+            [ref.target_url_for_image_number(i) for i in range(10, 13)]
+        )
+
+        with self.assertRaises(IndexError):
+            ref.target_urls_for_image_range(20, 10)
+        with self.assertRaises(IndexError):
+            ref.target_urls_for_image_range(0, -1)
+        # the last image number of these ranges does not fit in an int
+        with self.assertRaises(IndexError):
+            ref.target_urls_for_image_range(2, 2 ** 31 - 1)
+        with self.assertRaises(IndexError):
+            ref.target_urls_for_image_range(2 ** 31 - 1, 2)
+
     def test_abstract_target_url(self):
         ref = otio.schema.ImageSequenceReference(
             "file:///show/seq/shot/rndr/",
@@ -498,6 +545,36 @@ class ImageSequenceReferenceTests(
             ref.frame_for_time(otio.opentime.RationalTime(118, 48)), 48
         )
 
+    def test_frames_for_times(self):
+        ref = otio.schema.ImageSequenceReference(
+            "file:///show/seq/shot/rndr/",
+            "show_shot.",
+            ".exr",
+            frame_zero_padding=4,
+            available_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(12, 24),
+                otio.opentime.RationalTime(48, 24),
+            ),
+            start_frame=1,
+            frame_step=1,
+            rate=24,
+        )
+
+        times = [
+            ref.available_range.start_time,
+            otio.opentime.RationalTime(15, 24),
+            otio.opentime.RationalTime(118, 48),
+            ref.available_range.end_time_inclusive(),
+        ]
+        self.assertEqual(
+            ref.frames_for_times(times),
+            [ref.frame_for_time(time) for time in times]
+        )
+        self.assertEqual(ref.frames_for_times([]), [])
+
+        with self.assertRaises(ValueError):
+            ref.frames_for_times(times + [otio.opentime.RationalTime(0, 24)])
+
     def test_frame_for_time_out_of_range(self):
         ref = otio.schema.ImageSequenceReference(
             "file:///show/seq/shot/rndr/",
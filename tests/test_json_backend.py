@@ -4,7 +4,14 @@
 """Unit tests for the JSON format OTIO Serializes to."""
 
 import unittest
+import gzip
+import io
 import json
+import mmap
+import os
+import socket
+import tempfile
+from concurrent import futures
 
 import opentimelineio as otio
 import opentimelineio.test_utils as otio_test_utils
@@ -128,5 +135,418 @@ class TestJsonFormat(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.check_against_baseline(trx, "empty_generator_reference")
 
 
+class TestJsonStream(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def setUp(self):
+        self.tl = otio.schema.Timeline(name="stream")
+        track = otio.schema.Track()
+        self.tl.tracks.append(track)
+        for i in range(10):
+            track.append(
+                otio.schema.Clip(
+                    name=f"clip {i} \u00e9",
+                    metadata={"index": i},
+                )
+            )
+
+    def test_bytes_and_text_streams(self):
+        text = otio.adapters.otio_json.write_to_string(self.tl)
+
+        for stream in (
+            io.BytesIO(text.encode("utf-8")),
+            io.StringIO(text),
+        ):
+            for chunk_size in (1, 7, 65536):
+                stream.seek(0)
+                result = otio.core.deserialize_json_from_stream(
+                    stream,
+                    chunk_size=chunk_size
+                )
+                self.assertJsonEqual(result, self.tl)
+
+    def test_bytes_like_input(self):
+        text = otio.adapters.otio_json.write_to_string(self.tl)
+        data = text.encode("utf-8")
+
+        with tempfile.TemporaryFile() as f:
+            f.write(data)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for input in (
+                    data,
+                    bytearray(data),
+                    memoryview(b"[" + data + b"]")[1:-1],
+                    mapped,
+                ):
+                    result = otio.core.deserialize_json_from_string(input)
+                    self.assertJsonEqual(result, self.tl)
+
+        # the end of the buffer is the end of the input
+        with self.assertRaises(ValueError):
+            otio.core.deserialize_json_from_string(memoryview(data)[:-1])
+        with self.assertRaises(TypeError):
+            otio.core.deserialize_json_from_string(1)
+
+    def test_bytes_like_input_released_on_error(self):
+        @otio.core.register_type
+        class BrokenUpgrade(otio.core.SerializableObject):
+            _serializable_label = "BrokenUpgrade.2"
+
+        @otio.core.upgrade_function_for(BrokenUpgrade, 2)
+        def upgrade_one_to_two(_data_dict):
+            raise RuntimeError("broken upgrade")
+
+        data = bytearray(b'{"OTIO_SCHEMA": "BrokenUpgrade.1"}')
+        with self.assertRaisesRegex(RuntimeError, "broken upgrade"):
+            otio.core.deserialize_json_from_string(data)
+
+        # the buffer is no longer exported, so the bytearray can be resized
+        data.extend(b" ")
+        del data[-1:]
+
+    def test_parse_error(self):
+        with self.assertRaises(ValueError):
+            otio.core.deserialize_json_from_stream(io.BytesIO(b'{"OTIO_SCHEMA'))
+
+    def test_read_error(self):
+        class BrokenStream:
+            def read(self, size):
+                raise OSError("broken stream")
+
+        with self.assertRaisesRegex(OSError, "broken stream"):
+            otio.core.deserialize_json_from_stream(BrokenStream())
+
+    def test_write_to_streams(self):
+        text = otio.adapters.otio_json.write_to_string(self.tl)
+
+        for chunk_size in (1, 7, 65536):
+            stream = io.BytesIO()
+            self.assertTrue(
+                otio.core.serialize_json_to_stream(
+                    self.tl,
+                    stream,
+                    chunk_size=chunk_size
+                )
+            )
+            self.assertEqual(stream.getvalue().decode("utf-8"), text)
+
+            # multi-byte characters are not split between str chunks
+            stream = io.StringIO()
+            otio.core.serialize_json_to_stream(
+                self.tl,
+                stream,
+                chunk_size=chunk_size
+            )
+            self.assertEqual(stream.getvalue(), text)
+
+        stream = io.BytesIO()
+        with gzip.GzipFile(fileobj=stream, mode="wb") as compressed:
+            otio.core.serialize_json_to_stream(self.tl, compressed, indent=-1)
+        self.assertEqual(
+            gzip.decompress(stream.getvalue()).decode("utf-8"),
+            otio.core.serialize_json_to_string(self.tl, indent=-1)
+        )
+
+    def test_write_to_socket(self):
+        sender, receiver = socket.socketpair()
+        with sender, receiver, receiver.makefile("rb") as stream:
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(
+                    otio.core.deserialize_json_from_stream,
+                    stream
+                )
+                otio.core.serialize_json_to_stream(self.tl, sender)
+                sender.shutdown(socket.SHUT_WR)
+                self.assertJsonEqual(result.result(), self.tl)
+
+    def test_write_error(self):
+        class BrokenStream:
+            def write(self, data):
+                raise OSError("broken stream")
+
+        with self.assertRaisesRegex(OSError, "broken stream"):
+            otio.core.serialize_json_to_stream(
+                self.tl,
+                BrokenStream(),
+                chunk_size=16
+            )
+
+
+class TestJsonLazyMetadata(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def setUp(self):
+        self.tl = otio.schema.Timeline(name="lazy")
+        track = otio.schema.Track()
+        self.tl.tracks.append(track)
+        for i in range(3):
+            track.append(
+                otio.schema.Clip(
+                    name=f"clip {i}",
+                    metadata={
+                        "studio": {"index": i, "tags": ["a", "b"]},
+                        "empty": {},
+                    },
+                )
+            )
+        # schema objects in metadata are decoded along with the file
+        track[2].metadata["studio"]["time"] = otio.opentime.RationalTime(
+            1,
+            24
+        )
+
+        # write the metadata in a way the serializer would not
+        self.text = otio.adapters.otio_json.write_to_string(
+            self.tl
+        ).replace('"tags": [', '"tags":  [')
+
+    def test_untouched_metadata_is_written_verbatim(self):
+        for result in (
+            otio.core.deserialize_json_from_string(
+                self.text,
+                lazy_metadata=True
+            ),
+            otio.core.deserialize_json_from_stream(
+                io.StringIO(self.text),
+                lazy_metadata=True
+            ),
+            otio.adapters.read_from_string(
+                self.text,
+                "otio_json",
+                lazy_metadata=True
+            ),
+        ):
+            output = otio.adapters.otio_json.write_to_string(result)
+            self.assertEqual(output.count('"tags":  ['), 2)
+            self.assertIsOTIOEquivalentTo(result, self.tl)
+
+    def test_access_decodes_metadata(self):
+        result = otio.core.deserialize_json_from_string(
+            self.text,
+            lazy_metadata=True
+        )
+        clips = result.find_clips()
+        self.assertEqual(clips[0].metadata["studio"]["index"], 0)
+        self.assertEqual(
+            clips[2].metadata["studio"]["time"],
+            otio.opentime.RationalTime(1, 24)
+        )
+
+        # metadata accessed from python may have been modified, so it is
+        # written out again
+        clips[0].metadata["studio"]["index"] = 10
+        output = otio.adapters.otio_json.write_to_string(result)
+        self.assertEqual(output.count('"tags":  ['), 1)
+        self.assertEqual(clips[1].metadata["studio"]["index"], 1)
+        result = otio.adapters.otio_json.read_from_string(output)
+        self.assertEqual(
+            result.find_clips()[0].metadata["studio"]["index"],
+            10
+        )
+
+
+class TestJsonLazyChildren(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def setUp(self):
+        self.tl = otio.schema.Timeline(name="lazy")
+        for t in range(3):
+            track = otio.schema.Track(name=f"track {t}")
+            self.tl.tracks.append(track)
+            for i in range(2):
+                track.append(
+                    otio.schema.Clip(
+                        name=f"clip {t} {i}",
+                        metadata={"note": "[{\"brackets\" in strings}]"},
+                        source_range=otio.opentime.TimeRange(
+                            duration=otio.opentime.RationalTime(10, 24)
+                        ),
+                    )
+                )
+        self.tl.tracks[1].append(otio.schema.Stack(name="nested"))
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "lazy.otio")
+        otio.adapters.write_to_file(self.tl, self.path)
+
+    def test_children_are_read_on_access(self):
+        result = otio.adapters.read_from_file(self.path, lazy_children=True)
+        self.assertFalse(result.tracks.is_materialized)
+
+        track = result.tracks[1]
+        self.assertTrue(result.tracks.is_materialized)
+        self.assertFalse(track.is_materialized)
+        self.assertFalse(result.tracks[0].is_materialized)
+        self.assertEqual(track[0].name, "clip 1 0")
+        self.assertIs(track[0].parent(), track)
+        self.assertTrue(track.is_materialized)
+        self.assertFalse(track[2].is_materialized)
+        self.assertEqual(
+            track.duration(),
+            otio.opentime.RationalTime(20, 24)
+        )
+
+        self.assertIsOTIOEquivalentTo(result, self.tl)
+
+    def test_dematerialize(self):
+        result = otio.adapters.read_from_file(self.path, lazy_children=True)
+        track = result.tracks[0]
+        track.materialize()
+        clip = track[0]
+        clip.name = "changed"
+        self.assertTrue(track.dematerialize())
+        self.assertFalse(track.is_materialized)
+        self.assertIsNone(clip.parent())
+        self.assertEqual(track[0].name, "clip 0 0")
+
+        # once the list of children is modified they stay in memory
+        del track[0]
+        self.assertFalse(track.dematerialize())
+        self.assertEqual(len(track), 1)
+        self.assertFalse(self.tl.tracks[0].dematerialize())
+
+    def test_changed_file(self):
+        result = otio.adapters.read_from_file(self.path, lazy_children=True)
+        tracks = result.tracks
+        with open(self.path, "w") as f:
+            f.write("{}")
+        with self.assertRaises(ValueError):
+            tracks.materialize()
+
+        # the composition is not presented as empty
+        with self.assertRaises(ValueError):
+            len(tracks)
+        with self.assertRaises(ValueError):
+            list(tracks)
+        with self.assertRaises(ValueError):
+            otio.adapters.write_to_string(result)
+        self.assertFalse(tracks.is_materialized)
+
+    def test_save_in_place(self):
+        result = otio.adapters.read_from_file(self.path, lazy_children=True)
+        result.name = "changed"
+        otio.adapters.write_to_file(result, self.path)
+
+        self.assertEqual(len(result.tracks), 3)
+        self.tl.name = "changed"
+        self.assertIsOTIOEquivalentTo(result, self.tl)
+        self.assertIsOTIOEquivalentTo(
+            otio.adapters.read_from_file(self.path),
+            self.tl
+        )
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["lazy.otio"])
+
+
+class TestJsonIndex(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def setUp(self):
+        self.tl = otio.schema.Timeline(name="indexed")
+        for t in range(2):
+            track = otio.schema.Track(name=f"track {t}")
+            self.tl.tracks.append(track)
+            for i in range(3):
+                track.append(
+                    otio.schema.Clip(
+                        name=f"clip {t} {i}",
+                        metadata={"\u00e9": "{not an object}"},
+                        source_range=otio.opentime.TimeRange(
+                            duration=otio.opentime.RationalTime(10, 24)
+                        ),
+                    )
+                )
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "indexed.otio")
+
+    def test_index(self):
+        otio.adapters.write_to_file(self.tl, self.path, write_index=True)
+        self.assertTrue(os.path.exists(self.path + ".idx"))
+
+        index = otio.adapters.otio_json.read_index(self.path)
+        self.assertEqual(index["schema"], "Timeline.1")
+        self.assertEqual(index["name"], "indexed")
+        self.assertEqual(index["track_count"], 2)
+        self.assertEqual(index["clip_count"], 6)
+        self.assertEqual(index["duration"], {"value": 30.0, "rate": 24.0})
+        self.assertEqual(
+            [e["path"] for e in index["objects"]],
+            [[0], [0, 0], [0, 1], [0, 2], [1], [1, 0], [1, 1], [1, 2]]
+        )
+
+        for path in ([1], [0, 2]):
+            result = otio.adapters.otio_json.read_indexed_object(
+                self.path,
+                path
+            )
+            expected = self.tl.tracks
+            for i in path:
+                expected = expected[i]
+            self.assertIsOTIOEquivalentTo(result, expected)
+
+        with self.assertRaises(IndexError):
+            otio.adapters.otio_json.read_indexed_object(self.path, [2])
+
+    def test_stale_index(self):
+        self.assertIsNone(otio.adapters.otio_json.read_index(self.path))
+
+        otio.adapters.write_to_file(self.tl, self.path, write_index=True)
+        self.tl.tracks[0].name = "renamed track"
+        otio.adapters.write_to_file(self.tl, self.path)
+        self.assertIsNone(otio.adapters.otio_json.read_index(self.path))
+        with self.assertRaises(otio.exceptions.CouldNotReadFileError):
+            otio.adapters.otio_json.read_indexed_object(self.path, [0])
+
+    def test_index_downgraded_schemas(self):
+        otio.adapters.write_to_file(
+            self.tl,
+            self.path,
+            target_schema_versions={"Clip": 1},
+            write_index=True
+        )
+        index = otio.adapters.otio_json.read_index(self.path)
+        self.assertEqual(index["schema"], "Timeline.1")
+        self.assertEqual(
+            [e["schema"] for e in index["objects"]],
+            ["Track.1", "Clip.1", "Clip.1", "Clip.1"] * 2
+        )
+        self.assertEqual(
+            otio.adapters.otio_json.read_indexed_object(
+                self.path,
+                [0, 1]
+            ).name,
+            "clip 0 1"
+        )
+
+    def test_stack_index(self):
+        otio.adapters.write_to_file(
+            self.tl.tracks,
+            self.path,
+            write_index=True
+        )
+        index = otio.adapters.otio_json.read_index(self.path)
+        self.assertEqual(index["schema"], "Stack.1")
+        self.assertEqual(index["track_count"], 2)
+        self.assertEqual(index["clip_count"], 6)
+        self.assertEqual(index["duration"], {"value": 30.0, "rate": 24.0})
+        self.assertEqual(
+            [e["path"] for e in index["objects"]],
+            [[0], [0, 0], [0, 1], [0, 2], [1], [1, 0], [1, 1], [1, 2]]
+        )
+
+    def test_not_a_timeline(self):
+        otio.adapters.write_to_file(
+            self.tl.tracks[0],
+            self.path,
+            write_index=True
+        )
+        index = otio.adapters.otio_json.read_index(self.path)
+        self.assertEqual(index["track_count"], 0)
+        self.assertIsNone(index["duration"])
+        self.assertEqual(
+            [e["path"] for e in index["objects"]],
+            [[0], [1], [2]]
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Test file for the media algorithms library."""
+
+import os
+import tempfile
+import unittest
+
+import opentimelineio as otio
+
+
+class VerifyMediaTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = self.tmpdir.name
+
+        os.mkdir(os.path.join(self.root, "frames"))
+        for frame in list(range(1001, 1005)) + list(range(1007, 1010)):
+            self._touch("frames", f"shot.{frame:04}.exr")
+        self._touch("movie.mov")
+
+        self.timeline = otio.schema.Timeline()
+        track = otio.schema.Track()
+        self.timeline.tracks.append(track)
+
+        self.movie = otio.schema.Clip(
+            name="movie",
+            media_reference=otio.schema.ExternalReference(
+                otio.url_utils.url_from_filepath(
+                    os.path.join(self.root, "movie.mov")
+                )
+            )
+        )
+        self.missing_movie = otio.schema.Clip(
+            name="missing movie",
+            media_reference=otio.schema.ExternalReference(
+                os.path.join(self.root, "missing.mov")
+            )
+        )
+        self.frames = otio.schema.Clip(
+            name="frames",
+            media_reference=otio.schema.ImageSequenceReference(
+                otio.url_utils.url_from_filepath(
+                    os.path.join(self.root, "frames")
+                ),
+                "shot.",
+                ".exr",
+                start_frame=1001,
+                rate=24,
+                frame_zero_padding=4,
+                available_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(0, 24),
+                    otio.opentime.RationalTime(10, 24),
+                ),
+            )
+        )
+        self.remote = otio.schema.Clip(
+            name="remote",
+            media_reference=otio.schema.ExternalReference(
+                "https://example.com/movie.mov"
+            )
+        )
+        for clip in (self.movie, self.missing_movie, self.frames,
+                     self.remote, otio.schema.Clip(name="no media")):
+            track.append(clip)
+
+    def _touch(self, *parts):
+        with open(os.path.join(self.root, *parts), "w"):
+            pass
+
+    def test_verify_media(self):
+        missing = otio.algorithms.verify_media(self.timeline, workers=2)
+        self.assertEqual(
+            missing,
+            {
+                self.missing_movie: None,
+                self.frames: [(1005, 1006), (1010, 1010)],
+            }
+        )
+
+    def test_report_unchecked(self):
+        no_range = otio.schema.Clip(
+            name="no range",
+            media_reference=otio.schema.ImageSequenceReference(
+                otio.url_utils.url_from_filepath(
+                    os.path.join(self.root, "frames")
+                ),
+                "shot.",
+                ".exr",
+            )
+        )
+        self.timeline.tracks[0].append(no_range)
+        no_media = self.timeline.tracks[0][4]
+
+        missing = otio.algorithms.verify_media(self.timeline)
+        self.assertNotIn(no_range, missing)
+
+        missing = otio.algorithms.verify_media(
+            self.timeline,
+            report_unchecked=True
+        )
+        not_checked = otio.algorithms.media_algo.NOT_CHECKED
+        self.assertEqual(
+            missing,
+            {
+                self.missing_movie: None,
+                self.frames: [(1005, 1006), (1010, 1010)],
+                self.remote: not_checked,
+                no_media: not_checked,
+                no_range: not_checked,
+            }
+        )
+
+    def test_frame_step(self):
+        self.frames.media_reference.frame_step = 2
+        missing = otio.algorithms.verify_media(self.timeline)
+        self.assertEqual(missing[self.frames], [(1005, 1005)])
+
+    def test_cached_listings(self):
+        otio.algorithms.verify_media(self.timeline)
+        self._touch("missing.mov")
+        self._touch("frames", "shot.1010.exr")
+
+        missing = otio.algorithms.verify_media(self.timeline)
+        self.assertIn(self.missing_movie, missing)
+        self.assertEqual(missing[self.frames], [(1005, 1006), (1010, 1010)])
+
+        missing = otio.algorithms.verify_media(self.timeline, refresh=True)
+        self.assertNotIn(self.missing_movie, missing)
+        self.assertEqual(missing[self.frames], [(1005, 1006)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -101,6 +101,48 @@ class OTIODTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
         for fname, count in known_files.items():
             self.assertEqual(len(manifest[fname]), count)
 
+    def test_relink_plan(self):
+        before = otio.adapters.write_to_string(self.tl)
+        references = [cl.media_reference for cl in self.tl.find_clips()]
+
+        plan = file_bundle_utils._relink_plan(
+            input_otio=self.tl,
+            media_policy=file_bundle_utils.MediaReferencePolicy.ErrorIfNotFile,
+            adapter_name="TEST_NAME",
+            workers=2,
+        )
+
+        # the plan is computed without touching the input
+        self.assertEqual(otio.adapters.write_to_string(self.tl), before)
+        self.assertEqual(
+            {f: len(mrs) for f, mrs in plan.path_to_reference_map.items()},
+            {
+                MEDIA_EXAMPLE_PATH_ABS: 5,
+                os.path.abspath(MEDIA_EXAMPLE_PATH_REL): 4
+            }
+        )
+        for mrs in plan.path_to_reference_map.values():
+            for mr in mrs:
+                self.assertFalse(any(mr is ref for ref in references))
+
+        with plan.applied():
+            for cl in self.tl.find_clips():
+                cl.media_reference.target_url = "bundled"
+            self.assertNotEqual(otio.adapters.write_to_string(self.tl), before)
+
+        self.assertEqual(otio.adapters.write_to_string(self.tl), before)
+        for cl, mr in zip(self.tl.find_clips(), references):
+            self.assertIs(cl.media_reference, mr)
+
+    def test_input_is_not_modified(self):
+        before = otio.adapters.write_to_string(self.tl)
+
+        with tempfile.NamedTemporaryFile(suffix=".otiod") as bogusfile:
+            tmp_path = bogusfile.name
+        otio.adapters.write_to_file(self.tl, tmp_path)
+
+        self.assertEqual(otio.adapters.write_to_string(self.tl), before)
+
     def test_round_trip(self):
         with tempfile.NamedTemporaryFile(suffix=".otiod") as bogusfile:
             tmp_path = bogusfile.name
@@ -187,6 +229,89 @@ class OTIODTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
         self.assertJsonEqual(result, self.tl)
 
+    def test_existing_bundle(self):
+        tmp_path = tempfile.mkdtemp(suffix=".otiod")
+        with self.assertRaises(otio.exceptions.OTIOError):
+            otio.adapters.write_to_file(self.tl, tmp_path)
+
+    def test_incremental(self):
+        with tempfile.NamedTemporaryFile(suffix=".otiod") as bogusfile:
+            tmp_path = bogusfile.name
+        otio.adapters.write_to_file(self.tl, tmp_path, workers=2)
+
+        media_dir = os.path.join(
+            tmp_path,
+            otio.adapters.file_bundle_utils.BUNDLE_DIR_NAME
+        )
+        before = {
+            fn: os.stat(os.path.join(media_dir, fn)).st_ino
+            for fn in os.listdir(media_dir)
+        }
+        self.assertEqual(len(before), 2)
+
+        # source mtimes are preserved, so an update copies nothing
+        self.tl.name = "updated"
+        copied = []
+        copy_fn = file_bundle_utils._copy_media_file
+
+        def counting_copy(src, *args):
+            result = copy_fn(src, *args)
+            if result:
+                copied.append(src)
+            return result
+
+        file_bundle_utils._copy_media_file = counting_copy
+        try:
+            otio.adapters.write_to_file(
+                self.tl,
+                tmp_path,
+                skip_existing=(
+                    file_bundle_utils.SkipExistingPolicy.SizeAndMtimeMatch
+                )
+            )
+
+            # a changed file in the bundle is copied again
+            with open(os.path.join(media_dir, sorted(before)[0]), "r+b") as fo:
+                fo.write(b"x")
+            otio.adapters.write_to_file(
+                self.tl,
+                tmp_path,
+                skip_existing=file_bundle_utils.SkipExistingPolicy.ChecksumMatches
+            )
+        finally:
+            file_bundle_utils._copy_media_file = copy_fn
+
+        self.assertEqual(len(copied), 1)
+        self.assertEqual(
+            otio.adapters.read_from_file(tmp_path).name,
+            "updated"
+        )
+        self.assertEqual(
+            before[sorted(before)[1]],
+            os.stat(os.path.join(media_dir, sorted(before)[1])).st_ino
+        )
+
+    def test_link_policies(self):
+        for policy in (
+            file_bundle_utils.MediaLinkPolicy.Hardlink,
+            file_bundle_utils.MediaLinkPolicy.Reflink,
+        ):
+            with tempfile.NamedTemporaryFile(suffix=".otiod") as bogusfile:
+                tmp_path = bogusfile.name
+            otio.adapters.write_to_file(self.tl, tmp_path, link_policy=policy)
+
+            # whether or not the filesystem supports linking, the bundle
+            # contains the media
+            bundled = os.path.join(
+                tmp_path,
+                file_bundle_utils.BUNDLE_DIR_NAME,
+                os.path.basename(MEDIA_EXAMPLE_PATH_ABS)
+            )
+            with open(bundled, "rb") as fi, open(
+                MEDIA_EXAMPLE_PATH_ABS, "rb"
+            ) as src:
+                self.assertEqual(fi.read(), src.read())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ import tempfile
 import shutil
 
 import urllib.parse as urlparse
+import zipfile
 
 import opentimelineio as otio
 import opentimelineio.test_utils as otio_test_utils
@@ -246,6 +247,89 @@ class OTIOZTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
             )
             self.assertIn("original_target_url", cl.media_reference.metadata)
 
+    def test_incremental(self):
+        with tempfile.NamedTemporaryFile(suffix=".otioz") as bogusfile:
+            tmp_path = bogusfile.name
+        otio.adapters.write_to_file(self.tl, tmp_path, workers=1)
+
+        with zipfile.ZipFile(tmp_path) as zi:
+            before = {i.filename: zi.read(i) for i in zi.infolist()}
+
+        # can't write over an existing bundle by default
+        with self.assertRaises(otio.exceptions.OTIOError):
+            otio.adapters.write_to_file(self.tl, tmp_path)
+
+        policies = otio.adapters.file_bundle_utils.SkipExistingPolicy
+        for policy in (
+            policies.SizeMatches,
+            policies.SizeAndMtimeMatch,
+            policies.ChecksumMatches,
+        ):
+            self.tl.name = policy
+            otio.adapters.write_to_file(
+                self.tl,
+                tmp_path,
+                workers=4,
+                skip_existing=policy
+            )
+
+            with zipfile.ZipFile(tmp_path) as zi:
+                self.assertIsNone(zi.testzip())
+                after = {i.filename: zi.read(i) for i in zi.infolist()}
+
+            self.assertEqual(sorted(before), sorted(after))
+            for name, data in before.items():
+                if name != otio.adapters.file_bundle_utils.BUNDLE_PLAYLIST_PATH:
+                    self.assertEqual(data, after[name])
+
+            self.assertEqual(otio.adapters.read_from_file(tmp_path).name, policy)
+
+    def test_media_extractors(self):
+        with tempfile.NamedTemporaryFile(suffix=".otioz") as bogusfile:
+            tmp_path = bogusfile.name
+        otio.adapters.write_to_file(self.tl, tmp_path)
+
+        result = otio.adapters.read_from_file(tmp_path)
+        clip = result.find_clips()[0]
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            otioz = otio.adapters.from_name("otioz").module()
+            with otioz.media_extractors(tmp_path) as media:
+                self.assertEqual(
+                    sorted(media),
+                    sorted([
+                        "media/" + os.path.basename(MEDIA_EXAMPLE_PATH_ABS),
+                        "media/" + os.path.basename(MEDIA_EXAMPLE_PATH_REL),
+                    ])
+                )
+
+                extractor = media.for_reference(clip.media_reference)
+                with open(
+                    os.path.join(
+                        SAMPLE_DATA_DIR,
+                        os.path.basename(extractor.bundle_path)
+                    ),
+                    "rb"
+                ) as fi:
+                    source = fi.read()
+
+                self.assertEqual(extractor.file_size, len(source))
+                with extractor.open() as fi:
+                    self.assertEqual(fi.read(), source)
+
+                extracted = extractor.extract(tempdir)
+
+            # only the requested media was extracted
+            self.assertEqual(
+                os.listdir(os.path.join(tempdir, "media")),
+                [os.path.basename(extractor.bundle_path)]
+            )
+            with open(extracted, "rb") as fi:
+                self.assertEqual(fi.read(), source)
+        finally:
+            shutil.rmtree(tempdir)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Tests for the on-disk read cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import opentimelineio as otio
+import opentimelineio.test_utils as otio_test_utils
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+SCREENING_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "screening_example.otio")
+MULTITRACK_PATH = os.path.join(SAMPLE_DATA_DIR, "multitrack.otio")
+
+read_cache = otio.adapters.read_cache
+
+
+class ReadCacheTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="otio_read_cache")
+        self.cache_dir = os.path.join(self.tmpdir, "cache")
+        self.path = os.path.join(self.tmpdir, "test.otio")
+        shutil.copy(SCREENING_EXAMPLE_PATH, self.path)
+
+        self.env_patch = mock.patch.dict(
+            os.environ,
+            {read_cache.CACHE_DIR_ENVVAR: self.cache_dir}
+        )
+        self.env_patch.start()
+
+        self.read_patch = mock.patch.object(
+            otio.adapters.Adapter,
+            "read_from_file",
+            autospec=True,
+            side_effect=otio.adapters.Adapter.read_from_file,
+        )
+        self.adapter_read = self.read_patch.start()
+
+    def tearDown(self):
+        self.read_patch.stop()
+        self.env_patch.stop()
+        shutil.rmtree(self.tmpdir)
+
+    def snapshots(self):
+        return [f for f in os.listdir(self.cache_dir) if f.endswith(".otio")]
+
+    def test_disabled_by_default(self):
+        with mock.patch.dict(os.environ, {read_cache.CACHE_DIR_ENVVAR: ""}):
+            otio.adapters.read_from_file(self.path)
+            otio.adapters.read_from_file(self.path)
+
+        self.assertEqual(self.adapter_read.call_count, 2)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_hit(self):
+        first = otio.adapters.read_from_file(self.path)
+        second = otio.adapters.read_from_file(self.path)
+
+        self.assertEqual(self.adapter_read.call_count, 1)
+        self.assertEqual(len(self.snapshots()), 1)
+        self.assertIsNot(first, second)
+        self.assertJsonEqual(first, second)
+
+    def test_arguments_are_part_of_the_key(self):
+        otio.adapters.read_from_file(self.path)
+        otio.adapters.read_from_file(
+            self.path,
+            media_linker_name=otio.media_linker.MediaLinkingPolicy.DoNotLinkMedia
+        )
+
+        self.assertEqual(self.adapter_read.call_count, 2)
+        self.assertEqual(len(self.snapshots()), 2)
+
+    def test_content_validation(self):
+        otio.adapters.read_from_file(self.path)
+
+        # same contents under another name are a hit
+        other = os.path.join(self.tmpdir, "other.otio")
+        shutil.copy(self.path, other)
+        otio.adapters.read_from_file(other)
+        self.assertEqual(self.adapter_read.call_count, 1)
+
+        # changed contents are a miss
+        shutil.copy(MULTITRACK_PATH, self.path)
+        result = otio.adapters.read_from_file(self.path)
+        self.assertEqual(self.adapter_read.call_count, 2)
+        self.assertJsonEqual(
+            result,
+            otio.adapters.otio_json.read_from_file(MULTITRACK_PATH)
+        )
+
+    def test_stat_validation(self):
+        with mock.patch.dict(os.environ, {read_cache.VALIDATION_ENVVAR: "stat"}):
+            otio.adapters.read_from_file(self.path)
+            otio.adapters.read_from_file(self.path)
+            self.assertEqual(self.adapter_read.call_count, 1)
+
+            st = os.stat(self.path)
+            os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+            otio.adapters.read_from_file(self.path)
+            self.assertEqual(self.adapter_read.call_count, 2)
+
+    def test_invalid_environment(self):
+        with mock.patch.dict(os.environ, {read_cache.VALIDATION_ENVVAR: "bogus"}):
+            with self.assertRaises(
+                otio.exceptions.InvalidEnvironmentVariableError
+            ):
+                otio.adapters.read_from_file(self.path)
+
+        with mock.patch.dict(os.environ, {read_cache.MAX_MB_ENVVAR: "lots"}):
+            with self.assertRaises(
+                otio.exceptions.InvalidEnvironmentVariableError
+            ):
+                otio.adapters.read_from_file(self.path)
+
+    def test_corrupt_snapshot(self):
+        otio.adapters.read_from_file(self.path)
+        snapshot = os.path.join(self.cache_dir, self.snapshots()[0])
+        with open(snapshot, "w") as fo:
+            fo.write("{ not json")
+
+        result = otio.adapters.read_from_file(self.path)
+        self.assertEqual(self.adapter_read.call_count, 2)
+        self.assertJsonEqual(
+            result,
+            otio.adapters.otio_json.read_from_file(SCREENING_EXAMPLE_PATH)
+        )
+
+    def test_prune(self):
+        other = os.path.join(self.tmpdir, "other.otio")
+        shutil.copy(MULTITRACK_PATH, other)
+
+        otio.adapters.read_from_file(self.path)
+        otio.adapters.read_from_file(other)
+        self.assertEqual(len(self.snapshots()), 2)
+
+        read_cache.prune(max(
+            os.path.getsize(os.path.join(self.cache_dir, f))
+            for f in self.snapshots()
+        ))
+        self.assertEqual(len(self.snapshots()), 1)
+
+        read_cache.clear()
+        self.assertEqual(self.snapshots(), [])
+
+    def test_default_media_linker_is_part_of_the_key(self):
+        otio.adapters.read_from_file(self.path)
+        with mock.patch.dict(
+            os.environ,
+            {"OTIO_DEFAULT_MEDIA_LINKER": "example"}
+        ):
+            key = read_cache.snapshot_key("otio_json", self.path)
+        self.assertNotEqual(key, read_cache.snapshot_key("otio_json", self.path))
+
+    def test_hook_scripts_are_part_of_the_key(self):
+        key = read_cache.snapshot_key("otio_json", self.path)
+        with mock.patch.object(
+            read_cache,
+            "_hook_scripts",
+            return_value={"post_adapter_read": [("hook", "/hook.py")]}
+        ):
+            self.assertNotEqual(
+                read_cache.snapshot_key("otio_json", self.path),
+                key
+            )
+
+    def test_bundle_directory(self):
+        bundle = os.path.join(self.tmpdir, "test.otiod")
+        os.makedirs(os.path.join(bundle, "media"))
+        content = os.path.join(bundle, "content.otio")
+        shutil.copy(SCREENING_EXAMPLE_PATH, content)
+
+        for mode in read_cache.VALIDATION_MODES:
+            with mock.patch.dict(
+                os.environ,
+                {read_cache.VALIDATION_ENVVAR: mode}
+            ):
+                self.adapter_read.reset_mock()
+                otio.adapters.read_from_file(bundle)
+                otio.adapters.read_from_file(bundle)
+                self.assertEqual(self.adapter_read.call_count, 1)
+
+                # rewriting the playlist is a miss, though the mtime of the
+                # bundle directory does not change
+                shutil.copy(MULTITRACK_PATH, content)
+                result = otio.adapters.read_from_file(bundle)
+                self.assertEqual(self.adapter_read.call_count, 2)
+                self.assertEqual(
+                    result.name,
+                    otio.adapters.otio_json.read_from_file(MULTITRACK_PATH).name
+                )
+
+                # so is adding media
+                with open(os.path.join(bundle, "media", mode), "w"):
+                    pass
+                otio.adapters.read_from_file(bundle)
+                self.assertEqual(self.adapter_read.call_count, 3)
+
+                shutil.copy(SCREENING_EXAMPLE_PATH, content)
+
+    def test_side_effects_are_not_cached(self):
+        bundle = os.path.join(self.tmpdir, "test.otioz")
+        timeline = otio.schema.Timeline()
+        timeline.tracks.append(otio.schema.Track())
+        timeline.tracks[0].append(
+            otio.schema.Clip(
+                media_reference=otio.schema.ExternalReference(
+                    otio.url_utils.url_from_filepath(self.path)
+                )
+            )
+        )
+        otio.adapters.write_to_file(timeline, bundle)
+        self.adapter_read.reset_mock()
+
+        for i in range(2):
+            extracted = os.path.join(self.tmpdir, f"extracted{i}")
+            os.mkdir(extracted)
+            otio.adapters.read_from_file(
+                bundle,
+                extract_to_directory=extracted
+            )
+            self.assertTrue(
+                os.path.exists(os.path.join(extracted, "content.otio"))
+            )
+        self.assertEqual(self.adapter_read.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
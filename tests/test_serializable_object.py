@@ -8,6 +8,8 @@ import opentimelineio.test_utils as otio_test_utils
 
 import unittest
 import json
+import pickle
+import threading
 
 
 class OpenTimeTypeSerializerTest(unittest.TestCase):
@@ -270,5 +272,154 @@ class VersioningTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         )
 
 
+class ObjectArenaTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def test_read_in_arena(self):
+        tl = otio.schema.Timeline()
+        tl.tracks.append(otio.schema.Track())
+        for i in range(100):
+            tl.tracks[0].append(otio.schema.Clip(name=f"clip {i}"))
+        text = otio.adapters.write_to_string(tl)
+
+        arena = otio.core.ObjectArena()
+        with arena:
+            result = otio.adapters.read_from_string(text)
+            made_inside = otio.schema.Clip(name="inside")
+            with self.assertRaises(ValueError):
+                with arena:
+                    pass
+
+        self.assertIsOTIOEquivalentTo(result, tl)
+        clip = result.tracks[0][10]
+        del result
+        self.assertEqual(clip.name, "clip 10")
+        self.assertEqual(made_inside.name, "inside")
+
+        # the arena can be used again once it has been left
+        with arena:
+            result = otio.adapters.read_from_string(text)
+        self.assertIsOTIOEquivalentTo(result, tl)
+
+    def test_exit_out_of_order(self):
+        outer = otio.core.ObjectArena()
+        inner = otio.core.ObjectArena()
+
+        outer.__enter__()
+        inner.__enter__()
+        clip = otio.schema.Clip(name="inner")
+        with self.assertRaises(RuntimeError):
+            outer.__exit__(None, None, None)
+
+        # the arenas are still usable once exited in order
+        inner.__exit__(None, None, None)
+        outer.__exit__(None, None, None)
+        self.assertEqual(clip.name, "inner")
+
+    def test_exit_on_other_thread(self):
+        arena = otio.core.ObjectArena()
+        arena.__enter__()
+
+        errors = []
+
+        def exit_arena():
+            try:
+                arena.__exit__(None, None, None)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=exit_arena)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+
+        arena.__exit__(None, None, None)
+
+
+class StringPoolTests(unittest.TestCase):
+
+    def test_stats(self):
+        url = "file:///projects/big/plates/shot_010.%04d.exr" % 1
+        before = otio.core.string_pool_stats()
+        clips = [
+            otio.schema.Clip(
+                name="shared name",
+                media_reference=otio.schema.ExternalReference(url)
+            )
+            for _ in range(10)
+        ]
+        after = otio.core.string_pool_stats()
+        self.assertEqual(after["strings"], before["strings"] + 2)
+        self.assertEqual(after["references"], before["references"] + 20)
+        self.assertEqual(
+            after["deduplicated_bytes"],
+            before["deduplicated_bytes"] + 9 * (len(url) + len("shared name"))
+        )
+        self.assertEqual(clips[3].media_reference.target_url, url)
+
+        del clips
+        self.assertEqual(otio.core.string_pool_stats(), before)
+
+
+class PickleTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def setUp(self):
+        self.track = otio.schema.Track(name="track")
+        for i in range(10):
+            clip = otio.schema.Clip(
+                name=f"clip {i}",
+                media_reference=otio.schema.ExternalReference(
+                    "file:///shot.mov"
+                ),
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(i, 24),
+                    otio.opentime.RationalTime(10, 24),
+                ),
+                metadata={
+                    "index": i,
+                    "ratio": i / 2,
+                    "tags": ["a", "b", None, True],
+                    "color": otio.core.Color(1, 0.5, 0.25),
+                },
+            )
+            self.track.append(clip)
+
+    def test_protocols(self):
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                result = pickle.loads(pickle.dumps(self.track, protocol))
+                self.assertIsNot(result, self.track)
+                self.assertJsonEqual(result, self.track)
+
+    def test_out_of_band(self):
+        buffers = []
+        data = pickle.dumps(self.track, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), len(buffers[0].raw()))
+
+        result = pickle.loads(data, buffers=buffers)
+        self.assertJsonEqual(result, self.track)
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            otio.core._core_utils._from_binary(b"OTIOBIN1\x08")
+        with self.assertRaises(ValueError):
+            otio.core._core_utils._from_binary(b"not otio")
+
+    def test_share(self):
+        handle = otio.core.share(self.track)
+        handle = pickle.loads(pickle.dumps(handle))
+        self.assertJsonEqual(otio.core.attach(handle), self.track)
+        with self.assertRaises(FileNotFoundError):
+            otio.core.attach(handle)
+
+        handle = otio.core.share(self.track)
+        for _ in range(2):
+            result = otio.core.attach(handle, unlink=False)
+            self.assertJsonEqual(result, self.track)
+        handle.unlink()
+        with self.assertRaises(FileNotFoundError):
+            otio.core.attach(handle)
+
+
 if __name__ == '__main__':
     unittest.main()
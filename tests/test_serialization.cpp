@@ -4,14 +4,23 @@
 #include "utils.h"
 
 #include <opentimelineio/clip.h>
+#include <opentimelineio/externalReference.h>
 #include <opentimelineio/timeline.h>
 #include <opentimelineio/track.h>
+#include <opentimelineio/deserialization.h>
+#include <opentimelineio/objectArena.h>
 #include <opentimelineio/serialization.h>
 #include <opentimelineio/serializableObject.h>
 #include <opentimelineio/serializableObjectWithMetadata.h>
 #include <opentimelineio/safely_typed_any.h>
+#include <opentimelineio/stringPool.h>
+#include <opentimelineio/timelineAlgorithm.h>
 
+#include <cstdio>
+#include <filesystem>
+#include <fstream>
 #include <iostream>
+#include <sstream>
 #include <string>
 
 namespace otime = opentime::OPENTIME_VERSION;
@@ -115,6 +124,417 @@ main(int argc, char** argv)
 })CONTENT");
     });
 
+    tests.add_test(
+        "deserialize from stream", [] {
+        otio::SerializableObject::Retainer<otio::SerializableObjectWithMetadata> so =
+            new otio::SerializableObjectWithMetadata("stream");
+
+        otio::ErrorStatus err;
+        std::istringstream input(so.value->to_json_string(&err, {}));
+        assertFalse(otio::is_error(err));
+
+        std::any result;
+        assertTrue(otio::deserialize_json_from_stream(input, &result, &err));
+        assertFalse(otio::is_error(err));
+
+        auto so_result = std::any_cast<otio::SerializableObject::Retainer<>>(
+            result);
+        auto named = dynamic_cast<otio::SerializableObjectWithMetadata*>(
+            so_result.value);
+        assertTrue(named != nullptr);
+        assertEqual(named->name(), std::string("stream"));
+
+        std::istringstream bad_input("{\"OTIO_SCHEMA\": ");
+        assertFalse(otio::deserialize_json_from_stream(bad_input, &result, &err));
+        assertEqual(err.outcome, otio::ErrorStatus::JSON_PARSE_ERROR);
+    });
+
+    tests.add_test(
+        "serialize to stream", [] {
+        otio::SerializableObject::Retainer<otio::Track> tr = new otio::Track();
+        for (int i = 0; i < 1000; ++i)
+        {
+            tr->append_child(new otio::Clip("clip " + std::to_string(i)));
+        }
+
+        for (int indent: { 4, 0 })
+        {
+            otio::ErrorStatus  err;
+            std::ostringstream output;
+            assertTrue(otio::serialize_json_to_stream(
+                otio::SerializableObject::Retainer<>(tr.value),
+                output,
+                nullptr,
+                &err,
+                indent));
+            assertFalse(otio::is_error(err));
+            assertEqual(output.str(), tr->to_json_string(&err, {}, indent));
+        }
+
+        std::ofstream closed;
+        otio::ErrorStatus err;
+        assertFalse(otio::serialize_json_to_stream(
+            otio::SerializableObject::Retainer<>(tr.value),
+            closed,
+            nullptr,
+            &err));
+        assertEqual(err.outcome, otio::ErrorStatus::FILE_WRITE_FAILED);
+    });
+
+    tests.add_test(
+        "deserialize from buffer", [] {
+        otio::SerializableObject::Retainer<otio::SerializableObjectWithMetadata> so =
+            new otio::SerializableObjectWithMetadata("buffer");
+
+        otio::ErrorStatus err;
+        std::string const input = so.value->to_json_string(&err, {});
+        std::string const padded = input + "}}}";
+
+        std::any result;
+        assertTrue(otio::deserialize_json_from_buffer(
+            padded.data(),
+            input.size(),
+            &result,
+            &err));
+        assertFalse(otio::is_error(err));
+
+        auto so_result = std::any_cast<otio::SerializableObject::Retainer<>>(
+            result);
+        auto named = dynamic_cast<otio::SerializableObjectWithMetadata*>(
+            so_result.value);
+        assertTrue(named != nullptr);
+        assertEqual(named->name(), std::string("buffer"));
+
+        assertFalse(otio::deserialize_json_from_buffer(
+            input.data(),
+            input.size() - 1,
+            &result,
+            &err));
+        assertEqual(err.outcome, otio::ErrorStatus::JSON_PARSE_ERROR);
+    });
+
+    tests.add_test(
+        "typed arrays", [] {
+        otio::SerializableObject::Retainer<otio::SerializableObjectWithMetadata> so =
+            new otio::SerializableObjectWithMetadata();
+        so->metadata()["ints"] = otio::Int64Array{ 1 };
+        so->metadata()["floats"] =
+            otio::Float64Array{ 0.5, -2.0, 1e300 };
+        so->metadata()["empty"] = otio::Float64Array();
+
+        otio::ErrorStatus err;
+        auto output = so.value->to_json_string(&err, {}, 0);
+        assertFalse(otio::is_error(err));
+        assertNotEqual(
+            output.find(R"CONTENT({"OTIO_SCHEMA":"TypedArray.1","dtype":"int64","data":"AQAAAAAAAAA="})CONTENT"),
+            std::string::npos);
+
+        otio::SerializableObject::Retainer<otio::SerializableObjectWithMetadata> result =
+            dynamic_cast<otio::SerializableObjectWithMetadata*>(
+                otio::SerializableObject::from_json_string(output, &err));
+        assertFalse(otio::is_error(err));
+        assertTrue(result.value != nullptr);
+        assertTrue(result->is_equivalent_to(*so.value));
+        assertTrue(
+            std::any_cast<otio::Float64Array>(result->metadata()["floats"])
+            == otio::Float64Array({ 0.5, -2.0, 1e300 }));
+        assertTrue(
+            std::any_cast<otio::Float64Array>(result->metadata()["empty"])
+                .empty());
+
+        std::string bad_data = R"CONTENT({"OTIO_SCHEMA":"SerializableObjectWithMetadata.1","metadata":{"ints":{"OTIO_SCHEMA":"TypedArray.1","dtype":"int64","data":"AQAA"}},"name":""})CONTENT";
+        assertTrue(
+            otio::SerializableObject::from_json_string(bad_data, &err)
+            == nullptr);
+        assertEqual(err.outcome, otio::ErrorStatus::MALFORMED_SCHEMA);
+    });
+
+    tests.add_test(
+        "lazy metadata", [] {
+        std::string input = R"CONTENT({
+    "OTIO_SCHEMA": "SerializableObjectWithMetadata.1",
+    "metadata": {"b":  [1, 2.5, null],  "a": {"c": "d"}},
+    "name": ""
+})CONTENT";
+
+        otio::ErrorStatus err;
+        std::any          result;
+        assertTrue(otio::deserialize_json_from_string(
+            input, &result, &err, true /* lazy_metadata */));
+        otio::SerializableObject::Retainer<otio::SerializableObjectWithMetadata> so =
+            dynamic_cast<otio::SerializableObjectWithMetadata*>(
+                std::any_cast<otio::SerializableObject::Retainer<>>(result)
+                    .value);
+        assertTrue(so.value != nullptr);
+
+        // reading through a const reference keeps the text
+        otio::AnyDictionary const& metadata = so.value->metadata();
+        assertEqual(
+            *metadata.raw_json(),
+            std::string(R"CONTENT({"b":  [1, 2.5, null],  "a": {"c": "d"}})CONTENT"));
+        assertEqual(metadata.size(), size_t(2));
+        assertEqual(metadata.begin()->first, std::string("a"));
+        assertEqual(
+            std::any_cast<otio::AnyVector const&>(metadata.at("b")).size(),
+            size_t(3));
+        assertEqual(
+            so.value->to_json_string(&err, {}),
+            input);
+
+        // so does gathering statistics
+        otio::TimelineStatistics stats = otio::timeline_statistics(so.value);
+        assertEqual(stats.metadata_keys["a"], 1);
+        assertTrue(metadata.raw_json() != nullptr);
+
+        // copies keep the text too
+        otio::AnyDictionary copy = metadata;
+        assertTrue(copy.raw_json() != nullptr);
+
+        // non-const access may modify the items, so it drops the text
+        so.value->metadata()["e"] = int64_t(1);
+        assertTrue(metadata.raw_json() == nullptr);
+        assertEqual(
+            so.value->to_json_string(&err, {}, 0),
+            std::string(R"CONTENT({"OTIO_SCHEMA":"SerializableObjectWithMetadata.1","metadata":{"a":{"c":"d"},"b":[1,2.5,null],"e":1},"name":""})CONTENT"));
+
+        assertTrue(otio::deserialize_json_from_string(
+            input, &result, &err, false /* lazy_metadata */));
+        so = dynamic_cast<otio::SerializableObjectWithMetadata*>(
+            std::any_cast<otio::SerializableObject::Retainer<>>(result).value);
+        assertTrue(so->metadata().raw_json() == nullptr);
+    });
+
+    tests.add_test(
+        "lazy children", [] {
+        otio::SerializableObject::Retainer<otio::Timeline> tl =
+            new otio::Timeline();
+        for (int i = 0; i < 2; ++i)
+        {
+            otio::SerializableObject::Retainer<otio::Track> tr =
+                new otio::Track("track " + std::to_string(i));
+            tr->append_child(new otio::Clip("clip " + std::to_string(i)));
+            tl->tracks()->append_child(tr);
+        }
+
+        std::string const file_name =
+            (std::filesystem::temp_directory_path() / "otio_lazy_children.otio")
+                .string();
+        otio::ErrorStatus err;
+        assertTrue(tl->to_json_file(file_name, &err));
+
+        std::any result;
+        assertTrue(otio::deserialize_json_from_file(
+            file_name, &result, &err, false, true /* lazy_children */));
+        otio::SerializableObject::Retainer<otio::Timeline> lazy =
+            dynamic_cast<otio::Timeline*>(
+                std::any_cast<otio::SerializableObject::Retainer<>>(result)
+                    .value);
+        assertTrue(lazy.value != nullptr);
+        otio::Stack* stack = lazy->tracks();
+        assertFalse(stack->is_materialized());
+
+        // tracks are read with the stack, clips when the track is accessed
+        auto track = dynamic_cast<otio::Track*>(stack->children()[1].value);
+        assertTrue(stack->is_materialized());
+        assertFalse(track->is_materialized());
+        assertEqual(track->name(), std::string("track 1"));
+        assertEqual(track->children().size(), size_t(1));
+        assertEqual(track->children()[0]->name(), std::string("clip 1"));
+        assertTrue(track->children()[0]->parent() == track);
+        assertTrue(lazy->is_equivalent_to(*tl.value));
+
+        assertTrue(track->dematerialize());
+        assertFalse(track->is_materialized());
+        assertTrue(track->materialize(&err));
+        assertEqual(track->children()[0]->name(), std::string("clip 1"));
+
+        // the file has changed, so the children can not be read
+        auto other = dynamic_cast<otio::Track*>(stack->children()[0].value);
+        assertTrue(other->dematerialize());
+        std::ofstream(file_name) << "[]";
+        assertFalse(other->materialize(&err));
+        assertTrue(otio::is_error(err));
+        bool threw = false;
+        try
+        {
+            other->children();
+        }
+        catch (std::runtime_error const&)
+        {
+            threw = true;
+        }
+        assertTrue(threw);
+        assertFalse(other->is_materialized());
+        std::remove(file_name.c_str());
+    });
+
+    tests.add_test(
+        "object ranges", [] {
+        otio::SerializableObject::Retainer<otio::Track> tr = new otio::Track();
+        otio::SerializableObject::Retainer<otio::Clip> cl = new otio::Clip("a");
+        tr->append_child(cl);
+
+        std::string const file_name =
+            (std::filesystem::temp_directory_path() / "otio_object_ranges.otio")
+                .string();
+        otio::ErrorStatus                  err;
+        std::vector<otio::JSONObjectRange> ranges;
+        assertTrue(otio::serialize_json_to_file(
+            std::any(otio::SerializableObject::Retainer<>(tr.value)),
+            file_name,
+            nullptr,
+            &err,
+            4,
+            &ranges));
+
+        // the track and the clip, but not the media reference
+        assertEqual(ranges.size(), size_t(2));
+        assertTrue(ranges[0].object == tr.value);
+        assertTrue(ranges[1].object == cl.value);
+
+        std::ifstream     input(file_name, std::ios::binary);
+        std::stringstream contents;
+        contents << input.rdbuf();
+        std::string const text = contents.str();
+        assertEqual(ranges[0].begin, size_t(0));
+        assertEqual(ranges[0].end, text.size());
+
+        std::string const clip_text =
+            text.substr(ranges[1].begin, ranges[1].end - ranges[1].begin);
+        otio::SerializableObject::Retainer<otio::Clip> result =
+            dynamic_cast<otio::Clip*>(
+                otio::SerializableObject::from_json_string(clip_text, &err));
+        assertTrue(result.value != nullptr);
+        assertTrue(result->is_equivalent_to(*cl.value));
+        std::remove(file_name.c_str());
+    });
+
+    tests.add_test(
+        "object arena", [] {
+        otio::SerializableObject::Retainer<otio::Track> tr = new otio::Track();
+        for (int i = 0; i < 1000; ++i)
+        {
+            tr->append_child(new otio::Clip("clip " + std::to_string(i)));
+        }
+        otio::ErrorStatus err;
+        std::string const input = tr->to_json_string(&err, {}, 0);
+
+        otio::SerializableObject::Retainer<otio::Track> result;
+        otio::SerializableObject::Retainer<otio::Clip>  detached;
+        {
+            otio::ObjectArena arena;
+            result = dynamic_cast<otio::Track*>(
+                otio::SerializableObject::from_json_string(input, &err));
+            assertTrue(result.value != nullptr);
+            assertTrue(result->is_equivalent_to(*tr.value));
+
+            // arenas nest
+            otio::ObjectArena inner;
+            otio::SerializableObject::Retainer<otio::Clip> cl =
+                new otio::Clip("inner");
+        }
+
+        // objects outlive the arena, and can be detached and kept while the
+        // rest of the graph is freed
+        detached = dynamic_cast<otio::Clip*>(result->children()[500].value);
+        assertTrue(result->remove_child(500, &err));
+        result = nullptr;
+        assertEqual(detached->name(), std::string("clip 500"));
+        detached->set_name("still here");
+        assertEqual(detached->name(), std::string("still here"));
+    });
+
+    tests.add_test("string pool", [] {
+        std::string const url = "file:///projects/big/plates/shot_010.exr";
+        otio::InternedString a(url);
+        otio::InternedString b(std::string("file:///projects/big/plates/")
+                               + "shot_010.exr");
+        otio::InternedString c("file:///projects/big/plates/shot_020.exr");
+        assertTrue(a == b);
+        assertTrue(a != c);
+        assertTrue(a.c_str() == b.c_str());
+        assertEqual(a.str(), url);
+        assertEqual(a.size(), url.size());
+        assertTrue(otio::InternedString().empty());
+        assertTrue(otio::InternedString(std::string()).empty());
+        assertEqual(std::string(otio::InternedString().c_str()), std::string());
+
+        // reading shares the names and urls the objects repeat
+        otio::SerializableObject::Retainer<otio::Track> tr(new otio::Track);
+        for (int i = 0; i < 100; ++i)
+        {
+            tr->append_child(new otio::Clip(
+                "shared clip name",
+                new otio::ExternalReference(url)));
+        }
+        std::string const text = tr->to_json_string();
+
+        otio::StringPoolStats const before = otio::string_pool_stats();
+        otio::ErrorStatus           err;
+        otio::SerializableObject::Retainer<otio::Track> result(
+            dynamic_cast<otio::Track*>(
+                otio::SerializableObject::from_json_string(text, &err)));
+        assertFalse(otio::is_error(err));
+        otio::StringPoolStats const after = otio::string_pool_stats();
+        assertEqual(after.strings, before.strings);
+        assertEqual(after.references, before.references + 200);
+        assertEqual(
+            after.deduplicated_bytes,
+            before.deduplicated_bytes + 100 * (url.size() + 16));
+
+        auto clip = dynamic_cast<otio::Clip*>(result->children()[0].value);
+        clip->set_name("renamed");
+        assertEqual(clip->name(), std::string("renamed"));
+        result = nullptr;
+
+        // strings are freed with the last object that holds them
+        tr = nullptr;
+        otio::StringPoolStats const freed = otio::string_pool_stats();
+        assertEqual(freed.references, before.references - 200);
+        assertEqual(freed.strings, before.strings - 1);
+    });
+
+    tests.add_test("binary encoding", [] {
+        otio::SerializableObject::Retainer<otio::Track> tr(new otio::Track);
+        for (int i = 0; i < 100; ++i)
+        {
+            otio::SerializableObject::Retainer<otio::Clip> cl(new otio::Clip(
+                "clip " + std::to_string(i % 10),
+                new otio::ExternalReference("file:///shot.mov"),
+                otio::TimeRange(
+                    otio::RationalTime(i, 24),
+                    otio::RationalTime(10, 24))));
+            cl->metadata()["index"] = int64_t(i);
+            cl->metadata()["ratio"] = 0.5 * i;
+            cl->metadata()["note"]  = std::string(100, 'x');
+            tr->append_child(cl);
+        }
+
+        otio::ErrorStatus err;
+        std::string const data = otio::serialize_binary_to_string(
+            std::any(otio::SerializableObject::Retainer<>(tr.value)),
+            &err);
+        assertFalse(otio::is_error(err));
+        assertTrue(data.size() < tr->to_json_string(&err, {}, 0).size());
+
+        std::any result;
+        assertTrue(otio::deserialize_binary_from_buffer(
+            data.data(),
+            data.size(),
+            &result,
+            &err));
+        auto so = std::any_cast<otio::SerializableObject::Retainer<>>(result);
+        assertTrue(so->is_equivalent_to(*tr.value));
+
+        // truncated data is an error, not a crash
+        assertFalse(otio::deserialize_binary_from_buffer(
+            data.data(),
+            data.size() / 2,
+            &result,
+            &err));
+        assertEqual(err.outcome, otio::ErrorStatus::MALFORMED_SCHEMA);
+    });
+
     tests.run(argc, argv);
     return 0;
 }
@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Tests for the OTIO timeline service."""
+
+import errno
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from concurrent import futures
+from unittest import mock
+
+import opentimelineio as otio
+import opentimelineio.test_utils as otio_test_utils
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+SCREENING_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "screening_example.otio")
+MULTITRACK_PATH = os.path.join(SAMPLE_DATA_DIR, "multitrack.otio")
+
+
+class TimelineCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="otio_service")
+        self.path = os.path.join(self.tmpdir, "test.otio")
+        shutil.copy(SCREENING_EXAMPLE_PATH, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_hit_and_miss(self):
+        cache = otio.service.TimelineCache()
+        first = cache.get(self.path)
+        second = cache.get(self.path)
+
+        self.assertIs(first, second)
+        info = cache.info()
+        self.assertEqual(info["hits"], 1)
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["entries"], 1)
+        self.assertEqual(info["bytes"], os.path.getsize(self.path))
+
+    def test_modified_file_is_reread(self):
+        cache = otio.service.TimelineCache()
+        first = cache.get(self.path)
+
+        first.name = "modified"
+        otio.adapters.write_to_file(first, self.path)
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+        second = cache.get(self.path)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, "modified")
+        self.assertEqual(cache.info()["entries"], 1)
+
+    def test_eviction(self):
+        other = os.path.join(self.tmpdir, "other.otio")
+        shutil.copy(MULTITRACK_PATH, other)
+
+        cache = otio.service.TimelineCache(
+            max_bytes=max(os.path.getsize(self.path), os.path.getsize(other))
+        )
+        cache.get(self.path)
+        cache.get(other)
+
+        self.assertEqual(cache.info()["paths"], [os.path.abspath(other)])
+
+        # larger than the cache, returned but not kept
+        cache.max_bytes = 0
+        cache.clear()
+        self.assertIsNotNone(cache.get(self.path))
+        self.assertEqual(cache.info()["entries"], 0)
+
+    def test_concurrent_reads(self):
+        other = os.path.join(self.tmpdir, "other.otio")
+        shutil.copy(MULTITRACK_PATH, other)
+
+        cache = otio.service.TimelineCache()
+        cache.get(other)
+
+        reading = threading.Event()
+        release = threading.Event()
+        read_from_file = otio.adapters.read_from_file
+        calls = []
+
+        def slow_read(*args, **kwargs):
+            calls.append(args[0])
+            reading.set()
+            release.wait(30)
+            return read_from_file(*args, **kwargs)
+
+        with mock.patch.object(
+            otio.adapters,
+            "read_from_file",
+            side_effect=slow_read
+        ):
+            with futures.ThreadPoolExecutor(max_workers=2) as executor:
+                results = [executor.submit(cache.get, self.path)]
+                self.assertTrue(reading.wait(30))
+                results.append(executor.submit(cache.get, self.path))
+
+                # hits are not blocked by the read in progress
+                self.assertIsNotNone(cache.get(other))
+
+                release.set()
+                first, second = [f.result(30) for f in results]
+
+        self.assertIs(first, second)
+        self.assertEqual(calls, [os.path.abspath(self.path)])
+        self.assertEqual(cache.info()["entries"], 2)
+
+    def test_failed_read(self):
+        with open(self.path, "w") as fo:
+            fo.write("{ not json")
+
+        cache = otio.service.TimelineCache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get(self.path)
+        self.assertEqual(cache.info()["misses"], 2)
+
+
+@unittest.skipIf(
+    not hasattr(socket, "AF_UNIX"),
+    "Unix domain sockets are not available on this platform"
+)
+class TimelineServerTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="otio_service")
+        self.socket_path = os.path.join(self.tmpdir, "otio.sock")
+        self.server = otio.service.TimelineServer(self.socket_path)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.tmpdir)
+
+    def query(self, command, **arguments):
+        return otio.service.query(
+            command,
+            socket_path=self.socket_path,
+            timeout=30,
+            **arguments
+        )
+
+    def test_ping(self):
+        self.assertEqual(self.query("ping"), "pong")
+
+    def test_stats(self):
+        result = self.query("stats", path=SCREENING_EXAMPLE_PATH)
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+
+        self.assertEqual(result["schema"], "Timeline.1")
+        self.assertEqual(result["tracks"], len(timeline.tracks))
+        self.assertEqual(result["clips"], len(timeline.find_clips()))
+        self.assertEqual(
+            result["duration"],
+            {
+                "value": timeline.duration().value,
+                "rate": timeline.duration().rate
+            }
+        )
+
+        self.query("stats", path=SCREENING_EXAMPLE_PATH)
+        info = self.query("cache_info")
+        self.assertEqual(info["hits"], 1)
+        self.assertEqual(info["misses"], 1)
+
+    def test_clips(self):
+        result = self.query("clips", path=MULTITRACK_PATH)
+        timeline = otio.adapters.read_from_file(MULTITRACK_PATH)
+
+        self.assertEqual(
+            [c["name"] for c in result],
+            [c.name for c in timeline.find_clips()]
+        )
+
+    def test_child_at_time(self):
+        timeline = otio.adapters.read_from_file(MULTITRACK_PATH)
+        time = otio.opentime.RationalTime(1, 24)
+
+        result = self.query(
+            "child_at_time",
+            path=MULTITRACK_PATH,
+            time={"value": time.value, "rate": time.rate}
+        )
+        self.assertEqual(len(result), len(timeline.tracks))
+        for entry, track in zip(result, timeline.tracks):
+            child = track.child_at_time(time)
+            self.assertEqual(entry["child"]["name"], child.name)
+
+        result = self.query(
+            "child_at_time",
+            path=MULTITRACK_PATH,
+            time={"value": time.value, "rate": time.rate},
+            track=1
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["track"], 1)
+
+    def test_trimmed_to_range(self):
+        timeline = otio.adapters.read_from_file(MULTITRACK_PATH)
+        trim_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(10, 24),
+            otio.opentime.RationalTime(20, 24)
+        )
+
+        result = self.query(
+            "trimmed_to_range",
+            path=MULTITRACK_PATH,
+            range={
+                "start_time": {"value": 10, "rate": 24},
+                "duration": {"value": 20, "rate": 24},
+            }
+        )
+
+        self.assertJsonEqual(
+            otio.adapters.read_from_string(result),
+            otio.algorithms.timeline_trimmed_to_range(timeline, trim_range)
+        )
+
+    def test_socket_in_use(self):
+        with self.assertRaises(OSError) as cm:
+            otio.service.TimelineServer(self.socket_path)
+        self.assertEqual(cm.exception.errno, errno.EADDRINUSE)
+
+        # the running server still has its socket
+        self.assertEqual(self.query("ping"), "pong")
+
+    def test_stale_socket(self):
+        stale_path = os.path.join(self.tmpdir, "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(stale_path)
+        stale.close()
+
+        server = otio.service.TimelineServer(stale_path)
+        server.server_close()
+
+    def test_errors(self):
+        with self.assertRaises(otio.exceptions.ServiceError):
+            self.query("not_a_command")
+
+        with self.assertRaises(otio.exceptions.ServiceError):
+            self.query("stats", path=os.path.join(self.tmpdir, "missing.otio"))
+
+        with self.assertRaises(otio.exceptions.ServiceError):
+            self.query("child_at_time", path=MULTITRACK_PATH, time=12)
+
+        # the server is still up
+        self.assertEqual(self.query("ping"), "pong")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,11 @@
 #include "utils.h"
 
 #include <opentimelineio/clip.h>
+#include <opentimelineio/externalReference.h>
+#include <opentimelineio/gap.h>
+#include <opentimelineio/stack.h>
 #include <opentimelineio/timeline.h>
+#include <opentimelineio/timelineAlgorithm.h>
 #include <opentimelineio/track.h>
 
 #include <iostream>
@@ -78,6 +82,126 @@ main(int argc, char** argv)
         assertEqual(result[0].value, cl.value);
     });
 
+    tests.add_test(
+        "test_timeline_trimmed_to_range", [] {
+        using namespace otio;
+        const TimeRange range(RationalTime(0.0, 24.0), RationalTime(10.0, 24.0));
+        SerializableObject::Retainer<Track> tr0 = new Track();
+        SerializableObject::Retainer<Track> tr1 = new Track();
+        for (int i = 0; i < 3; ++i)
+        {
+            tr0->append_child(new Clip("a" + std::to_string(i), nullptr, range));
+            tr1->append_child(new Clip("b" + std::to_string(i), nullptr, range));
+        }
+
+        // the second track starts 10 frames into its children
+        tr1->set_source_range(
+            TimeRange(RationalTime(10.0, 24.0), RationalTime(20.0, 24.0)));
+
+        SerializableObject::Retainer<Timeline> tl = new Timeline("tl");
+        tl->tracks()->append_child(tr0);
+        tl->tracks()->append_child(tr1);
+
+        OTIO_NS::ErrorStatus err;
+        SerializableObject::Retainer<Timeline> result =
+            timeline_trimmed_to_range(
+                tl,
+                TimeRange(RationalTime(5.0, 24.0), RationalTime(10.0, 24.0)),
+                &err);
+        assertFalse(is_error(err));
+        assertEqual(result->name(), std::string("tl"));
+        assertEqual(result->tracks()->children().size(), 2);
+
+        auto res0 = dynamic_retainer_cast<Track>(result->tracks()->children()[0]);
+        auto res1 = dynamic_retainer_cast<Track>(result->tracks()->children()[1]);
+        assertEqual(res0->children().size(), 2);
+        assertEqual(res0->children()[0]->name(), std::string("a0"));
+        assertEqual(res1->children().size(), 2);
+        assertEqual(res1->children()[0]->name(), std::string("b1"));
+        assertEqual(res1->children()[1]->name(), std::string("b2"));
+        assertFalse(res1->source_range().has_value());
+        assertEqual(
+            res1->duration(),
+            RationalTime(10.0, 24.0));
+        assertEqual(
+            result->duration(),
+            RationalTime(10.0, 24.0));
+
+        // the input is untouched
+        assertEqual(tr1->children().size(), 3);
+        assertTrue(tr1->source_range().has_value());
+    });
+
+    tests.add_test("test_timeline_statistics", [] {
+        using namespace otio;
+        SerializableObject::Retainer<Timeline> tl = new Timeline();
+        SerializableObject::Retainer<Track> video = new Track();
+        SerializableObject::Retainer<Track> audio =
+            new Track("audio", std::nullopt, Track::Kind::audio);
+        tl->tracks()->append_child(video);
+        tl->tracks()->append_child(audio);
+
+        AnyDictionary metadata;
+        metadata["cdl"] = AnyDictionary();
+        video->append_child(new Clip(
+            "a",
+            new ExternalReference("file:///a.mov"),
+            TimeRange(RationalTime(0, 24), RationalTime(10, 24)),
+            metadata));
+        video->append_child(
+            new Gap(TimeRange(RationalTime(0, 24), RationalTime(5, 24))));
+
+        // a nested stack with a track, for the nesting depth
+        SerializableObject::Retainer<Stack> nested = new Stack();
+        SerializableObject::Retainer<Track> nested_track =
+            new Track("nested", std::nullopt, "Data");
+        nested_track->append_child(new Clip(
+            "b",
+            nullptr,
+            TimeRange(RationalTime(0, 30), RationalTime(30, 30))));
+        nested->append_child(nested_track);
+        video->append_child(nested);
+
+        audio->append_child(new Clip(
+            "c",
+            nullptr,
+            TimeRange(RationalTime(0, 24), RationalTime(48, 24))));
+
+        TimelineStatistics stats = timeline_statistics(tl);
+        assertEqual(stats.track_count, 2);
+        assertEqual(stats.clip_count, 3);
+        assertEqual(stats.deepest_nesting, 6);
+        assertEqual(stats.schema_counts["Clip"], 3);
+        assertEqual(stats.schema_counts["Track"], 3);
+        assertEqual(stats.schema_counts["Stack"], 2);
+        assertEqual(stats.schema_counts["Gap"], 1);
+        assertEqual(stats.schema_counts["ExternalReference"], 1);
+        assertEqual(stats.schema_counts["MissingReference"], 2);
+        assertEqual(stats.track_kinds[Track::Kind::video], 1);
+        assertEqual(stats.track_kinds[Track::Kind::audio], 1);
+        assertEqual(stats.track_kinds["Data"], 1);
+        assertEqual(
+            stats.track_kind_durations[Track::Kind::video],
+            RationalTime(39, 24));
+        assertEqual(
+            stats.track_kind_durations[Track::Kind::audio],
+            RationalTime(48, 24));
+        assertEqual(stats.clip_rates[24.0], 2);
+        assertEqual(stats.clip_rates[30.0], 1);
+        assertEqual(stats.clip_metadata_keys["cdl"], 1);
+        assertEqual(stats.metadata_keys["cdl"], 1);
+        assertEqual(stats.media_reference_kinds["MissingReference"], 2);
+        assertTrue(stats.range.has_value());
+        assertEqual(stats.range->duration(), RationalTime(48, 24));
+
+        // any object can be the root
+        stats = timeline_statistics(nested_track);
+        assertEqual(stats.clip_count, 1);
+        assertEqual(stats.deepest_nesting, 2);
+        assertEqual(stats.track_count, 0);
+        assertFalse(stats.range.has_value());
+    });
+
     tests.run(argc, argv);
     return 0;
 }
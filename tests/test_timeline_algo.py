@@ -5,11 +5,14 @@
 
 """Test file for the track algorithms library."""
 
+import os
 import unittest
 
 import opentimelineio as otio
 import opentimelineio.test_utils as otio_test_utils
 
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+
 
 class TimelineTrimmingTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
     """ test harness for timeline trimming function """
@@ -353,6 +356,243 @@ class TimelineTrimmingTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
         self.assertJsonEqual(expected, trimmed)
 
+    def test_trim_track_with_source_range(self):
+        original_timeline, original_track = self.make_sample_timeline()
+
+        # the track starts 60 frames into its children
+        original_track.source_range = otio.opentime.TimeRange(
+            start_time=otio.opentime.RationalTime(60, 24),
+            duration=otio.opentime.RationalTime(80, 24)
+        )
+        before = otio.adapters.write_to_string(original_timeline)
+
+        trimmed = otio.algorithms.timeline_trimmed_to_range(
+            original_timeline,
+            otio.opentime.TimeRange(
+                start_time=otio.opentime.RationalTime(0, 24),
+                duration=otio.opentime.RationalTime(40, 24)
+            )
+        )
+        self.assertEqual(otio.adapters.write_to_string(original_timeline), before)
+
+        trimmed = trimmed.tracks[0]
+        self.assertIsNone(trimmed.source_range)
+        self.assertEqual([c.name for c in trimmed], ["B"])
+        self.assertEqual(
+            trimmed[0].trimmed_range(),
+            otio.opentime.TimeRange(
+                start_time=otio.opentime.RationalTime(10, 24),
+                duration=otio.opentime.RationalTime(40, 24)
+            )
+        )
+
+    def _stack_ranges(self, timeline):
+        return [
+            [
+                (child.name, track.transformed_time_range(
+                    track.range_of_child(child),
+                    timeline.tracks
+                ))
+                for child in track
+                if isinstance(child, otio.schema.Clip)
+            ]
+            for track in timeline.tracks
+        ]
+
+    def test_trim_track_with_offset_source_range(self):
+        # the third track starts 7 frames before its children, so that its
+        # clip lines up with the clip of the second track
+        timeline = otio.adapters.read_from_file(
+            os.path.join(SAMPLE_DATA_DIR, "multiple_track.otio")
+        )
+        trim_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(1.9, 24),
+            otio.opentime.RationalTime(7.6, 24)
+        )
+        trimmed = otio.algorithms.timeline_trimmed_to_range(
+            timeline,
+            trim_range
+        )
+
+        expected = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(5.1, 24),
+            otio.opentime.RationalTime(2.5, 24)
+        )
+        ranges = self._stack_ranges(trimmed)
+        self.assertEqual(ranges[1], [("Clip-003", expected)])
+        self.assertEqual(ranges[2], [("Clip-005", expected)])
+        for track in trimmed.tracks:
+            self.assertEqual(track.duration(), trim_range.duration)
+
+    def test_trim_track_outside_its_source_range(self):
+        # the source_range of the track is before its children, so nothing
+        # of it is visible, but it keeps its duration
+        timeline = otio.adapters.read_from_file(
+            os.path.join(SAMPLE_DATA_DIR, "screening_example.otio")
+        )
+        trim_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(100, 24)
+        )
+        trimmed = otio.algorithms.timeline_trimmed_to_range(
+            timeline,
+            trim_range
+        )
+        self.assertEqual(len(trimmed.tracks[0]), 0)
+        self.assertEqual(trimmed.tracks[0].duration(), trim_range.duration)
+        self.assertEqual(trimmed.duration(), trim_range.duration)
+
+    def test_trim_keeps_types_and_fields(self):
+        @otio.core.register_type
+        class TaggedTrack(otio.schema.Track):
+            _serializable_label = "TaggedTrack.1"
+            tag = otio.core.serializable_field("tag")
+
+        timeline, _ = self.make_sample_timeline()
+        track = TaggedTrack(name="tagged")
+        track.tag = "keep"
+        track.append(otio.schema.Clip(
+            name="C",
+            source_range=otio.opentime.TimeRange(
+                duration=otio.opentime.RationalTime(10, 24)
+            )
+        ))
+        timeline.tracks.append(track)
+
+        trimmed = otio.algorithms.timeline_trimmed_to_range(
+            timeline,
+            otio.opentime.TimeRange(
+                duration=otio.opentime.RationalTime(5, 24)
+            )
+        )
+        self.assertIsInstance(trimmed.tracks[1], TaggedTrack)
+        self.assertEqual(trimmed.tracks[1].tag, "keep")
+        self.assertIsInstance(
+            otio.algorithms.track_trimmed_to_range(
+                track,
+                otio.opentime.TimeRange(
+                    duration=otio.opentime.RationalTime(5, 24)
+                )
+            ),
+            TaggedTrack
+        )
+
+    def test_trim_transition_error(self):
+        track = otio.schema.Track()
+        for name in ("A", "B"):
+            track.append(otio.schema.Clip(
+                name=name,
+                source_range=otio.opentime.TimeRange(
+                    duration=otio.opentime.RationalTime(10, 24)
+                )
+            ))
+        track.insert(1, otio.schema.Transition(
+            in_offset=otio.opentime.RationalTime(2, 24),
+            out_offset=otio.opentime.RationalTime(2, 24)
+        ))
+        with self.assertRaisesRegex(
+            otio.exceptions.CannotTrimTransitionsError,
+            "^Cannot trim in the middle of a Transition.$"
+        ):
+            otio.algorithms.track_trimmed_to_range(
+                track,
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(9, 24),
+                    otio.opentime.RationalTime(5, 24)
+                )
+            )
+
+
+class TimelineStatisticsTests(unittest.TestCase):
+
+    def test_timeline_statistics(self):
+        rt = otio.opentime.RationalTime
+        tr = otio.opentime.TimeRange
+        timeline = otio.schema.Timeline(name="tl")
+        video = otio.schema.Track(name="video")
+        audio = otio.schema.Track(
+            name="audio",
+            kind=otio.schema.TrackKind.Audio
+        )
+        timeline.tracks.extend([video, audio])
+
+        video.append(
+            otio.schema.Clip(
+                name="a",
+                media_reference=otio.schema.ExternalReference(
+                    "file:///a.mov"
+                ),
+                source_range=tr(rt(0, 24), rt(10, 24)),
+                metadata={"cdl": {}}
+            )
+        )
+        video.append(otio.schema.Gap(source_range=tr(rt(0, 24), rt(5, 24))))
+        video.markers.append(otio.schema.Marker(metadata={"note": "x"}))
+        audio.append(
+            otio.schema.Clip(
+                name="b",
+                source_range=tr(rt(0, 48000), rt(96000, 48000))
+            )
+        )
+
+        stats = otio.algorithms.timeline_statistics(timeline)
+        self.assertEqual(stats["track_count"], 2)
+        self.assertEqual(stats["clip_count"], 2)
+        self.assertEqual(stats["deepest_nesting"], 4)
+        self.assertEqual(
+            stats["schema_counts"],
+            {
+                "Timeline": 1,
+                "Stack": 1,
+                "Track": 2,
+                "Clip": 2,
+                "Gap": 1,
+                "Marker": 1,
+                "ExternalReference": 1,
+                "MissingReference": 1,
+            }
+        )
+        self.assertEqual(stats["track_kinds"], {"Video": 1, "Audio": 1})
+        self.assertEqual(
+            stats["track_kind_durations"],
+            {"Video": rt(15, 24), "Audio": rt(96000, 48000)}
+        )
+        self.assertEqual(stats["range"], tr(rt(0, 24), rt(48, 24)))
+        self.assertEqual(stats["clip_rates"], {24: 1, 48000: 1})
+        self.assertEqual(stats["metadata_keys"], {"cdl": 1, "note": 1})
+        self.assertEqual(stats["clip_metadata_keys"], {"cdl": 1})
+        self.assertEqual(
+            stats["media_reference_kinds"],
+            {"ExternalReference": 1, "MissingReference": 1}
+        )
+
+    def test_statistics_of_a_track(self):
+        track = otio.schema.Track()
+        track.append(otio.schema.Clip())
+        stats = otio.algorithms.timeline_statistics(track)
+        self.assertEqual(stats["clip_count"], 1)
+        self.assertEqual(stats["track_count"], 0)
+        self.assertEqual(stats["deepest_nesting"], 2)
+        self.assertIsNone(stats["range"])
+        self.assertEqual(stats["clip_rates"], {})
+
+    def test_statistics_of_a_stack(self):
+        timeline = otio.schema.Timeline()
+        for kind in (otio.schema.TrackKind.Video, otio.schema.TrackKind.Audio):
+            track = otio.schema.Track(kind=kind)
+            track.append(otio.schema.Clip(
+                source_range=otio.opentime.TimeRange(
+                    duration=otio.opentime.RationalTime(10, 24)
+                )
+            ))
+            timeline.tracks.append(track)
+
+        stats = otio.algorithms.timeline_statistics(timeline.tracks)
+        expected = otio.algorithms.timeline_statistics(timeline)
+        for key in ("track_count", "range", "track_kind_durations"):
+            self.assertEqual(stats[key], expected[key])
+        self.assertEqual(stats["track_count"], 2)
+
 
 if __name__ == '__main__':
     unittest.main()
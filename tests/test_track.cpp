@@ -6,6 +6,7 @@
 #include <opentimelineio/clip.h>
 #include <opentimelineio/stack.h>
 #include <opentimelineio/track.h>
+#include <opentimelineio/trackAlgorithm.h>
 
 #include <iostream>
 
@@ -166,6 +167,54 @@ main(int argc, char** argv)
             std::find(items.begin(), items.end(), clip.value) != items.end());
     });
 
+    tests.add_test(
+        "test_track_trimmed_to_range", [] {
+        using namespace otio;
+
+        SerializableObject::Retainer<Track> track = new Track("track");
+        track->metadata()["foo"] = std::string("bar");
+        std::vector<SerializableObject::Retainer<Clip>> clips;
+        for (int i = 0; i < 3; ++i)
+        {
+            clips.push_back(new Clip(
+                "clip" + std::to_string(i),
+                nullptr,
+                TimeRange(RationalTime(100.0, 24.0), RationalTime(10.0, 24.0))));
+            track->append_child(clips.back());
+        }
+
+        otio::ErrorStatus err;
+        SerializableObject::Retainer<Track> result = track_trimmed_to_range(
+            track,
+            TimeRange(RationalTime(5.0, 24.0), RationalTime(10.0, 24.0)),
+            &err);
+        assertFalse(is_error(err));
+
+        // only the intersecting children are kept, as clones
+        assertEqual(result->children().size(), 2);
+        assertEqual(result->name(), std::string("track"));
+        assertEqual(
+            std::any_cast<std::string>(result->metadata()["foo"]),
+            std::string("bar"));
+        auto first  = dynamic_retainer_cast<Clip>(result->children()[0]);
+        auto second = dynamic_retainer_cast<Clip>(result->children()[1]);
+        assertNotEqual(first.value, clips[0].value);
+        assertEqual(first->name(), std::string("clip0"));
+        assertEqual(
+            first->source_range().value(),
+            TimeRange(RationalTime(105.0, 24.0), RationalTime(5.0, 24.0)));
+        assertEqual(
+            second->source_range().value(),
+            TimeRange(RationalTime(100.0, 24.0), RationalTime(5.0, 24.0)));
+
+        // the input is untouched
+        assertEqual(track->children().size(), 3);
+        assertEqual(
+            clips[0]->source_range().value(),
+            TimeRange(RationalTime(100.0, 24.0), RationalTime(10.0, 24.0)));
+        assertEqual(clips[0]->parent(), track.value);
+    });
+
     tests.run(argc, argv);
     return 0;
 }
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Tests for typed numeric arrays in metadata."""
+
+import array
+import copy
+import json
+import unittest
+
+import opentimelineio as otio
+import opentimelineio.test_utils as otio_test_utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TypedArrayTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+    def test_construct(self):
+        floats = otio.core.Float64Array([1, 2.5, -3])
+        self.assertEqual(len(floats), 3)
+        self.assertEqual(floats.tolist(), [1.0, 2.5, -3.0])
+        self.assertEqual(list(floats), [1.0, 2.5, -3.0])
+        self.assertEqual(floats[-1], -3.0)
+        self.assertEqual(floats.dtype, "float64")
+
+        ints = otio.core.Int64Array(range(4))
+        self.assertEqual(ints.tolist(), [0, 1, 2, 3])
+        self.assertEqual(otio.core.Int64Array.dtype, "int64")
+        self.assertEqual(
+            repr(ints),
+            "otio.core.Int64Array([0, 1, 2, 3])"
+        )
+
+        # arrays are immutable
+        with self.assertRaises(TypeError):
+            ints[1] = 10
+        with self.assertRaises(IndexError):
+            ints[4]
+
+        with self.assertRaises(TypeError):
+            otio.core.Int64Array([1.5])
+
+        self.assertEqual(ints, copy.deepcopy(ints))
+        self.assertNotEqual(ints, otio.core.Int64Array([0, 1, 2]))
+        self.assertNotEqual(ints, [0, 1, 2, 3])
+
+    def test_buffer_protocol(self):
+        floats = otio.core.Float64Array([1.0, 2.0, 3.0])
+        view = memoryview(floats)
+        self.assertEqual(view.format, "d")
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0])
+
+        # the view shares memory with the array, so it is read-only
+        self.assertTrue(view.readonly)
+        with self.assertRaises(TypeError):
+            view[0] = 5.0
+        self.assertEqual(floats[0], 1.0)
+
+        ints = otio.core.Int64Array(array.array("q", [1, 2, 3]))
+        self.assertEqual(ints.tolist(), [1, 2, 3])
+        self.assertEqual(
+            otio.core.Int64Array(memoryview(ints)[::2]).tolist(),
+            [1, 3]
+        )
+
+    def test_metadata(self):
+        so = otio.core.SerializableObjectWithMetadata()
+        so.metadata["floats"] = otio.core.Float64Array([0.5, 1.5])
+        so.metadata["ints"] = otio.core.Int64Array([-1, 2 ** 62])
+
+        floats = so.metadata["floats"]
+        self.assertIsInstance(floats, otio.core.Float64Array)
+        self.assertEqual(floats.tolist(), [0.5, 1.5])
+
+        # values read from metadata cannot be changed in place, since the
+        # change would be lost
+        with self.assertRaises(TypeError):
+            floats[0] = 10.0
+        with self.assertRaises(TypeError):
+            memoryview(so.metadata["floats"])[0] = 10.0
+        self.assertEqual(so.metadata["floats"][0], 0.5)
+
+        so.metadata["floats"] = otio.core.Float64Array([10.0, 1.5])
+        self.assertEqual(so.metadata["floats"][0], 10.0)
+
+        encoded = otio.adapters.write_to_string(so, "otio_json")
+        self.assertEqual(
+            json.loads(encoded)["metadata"]["ints"],
+            {
+                "OTIO_SCHEMA": "TypedArray.1",
+                "dtype": "int64",
+                "data": "//////////8AAAAAAAAAQA==",
+            }
+        )
+
+        decoded = otio.adapters.read_from_string(encoded, "otio_json")
+        self.assertJsonEqual(so, decoded)
+        self.assertEqual(
+            decoded.metadata["ints"],
+            otio.core.Int64Array([-1, 2 ** 62])
+        )
+
+    def test_invalid_encoding(self):
+        encoded = json.dumps(
+            {
+                "OTIO_SCHEMA": "SerializableObjectWithMetadata.1",
+                "metadata": {
+                    "values": {
+                        "OTIO_SCHEMA": "TypedArray.1",
+                        "dtype": "float32",
+                        "data": "",
+                    },
+                },
+                "name": "",
+            }
+        )
+        with self.assertRaises(ValueError):
+            otio.adapters.read_from_string(encoded, "otio_json")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        so = otio.core.SerializableObjectWithMetadata()
+        so.metadata["values"] = numpy.arange(6, dtype=numpy.float64)[::2]
+        so.metadata["ints"] = numpy.arange(3, dtype=numpy.int64)
+
+        values = so.metadata["values"]
+        self.assertIsInstance(values, otio.core.Float64Array)
+        self.assertEqual(values.tolist(), [0.0, 2.0, 4.0])
+        self.assertIsInstance(so.metadata["ints"], otio.core.Int64Array)
+
+        view = numpy.asarray(so.metadata["values"])
+        self.assertEqual(view.dtype, numpy.float64)
+        self.assertFalse(view.flags.writeable)
+        with self.assertRaises(ValueError):
+            view[1] = 7.0
+        self.assertEqual(so.metadata["values"][1], 2.0)
+
+        so.metadata["values"] = view * 2
+        self.assertEqual(so.metadata["values"].tolist(), [0.0, 4.0, 8.0])
+
+        with self.assertRaises(TypeError):
+            so.metadata["bad"] = numpy.zeros((2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()